@@ -0,0 +1,213 @@
+"""
+Compare the parsing paths of every panel's response models.
+
+Usage: python benchmarks/models.py [--models marzban,guard.admin,user]
+       [--items 20000] [--rounds 3] [--seed 0] [--no-gc]
+
+Each panel contributes its user, admin and node models plus its system or
+stats model (OVPanel has none), named ``<panel>.<kind>``; ``--models`` takes
+full names, panels or kinds. Payloads are synthetic JSON lists generated by
+``opexcore.mock.ModelFaker``. Each model is parsed from the encoded list with
+the default path of list endpoints (``decode_model``, i.e. ``validate_json``
+through a ``TypeAdapter``) and by decoding first and validating every item
+(the path of streamed items); user models are also parsed with a quota-sized
+field projection both ways. Times are per item and include decoding; memory
+is what the parsed list keeps per instance, measured with ``tracemalloc``.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type
+from pydantic import BaseModel
+from opexcore.core import RequestBase, decode_model
+from opexcore.core.parsing import parse, project
+from opexcore.mock import ModelFaker
+from opexcore.marzban.types import (
+    MarzbanAdmin,
+    MarzbanNodeResponse,
+    MarzbanSystemStats,
+    MarzbanUserResponse,
+)
+from opexcore.marzneshin.types import (
+    MarzneshinAdminResponse,
+    MarzneshinNodeResponse,
+    MarzneshinUserResponse,
+    MarzneshinUsersStats,
+)
+from opexcore.pasarguard.types import (
+    PasarGuardAdminDetails,
+    PasarGuardNodeResponse,
+    PasarGuardSystemStats,
+    PasarGuardUserResponse,
+)
+from opexcore.rustneshin.types import (
+    RustneshinAdminResponse,
+    RustneshinNodeResponse,
+    RustneshinUserResponse,
+    RustneshinUsersStats,
+)
+from opexcore.guard.types import (
+    GuardAdminResponse,
+    GuardNodeResponse,
+    GuardStatsResponse,
+    GuardSubscriptionResponse,
+)
+from opexcore.remnawave.types import (
+    RemnawaveAdmin,
+    RemnawaveNode,
+    RemnawaveSystemStats,
+    RemnawaveUser,
+)
+from opexcore.ovpanel.types import OVPanelAdmin, OVPanelNode, OVPanelUser
+
+MODELS: Dict[str, Tuple[Type[BaseModel], Optional[FrozenSet[str]]]] = {
+    "marzban.user": (
+        MarzbanUserResponse,
+        frozenset({"username", "status", "used_traffic", "data_limit", "expire"}),
+    ),
+    "marzban.admin": (MarzbanAdmin, None),
+    "marzban.node": (MarzbanNodeResponse, None),
+    "marzban.system": (MarzbanSystemStats, None),
+    "marzneshin.user": (
+        MarzneshinUserResponse,
+        frozenset({"username", "is_active", "used_traffic", "data_limit"}),
+    ),
+    "marzneshin.admin": (MarzneshinAdminResponse, None),
+    "marzneshin.node": (MarzneshinNodeResponse, None),
+    "marzneshin.stats": (MarzneshinUsersStats, None),
+    "pasarguard.user": (
+        PasarGuardUserResponse,
+        frozenset({"username", "status", "used_traffic", "data_limit", "expire"}),
+    ),
+    "pasarguard.admin": (PasarGuardAdminDetails, None),
+    "pasarguard.node": (PasarGuardNodeResponse, None),
+    "pasarguard.system": (PasarGuardSystemStats, None),
+    "rustneshin.user": (
+        RustneshinUserResponse,
+        frozenset({"username", "is_active", "used_traffic", "data_limit"}),
+    ),
+    "rustneshin.admin": (RustneshinAdminResponse, None),
+    "rustneshin.node": (RustneshinNodeResponse, None),
+    "rustneshin.stats": (RustneshinUsersStats, None),
+    "guard.user": (
+        GuardSubscriptionResponse,
+        frozenset({"username", "is_active", "current_usage", "limit_usage"}),
+    ),
+    "guard.admin": (GuardAdminResponse, None),
+    "guard.node": (GuardNodeResponse, None),
+    "guard.stats": (GuardStatsResponse, None),
+    "remnawave.user": (
+        RemnawaveUser,
+        frozenset({"username", "status", "used_traffic_bytes", "traffic_limit_bytes"}),
+    ),
+    "remnawave.admin": (RemnawaveAdmin, None),
+    "remnawave.node": (RemnawaveNode, None),
+    "remnawave.system": (RemnawaveSystemStats, None),
+    "ovpanel.user": (OVPanelUser, frozenset({"name", "status"})),
+    "ovpanel.admin": (OVPanelAdmin, None),
+    "ovpanel.node": (OVPanelNode, None),
+}
+"""Response models by ``<panel>.<kind>``, with the fields of their projection"""
+
+Case = Callable[[bytes], Any]
+
+
+def cases(model: Type[BaseModel], fields: Optional[FrozenSet[str]]) -> Dict[str, Case]:
+    codec = RequestBase.codec
+    found: Dict[str, Case] = {
+        "validate_json": lambda body: decode_model(body, List[model]),
+        "decode+validate": lambda body: parse(List[model], codec.loads(body)),
+    }
+    if fields is not None:
+        projected = project(model, fields)
+        found["projection"] = lambda body: decode_model(body, List[projected])
+        found["projection+dict"] = lambda body: parse(
+            List[projected], codec.loads(body)
+        )
+    return found
+
+
+def select(names: List[str]) -> List[str]:
+    """Models matching full names, panels (``marzban``) or kinds (``node``)"""
+    return [
+        key for key in MODELS if any(name in (key, *key.split(".")) for name in names)
+    ]
+
+
+def best_of(rounds: int, func: Callable[[], Any]) -> float:
+    timings: List[float] = []
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def retained(func: Callable[[], Any]) -> int:
+    """Bytes still allocated while the result of ``func`` is held"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = func()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--models", default=",".join(MODELS))
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-gc", action="store_true", help="disable the cyclic garbage collector"
+    )
+    args = parser.parse_args()
+    names = [name for name in args.models.split(",") if name]
+    unknown = {name for name in names if not select([name])}
+    if unknown:
+        parser.error(f"unknown models: {', '.join(sorted(unknown))}")
+    if args.no_gc:
+        gc.disable()
+
+    codec = RequestBase.codec
+    print(
+        f"{args.items} items per model, {codec.name} codec, best of {args.rounds}"
+        f"{', gc disabled' if args.no_gc else ''}"
+    )
+    print(f"  {'case':<16}{'us/item':>10}{'speedup':>9}{'B/item':>10}")
+    summary: Dict[str, float] = {}
+    for name in select(names):
+        model, fields = MODELS[name]
+        faker = ModelFaker(model, args.seed)
+        body = codec.dumps([faker(index) for index in range(args.items)])
+        print(
+            f"{name}: {model.__name__}"
+            f" ({len(body) / args.items:.0f} B of JSON per item)"
+        )
+        baseline = None
+        for case, func in cases(model, fields).items():
+            elapsed = best_of(args.rounds, lambda: func(body)) / args.items
+            baseline = baseline or elapsed
+            size = retained(lambda: func(body)) / args.items
+            print(
+                f"  {case:<16}{elapsed * 1e6:>10.2f}{baseline / elapsed:>8.2f}x"
+                f"{size:>10.0f}"
+            )
+        summary[name] = baseline
+
+    print("\nDefault path, slowest first")
+    for name, elapsed in sorted(summary.items(), key=lambda item: -item[1]):
+        print(
+            f"  {name:<20}{MODELS[name][0].__name__:<28}{elapsed * 1e6:>8.2f} us/item"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Benchmark operations of every panel, expressed with its manager.
+
+Each adapter implements the operations the suite measures: ``login``,
+``scan`` (iterate every user, returns the number read), ``get_all`` (load
+every user into one list, returns its length; None where the manager has no
+``get_all_*``), ``create`` (one user), ``pick`` (a user to fetch the
+subscription of), ``subscription`` and ``stats``.
+"""
+
+from contextlib import aclosing
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Type
+from opexcore import (
+    MarzbanManager,
+    MarzneshinManager,
+    PasarGuardManager,
+    RustneshinManager,
+    GuardManager,
+    RemnawaveManager,
+    OVPanelManager,
+)
+from opexcore.marzban.types import MarzbanUserCreate
+from opexcore.marzneshin.types import MarzneshinUserCreate
+from opexcore.pasarguard.types import PasarGuardUserCreate
+from opexcore.rustneshin.types import RustneshinUserCreate
+from opexcore.guard.types import GuardSubscriptionCreate
+from opexcore.remnawave.types import RemnawaveUserCreate
+from opexcore.ovpanel.types import OVPanelCreateUser
+
+USERNAME = "admin"
+PASSWORD = "admin"
+
+
+class Panel:
+    manager: Any = None
+    get_all: Optional[Callable[[], Awaitable[int]]]
+
+    def __init__(self, url: str, page_size: int):
+        self.url = url
+        self.page_size = page_size
+        self.token = ""
+
+    async def login(self) -> None:
+        token = await self.manager.admin_token(self.url, USERNAME, PASSWORD)
+        self.token = token.access_token
+
+    async def scan(self) -> int:
+        count = 0
+        async for _ in self.manager.iter_users(
+            self.url, self.token, page_size=self.page_size
+        ):
+            count += 1
+        return count
+
+    async def get_all(self) -> int:
+        users = await self.manager.get_all_users(
+            self.url, self.token, page_size=self.page_size
+        )
+        return len(users)
+
+    async def create(self, index: int) -> None:
+        raise NotImplementedError
+
+    async def pick(self) -> Any:
+        raise NotImplementedError
+
+    async def subscription(self, user: Any) -> None:
+        raise NotImplementedError
+
+    async def stats(self) -> None:
+        raise NotImplementedError
+
+
+class Marzban(Panel):
+    manager = MarzbanManager
+
+    async def create(self, index: int) -> None:
+        user = MarzbanUserCreate(username=f"bench_{index}", proxies={"vless": {}})
+        await self.manager.add_user(self.url, self.token, user)
+
+    async def pick(self) -> Any:
+        users = await self.manager.get_users(self.url, self.token, limit=1)
+        return users.users[0].username
+
+    async def subscription(self, user: Any) -> None:
+        await self.manager.user_subscription(self.url, user)
+
+    async def stats(self) -> None:
+        await self.manager.get_system_stats(self.url, self.token)
+
+
+class PasarGuard(Marzban):
+    manager = PasarGuardManager
+
+    async def create(self, index: int) -> None:
+        user = PasarGuardUserCreate(username=f"bench_{index}", status="active")
+        await self.manager.create_user(self.url, self.token, user)
+
+
+class Marzneshin(Panel):
+    manager = MarzneshinManager
+    get_all = None
+
+    async def create(self, index: int) -> None:
+        user = MarzneshinUserCreate(username=f"bench_{index}", expire_strategy="never")
+        await self.manager.add_user(self.url, self.token, user)
+
+    async def pick(self) -> Any:
+        users = await self.manager.get_users(self.url, self.token, page=1, size=1)
+        return users[0].username, users[0].key
+
+    async def subscription(self, user: Any) -> None:
+        await self.manager.user_subscription(self.url, *user)
+
+    async def stats(self) -> None:
+        await self.manager.get_users_stats(self.url, self.token)
+
+
+class Rustneshin(Marzneshin):
+    manager = RustneshinManager
+    get_all = Panel.get_all
+
+    async def create(self, index: int) -> None:
+        user = RustneshinUserCreate(username=f"bench_{index}", expire_strategy="never")
+        await self.manager.create_user(self.url, self.token, user)
+
+    async def pick(self) -> Any:
+        users = await self.manager.get_users(self.url, self.token, page=1, size=1)
+        return users.items[0].username, users.items[0].key
+
+
+class Guard(Panel):
+    manager = GuardManager
+
+    async def login(self) -> None:
+        token = await self.manager.create_token(self.url, USERNAME, PASSWORD)
+        self.token = token.access_token
+
+    async def scan(self) -> int:
+        count = 0
+        async for _ in self.manager.iter_subscriptions(
+            self.url, self.token, page_size=self.page_size
+        ):
+            count += 1
+        return count
+
+    async def get_all(self) -> int:
+        subscriptions = await self.manager.get_all_subscriptions(
+            self.url, self.token, page_size=self.page_size
+        )
+        return len(subscriptions)
+
+    async def create(self, index: int) -> None:
+        subscription = GuardSubscriptionCreate(
+            username=f"bench_{index}",
+            limit_usage=10 * 1024**3,
+            limit_expire=30 * 86400,
+            service_ids=[1],
+        )
+        await self.manager.create_subscriptions(self.url, self.token, [subscription])
+
+    async def pick(self) -> Any:
+        subscriptions = await self.manager.get_subscriptions(
+            self.url, self.token, page=1, size=1
+        )
+        return subscriptions[0].access_key
+
+    async def subscription(self, user: Any) -> None:
+        await self.manager.get_subscription_by_secret(self.url, user)
+
+    async def stats(self) -> None:
+        await self.manager.get_subscription_stats(self.url, self.token)
+
+
+class Remnawave(Panel):
+    manager = RemnawaveManager
+    get_all = None
+
+    async def login(self) -> None:
+        token = await self.manager.admin_login(self.url, USERNAME, PASSWORD)
+        self.token = token.access_token
+
+    async def create(self, index: int) -> None:
+        expire = (date.today() + timedelta(days=30)).isoformat()
+        user = RemnawaveUserCreate(username=f"bench_{index}", expire_at=expire)
+        await self.manager.create_user(self.url, self.token, user)
+
+    async def pick(self) -> Any:
+        users = await self.manager.get_users(self.url, self.token, size=1)
+        return users[0].short_uuid
+
+    async def subscription(self, user: Any) -> None:
+        await self.manager.get_subscription_links(self.url, user)
+
+    async def stats(self) -> None:
+        await self.manager.get_system_stats(self.url, self.token)
+
+
+class OVPanel(Panel):
+    manager = OVPanelManager
+
+    async def login(self) -> None:
+        token = await self.manager.login(self.url, USERNAME, PASSWORD)
+        self.token = token.access_token
+
+    async def scan(self) -> int:
+        count = 0
+        async for _ in self.manager.stream_users(self.url, self.token):
+            count += 1
+        return count
+
+    async def get_all(self) -> int:
+        response = await self.manager.get_all_users(self.url, self.token)
+        return len(response.data)
+
+    async def create(self, index: int) -> None:
+        user = OVPanelCreateUser(
+            name=f"b{index:06d}", expiry_date=date.today() + timedelta(days=30)
+        )
+        await self.manager.create_user(self.url, self.token, user)
+
+    async def pick(self) -> Any:
+        nodes = await self.manager.list_nodes(self.url, self.token)
+        async with aclosing(self.manager.stream_users(self.url, self.token)) as users:
+            async for user in users:
+                return user.uuid, nodes.data[0]["id"]
+
+    async def subscription(self, user: Any) -> None:
+        await self.manager.download_ovpn_client(self.url, self.token, *user)
+
+    async def stats(self) -> None:
+        await self.manager.get_server_info(self.url, self.token)
+
+
+PANELS: Dict[str, Type[Panel]] = {
+    "marzban": Marzban,
+    "marzneshin": Marzneshin,
+    "pasarguard": PasarGuard,
+    "rustneshin": Rustneshin,
+    "guard": Guard,
+    "remnawave": Remnawave,
+    "ovpanel": OVPanel,
+}
@@ -0,0 +1,338 @@
+"""
+Measure SDK throughput, latency and memory per panel against local mock panels.
+
+Usage: python benchmarks/sdk.py [--panels marzban,guard] [--ops login,scan]
+       [--users 20000] [--requests 200] [--concurrency 8]
+       [--output results.json] [--baseline previous.json]
+
+Every panel is served by ``python -m opexcore.mock`` in its own process, so
+the numbers only cover the SDK side. For each operation the suite reports
+requests per second, p50/p95/p99 latency, CPU time per call (which, unlike
+latency, does not depend on how fast the mock is), the peak of traced Python
+allocations and retained bytes per call (from a separate ``tracemalloc``
+pass, which is too slow to time), and peak RSS. Keep ``--concurrency`` below
+the session pool's per-host limit (10) or latency includes pool queueing.
+Full reads (``scan`` through ``iter_*``/``stream_*``, ``get_all`` through
+``get_all_*``) fail unless they return every user of the dataset. With
+``--baseline`` the run is compared with an earlier JSON report and
+regressions beyond ``--threshold`` are flagged.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from importlib.metadata import version
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from opexcore.core import RequestBase
+from panels import PANELS, Panel
+
+OPERATIONS = ("login", "scan", "get_all", "create", "subscription", "stats")
+FULL_READS = ("scan", "get_all")
+
+Call = Callable[[], Awaitable[Any]]
+
+
+def percentile(ordered: List[float], share: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(share * len(ordered)) - 1))]
+
+
+def _status_kb(field: str) -> Optional[int]:
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak RSS of this process; only Linux supports it"""
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    peak = _status_kb("VmHWM")
+    if peak is None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak //= 1024
+    return peak / 1024
+
+
+async def run_calls(
+    calls: int, concurrency: int, call: Call
+) -> Tuple[List[float], float]:
+    """Run ``call`` ``calls`` times from ``concurrency`` workers"""
+    latencies: List[float] = []
+    remaining = iter(range(calls))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, calls))))
+    return latencies, time.perf_counter() - started
+
+
+async def measure(
+    call: Call, calls: int, concurrency: int, memory_calls: int
+) -> Dict[str, Any]:
+    """Time ``calls`` calls, then trace allocations of ``memory_calls`` more"""
+    await run_calls(min(calls, concurrency), concurrency, call)
+    rss_reset = reset_peak_rss()
+    cpu = time.process_time()
+    latencies, elapsed = await run_calls(calls, concurrency, call)
+    cpu = time.process_time() - cpu
+    ordered = sorted(latencies)
+    result = {
+        "calls": calls,
+        "concurrency": concurrency,
+        "rps": calls / elapsed,
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p95_ms": percentile(ordered, 0.95) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "cpu_ms": cpu / calls * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_rss_reset": rss_reset,
+    }
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    await run_calls(memory_calls, concurrency, call)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result["alloc_peak_kb"] = (peak - before) / 1024
+    result["retained_per_call_b"] = (after - before) / memory_calls
+    return result
+
+
+async def start_mock(panel: str, args: argparse.Namespace) -> Tuple[Any, str]:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "opexcore.mock",
+        panel,
+        "--port",
+        "0",
+        "--users",
+        str(args.users),
+        "--seed",
+        str(args.seed),
+        "--latency",
+        str(args.latency),
+        stdout=subprocess.PIPE,
+    )
+    line = (await asyncio.wait_for(process.stdout.readline(), 30)).decode()
+    match = re.search(r"http://\S+", line)
+    if match is None:
+        process.kill()
+        raise RuntimeError(f"mock {panel} did not start: {line!r}")
+    return process, match.group(0)
+
+
+async def bench_panel(name: str, args: argparse.Namespace) -> Dict[str, Any]:
+    process, url = await start_mock(name, args)
+    results: Dict[str, Any] = {}
+    try:
+        panel: Panel = PANELS[name](url, args.page_size)
+        await panel.login()
+        counter = itertools.count()
+        created = 0
+        user = await panel.pick() if "subscription" in args.ops else None
+
+        async def create() -> None:
+            nonlocal created
+            await panel.create(next(counter))
+            created += 1
+
+        def full_read(operation: str, read: Callable[[], Awaitable[int]]) -> Call:
+            async def call() -> None:
+                count = await read()
+                if count != args.users + created:
+                    raise RuntimeError(
+                        f"{name} {operation} read {count} users "
+                        f"of {args.users + created}"
+                    )
+
+            return call
+
+        calls: Dict[str, Optional[Tuple[Call, int]]] = {
+            "login": (panel.login, args.requests),
+            "scan": (full_read("scan", panel.scan), args.scans),
+            "get_all": (
+                (full_read("get_all", panel.get_all), args.scans)
+                if panel.get_all is not None
+                else None
+            ),
+            "create": (create, args.requests),
+            "subscription": (lambda: panel.subscription(user), args.requests),
+            "stats": (panel.stats, args.requests),
+        }
+        for operation in args.ops:
+            if calls[operation] is None:
+                print(f"  {name:<11} {operation:<13}not supported", flush=True)
+                continue
+            call, count = calls[operation]
+            concurrency = 1 if operation in FULL_READS else args.concurrency
+            memory_calls = max(1, min(count, args.memory_calls))
+            result = await measure(call, count, concurrency, memory_calls)
+            if operation in FULL_READS:
+                result["items_per_s"] = args.users * result["rps"]
+            results[operation] = result
+            print(f"  {name:<11} {format_row(operation, result)}", flush=True)
+    finally:
+        process.terminate()
+        await process.wait()
+        await RequestBase.shutdown()
+    return results
+
+
+def format_row(operation: str, result: Dict[str, Any]) -> str:
+    return (
+        f"{operation:<13}{result['rps']:>10.1f}{result['p50_ms']:>10.2f}"
+        f"{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['cpu_ms']:>10.3f}"
+        f"{result['alloc_peak_kb']:>12.1f}{result['retained_per_call_b']:>12.0f}"
+        f"{result['peak_rss_mb']:>10.1f}"
+    )
+
+
+COMPARED = {
+    "rps": 1,
+    "p50_ms": -1,
+    "p95_ms": -1,
+    "p99_ms": -1,
+    "cpu_ms": -1,
+    "alloc_peak_kb": -1,
+    "peak_rss_mb": -1,
+}
+"""Metrics compared with a baseline, 1 when higher is better and -1 otherwise"""
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Print the change of every metric and return the regressions"""
+    regressions = []
+    print(f"\nChange against baseline (regression beyond {threshold:.0%} marked !)")
+    for panel, operations in current["results"].items():
+        for operation, result in operations.items():
+            previous = baseline.get("results", {}).get(panel, {}).get(operation)
+            if previous is None:
+                continue
+            cells = []
+            for metric, direction in COMPARED.items():
+                old, new = previous.get(metric), result.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old
+                worse = change * direction < -threshold
+                cells.append(f"{metric} {change:+.1%}{' !' if worse else ''}")
+                if worse:
+                    regressions.append(f"{panel}.{operation}.{metric} {change:+.1%}")
+            print(f"  {panel:<11} {operation:<13}" + "  ".join(cells))
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    RequestBase.coalesce_requests = args.coalesce
+    header = (
+        f"{'operation':<13}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'cpu ms':>10}"
+        f"{'alloc kB':>12}{'kept B':>12}{'rss MB':>10}"
+    )
+    print(f"  {'panel':<11} {header}")
+    results = {}
+    for name in args.panels:
+        results[name] = await bench_panel(name, args)
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "opexcore": version("opexcore") if _installed() else None,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "codec": RequestBase.codec.name,
+            "cpu_count": os.cpu_count(),
+            "args": {
+                key: value
+                for key, value in vars(args).items()
+                if key not in ("output", "baseline")
+            },
+        },
+        "results": results,
+    }
+
+
+def _installed() -> bool:
+    try:
+        version("opexcore")
+    except Exception:
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--panels", default=",".join(PANELS))
+    parser.add_argument("--ops", default=",".join(OPERATIONS))
+    parser.add_argument("--users", type=int, default=20000, help="mock dataset size")
+    parser.add_argument("--requests", type=int, default=200, help="calls per operation")
+    parser.add_argument("--scans", type=int, default=3, help="full scans to time")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument(
+        "--memory-calls", type=int, default=50, help="calls traced for allocations"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="mock delay in s")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--coalesce",
+        action="store_true",
+        help="let identical concurrent GETs share one request",
+    )
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare with")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+    args.panels = [name for name in args.panels.split(",") if name]
+    args.ops = [name for name in args.ops.split(",") if name]
+    unknown = set(args.panels) - set(PANELS) | set(args.ops) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown panels or operations: {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            regressions = compare(report, json.load(baseline), args.threshold)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
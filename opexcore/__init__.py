@@ -1,19 +1,63 @@
-from .core import RequestBase
-from .marzneshin import MarzneshinManager
-from .marzban import MarzbanManager
-from .guard import GuardManager
-from .pasarguard import PasarGuardManager
-from .remnawave import RemnawaveManager
-from .ovpanel import OVPanelManager
-from .rustneshin import RustneshinManager
+from typing import TYPE_CHECKING
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .core import (
+        RequestBase,
+        SessionPool,
+        PanelClient,
+        TokenManager,
+        ResponseCache,
+        SyncClient,
+    )
+    from .marzneshin import MarzneshinManager, MarzneshinClient
+    from .marzban import MarzbanManager, MarzbanClient
+    from .guard import GuardManager, GuardClient
+    from .pasarguard import PasarGuardManager, PasarGuardClient
+    from .remnawave import RemnawaveManager, RemnawaveClient
+    from .ovpanel import OVPanelManager, OVPanelClient
+    from .rustneshin import RustneshinManager, RustneshinClient
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".core": [
+            "RequestBase",
+            "SessionPool",
+            "PanelClient",
+            "TokenManager",
+            "ResponseCache",
+            "SyncClient",
+        ],
+        ".marzneshin": ["MarzneshinManager", "MarzneshinClient"],
+        ".marzban": ["MarzbanManager", "MarzbanClient"],
+        ".guard": ["GuardManager", "GuardClient"],
+        ".pasarguard": ["PasarGuardManager", "PasarGuardClient"],
+        ".remnawave": ["RemnawaveManager", "RemnawaveClient"],
+        ".ovpanel": ["OVPanelManager", "OVPanelClient"],
+        ".rustneshin": ["RustneshinManager", "RustneshinClient"],
+    },
+)
 
 __all__ = [
     "RequestBase",
+    "SessionPool",
+    "PanelClient",
+    "TokenManager",
+    "ResponseCache",
+    "SyncClient",
     "MarzneshinManager",
+    "MarzneshinClient",
     "MarzbanManager",
+    "MarzbanClient",
     "GuardManager",
+    "GuardClient",
     "PasarGuardManager",
+    "PasarGuardClient",
     "RemnawaveManager",
+    "RemnawaveClient",
     "OVPanelManager",
+    "OVPanelClient",
     "RustneshinManager",
+    "RustneshinClient",
 ]
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class PanelModel(BaseModel):
+    """
+    Base of the panel request and response models.
+
+    Validators are built on first use instead of at import time, so a
+    process only pays for the models of the panels and endpoints it calls.
+    """
+
+    model_config = ConfigDict(defer_build=True)
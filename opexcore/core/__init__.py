@@ -1,3 +1,84 @@
 from .request import RequestBase
+from .session import SessionPool
+from .context import ClientContext, current_context
+from .auth import TokenManager, jwt_expiry
+from .client import PanelClient
+from .pagination import paginate, gather_pages, PaginationError
+from .cache import ResponseCache, cached, invalidates
+from .retry import RetryPolicy, retry_safe, deadline
+from .breaker import CircuitBreaker, CircuitOpenError
+from .ratelimit import RateLimiter, TokenBucket, classify_endpoint
+from .codec import JsonCodec, get_codec, decode_model
+from .parsing import Projection, project, with_items
+from .download import DownloadResult, Target
+from .archive import ArchiveJob, ArchiveReport, archive_name, write_archive
+from .compression import Compression, Transfer, record_transfers
+from .instrumentation import (
+    Instrumentation,
+    RequestEvent,
+    ParseEvent,
+    LoggingSink,
+    HistogramSink,
+    Histogram,
+)
+from .metrics import (
+    MetricsRegistry,
+    MetricsSink,
+    Counter,
+    LatencyHistogram,
+    metrics_handler,
+)
+from .sync import EventLoopThread, SyncClient, default_loop
 
-__all__ = ["RequestBase"]
+__all__ = [
+    "RequestBase",
+    "SessionPool",
+    "ClientContext",
+    "current_context",
+    "TokenManager",
+    "jwt_expiry",
+    "PanelClient",
+    "paginate",
+    "gather_pages",
+    "PaginationError",
+    "ResponseCache",
+    "cached",
+    "invalidates",
+    "RetryPolicy",
+    "retry_safe",
+    "deadline",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RateLimiter",
+    "TokenBucket",
+    "classify_endpoint",
+    "JsonCodec",
+    "get_codec",
+    "decode_model",
+    "Projection",
+    "project",
+    "with_items",
+    "DownloadResult",
+    "Target",
+    "ArchiveJob",
+    "ArchiveReport",
+    "archive_name",
+    "write_archive",
+    "Compression",
+    "Transfer",
+    "record_transfers",
+    "Instrumentation",
+    "RequestEvent",
+    "ParseEvent",
+    "LoggingSink",
+    "HistogramSink",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsSink",
+    "Counter",
+    "LatencyHistogram",
+    "metrics_handler",
+    "EventLoopThread",
+    "SyncClient",
+    "default_loop",
+]
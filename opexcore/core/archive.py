@@ -0,0 +1,177 @@
+import asyncio
+import io
+import os
+import re
+import tarfile
+import time
+import zipfile
+from typing import (
+    Optional,
+    List,
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
+    Set,
+    Tuple,
+    Union,
+)
+from .download import Target
+
+ArchiveJob = Tuple[str, Callable[[], Awaitable[bytes]]]
+"""Name of an archive entry and a coroutine function fetching its content"""
+
+ARCHIVE_FORMATS = ("zip", "tar", "tar.gz")
+
+_SEPARATORS = re.compile(r"[/\\]+")
+
+
+def _segment(name: str) -> str:
+    name = _SEPARATORS.sub("_", name).replace("\0", "_")
+    return "_" if not name.strip(".") else name
+
+
+def archive_name(*segments: str) -> str:
+    """
+    Join names taken from panel data into a safe archive entry name.
+
+    Separators inside a segment are replaced, and segments that would leave
+    the archive's directory (empty, ``.`` or ``..``) become ``_``, so the
+    entry always extracts below the target directory.
+
+    :param segments: Directory and file names, e.g. a node and a user name
+    :return: Entry name such as ``node/alice.ovpn``
+    """
+    return "/".join(_segment(segment) for segment in segments)
+
+
+class ArchiveReport:
+    """Outcome of a bulk export into an archive"""
+
+    __slots__ = ("written", "bytes", "failures", "elapsed")
+
+    def __init__(self):
+        self.written = 0
+        self.bytes = 0
+        self.failures: List[Tuple[str, BaseException]] = []
+        self.elapsed = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    def __repr__(self) -> str:
+        return (
+            f"ArchiveReport(written={self.written}, bytes={self.bytes}, "
+            f"failed={self.failed}, elapsed={self.elapsed:.2f})"
+        )
+
+
+class _ArchiveWriter:
+    """Adds entries to a ZIP or tar archive one at a time"""
+
+    def __init__(self, target: Target, format: str):
+        if format not in ARCHIVE_FORMATS:
+            raise ValueError(f"unknown archive format: {format}")
+        path = isinstance(target, (str, os.PathLike))
+        if format == "zip":
+            self._zip = zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED)
+            self._tar = None
+        else:
+            compression = "gz" if format == "tar.gz" else ""
+            if path:
+                self._tar = tarfile.open(target, f"w:{compression}")
+            else:
+                # Stream mode never seeks, so any writable file object works
+                self._tar = tarfile.open(fileobj=target, mode=f"w|{compression}")
+            self._zip = None
+
+    def add(self, name: str, data: bytes) -> None:
+        name = archive_name(*_SEPARATORS.split(name.strip("/\\")))
+        if self._zip is not None:
+            self._zip.writestr(name, data)
+            return
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        (self._zip or self._tar).close()
+
+
+async def write_archive(
+    jobs: Union[Iterable[ArchiveJob], AsyncIterable[ArchiveJob]],
+    target: Target,
+    format: str = "zip",
+    concurrency: int = 8,
+    progress: Optional[Callable[[ArchiveReport], Any]] = None,
+) -> ArchiveReport:
+    """
+    Fetch entries concurrently and add each to an archive as soon as it arrives.
+
+    Jobs are pulled lazily and at most ``concurrency`` entries are fetched or
+    held at once, so memory does not grow with the number of jobs. A failed
+    entry is recorded in the report and skipped; the others carry on.
+    Compression and file writes run in a worker thread, one entry at a time,
+    and entry names are passed through ``archive_name`` so none can point
+    outside the archive.
+
+    :param jobs: Entry names paired with coroutine functions returning their
+        content, as a plain or async iterable
+    :param target: Archive file path, or a writable binary file object
+    :param format: ``"zip"``, ``"tar"`` or ``"tar.gz"``
+    :param concurrency: Maximum number of entries fetched at once
+    :param progress: Called with the report after every finished entry
+    :return: Counts, sizes and the failed entries with their errors
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    writer = await asyncio.to_thread(_ArchiveWriter, target, format)
+    report = ArchiveReport()
+    started = time.monotonic()
+    pending: Set[asyncio.Task] = set()
+
+    async def fetch(name: str, job: Callable[[], Awaitable[bytes]]) -> Any:
+        try:
+            return name, await job(), None
+        except Exception as error:
+            return name, None, error
+
+    async def collect(done: Iterable[asyncio.Task]) -> None:
+        for task in done:
+            name, data, error = task.result()
+            if error is None:
+                await asyncio.to_thread(writer.add, name, data)
+                report.written += 1
+                report.bytes += len(data)
+            else:
+                report.failures.append((name, error))
+            if progress is not None:
+                progress(report)
+
+    async def drain(until: int) -> None:
+        nonlocal pending
+        while len(pending) > until:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            await collect(done)
+
+    try:
+        if hasattr(jobs, "__aiter__"):
+            async for name, job in jobs:
+                await drain(concurrency - 1)
+                pending.add(asyncio.ensure_future(fetch(name, job)))
+        else:
+            for name, job in jobs:
+                await drain(concurrency - 1)
+                pending.add(asyncio.ensure_future(fetch(name, job)))
+        await drain(0)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.to_thread(writer.close)
+    report.elapsed = time.monotonic() - started
+    return report
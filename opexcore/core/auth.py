@@ -0,0 +1,151 @@
+import asyncio
+import base64
+import json
+import time
+from typing import Optional, Dict, Any, Awaitable, Callable, Hashable
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the ``exp`` claim of a JWT without verifying it.
+
+    :param token: Encoded token
+    :return: Expiry as a UNIX timestamp, or None if the token carries none
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (ValueError, TypeError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class CachedToken:
+    """A token and the time it stops being valid"""
+
+    __slots__ = ("value", "expires_at")
+
+    def __init__(self, value: str, expires_at: Optional[float] = None):
+        self.value = value
+        self.expires_at = expires_at
+
+    def expires_in(self) -> Optional[float]:
+        """Seconds until expiry, None when the expiry is unknown"""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.time()
+
+
+class TokenManager:
+    """
+    Cache of panel tokens with single-flight, ahead-of-expiry refresh.
+
+    Tokens are stored under a caller-chosen key, usually
+    ``(panel, host, username)``. Concurrent callers that need a new token share
+    one in-flight login. A token inside the refresh margin is still handed out
+    while a single background login replaces it.
+    """
+
+    def __init__(self, refresh_margin: float = 60, default_ttl: Optional[float] = None):
+        """
+        Create a token manager.
+
+        :param refresh_margin: Seconds before expiry at which a token is refreshed
+        :param default_ttl: Lifetime assumed for tokens that carry no JWT expiry,
+            None to keep them until the panel rejects them
+        """
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self._tokens: Dict[Hashable, CachedToken] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def set(self, key: Hashable, token: str) -> CachedToken:
+        """
+        Store a token obtained elsewhere.
+
+        :param key: Cache key
+        :param token: Encoded token
+        :return: Cached token entry
+        """
+        expires_at = jwt_expiry(token)
+        if expires_at is None and self.default_ttl is not None:
+            expires_at = time.time() + self.default_ttl
+        cached = CachedToken(token, expires_at)
+        self._tokens[key] = cached
+        return cached
+
+    def peek(self, key: Hashable) -> Optional[CachedToken]:
+        """Return the cached token for ``key`` without refreshing it"""
+        return self._tokens.get(key)
+
+    def invalidate(self, key: Hashable, token: Optional[str] = None) -> None:
+        """
+        Drop a cached token.
+
+        When ``token`` is given the entry is only dropped if it still holds that
+        token, so a stale rejection cannot discard a token that was already
+        refreshed by another caller.
+
+        :param key: Cache key
+        :param token: The token that was rejected
+        """
+        cached = self._tokens.get(key)
+        if cached is not None and (token is None or cached.value == token):
+            del self._tokens[key]
+
+    def _refresh(
+        self, key: Hashable, login: Callable[[], Awaitable[str]]
+    ) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+
+            async def run() -> str:
+                try:
+                    return self.set(key, await login()).value
+                finally:
+                    self._inflight.pop(key, None)
+
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = task
+        return task
+
+    async def get(
+        self,
+        key: Hashable,
+        login: Callable[[], Awaitable[str]],
+        force: bool = False,
+    ) -> str:
+        """
+        Return a valid token, logging in only when needed.
+
+        :param key: Cache key
+        :param login: Coroutine function that logs in and returns a new token
+        :param force: Log in again even if a cached token is still valid
+        :return: Encoded token
+        """
+        cached = self._tokens.get(key)
+        if cached is not None and not force:
+            expires_in = cached.expires_in()
+            if expires_in is None or expires_in > self.refresh_margin:
+                return cached.value
+            if expires_in > 0:
+                self._refresh(key, login).add_done_callback(_consume_exception)
+                return cached.value
+        return await asyncio.shield(self._refresh(key, login))
+
+    def snapshot(self) -> Dict[Hashable, Dict[str, Any]]:
+        """Expiry information for every cached token, keyed like the cache"""
+        return {
+            key: {"expires_in": cached.expires_in()}
+            for key, cached in self._tokens.items()
+        }
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Mark a background refresh error as retrieved; the next caller retries."""
+    if not task.cancelled():
+        task.exception()
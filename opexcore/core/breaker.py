@@ -0,0 +1,227 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Tuple,
+)
+from aiohttp import ClientConnectionError, ClientError, ClientResponseError
+from .session import SessionPool
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ClientError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"circuit open for {host}, retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "outcomes", "opened_at", "probes")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    A host's circuit opens after ``failure_threshold`` consecutive failures, or
+    when at least ``error_rate`` of the requests in the last ``window`` seconds
+    failed (once ``min_requests`` were made). While open, requests to the host
+    fail immediately with ``CircuitOpenError``. After ``reset_timeout`` seconds
+    up to ``half_open_probes`` requests are let through: a success closes the
+    circuit, a failure opens it again.
+
+    Connection errors, timeouts and 5xx responses count as failures; other
+    responses, including 4xx, count as successes.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        error_rate: float = 0.5,
+        min_requests: int = 20,
+        window: float = 60,
+        reset_timeout: float = 30,
+        half_open_probes: int = 1,
+    ):
+        """
+        Create a circuit breaker.
+
+        :param failure_threshold: Consecutive failures that open the circuit
+        :param error_rate: Failure ratio within ``window`` that opens the circuit
+        :param min_requests: Requests within ``window`` needed before the error
+            rate is considered
+        :param window: Length of the error rate window in seconds
+        :param reset_timeout: Seconds an open circuit waits before probing
+        :param half_open_probes: Requests allowed through at once while probing
+        """
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._circuits: Dict[str, _Circuit] = {}
+
+    @staticmethod
+    def is_failure(error: BaseException) -> bool:
+        """Whether ``error`` means the host is unhealthy"""
+        if isinstance(error, ClientResponseError):
+            return error.status >= 500
+        return isinstance(error, (ClientConnectionError, asyncio.TimeoutError))
+
+    def _circuit(self, host: str) -> _Circuit:
+        origin = SessionPool._origin(host)
+        circuit = self._circuits.get(origin)
+        if circuit is None:
+            circuit = self._circuits[origin] = _Circuit()
+        return circuit
+
+    def _retry_in(self, circuit: _Circuit) -> float:
+        return max(0.0, circuit.opened_at + self.reset_timeout - time.monotonic())
+
+    def _trim(self, circuit: _Circuit, now: float) -> None:
+        while circuit.outcomes and circuit.outcomes[0][0] < now - self.window:
+            circuit.outcomes.popleft()
+
+    def state(self, host: str) -> str:
+        """
+        Return the state of a host's circuit.
+
+        :param host: Host URL
+        :return: ``"closed"``, ``"open"`` or ``"half_open"``
+        """
+        circuit = self._circuits.get(SessionPool._origin(host))
+        if circuit is None:
+            return CLOSED
+        if circuit.state == OPEN and self._retry_in(circuit) == 0:
+            return HALF_OPEN
+        return circuit.state
+
+    def is_available(self, host: str) -> bool:
+        """Whether requests to ``host`` are currently let through"""
+        return self.state(host) != OPEN
+
+    def _acquire(self, host: str) -> _Circuit:
+        circuit = self._circuit(host)
+        if circuit.state == OPEN:
+            retry_in = self._retry_in(circuit)
+            if retry_in > 0:
+                raise CircuitOpenError(SessionPool._origin(host), retry_in)
+            circuit.state = HALF_OPEN
+        if circuit.state == HALF_OPEN:
+            if circuit.probes >= self.half_open_probes:
+                raise CircuitOpenError(SessionPool._origin(host), 0.0)
+            circuit.probes += 1
+        return circuit
+
+    def _record(self, circuit: _Circuit, probe: bool, ok: bool) -> None:
+        now = time.monotonic()
+        if probe:
+            circuit.probes -= 1
+        circuit.outcomes.append((now, ok))
+        self._trim(circuit, now)
+        if ok:
+            circuit.failures = 0
+            if circuit.state == HALF_OPEN:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+            return
+
+        circuit.failures += 1
+        if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+            self._open(circuit, now)
+            return
+        if len(circuit.outcomes) >= self.min_requests:
+            failed = sum(1 for _, outcome in circuit.outcomes if not outcome)
+            if failed / len(circuit.outcomes) >= self.error_rate:
+                self._open(circuit, now)
+
+    @staticmethod
+    def _open(circuit: _Circuit, now: float) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.outcomes.clear()
+
+    @asynccontextmanager
+    async def track(self, host: str) -> AsyncIterator[None]:
+        """
+        Count the outcome of the block as one request to ``host``.
+
+        Use it for requests whose body is streamed, so that failures while
+        reading count as well.
+
+        :param host: Request URL or host URL
+        :raises CircuitOpenError: If the circuit is open
+        """
+        circuit = self._acquire(host)
+        probe = circuit.state == HALF_OPEN
+        try:
+            yield
+        except (asyncio.CancelledError, GeneratorExit):
+            if probe:
+                circuit.probes -= 1
+            raise
+        except Exception as error:
+            self._record(circuit, probe, not self.is_failure(error))
+            raise
+        self._record(circuit, probe, True)
+
+    async def call(self, host: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run one request through the circuit of ``host``.
+
+        :param host: Request URL or host URL
+        :param send: Coroutine function performing the request
+        :return: Result of ``send``
+        :raises CircuitOpenError: If the circuit is open
+        """
+        async with self.track(host):
+            return await send()
+
+    def reset(self, host: Optional[str] = None) -> None:
+        """
+        Close the circuit of ``host``, or of every host.
+
+        :param host: Host URL, None for all hosts
+        """
+        if host is None:
+            self._circuits.clear()
+        else:
+            self._circuits.pop(SessionPool._origin(host), None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """State of every known circuit, keyed by ``scheme://host:port``"""
+        now = time.monotonic()
+        result = {}
+        for origin, circuit in self._circuits.items():
+            self._trim(circuit, now)
+            failed = sum(1 for _, ok in circuit.outcomes if not ok)
+            total = len(circuit.outcomes)
+            result[origin] = {
+                "state": self.state(origin),
+                "consecutive_failures": circuit.failures,
+                "error_rate": failed / total if total else 0.0,
+                "retry_in": self._retry_in(circuit) if circuit.state == OPEN else 0.0,
+            }
+        return result
@@ -0,0 +1,268 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Optional, Dict, Any, Callable, Hashable, Iterable, Tuple
+from .context import current_context
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ("value", "fresh_until", "stale_until", "tags")
+
+    def __init__(
+        self, value: Any, fresh_until: float, stale_until: float, tags: frozenset
+    ):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.tags = tags
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache for read-mostly endpoints.
+
+    Only endpoints decorated with ``cached`` use it, and only while a cache is
+    installed, either globally with ``ResponseCache.install`` or per client.
+    A fresh entry is returned as is. A stale entry is returned while one
+    background call refreshes it (stale-while-revalidate). Endpoints decorated
+    with ``invalidates`` drop the entries they affect on the same host.
+
+    Cached responses are not copied: every caller receives the same model,
+    list or dict, so results of cached endpoints must not be mutated; copy
+    them first (e.g. ``model_copy(deep=True)``) to modify them.
+    """
+
+    _default: Optional["ResponseCache"] = None
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Create a response cache.
+
+        :param maxsize: Maximum number of cached responses
+        :param ttls: Per-endpoint freshness overrides in seconds, keyed by
+            ``"Manager.method"``; 0 disables caching for that endpoint
+        :param stale_ttls: Per-endpoint overrides of how long a stale response
+            may still be served while it is refreshed
+        """
+        self.maxsize = maxsize
+        self.ttls = dict(ttls or {})
+        self.stale_ttls = dict(stale_ttls or {})
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._generations: Dict[Tuple[str, str], int] = {}
+
+    @classmethod
+    def install(cls, cache: Optional["ResponseCache"]) -> None:
+        """
+        Set the cache used by calls that do not run on a client with its own.
+
+        :param cache: Cache to install, None to disable global caching
+        """
+        ResponseCache._default = cache
+
+    @classmethod
+    def active(cls) -> Optional["ResponseCache"]:
+        """Return the cache for the current call, if caching is enabled"""
+        context = current_context()
+        if context is not None and context.cache is not None:
+            return context.cache
+        return ResponseCache._default
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        self._entries.clear()
+
+    def invalidate(self, host: str, tags: Iterable[str]) -> int:
+        """
+        Drop the cached responses of ``host`` carrying any of ``tags``.
+
+        :param host: API host URL
+        :param tags: Tags to invalidate
+        :return: Number of entries dropped
+        """
+        host = host.rstrip("/")
+        tags = frozenset(tags)
+        for tag in tags:
+            key = (host, tag)
+            self._generations[key] = self._generations.get(key, 0) + 1
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if key[1] == host and entry.tags & tags
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def _generation(self, host: str, tags: frozenset) -> Tuple[int, ...]:
+        return tuple(self._generations.get((host, tag), 0) for tag in sorted(tags))
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(
+        self,
+        key: Hashable,
+        host: str,
+        tags: frozenset,
+        ttl: float,
+        stale_ttl: float,
+        call: Callable[[], Any],
+        background: bool = False,
+    ) -> asyncio.Future:
+        future = self._inflight.get(key)
+        if future is not None:
+            return future
+
+        generation = self._generation(host, tags)
+
+        async def run() -> Any:
+            try:
+                value = await call()
+            finally:
+                self._inflight.pop(key, None)
+            if self._generation(host, tags) == generation:
+                now = time.monotonic()
+                self._store(key, _Entry(value, now + ttl, now + ttl + stale_ttl, tags))
+            return value
+
+        future = asyncio.ensure_future(run())
+        if background:
+            # Nobody awaits a background refresh, so its failure is logged
+            future.add_done_callback(_log_refresh_error)
+        self._inflight[key] = future
+        return future
+
+    async def get_or_load(
+        self,
+        endpoint: str,
+        host: str,
+        key: Hashable,
+        tags: frozenset,
+        ttl: float,
+        stale_ttl: float,
+        call: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the cached response for ``key`` or load it with ``call``.
+
+        Concurrent misses for the same key share one call.
+
+        :param endpoint: Endpoint name used for TTL overrides
+        :param host: API host URL
+        :param key: Cache key
+        :param tags: Tags used for invalidation
+        :param ttl: Default freshness in seconds
+        :param stale_ttl: Default stale-while-revalidate window in seconds
+        :param call: Coroutine function performing the request
+        :return: Response, shared with every other caller of the same key
+        """
+        ttl = self.ttls.get(endpoint, ttl)
+        stale_ttl = self.stale_ttls.get(endpoint, stale_ttl)
+        if ttl <= 0:
+            return await call()
+
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if now < entry.fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._load(key, host, tags, ttl, stale_ttl, call, background=True)
+                return entry.value
+
+        self.misses += 1
+        return await asyncio.shield(self._load(key, host, tags, ttl, stale_ttl, call))
+
+
+def _log_refresh_error(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Background cache refresh failed: %r", future.exception())
+
+
+def cached(ttl: float, stale_ttl: float = 0, tags: Iterable[str] = ()) -> Callable:
+    """
+    Mark a manager endpoint as cacheable.
+
+    The endpoint is only cached while a ``ResponseCache`` is active. The cache
+    key covers the host and every argument except ``timeout``. Callers share
+    the cached response object, so it must not be mutated.
+
+    :param ttl: Seconds a response stays fresh
+    :param stale_ttl: Seconds a stale response may still be served while it is
+        refreshed in the background
+    :param tags: Tags that ``invalidates`` uses to drop the response
+    """
+    tags = frozenset(tags)
+
+    def decorator(func: Callable) -> Callable:
+        endpoint = func.__qualname__
+
+        @wraps(func)
+        async def wrapper(cls, host: str, *args: Any, **kwargs: Any) -> Any:
+            cache = ResponseCache.active()
+            if cache is None:
+                return await func(cls, host, *args, **kwargs)
+            key_kwargs = sorted(
+                (name, value) for name, value in kwargs.items() if name != "timeout"
+            )
+            key = (endpoint, host.rstrip("/"), repr(args), repr(key_kwargs))
+            return await cache.get_or_load(
+                endpoint,
+                host.rstrip("/"),
+                key,
+                tags,
+                ttl,
+                stale_ttl,
+                lambda: func(cls, host, *args, **kwargs),
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*tags: str) -> Callable:
+    """
+    Mark a manager endpoint as changing the data cached under ``tags``.
+
+    After the endpoint succeeds, cached responses with those tags for the same
+    host are dropped from the active cache.
+
+    :param tags: Tags to invalidate
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(cls, host: str, *args: Any, **kwargs: Any) -> Any:
+            result = await func(cls, host, *args, **kwargs)
+            cache = ResponseCache.active()
+            if cache is not None:
+                cache.invalidate(host, tags)
+            return result
+
+        return wrapper
+
+    return decorator
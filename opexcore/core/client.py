@@ -0,0 +1,315 @@
+import inspect
+from functools import wraps
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Callable,
+    FrozenSet,
+    Tuple,
+    Type,
+)
+from aiohttp import ClientResponseError
+from .request import RequestBase
+from .session import SessionPool
+from .context import ClientContext, _current_context
+from .auth import TokenManager
+from .cache import ResponseCache
+from .retry import RetryPolicy
+from .breaker import CircuitBreaker
+from .ratelimit import RateLimiter
+from .compression import Compression
+from .instrumentation import Instrumentation
+
+
+class PanelClient:
+    """
+    Panel API client bound to one host and one set of credentials.
+
+    Every public classmethod of ``manager`` is available on the client with
+    ``host``, ``token`` and ``timeout`` filled in, so
+    ``await client.get_user("alice")`` calls
+    ``manager.get_user(client.host, client.token, "alice", timeout=client.timeout)``.
+    Calls run on the client's own session pool.
+
+    Tokens come from a ``TokenManager``: the client logs in on first use,
+    refreshes ahead of the JWT expiry, and on a 401 refreshes once and retries.
+    Iterators (``iter_*``, ``stream_*``) retry only when the first page is
+    rejected, since restarting later would repeat the items already yielded.
+    """
+
+    manager: Type[RequestBase] = RequestBase
+    public_methods: FrozenSet[str] = frozenset()
+    """Endpoints whose ``token`` argument is not the admin token"""
+
+    def __init__(
+        self,
+        host: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+        timeout: int = 10,
+        pool: Optional[SessionPool] = None,
+        tokens: Optional[TokenManager] = None,
+        cache: Optional[ResponseCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[RateLimiter] = None,
+        compression: Optional[Compression] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        **pool_settings: Any,
+    ):
+        """
+        Create a panel client.
+
+        :param host: API host URL
+        :param username: Admin username, used to log in when no token is given
+        :param password: Admin password
+        :param token: Authentication token, skips the login when given
+        :param timeout: Default request timeout in seconds
+        :param pool: Session pool to use, a private one is created when omitted
+        :param tokens: Token cache to use, may be shared between clients
+        :param cache: Response cache for cacheable endpoints, enables caching
+        :param retry: Retry policy for failed requests, enables retries
+        :param breaker: Circuit breaker, may be shared between clients
+        :param limiter: Rate limiter, share it between clients of the same host
+        :param compression: Response and request body compression, enables
+            transfer statistics
+        :param instrumentation: Sends per-request timings of this client to
+            its sinks
+        :param pool_settings: Keyword arguments forwarded to ``SessionPool``
+        """
+        self.host = host.rstrip("/")
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self._owns_pool = pool is None
+        self.pool = pool or SessionPool(**pool_settings)
+        self.context = ClientContext(
+            pool=self.pool,
+            cache=cache,
+            retry=retry,
+            breaker=breaker,
+            limiter=limiter,
+            compression=compression,
+            instrumentation=instrumentation,
+        )
+        self.tokens = tokens or TokenManager()
+        self._token_key = (type(self).__name__, self.host, username)
+        self.token = token
+        if token is not None:
+            self.tokens.set(self._token_key, token)
+
+    @property
+    def token(self) -> Optional[str]:
+        """Current authentication token"""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        self._token = value
+        self.headers = self.manager._generate_headers(value)
+
+    def url(self, path: str) -> str:
+        """
+        Build an absolute URL on this client's host.
+
+        :param path: Path relative to the host, e.g. ``/api/users``
+        :return: Absolute URL
+        """
+        return f"{self.host}/{path.lstrip('/')}"
+
+    async def _authenticate(self) -> str:
+        """Log in with the configured credentials and return a fresh token."""
+        raise NotImplementedError(f"{type(self).__name__} does not support logging in")
+
+    async def _login(self) -> str:
+        if self.username is None or self.password is None:
+            raise ValueError(
+                f"{type(self).__name__} needs a token or a username and password"
+            )
+        token_context = _current_context.set(self.context)
+        try:
+            return await self._authenticate()
+        finally:
+            _current_context.reset(token_context)
+
+    async def login(self) -> str:
+        """
+        Log in with the configured credentials and store the token.
+
+        :return: Authentication token
+        """
+        self.token = await self.tokens.get(self._token_key, self._login, force=True)
+        return self.token
+
+    async def ensure_token(self) -> str:
+        """
+        Return a valid token, logging in or refreshing it when needed.
+
+        :return: Authentication token
+        """
+        token = await self.tokens.get(self._token_key, self._login)
+        if token != self._token:
+            self.token = token
+        return token
+
+    async def _with_token(self, call: Callable[[str], Any]) -> Any:
+        """Run ``call(token)``, refreshing the token and retrying once on a 401."""
+        token = await self.ensure_token()
+        try:
+            return await call(token)
+        except ClientResponseError as error:
+            if error.status != 401 or self.password is None:
+                raise
+        self.tokens.invalidate(self._token_key, token)
+        return await call(await self.ensure_token())
+
+    @classmethod
+    def _signature(cls, name: str) -> Tuple[bool, bool]:
+        """Return whether endpoint ``name`` takes the admin token and a timeout."""
+        cache = cls.__dict__.get("_signatures")
+        if cache is None:
+            cache = {}
+            setattr(cls, "_signatures", cache)
+        if name not in cache:
+            parameters = list(inspect.signature(getattr(cls.manager, name)).parameters)
+            takes_token = (
+                name not in cls.public_methods
+                and len(parameters) > 1
+                and parameters[1] == "token"
+            )
+            cache[name] = (takes_token, "timeout" in parameters)
+        return cache[name]
+
+    def _bind(self, name: str, method: Callable) -> Callable:
+        takes_token, takes_timeout = self._signature(name)
+
+        if inspect.isasyncgenfunction(method):
+
+            @wraps(method)
+            async def iterate(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                if takes_timeout:
+                    kwargs.setdefault("timeout", self.timeout)
+                token = await self.ensure_token() if takes_token else None
+
+                def start() -> AsyncIterator[Any]:
+                    if takes_token:
+                        return method(self.host, token, *args, **kwargs)
+                    return method(self.host, *args, **kwargs)
+
+                iterator = start()
+                started = False
+                try:
+                    while True:
+                        token_context = _current_context.set(self.context)
+                        try:
+                            item = await iterator.__anext__()
+                        except StopAsyncIteration:
+                            return
+                        except ClientResponseError as error:
+                            # Only the first page can be retried: restarting
+                            # later would yield the items seen so far again
+                            if (
+                                started
+                                or not takes_token
+                                or error.status != 401
+                                or self.password is None
+                            ):
+                                raise
+                            self.tokens.invalidate(self._token_key, token)
+                            token = await self.ensure_token()
+                            await iterator.aclose()
+                            iterator = start()
+                            started = True
+                            continue
+                        finally:
+                            _current_context.reset(token_context)
+                        started = True
+                        yield item
+                finally:
+                    await iterator.aclose()
+
+            return iterate
+
+        @wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            if takes_timeout:
+                kwargs.setdefault("timeout", self.timeout)
+            token_context = _current_context.set(self.context)
+            try:
+                if takes_token:
+                    return await self._with_token(
+                        lambda token: method(self.host, token, *args, **kwargs)
+                    )
+                return await method(self.host, *args, **kwargs)
+            finally:
+                _current_context.reset(token_context)
+
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self.manager, name, None)
+        if method is None or not (
+            inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method)
+        ):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        bound = self._bind(name, method)
+        setattr(self, name, bound)
+        return bound
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[int] = None,
+        response_type: str = "json",
+    ) -> Any:
+        """
+        Perform an authenticated request against a path on this client's host.
+
+        :param method: HTTP method (GET, POST, etc.)
+        :param path: Path relative to the host, e.g. ``/api/users``
+        :param params: Query parameters
+        :param data: Request body data
+        :param timeout: Request timeout in seconds, defaults to the client's
+        :param response_type: ``"json"``, ``"text"`` or ``"bytes"``
+        :return: Parsed JSON response, or the body as text or bytes
+        """
+        token_context = _current_context.set(self.context)
+        try:
+            return await self._with_token(
+                lambda token: self.manager.fetch(
+                    method=method,
+                    url=self.url(path),
+                    params=params,
+                    data=data,
+                    headers=(
+                        self.headers
+                        if token == self._token
+                        else self.manager._generate_headers(token)
+                    ),
+                    timeout=timeout or self.timeout,
+                    response_type=response_type,
+                )
+            )
+        finally:
+            _current_context.reset(token_context)
+
+    async def close(self) -> None:
+        """Close the client's session pool if the client created it."""
+        if self._owns_pool:
+            await self.pool.close()
+
+    async def __aenter__(self) -> "PanelClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,111 @@
+import json
+from functools import lru_cache
+from typing import Optional, Any
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+class JsonCodec:
+    """Standard library JSON encoding and decoding"""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as JSON.
+
+        :param value: JSON-compatible value
+        :return: UTF-8 encoded JSON
+        """
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, body: bytes) -> Any:
+        """
+        Decode a JSON document.
+
+        :param body: UTF-8 encoded JSON
+        :return: Decoded value
+        """
+        return json.loads(body)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by ``orjson``"""
+
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, body: bytes) -> Any:
+        return orjson.loads(body)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by ``msgspec``"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def loads(self, body: bytes) -> Any:
+        return self._decoder.decode(body)
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Return a JSON codec by name, or the fastest one installed.
+
+    :param name: ``"orjson"``, ``"msgspec"`` or ``"json"``; None picks orjson,
+        then msgspec, then the standard library
+    :return: JSON codec
+    """
+    if name is None:
+        name = "orjson" if orjson else "msgspec" if msgspec else "json"
+    if name == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        return OrjsonCodec()
+    if name == "msgspec":
+        if msgspec is None:
+            raise ImportError("msgspec is not installed")
+        return MsgspecCodec()
+    if name == "json":
+        return JsonCodec()
+    raise ValueError(f"unknown JSON codec: {name}")
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def decode_model(body: bytes, model: Any) -> Any:
+    """
+    Validate a JSON document straight into ``model``.
+
+    Parsing happens in pydantic-core without building intermediate Python
+    dicts. ``model`` may be a model class or any type pydantic accepts, such
+    as ``List[Model]``.
+
+    :param body: UTF-8 encoded JSON
+    :param model: Target type
+    :return: Validated value
+    """
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model.model_validate_json(body)
+    return _adapter(model).validate_json(body)
@@ -0,0 +1,229 @@
+import gzip
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, List, Any, Iterator, Mapping, Sequence, Tuple
+from urllib.parse import urlencode
+from .session import SessionPool
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+_transfers: ContextVar[Optional[List["Transfer"]]] = ContextVar(
+    "opexcore_transfers", default=None
+)
+
+
+class Transfer:
+    """Byte counts of one request, before and after compression"""
+
+    __slots__ = (
+        "method",
+        "url",
+        "sent",
+        "sent_wire",
+        "received",
+        "received_wire",
+        "encoding",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        sent: int,
+        sent_wire: int,
+        received: int,
+        received_wire: int,
+        encoding: Optional[str],
+    ):
+        self.method = method
+        self.url = url
+        self.sent = sent
+        self.sent_wire = sent_wire
+        self.received = received
+        self.received_wire = received_wire
+        self.encoding = encoding
+
+    @property
+    def ratio(self) -> float:
+        """Bytes on the wire per decoded byte, both directions together"""
+        total = self.sent + self.received
+        return (self.sent_wire + self.received_wire) / total if total else 1.0
+
+    def __repr__(self) -> str:
+        return (
+            f"Transfer({self.method} {self.url}, sent={self.sent_wire}/{self.sent}, "
+            f"received={self.received_wire}/{self.received}, "
+            f"encoding={self.encoding!r})"
+        )
+
+
+@contextmanager
+def record_transfers() -> Iterator[List[Transfer]]:
+    """
+    Collect the byte counts of every request made inside the block.
+
+    Only requests sent while compression is enabled are recorded.
+
+    :return: List filled with one ``Transfer`` per request
+    """
+    transfers: List[Transfer] = []
+    token = _transfers.set(transfers)
+    try:
+        yield transfers
+    finally:
+        _transfers.reset(token)
+
+
+class _TransferStats:
+    __slots__ = ("requests", "sent", "sent_wire", "received", "received_wire")
+
+    def __init__(self):
+        self.requests = 0
+        self.sent = 0
+        self.sent_wire = 0
+        self.received = 0
+        self.received_wire = 0
+
+    def add(self, transfer: Transfer) -> None:
+        self.requests += 1
+        self.sent += transfer.sent
+        self.sent_wire += transfer.sent_wire
+        self.received += transfer.received
+        self.received_wire += transfer.received_wire
+
+
+class Compression:
+    """
+    Negotiated response compression and compressed request bodies.
+
+    Responses are requested with every encoding that can be decoded here
+    (``br`` only when the ``brotli`` package is installed) and decoded by
+    the client, so the bytes that crossed the wire can be counted. Request
+    bodies are gzip-compressed from ``request_threshold`` bytes on; leave it
+    unset for panels that do not accept compressed bodies.
+    """
+
+    def __init__(
+        self,
+        request_threshold: Optional[int] = None,
+        level: int = 6,
+        encodings: Optional[Sequence[str]] = None,
+    ):
+        """
+        Create a compression setting.
+
+        :param request_threshold: Smallest request body, in bytes, sent
+            gzip-compressed; None to never compress request bodies
+        :param level: gzip compression level of request bodies
+        :param encodings: Response encodings to accept, in order of
+            preference; defaults to ``br``, ``gzip`` and ``deflate``
+        """
+        if encodings is None:
+            encodings = ("br", "gzip", "deflate") if brotli else ("gzip", "deflate")
+        unsupported = [name for name in encodings if name not in _DECODERS]
+        if unsupported or ("br" in encodings and brotli is None):
+            raise ValueError(f"unsupported encodings: {list(encodings)}")
+        self.request_threshold = request_threshold
+        self.level = level
+        self.accept_encoding = ", ".join(encodings)
+        self._stats: Dict[str, _TransferStats] = {}
+
+    def compress(self, body: Any) -> Tuple[Any, Optional[str]]:
+        """
+        Compress a request body if it is large enough.
+
+        :param body: Request body; ``bytes`` and text bodies are compressed,
+            text encoded as UTF-8
+        :return: Body to send and its content encoding, None if unchanged
+        """
+        if self.request_threshold is None:
+            return body, None
+        raw = body.encode() if isinstance(body, str) else body
+        if not isinstance(raw, bytes) or len(raw) < self.request_threshold:
+            return body, None
+        return gzip.compress(raw, self.level), "gzip"
+
+    @staticmethod
+    def body_size(body: Any) -> int:
+        """
+        Size of a request body as it is encoded on the wire, before compression.
+
+        :param body: Request body: bytes, text, or a mapping sent as a form
+        :return: Size in bytes, 0 for no body and for streamed bodies
+        """
+        if isinstance(body, (bytes, bytearray)):
+            return len(body)
+        if isinstance(body, str):
+            return len(body.encode())
+        if isinstance(body, Mapping):
+            return len(urlencode(body, doseq=True).encode())
+        return 0
+
+    @staticmethod
+    def decompress(body: bytes, encoding: Optional[str]) -> bytes:
+        """
+        Decode a response body.
+
+        :param body: Body as received
+        :param encoding: Value of the ``Content-Encoding`` header
+        :return: Decoded body
+        """
+        if not encoding or encoding == "identity" or not body:
+            return body
+        decoder = _DECODERS.get(encoding)
+        if decoder is None:
+            raise ValueError(f"unsupported content encoding: {encoding}")
+        return decoder(body)
+
+    def record(self, transfer: Transfer) -> None:
+        """Add a finished request to the statistics of its host"""
+        origin = SessionPool._origin(transfer.url)
+        stats = self._stats.get(origin)
+        if stats is None:
+            stats = self._stats[origin] = _TransferStats()
+        stats.add(transfer)
+        transfers = _transfers.get()
+        if transfers is not None:
+            transfers.append(transfer)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Transfer statistics keyed by ``scheme://host:port``.
+
+        Each entry holds the number of ``requests``, the decoded and on-wire
+        bytes ``sent`` and ``received``, and the overall ``ratio`` of wire to
+        decoded bytes.
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        for origin, stats in self._stats.items():
+            total = stats.sent + stats.received
+            wire = stats.sent_wire + stats.received_wire
+            result[origin] = {
+                "requests": stats.requests,
+                "sent": stats.sent,
+                "sent_wire": stats.sent_wire,
+                "received": stats.received,
+                "received_wire": stats.received_wire,
+                "ratio": wire / total if total else 1.0,
+            }
+        return result
+
+
+def _inflate(body: bytes) -> bytes:
+    # "deflate" is zlib-wrapped by the spec, but some servers send raw deflate
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        return zlib.decompress(body, -zlib.MAX_WBITS)
+
+
+_DECODERS = {
+    "gzip": gzip.decompress,
+    "x-gzip": gzip.decompress,
+    "deflate": _inflate,
+    "br": lambda body: brotli.decompress(body),
+}
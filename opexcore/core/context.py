@@ -0,0 +1,54 @@
+from contextvars import ContextVar
+from typing import Optional, TYPE_CHECKING
+from .session import SessionPool
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .retry import RetryPolicy
+    from .breaker import CircuitBreaker
+    from .ratelimit import RateLimiter
+    from .compression import Compression
+    from .instrumentation import Instrumentation
+
+
+class ClientContext:
+    """Transport settings of a single panel client, active while it runs a call"""
+
+    def __init__(
+        self,
+        pool: Optional[SessionPool] = None,
+        cache: Optional["ResponseCache"] = None,
+        retry: Optional["RetryPolicy"] = None,
+        breaker: Optional["CircuitBreaker"] = None,
+        limiter: Optional["RateLimiter"] = None,
+        compression: Optional["Compression"] = None,
+        instrumentation: Optional["Instrumentation"] = None,
+    ):
+        """
+        Create a client context.
+
+        :param pool: Session pool used instead of the shared one
+        :param cache: Response cache used instead of the global one
+        :param retry: Retry policy used instead of the global one
+        :param breaker: Circuit breaker used instead of the global one
+        :param limiter: Rate limiter used instead of the global one
+        :param compression: Compression setting used instead of the global one
+        :param instrumentation: Instrumentation used instead of the global one
+        """
+        self.pool = pool
+        self.cache = cache
+        self.retry = retry
+        self.breaker = breaker
+        self.limiter = limiter
+        self.compression = compression
+        self.instrumentation = instrumentation
+
+
+_current_context: ContextVar[Optional[ClientContext]] = ContextVar(
+    "opexcore_client_context", default=None
+)
+
+
+def current_context() -> Optional[ClientContext]:
+    """Return the context of the client running the current call, if any"""
+    return _current_context.get()
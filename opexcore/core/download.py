@@ -0,0 +1,151 @@
+import asyncio
+import inspect
+import os
+from typing import Optional, Any, Union
+
+Target = Union[str, os.PathLike, Any]
+"""File path, or a binary file object whose ``write`` may be a coroutine"""
+
+
+class DownloadResult:
+    """Outcome of a download written to a file or file object"""
+
+    __slots__ = ("target", "size", "checksum", "resumed")
+
+    def __init__(
+        self, target: Target, size: int, checksum: Optional[str], resumed: bool
+    ):
+        self.target = target
+        self.size = size
+        self.checksum = checksum
+        self.resumed = resumed
+
+    def __repr__(self) -> str:
+        return (
+            f"DownloadResult(target={self.target!r}, size={self.size}, "
+            f"checksum={self.checksum!r}, resumed={self.resumed})"
+        )
+
+
+def _validator(headers: Any) -> Optional[str]:
+    """
+    Return the ``If-Range`` validator of a response: its strong ``ETag``,
+    else its ``Last-Modified`` date, None when it has neither.
+    """
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+class _Writer:
+    """
+    Sequential writes to a download target, restartable from scratch.
+
+    A file path is written to ``<path>.part``; the validator of the body
+    being written is kept next to it in ``<path>.part.validator``, so a
+    later call only resumes the same document.
+    """
+
+    def __init__(self, target: Target, resume: bool):
+        self.target = target
+        self.resume = resume
+        self.path: Optional[str] = None
+        self.file: Any = target
+        self.validator: Optional[str] = None
+        if isinstance(target, (str, os.PathLike)):
+            self.path = os.fspath(target)
+            self.part = self.path + ".part"
+            self.validator_path = self.part + ".validator"
+
+    async def open(self, hasher: Any) -> int:
+        """Prepare the target and return the bytes already written"""
+        if self.path is None:
+            return 0
+        if self.resume and os.path.exists(self.part):
+            self.validator = await asyncio.to_thread(_read_text, self.validator_path)
+            if self.validator is not None:
+                if hasher is not None:
+                    await asyncio.to_thread(_hash_file, self.part, hasher)
+                self.file = await asyncio.to_thread(open, self.part, "ab")
+                return self.file.tell()
+        self.file = await asyncio.to_thread(open, self.part, "wb")
+        return 0
+
+    async def remember(self, value: Optional[str]) -> None:
+        """Record the validator of the body being written"""
+        if value == self.validator:
+            return
+        self.validator = value
+        if self.path is not None:
+            await asyncio.to_thread(_write_text, self.validator_path, value)
+
+    async def write(self, chunk: bytes) -> None:
+        if self.path is not None:
+            await asyncio.to_thread(self.file.write, chunk)
+            return
+        result = self.file.write(chunk)
+        if inspect.isawaitable(result):
+            await result
+        drain = getattr(self.file, "drain", None)
+        if drain is not None:
+            await drain()
+
+    async def restart(self) -> None:
+        """Drop everything written so far"""
+        seekable = getattr(self.file, "seekable", None)
+        if seekable is None or not seekable():
+            raise ValueError("server ignored the range request and target cannot seek")
+        await _maybe_await(self.file.seek(0))
+        await _maybe_await(self.file.truncate())
+        await self.remember(None)
+
+    async def finish(self) -> None:
+        if self.path is not None:
+            await asyncio.to_thread(self.file.close)
+            await asyncio.to_thread(os.replace, self.part, self.path)
+            await asyncio.to_thread(_write_text, self.validator_path, None)
+
+    async def abort(self, discard: bool) -> None:
+        """Close the target, keeping the partial file for a later resume unless ``discard``"""
+        if self.path is None or self.file is self.target:
+            return
+        await asyncio.to_thread(self.file.close)
+        if discard:
+            await asyncio.to_thread(os.remove, self.part)
+            await asyncio.to_thread(_write_text, self.validator_path, None)
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path) as file:
+            return file.read() or None
+    except FileNotFoundError:
+        return None
+
+
+def _write_text(path: str, value: Optional[str]) -> None:
+    """Write ``value`` to ``path``, or remove the file when it is None"""
+    if value is None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return
+    with open(path, "w") as file:
+        file.write(value)
+
+
+def _hash_file(path: str, hasher: Any, block: int = 1024 * 1024) -> None:
+    with open(path, "rb") as file:
+        while True:
+            data = file.read(block)
+            if not data:
+                return
+            hasher.update(data)
+
+
+async def _maybe_await(result: Any) -> Any:
+    if inspect.isawaitable(result):
+        return await result
+    return result
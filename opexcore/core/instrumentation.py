@@ -0,0 +1,422 @@
+import bisect
+import logging
+import re
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import Optional, Dict, List, Any, Callable, Iterator, Sequence, Tuple
+from aiohttp import ClientResponseError, TraceConfig
+from yarl import URL
+
+_current_event: ContextVar[Optional["RequestEvent"]] = ContextVar(
+    "opexcore_request_event", default=None
+)
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|[A-Za-z0-9_-]{32,})$")
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Latency bucket bounds in seconds"""
+
+
+def endpoint_path(url: str) -> str:
+    """
+    Path of ``url`` with numeric IDs, UUIDs and tokens replaced by ``{id}``.
+
+    :param url: Request URL
+    :return: Path usable as a low-cardinality endpoint label
+    """
+    segments = URL(url).path.split("/")
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in segments
+    )
+
+
+class RequestEvent:
+    """
+    Timings and sizes of one request, retries included.
+
+    Times are in seconds; ``dns`` and ``connect`` stay None when a pooled
+    connection was reused, and ``connect`` includes the TLS handshake.
+    ``attempts`` is 0 for requests that shared another request's response.
+    """
+
+    __slots__ = (
+        "panel",
+        "operation",
+        "method",
+        "url",
+        "status",
+        "error",
+        "attempts",
+        "dns",
+        "connect",
+        "ttfb",
+        "total",
+        "decode",
+        "sent",
+        "received",
+        "started",
+        "_attempt_started",
+        "_dns_started",
+        "_connect_started",
+    )
+
+    def __init__(self, panel: str, operation: Optional[str], method: str, url: str):
+        self.panel = panel
+        self.operation = operation
+        self.method = method
+        self.url = url
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.attempts = 0
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.total = 0.0
+        self.decode = 0.0
+        self.sent = 0
+        self.received = 0
+        self.started = time.perf_counter()
+        self._attempt_started = self.started
+        self._dns_started = 0.0
+        self._connect_started = 0.0
+
+    @property
+    def endpoint(self) -> str:
+        """Manager method that sent the request, or its templated path"""
+        return self.operation or f"{self.method} {endpoint_path(self.url)}"
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.panel} {self.endpoint}, status={self.status}, "
+            f"attempts={self.attempts}, total={self.total:.4f})"
+        )
+
+
+class ParseEvent:
+    """Time spent building response models outside the transport"""
+
+    __slots__ = ("panel", "model", "items", "seconds")
+
+    def __init__(self, panel: str, model: str, items: int, seconds: float):
+        self.panel = panel
+        self.model = model
+        self.items = items
+        self.seconds = seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"ParseEvent({self.panel} {self.model}, items={self.items}, "
+            f"seconds={self.seconds:.4f})"
+        )
+
+
+Sink = Callable[[Any], Any]
+"""Callable receiving every ``RequestEvent`` and ``ParseEvent``"""
+
+
+def _event(context: SimpleNamespace) -> Optional[RequestEvent]:
+    return context.trace_request_ctx
+
+
+async def _on_request_start(session, context, params) -> None:
+    event = _event(context)
+    if event is not None:
+        event.attempts += 1
+        event._attempt_started = time.perf_counter()
+
+
+async def _on_request_end(session, context, params) -> None:
+    event = _event(context)
+    if event is not None:
+        event.ttfb = time.perf_counter() - event._attempt_started
+        event.status = params.response.status
+
+
+async def _on_dns_start(session, context, params) -> None:
+    event = _event(context)
+    if event is not None:
+        event._dns_started = time.perf_counter()
+
+
+async def _on_dns_end(session, context, params) -> None:
+    event = _event(context)
+    if event is not None:
+        event.dns = (event.dns or 0.0) + time.perf_counter() - event._dns_started
+
+
+async def _on_connect_start(session, context, params) -> None:
+    event = _event(context)
+    if event is not None:
+        event._connect_started = time.perf_counter()
+
+
+async def _on_connect_end(session, context, params) -> None:
+    event = _event(context)
+    if event is not None:
+        elapsed = time.perf_counter() - event._connect_started
+        event.connect = (event.connect or 0.0) + elapsed
+
+
+async def _on_chunk_sent(session, context, params) -> None:
+    event = _event(context)
+    if event is not None:
+        event.sent += len(params.chunk)
+
+
+async def _on_chunk_received(session, context, params) -> None:
+    event = _event(context)
+    if event is not None:
+        event.received += len(params.chunk)
+
+
+def _trace_config() -> TraceConfig:
+    config = TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_request_end.append(_on_request_end)
+    config.on_dns_resolvehost_start.append(_on_dns_start)
+    config.on_dns_resolvehost_end.append(_on_dns_end)
+    config.on_connection_create_start.append(_on_connect_start)
+    config.on_connection_create_end.append(_on_connect_end)
+    config.on_request_chunk_sent.append(_on_chunk_sent)
+    config.on_response_chunk_received.append(_on_chunk_received)
+    config.freeze()
+    return config
+
+
+TRACE_CONFIG = _trace_config()
+"""aiohttp trace config filling the ``RequestEvent`` passed as request context"""
+
+
+def current_event() -> Optional[RequestEvent]:
+    """Return the event of the request being sent, if instrumented"""
+    return _current_event.get()
+
+
+def _operation() -> Optional[str]:
+    """Name of the panel manager method further up the call stack"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("opexcore.") and not module.startswith("opexcore.core"):
+            return frame.f_code.co_name
+        frame = frame.f_back
+    return None
+
+
+class Instrumentation:
+    """
+    Per-request events sent to pluggable sinks.
+
+    Sinks are callables receiving a ``RequestEvent`` after every request and
+    a ``ParseEvent`` whenever a manager builds response models. Nothing is
+    measured unless instrumentation is enabled on ``RequestBase`` or a client.
+    """
+
+    def __init__(self, *sinks: Sink):
+        """
+        Create an instrumentation.
+
+        :param sinks: Callables receiving the events, e.g. a function,
+            ``LoggingSink`` or ``HistogramSink``
+        """
+        self.sinks: List[Sink] = list(sinks)
+
+    def emit(self, event: Any) -> None:
+        """Pass an event to every sink; a failing sink is logged and skipped"""
+        for sink in self.sinks:
+            try:
+                sink(event)
+            except Exception:
+                logging.getLogger(__name__).exception("instrumentation sink failed")
+
+    @contextmanager
+    def observe(self, panel: str, method: str, url: str) -> Iterator[RequestEvent]:
+        """
+        Measure the request sent inside the block and emit its event.
+
+        :param panel: Name of the panel manager
+        :param method: HTTP method
+        :param url: Request URL
+        :return: Event filled while the request runs
+        """
+        event = RequestEvent(panel, _operation(), method, url)
+        token = _current_event.set(event)
+        try:
+            yield event
+        except Exception as error:
+            event.error = error
+            if isinstance(error, ClientResponseError):
+                event.status = error.status
+            raise
+        finally:
+            _current_event.reset(token)
+            event.total = time.perf_counter() - event.started
+            self.emit(event)
+
+    def parsed(self, panel: str, model: Any, items: int, seconds: float) -> None:
+        """Emit a ``ParseEvent``"""
+        name = getattr(model, "__name__", None) or repr(model)
+        self.emit(ParseEvent(panel, name, items, seconds))
+
+
+class LoggingSink:
+    """Log every event on a standard library logger"""
+
+    def __init__(
+        self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG
+    ):
+        """
+        :param logger: Logger to use, ``opexcore.requests`` by default
+        :param level: Level of request and parse events; failed requests are
+            logged as warnings
+        """
+        self.logger = logger or logging.getLogger("opexcore.requests")
+        self.level = level
+
+    def __call__(self, event: Any) -> None:
+        if isinstance(event, RequestEvent):
+            level = logging.WARNING if event.error is not None else self.level
+            if not self.logger.isEnabledFor(level):
+                return
+            self.logger.log(
+                level,
+                "%s %s %s status=%s attempts=%d dns=%s connect=%s ttfb=%s "
+                "total=%.4f decode=%.4f sent=%d received=%d",
+                event.panel,
+                event.endpoint,
+                event.url,
+                event.status,
+                event.attempts,
+                _seconds(event.dns),
+                _seconds(event.connect),
+                _seconds(event.ttfb),
+                event.total,
+                event.decode,
+                event.sent,
+                event.received,
+            )
+        elif self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level,
+                "%s parsed %d %s in %.4f",
+                event.panel,
+                event.items,
+                event.model,
+                event.seconds,
+            )
+
+
+def _seconds(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.4f}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values"""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by interpolating inside its bucket.
+
+        :param q: Quantile between 0 and 1
+        :return: Estimated value, 0 when nothing was observed
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                if index == len(self.bounds):
+                    return lower
+                return lower + (self.bounds[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+
+class HistogramSink:
+    """Latency histograms per panel and endpoint, kept in memory"""
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        :param bounds: Upper bounds of the latency buckets in seconds
+        """
+        self.bounds = tuple(bounds)
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._parsing: Dict[Tuple[str, str], Histogram] = {}
+
+    def __call__(self, event: Any) -> None:
+        if isinstance(event, RequestEvent):
+            key = (event.panel, event.endpoint)
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram(self.bounds)
+            histogram.observe(event.total)
+            if event.error is not None:
+                self._errors[key] = self._errors.get(key, 0) + 1
+        else:
+            key = (event.panel, event.model)
+            histogram = self._parsing.get(key)
+            if histogram is None:
+                histogram = self._parsing[key] = Histogram(self.bounds)
+            histogram.observe(event.seconds)
+
+    @staticmethod
+    def _summary(histogram: Histogram) -> Dict[str, Any]:
+        return {
+            "count": histogram.count,
+            "mean": histogram.sum / histogram.count,
+            "p50": histogram.quantile(0.5),
+            "p95": histogram.quantile(0.95),
+            "p99": histogram.quantile(0.99),
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Latency summaries keyed by panel, then endpoint.
+
+        Each entry holds the request ``count``, ``errors``, and the ``mean``,
+        ``p50``, ``p95`` and ``p99`` latency in seconds. Model parsing is
+        reported under ``"parse <model>"``.
+        """
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (panel, endpoint), histogram in self._latency.items():
+            summary = self._summary(histogram)
+            summary["errors"] = self._errors.get((panel, endpoint), 0)
+            result.setdefault(panel, {})[endpoint] = summary
+        for (panel, model), histogram in self._parsing.items():
+            result.setdefault(panel, {})[f"parse {model}"] = self._summary(histogram)
+        return result
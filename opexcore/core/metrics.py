@@ -0,0 +1,274 @@
+import threading
+from typing import Optional, Dict, List, Any, Callable, Sequence, Tuple
+from .session import SessionPool
+from .instrumentation import DEFAULT_BUCKETS, Histogram, ParseEvent, RequestEvent
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return _escape_help(value).replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    # HELP text escapes only backslashes and line feeds; quotes stay as is
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _definition(self) -> Tuple[Any, ...]:
+        """What a second registration under the same name must agree on"""
+        return type(self), self.labelnames
+
+    def _labels(self, labels: Dict[str, str]) -> LabelValues:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {list(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _selector(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _copy(self, values: Dict[LabelValues, Any]) -> List[Tuple[LabelValues, Any]]:
+        with self._lock:
+            return list(values.items())
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.help)}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Monotonic counter with labels"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increase the counter.
+
+        :param amount: Non-negative increment
+        :param labels: Value of every label
+        """
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._labels(labels), 0)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{self._selector(key)} {_format(value)}"
+            for key, value in sorted(self._copy(self._values))
+        ]
+
+
+class LatencyHistogram(_Metric):
+    """Histogram with labels, rendered with cumulative ``le`` buckets"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: Dict[LabelValues, Histogram] = {}
+
+    def _definition(self) -> Tuple[Any, ...]:
+        return (*super()._definition(), self.buckets)
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Record one observation.
+
+        :param value: Observed value, e.g. seconds
+        :param labels: Value of every label
+        """
+        key = self._labels(labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def histogram(self, **labels: str) -> Optional[Histogram]:
+        """Return the histogram of one label set, None if nothing was observed"""
+        return self._histograms.get(self._labels(labels))
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, histogram in sorted(self._copy(self._histograms)):
+            cumulative = 0
+            bounds = (*histogram.bounds, float("inf"))
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                selector = self._selector(key, f'le="{_format(bound)}"')
+                lines.append(f"{self.name}_bucket{selector} {cumulative}")
+            lines.append(
+                f"{self.name}_sum{self._selector(key)} {_format(histogram.sum)}"
+            )
+            lines.append(f"{self.name}_count{self._selector(key)} {histogram.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named metrics rendered together in the Prometheus text format.
+
+    Asking for a metric twice returns the same object; asking again with
+    another type, other label names or other buckets raises ``ValueError``.
+    """
+
+    def __init__(self, namespace: str = "opexcore"):
+        """
+        :param namespace: Prefix of every metric name
+        """
+        self.namespace = namespace
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> Any:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if existing._definition() != metric._definition():
+                raise ValueError(
+                    f"metric {metric.name} already registered with other "
+                    "type, labels or buckets"
+                )
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def _name(self, name: str) -> str:
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Return the counter ``<namespace>_<name>``, creating it if needed"""
+        return self._register(Counter(self._name(name), help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> LatencyHistogram:
+        """Return the histogram ``<namespace>_<name>``, creating it if needed"""
+        return self._register(
+            LatencyHistogram(self._name(name), help, labelnames, buckets)
+        )
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+class MetricsSink:
+    """
+    Instrumentation sink recording panel calls into a metrics registry.
+
+    Requests are timed in ``request_duration_seconds``, labeled by panel,
+    host and endpoint, and counted in ``requests_total`` with the status as
+    well (``error`` when no response arrived). Retries are counted in
+    ``retries_total`` and model building is timed in
+    ``parse_duration_seconds``.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        :param registry: Registry to record into, a new one when omitted
+        :param buckets: Upper bounds of the latency buckets in seconds
+        """
+        self.registry = registry or MetricsRegistry()
+        self.requests = self.registry.counter(
+            "requests_total",
+            "Panel API requests",
+            ("panel", "host", "endpoint", "status"),
+        )
+        self.duration = self.registry.histogram(
+            "request_duration_seconds",
+            "Panel API request latency, retries included",
+            ("panel", "host", "endpoint"),
+            buckets,
+        )
+        self.retries = self.registry.counter(
+            "retries_total", "Panel API request retries", ("panel", "host", "endpoint")
+        )
+        self.parsing = self.registry.histogram(
+            "parse_duration_seconds",
+            "Time spent building response models",
+            ("panel", "model"),
+            buckets,
+        )
+
+    def __call__(self, event: Any) -> None:
+        if isinstance(event, RequestEvent):
+            labels = {
+                "panel": event.panel,
+                "host": SessionPool._origin(event.url),
+                "endpoint": event.endpoint,
+            }
+            status = str(event.status) if event.status is not None else "error"
+            self.requests.inc(**labels, status=status)
+            self.duration.observe(event.total, **labels)
+            if event.retries:
+                self.retries.inc(event.retries, **labels)
+        elif isinstance(event, ParseEvent):
+            self.parsing.observe(event.seconds, panel=event.panel, model=event.model)
+
+
+def metrics_handler(registry: MetricsRegistry) -> Callable[[Any], Any]:
+    """
+    Build an aiohttp web handler serving ``registry`` for Prometheus to scrape.
+
+    :param registry: Registry to expose
+    :return: Handler for ``app.router.add_get("/metrics", handler)``
+    """
+    from aiohttp import web
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(
+            text=registry.render(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+    return handler
@@ -0,0 +1,131 @@
+import asyncio
+from typing import (
+    Optional,
+    List,
+    Tuple,
+    TypeVar,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
+
+T = TypeVar("T")
+
+
+class PaginationError(RuntimeError):
+    """Raised when the pages of a list do not add up to its reported total"""
+
+
+PageFetcher = Callable[[int, int], Awaitable[Tuple[List[T], Optional[int]]]]
+"""Fetch page ``index`` (0-based) of ``size`` items and return its items and the
+total, if known"""
+
+
+async def paginate(
+    fetch_page: PageFetcher,
+    page_size: int,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """
+    Iterate over every item of a paginated endpoint.
+
+    While the items of one page are consumed, the request for the next page is
+    already in flight, so a full scan costs roughly one round trip per page
+    instead of one round trip plus the consumer's work.
+
+    Panels may serve fewer items per page than requested; the size of the
+    first page is then used for the following requests, so no items are
+    skipped. Iteration stops at an empty page, or once ``total`` items have
+    been seen when the endpoint reports a total.
+
+    :param fetch_page: Coroutine function fetching one page by index and size
+    :param page_size: Number of items requested per page
+    :param prefetch: Request the next page before the current one is consumed
+    :return: Async iterator over the items
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    index = seen = 0
+    size = page_size
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(index, size))
+    try:
+        while pending is not None:
+            items, total = await pending
+            pending = None
+            if index == 0 and 0 < len(items) < size:
+                size = len(items)
+            seen += len(items)
+            more = bool(items) and (total is None or seen < total)
+            index += 1
+            if more and prefetch:
+                pending = asyncio.ensure_future(fetch_page(index, size))
+            for item in items:
+                yield item
+            if more and not prefetch:
+                pending = asyncio.ensure_future(fetch_page(index, size))
+    finally:
+        if pending is not None:
+            if not pending.done():
+                pending.cancel()
+            elif not pending.cancelled():
+                pending.exception()
+
+
+async def gather_pages(
+    fetch_page: PageFetcher,
+    page_size: int,
+    total: Optional[int] = None,
+    concurrency: int = 8,
+) -> List[T]:
+    """
+    Fetch every page of a paginated endpoint concurrently.
+
+    The first page is fetched on its own: it reports the total when
+    ``total`` is not given, and its length is the page size the panel really
+    serves, which may be capped below ``page_size``. The remaining pages are
+    then requested with that size, at most ``concurrency`` at a time, and
+    reassembled in page order. If any page fails, the pending ones are
+    cancelled and the error is raised.
+
+    :param fetch_page: Coroutine function fetching one page by index and size
+    :param page_size: Number of items requested per page
+    :param total: Total number of items, if already known
+    :param concurrency: Maximum number of pages fetched at once
+    :return: All items in page order
+    :raises PaginationError: If the pages do not hold exactly ``total``
+        items, e.g. because the list changed during the scan
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    first, reported = await fetch_page(0, page_size)
+    if total is None:
+        total = reported
+        if total is None:
+            raise ValueError("the endpoint did not report a total")
+    size = len(first) if 0 < len(first) < page_size else page_size
+
+    pages: List[Optional[List[T]]] = [first]
+    pages.extend([None] * (-(-total // size) - 1))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load(index: int) -> None:
+        async with semaphore:
+            items, _ = await fetch_page(index, size)
+        pages[index] = items
+
+    async with asyncio.TaskGroup() as group:
+        for index, page in enumerate(pages):
+            if page is None:
+                group.create_task(load(index))
+
+    items = [item for page in pages for item in page]
+    if len(items) != total:
+        raise PaginationError(
+            f"expected {total} items, the pages held {len(items)}; "
+            "the list changed during the scan or the panel pages inconsistently"
+        )
+    return items
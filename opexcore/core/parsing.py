@@ -0,0 +1,91 @@
+from functools import lru_cache
+from typing import (
+    Optional,
+    List,
+    Any,
+    FrozenSet,
+    Iterable,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+from pydantic import BaseModel, create_model
+
+Projection = Union[Iterable[str], Type[BaseModel]]
+"""Fields to keep from a response model, or a lighter model to parse into"""
+
+
+def parse(model: Any, data: Any) -> Any:
+    """
+    Build a response model, or a list of them, from decoded JSON.
+
+    :param model: Model class, or ``List[Model]``
+    :param data: Decoded JSON
+    :return: Model instance, or list of instances
+    """
+    if get_origin(model) is list:
+        (item,) = get_args(model)
+        return [item(**entry) for entry in data]
+    return model(**data)
+
+
+@lru_cache(maxsize=None)
+def _subset(model: Type[BaseModel], fields: FrozenSet[str]) -> Type[BaseModel]:
+    unknown = fields - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"{model.__name__} has no fields {sorted(unknown)}")
+    return create_model(
+        f"{model.__name__}Projection",
+        __config__=model.model_config,
+        __module__=model.__module__,
+        **{
+            name: (field.annotation, field)
+            for name, field in model.model_fields.items()
+            if name in fields
+        },
+    )
+
+
+def project(
+    model: Type[BaseModel], projection: Optional[Projection]
+) -> Type[BaseModel]:
+    """
+    Return the model to parse responses of ``model`` into.
+
+    A field set yields a cached model with only those fields of ``model``, so
+    everything else in the response is skipped instead of being built. A
+    model class is used as given.
+
+    :param model: Full response model
+    :param projection: Field names, a model class, or None for ``model``
+    :return: Model class
+    """
+    if projection is None:
+        return model
+    if isinstance(projection, type) and issubclass(projection, BaseModel):
+        return projection
+    return _subset(model, frozenset(projection))
+
+
+@lru_cache(maxsize=None)
+def with_items(
+    envelope: Type[BaseModel], field: str, item: Type[BaseModel]
+) -> Type[BaseModel]:
+    """
+    Derive a paginated response model whose ``field`` holds ``item`` models.
+
+    :param envelope: Paginated response model, e.g. ``MarzbanUsersResponse``
+    :param field: Name of its list field
+    :param item: Model of the list items
+    :return: Subclass of ``envelope``, or ``envelope`` itself if it already
+        holds ``item`` models
+    """
+    if envelope.model_fields[field].annotation == List[item]:
+        return envelope
+    return create_model(
+        envelope.__name__,
+        __base__=envelope,
+        __module__=envelope.__module__,
+        **{field: (List[item], envelope.model_fields[field])},
+    )
@@ -0,0 +1,191 @@
+import asyncio
+import math
+import time
+from typing import Optional, Dict, Any, Callable, Tuple
+from yarl import URL
+from .session import SessionPool
+
+READ = "read"
+WRITE = "write"
+AUTH = "auth"
+SUBSCRIPTION = "subscription"
+
+_AUTH_ENDPOINTS = frozenset({"token", "login", "register"})
+
+
+def classify_endpoint(method: str, url: str) -> str:
+    """
+    Sort a request into an endpoint class.
+
+    Subscription links (paths with a ``sub`` segment) are ``subscription``,
+    token and login endpoints are ``auth``, other GET requests are ``read``
+    and everything else is ``write``.
+
+    :param method: HTTP method
+    :param url: Request URL
+    :return: One of ``read``, ``write``, ``auth`` and ``subscription``
+    """
+    segments = [segment for segment in URL(url).path.split("/") if segment]
+    if "sub" in segments:
+        return SUBSCRIPTION
+    if segments and segments[-1] in _AUTH_ENDPOINTS:
+        return AUTH
+    if method.upper() in ("GET", "HEAD"):
+        return READ
+    return WRITE
+
+
+class TokenBucket:
+    """
+    Token bucket that queues callers in arrival order.
+
+    Waiting callers are served strictly first come, first served, so a burst
+    of requests is spread out at ``rate`` instead of racing for tokens.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Create a token bucket.
+
+        :param rate: Tokens added per second
+        :param burst: Maximum number of tokens, i.e. requests sent back to back
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting behind earlier callers if the bucket is empty"""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class _WaitStats:
+    __slots__ = ("requests", "delayed", "total_wait", "max_wait")
+
+    def __init__(self):
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def add(self, wait: float) -> None:
+        self.requests += 1
+        if wait > 0.001:
+            self.delayed += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class RateLimiter:
+    """
+    Client-side rate limits per host and per endpoint class.
+
+    Every request takes a token from its host's bucket and from the bucket of
+    its endpoint class on that host; requests over the limit wait in line
+    instead of failing. Each retry attempt is limited like a new request.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        class_rates: Optional[Dict[str, float]] = None,
+        host_rates: Optional[Dict[str, float]] = None,
+        classify: Callable[[str, str], str] = classify_endpoint,
+    ):
+        """
+        Create a rate limiter.
+
+        :param rate: Requests per second allowed per host, None for no host limit
+        :param burst: Requests a host may receive back to back, defaults to
+            ``rate`` rounded up
+        :param class_rates: Requests per second per host for each endpoint
+            class, e.g. ``{"write": 5, "auth": 1}``
+        :param host_rates: Per-host overrides of ``rate``, keyed by host URL
+        :param classify: Function mapping ``(method, url)`` to an endpoint class
+        """
+        self.rate = rate
+        self.burst = burst
+        self.class_rates = dict(class_rates or {})
+        self.host_rates = {
+            SessionPool._origin(host): value
+            for host, value in (host_rates or {}).items()
+        }
+        self.classify = classify
+        self._buckets: Dict[Tuple[str, Optional[str]], Optional[TokenBucket]] = {}
+        self._stats: Dict[Tuple[str, str], _WaitStats] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bucket(self, origin: str, kind: Optional[str]) -> Optional[TokenBucket]:
+        key = (origin, kind)
+        if key not in self._buckets:
+            if kind is None:
+                rate = self.host_rates.get(origin, self.rate)
+                burst = self.burst
+            else:
+                rate = self.class_rates.get(kind)
+                burst = None
+            if rate is None:
+                self._buckets[key] = None
+            else:
+                burst = burst if burst is not None else math.ceil(rate)
+                self._buckets[key] = TokenBucket(rate, burst)
+        return self._buckets[key]
+
+    async def acquire(self, method: str, url: str) -> float:
+        """
+        Wait until a request may be sent.
+
+        :param method: HTTP method
+        :param url: Request URL
+        :return: Seconds spent waiting
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._buckets = {}
+            self._loop = loop
+
+        origin = SessionPool._origin(url)
+        kind = self.classify(method, url)
+        started = time.monotonic()
+        for bucket in (self._bucket(origin, kind), self._bucket(origin, None)):
+            if bucket is not None:
+                await bucket.acquire()
+        wait = time.monotonic() - started
+
+        stats = self._stats.get((origin, kind))
+        if stats is None:
+            stats = self._stats[(origin, kind)] = _WaitStats()
+        stats.add(wait)
+        return wait
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Wait statistics keyed by ``scheme://host:port``, then endpoint class.
+
+        Each entry holds the number of ``requests``, how many were ``delayed``,
+        and the ``total_wait`` and ``max_wait`` in seconds.
+        """
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (origin, kind), stats in self._stats.items():
+            result.setdefault(origin, {})[kind] = {
+                "requests": stats.requests,
+                "delayed": stats.delayed,
+                "total_wait": stats.total_wait,
+                "max_wait": stats.max_wait,
+            }
+        return result
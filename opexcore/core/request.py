@@ -1,8 +1,176 @@
-from typing import Optional, Dict
-from aiohttp import ClientSession, ClientTimeout
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager, nullcontext
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Hashable,
+    Sequence,
+    get_args,
+)
+from aiohttp import ClientResponse, ClientResponseError, ClientTimeout
+from .session import SessionPool
+from .context import current_context
+from .retry import RetryPolicy
+from .breaker import CircuitBreaker
+from .ratelimit import RateLimiter
+from .compression import Compression, Transfer
+from .instrumentation import TRACE_CONFIG, Instrumentation, current_event
+from .codec import JsonCodec, get_codec, decode_model
+from .parsing import parse
+from .streaming import iter_json_array
+from .download import DownloadResult, Target, _Writer, _validator
+
+RESPONSE_TYPES = ("json", "text", "bytes")
+
+
+def _query_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return [_query_value(item) for item in value]
+    return value
+
+
+def _query(params: Optional[Dict]) -> Optional[Dict]:
+    """Spell booleans as ``true``/``false``; aiohttp rejects them in query strings"""
+    if not params:
+        return params
+    return {key: _query_value(value) for key, value in params.items()}
 
 
 class RequestBase:
+    _pool: Optional[SessionPool] = None
+    _inflight: Dict[Hashable, asyncio.Future] = {}
+    coalesce_requests: bool = True
+    """Share one upstream request between identical concurrent GETs"""
+    retry_policy: Optional[RetryPolicy] = None
+    """Policy for calls that do not run on a client with its own, None to never retry"""
+    circuit_breaker: Optional[CircuitBreaker] = None
+    """Breaker for calls that do not run on a client with its own, None to disable"""
+    rate_limiter: Optional[RateLimiter] = None
+    """Limiter for calls that do not run on a client with its own, None to disable"""
+    instrumentation: Optional[Instrumentation] = None
+    """Instrumentation for calls that do not run on a client with its own, None
+    to measure nothing"""
+    compression: Optional[Compression] = None
+    """Compression for calls that do not run on a client with its own, None to
+    leave content negotiation to aiohttp"""
+    codec: JsonCodec = get_codec()
+    """JSON codec for request and response bodies, the fastest one installed"""
+    stream_chunk_size: int = 64 * 1024
+    """Bytes read from the socket at a time by streaming requests"""
+
+    @classmethod
+    async def startup(
+        cls, pool: Optional[SessionPool] = None, **settings
+    ) -> SessionPool:
+        """
+        Install the shared session pool used by every manager.
+
+        Calling this is optional; a default pool is created lazily on the first
+        request. Use it to tune connection limits or to share a pool you own.
+
+        :param pool: Pool to install, a new one is created when omitted
+        :param settings: Keyword arguments forwarded to ``SessionPool``
+        :return: The installed pool
+        """
+        if RequestBase._pool is not None and RequestBase._pool is not pool:
+            await RequestBase._pool.close()
+        RequestBase._pool = pool or SessionPool(**settings)
+        return RequestBase._pool
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the shared session pool and all of its connections."""
+        if RequestBase._pool is not None:
+            await RequestBase._pool.close()
+            RequestBase._pool = None
+
+    @classmethod
+    def session_pool(cls) -> SessionPool:
+        """
+        Return the session pool for the current call.
+
+        This is the pool of the client running the call when there is one,
+        otherwise the shared pool, created with defaults if needed.
+        """
+        context = current_context()
+        if context is not None and context.pool is not None:
+            return context.pool
+        if RequestBase._pool is None:
+            RequestBase._pool = SessionPool()
+        return RequestBase._pool
+
+    @classmethod
+    def active_retry_policy(cls) -> Optional[RetryPolicy]:
+        """Return the retry policy for the current call, if retries are enabled"""
+        context = current_context()
+        if context is not None and context.retry is not None:
+            return context.retry
+        return RequestBase.retry_policy
+
+    @classmethod
+    def active_circuit_breaker(cls) -> Optional[CircuitBreaker]:
+        """Return the circuit breaker for the current call, if enabled"""
+        context = current_context()
+        if context is not None and context.breaker is not None:
+            return context.breaker
+        return RequestBase.circuit_breaker
+
+    @classmethod
+    def active_rate_limiter(cls) -> Optional[RateLimiter]:
+        """Return the rate limiter for the current call, if enabled"""
+        context = current_context()
+        if context is not None and context.limiter is not None:
+            return context.limiter
+        return RequestBase.rate_limiter
+
+    @classmethod
+    def active_compression(cls) -> Optional[Compression]:
+        """Return the compression setting for the current call, if enabled"""
+        context = current_context()
+        if context is not None and context.compression is not None:
+            return context.compression
+        return RequestBase.compression
+
+    @classmethod
+    def active_instrumentation(cls) -> Optional[Instrumentation]:
+        """Return the instrumentation for the current call, if enabled"""
+        context = current_context()
+        if context is not None and context.instrumentation is not None:
+            return context.instrumentation
+        return RequestBase.instrumentation
+
+    @classmethod
+    def _panel_name(cls) -> str:
+        return cls.__name__.removesuffix("Manager")
+
+    @classmethod
+    def _parse(cls, model: Any, data: Any) -> Any:
+        """
+        Build a response model, or ``List[Model]``, from decoded JSON.
+
+        :param model: Model class, or ``List[Model]``
+        :param data: Decoded JSON
+        :return: Model instance, or list of instances
+        """
+        instrumentation = cls.active_instrumentation()
+        if instrumentation is None:
+            return parse(model, data)
+        started = time.perf_counter()
+        result = parse(model, data)
+        instrumentation.parsed(
+            cls._panel_name(),
+            get_args(model)[0] if isinstance(result, list) else model,
+            len(result) if isinstance(result, list) else 1,
+            time.perf_counter() - started,
+        )
+        return result
+
     @classmethod
     async def fetch(
         cls,
@@ -12,27 +180,548 @@ class RequestBase:
         data: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         timeout: int = 10,
-    ) -> Dict:
+        idempotent: Optional[bool] = None,
+        json: Any = None,
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
         """
         Perform an HTTP request and return the result.
+
+        Identical concurrent GET requests (same URL, params and headers) share
+        a single upstream request and receive the same decoded response.
+        Failed requests are retried according to the active retry policy.
+
         :param method: HTTP method (GET, POST, etc.)
         :param url: URL to request
         :param params: Query parameters
         :param data: Request body data
         :param headers: Request headers
         :param timeout: Request timeout in seconds
-        :return: Parsed JSON response
+        :param idempotent: Whether the request may safely be sent twice, None
+            to decide by method
+        :param json: Value sent as a JSON body with the active codec
+        :param response_model: Type the JSON response is validated into
+            directly, e.g. a model class or ``List[Model]``
+        :param response_type: ``"json"`` to decode the body, ``"text"`` or
+            ``"bytes"`` to return it as is; use ``stream_bytes`` for bodies too
+            large to hold in memory
+        :return: Parsed JSON response, an instance of ``response_model``, or
+            the raw body
         """
-        async with ClientSession(timeout=ClientTimeout(total=timeout)) as session:
+        if response_type not in RESPONSE_TYPES:
+            raise ValueError(f"unknown response type: {response_type}")
+        instrumentation = cls.active_instrumentation()
+        with (
+            instrumentation.observe(cls._panel_name(), method, url)
+            if instrumentation is not None
+            else nullcontext()
+        ):
+            params = _query(params)
+            if json is not None:
+                data = RequestBase.codec.dumps(json)
+                headers = {"Content-Type": "application/json", **(headers or {})}
+            if (
+                method.upper() != "GET"
+                or data is not None
+                or not RequestBase.coalesce_requests
+            ):
+                return await cls._request(
+                    method,
+                    url,
+                    params,
+                    data,
+                    headers,
+                    timeout,
+                    idempotent,
+                    response_model,
+                    response_type,
+                )
+
+            key = cls._coalesce_key(
+                method,
+                url,
+                params,
+                headers,
+                response_model,
+                response_type,
+            )
+            future = RequestBase._inflight.get(key)
+            if future is None:
+                future = asyncio.ensure_future(
+                    cls._request(
+                        method,
+                        url,
+                        params,
+                        data,
+                        headers,
+                        timeout,
+                        None,
+                        response_model,
+                        response_type,
+                    )
+                )
+                RequestBase._inflight[key] = future
+                future.add_done_callback(lambda _: cls._release(key, future))
+            return await asyncio.shield(future)
+
+    @staticmethod
+    def _release(key: Hashable, future: asyncio.Future) -> None:
+        """Forget a finished shared request, even if every waiter gave up."""
+        RequestBase._inflight.pop(key, None)
+        if not future.cancelled():
+            future.exception()
+
+    @staticmethod
+    def _coalesce_key(
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Hashable:
+        """Identify requests that may share one response."""
+        return (
+            method.upper(),
+            url,
+            repr(sorted((params or {}).items())),
+            repr(sorted((headers or {}).items())),
+            response_model,
+            response_type,
+        )
+
+    @classmethod
+    async def _request(
+        cls,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        data: Optional[Any],
+        headers: Optional[Dict],
+        timeout: int,
+        idempotent: Optional[bool] = None,
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
+        policy = cls.active_retry_policy()
+        if policy is None:
+            return await cls._send(
+                method,
+                url,
+                params,
+                data,
+                headers,
+                timeout,
+                response_model,
+                response_type,
+            )
+        return await policy.run(
+            lambda attempt_timeout: cls._send(
+                method,
+                url,
+                params,
+                data,
+                headers,
+                attempt_timeout,
+                response_model,
+                response_type,
+            ),
+            method,
+            idempotent,
+            timeout,
+        )
+
+    @classmethod
+    async def _send(
+        cls,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        data: Optional[Any],
+        headers: Optional[Dict],
+        timeout: float,
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
+        limiter = cls.active_rate_limiter()
+        if limiter is not None:
+            await limiter.acquire(method, url)
+        breaker = cls.active_circuit_breaker()
+        if breaker is None:
+            return await cls._transmit(
+                method,
+                url,
+                params,
+                data,
+                headers,
+                timeout,
+                response_model,
+                response_type,
+            )
+        return await breaker.call(
+            url,
+            lambda: cls._transmit(
+                method,
+                url,
+                params,
+                data,
+                headers,
+                timeout,
+                response_model,
+                response_type,
+            ),
+        )
+
+    @classmethod
+    def _traced_session(cls, url: str) -> Any:
+        """Pooled session for ``url``, traced while a request is instrumented"""
+        pool = cls.session_pool()
+        if current_event() is not None:
+            pool.add_trace_config(TRACE_CONFIG)
+        return pool.get_session(url)
+
+    @classmethod
+    async def _transmit(
+        cls,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        data: Optional[Any],
+        headers: Optional[Dict],
+        timeout: float,
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
+        compression = cls.active_compression()
+        if compression is not None:
+            return await cls._transmit_compressed(
+                compression,
+                method,
+                url,
+                params,
+                data,
+                headers,
+                timeout,
+                response_model,
+                response_type,
+            )
+        session = cls._traced_session(url)
+        async with session.request(
+            method=method,
+            url=url,
+            params=params,
+            data=data,
+            headers=headers,
+            timeout=ClientTimeout(total=timeout),
+            trace_request_ctx=current_event(),
+        ) as response:
+            response.raise_for_status()
+            body = await response.read()
+            if response_type == "text":
+                return body.decode(response.get_encoding())
+        if response_type == "bytes":
+            return body
+        return cls._decode(body, response_model)
+
+    @classmethod
+    async def _transmit_compressed(
+        cls,
+        compression: Compression,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        data: Optional[Any],
+        headers: Optional[Dict],
+        timeout: float,
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
+        """``_transmit`` that compresses the body and counts the wire bytes"""
+        headers = {"Accept-Encoding": compression.accept_encoding, **(headers or {})}
+        sent = compression.body_size(data)
+        data, encoding = compression.compress(data)
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        session = cls._traced_session(url)
+        async with session.request(
+            method=method,
+            url=url,
+            params=params,
+            data=data,
+            headers=headers,
+            timeout=ClientTimeout(total=timeout),
+            auto_decompress=False,
+            trace_request_ctx=current_event(),
+        ) as response:
+            response.raise_for_status()
+            raw = await response.read()
+            received_encoding = response.headers.get("Content-Encoding", "").lower()
+            body = compression.decompress(raw, received_encoding)
+            text_encoding = response.get_encoding() if response_type == "text" else None
+        compression.record(
+            Transfer(
+                method,
+                url,
+                sent,
+                len(data) if encoding is not None else sent,
+                len(body),
+                len(raw),
+                received_encoding or None,
+            )
+        )
+        if response_type == "text":
+            return body.decode(text_encoding)
+        if response_type == "bytes":
+            return body
+        return cls._decode(body, response_model)
+
+    @classmethod
+    def _decode(cls, body: bytes, response_model: Any = None) -> Any:
+        """Decode a JSON response body, straight into ``response_model`` if given."""
+        event = current_event()
+        if event is not None:
+            started = time.perf_counter()
+            try:
+                return cls._decode_body(body, response_model)
+            finally:
+                event.decode += time.perf_counter() - started
+        return cls._decode_body(body, response_model)
+
+    @classmethod
+    def _decode_body(cls, body: bytes, response_model: Any = None) -> Any:
+        if response_model is not None:
+            return decode_model(body, response_model)
+        if not body.strip():
+            return None
+        return RequestBase.codec.loads(body)
+
+    @classmethod
+    @asynccontextmanager
+    async def stream(
+        cls,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[ClientResponse]:
+        """
+        Open a request and yield its response with the body still unread.
+
+        Rate limits and the circuit breaker apply; retries and coalescing do
+        not, since the body can only be read once.
+
+        :param method: HTTP method (GET, POST, etc.)
+        :param url: URL to request
+        :param params: Query parameters
+        :param data: Request body data
+        :param headers: Request headers
+        :param timeout: Seconds allowed to connect and for each read; the
+            whole transfer is not bounded
+        :return: Response with an unread body
+        """
+        limiter = cls.active_rate_limiter()
+        if limiter is not None:
+            await limiter.acquire(method, url)
+        breaker = cls.active_circuit_breaker()
+        async with breaker.track(url) if breaker is not None else nullcontext():
+            session = cls.session_pool().get_session(url)
             async with session.request(
                 method=method,
                 url=url,
-                params=params,
+                params=_query(params),
                 data=data,
                 headers=headers,
+                timeout=ClientTimeout(
+                    total=None, sock_connect=timeout, sock_read=timeout
+                ),
             ) as response:
                 response.raise_for_status()
-                return await response.json()
+                yield response
+
+    @classmethod
+    async def stream_items(
+        cls,
+        url: str,
+        model: Any,
+        path: Sequence[str] = (),
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[Any]:
+        """
+        GET a JSON array and yield its items as models while the body arrives.
+
+        Memory use is bounded by one item rather than the whole response.
+        Close the iterator (e.g. with ``contextlib.aclosing``) when leaving
+        it early.
+
+        :param url: URL to request
+        :param model: Model class of the items
+        :param path: Object keys leading to the array, empty if the body is
+            the array
+        :param params: Query parameters
+        :param headers: Request headers
+        :param timeout: Seconds allowed to connect and for each read
+        :return: Async iterator over the items
+        """
+        async with cls.stream(
+            "GET", url, params=params, headers=headers, timeout=timeout
+        ) as response:
+            chunks = response.content.iter_chunked(RequestBase.stream_chunk_size)
+            async for item in iter_json_array(chunks, path):
+                yield parse(model, item)
+
+    @classmethod
+    async def stream_bytes(
+        cls,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: int = 10,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        GET a body and yield it in chunks as it arrives.
+
+        Close the iterator (e.g. with ``contextlib.aclosing``) when leaving it
+        early.
+
+        :param url: URL to request
+        :param params: Query parameters
+        :param headers: Request headers
+        :param timeout: Seconds allowed to connect and for each read
+        :param chunk_size: Maximum bytes per chunk, defaults to
+            ``stream_chunk_size``
+        :return: Async iterator over the body chunks
+        """
+        async with cls.stream(
+            "GET", url, params=params, headers=headers, timeout=timeout
+        ) as response:
+            async for chunk in response.content.iter_chunked(
+                chunk_size or RequestBase.stream_chunk_size
+            ):
+                yield chunk
+
+    @classmethod
+    async def download_to(
+        cls,
+        url: str,
+        target: Target,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: int = 10,
+        checksum: Optional[str] = None,
+        expected_checksum: Optional[str] = None,
+        resume: bool = True,
+    ) -> DownloadResult:
+        """
+        GET a body and write it to a file or file object chunk by chunk.
+
+        At most one chunk is held in memory. A file path is written to
+        ``<path>.part`` and renamed once complete; when the transfer breaks,
+        retries of the active retry policy, and later calls with ``resume``,
+        continue from the bytes already on disk with a ``Range`` request.
+        Resuming needs a strong ``ETag`` or a ``Last-Modified`` date, sent
+        back as ``If-Range``: when the document changed, or the server gave
+        no validator (e.g. a generated backup), the download starts over so
+        bytes of two documents are never joined. A partial file is deleted
+        when the server rejects the request with a 4xx status.
+
+        :param url: URL to request
+        :param target: File path, or a binary file object; its ``write`` may
+            be a coroutine, and ``drain`` is awaited when present
+        :param params: Query parameters
+        :param headers: Request headers
+        :param timeout: Seconds allowed to connect and for each read
+        :param checksum: ``hashlib`` algorithm to digest the body with, e.g.
+            ``"sha256"``
+        :param expected_checksum: Hex digest the body must match; implies
+            ``sha256`` when ``checksum`` is not given
+        :param resume: Continue an existing ``.part`` file instead of
+            starting over
+        :return: Size and digest of the downloaded body
+        :raises ValueError: If the digest does not match ``expected_checksum``
+        """
+        if expected_checksum and not checksum:
+            checksum = "sha256"
+        writer = _Writer(target, resume)
+        hasher = hashlib.new(checksum) if checksum else None
+        offset = await writer.open(hasher)
+        resumed = offset > 0
+
+        async def start_over() -> None:
+            nonlocal hasher, offset, resumed
+            await writer.restart()
+            hasher = hashlib.new(checksum) if checksum else None
+            offset = 0
+            resumed = False
+
+        async def attempt(attempt_timeout: float) -> None:
+            nonlocal offset, resumed
+            while True:
+                if offset and writer.validator is None:
+                    await start_over()
+                request_headers = dict(headers or {})
+                if offset:
+                    request_headers["Range"] = f"bytes={offset}-"
+                    request_headers["If-Range"] = writer.validator
+                try:
+                    async with cls.stream(
+                        "GET",
+                        url,
+                        params=params,
+                        headers=request_headers,
+                        timeout=attempt_timeout,
+                    ) as response:
+                        current = _validator(response.headers)
+                        if offset and response.status == 206:
+                            if current is not None and current != writer.validator:
+                                # Server ignored If-Range for a changed document
+                                await start_over()
+                                continue
+                            resumed = True
+                        elif offset:
+                            await start_over()
+                        await writer.remember(current)
+                        async for chunk in response.content.iter_chunked(
+                            RequestBase.stream_chunk_size
+                        ):
+                            await writer.write(chunk)
+                            if hasher is not None:
+                                hasher.update(chunk)
+                            offset += len(chunk)
+                except ClientResponseError as error:
+                    # Range starting at the end of the file: nothing left to send
+                    if not (offset and error.status == 416):
+                        raise
+                return
+
+        try:
+            policy = cls.active_retry_policy()
+            if policy is None:
+                await attempt(timeout)
+            else:
+                await policy.run(attempt, "GET", True, timeout)
+        except BaseException as error:
+            rejected = (
+                isinstance(error, ClientResponseError)
+                and 400 <= error.status < 500
+                and error.status not in (408, 429)
+            )
+            await writer.abort(discard=rejected)
+            raise
+
+        digest = hasher.hexdigest() if hasher is not None else None
+        if expected_checksum and digest != expected_checksum.lower():
+            await writer.abort(discard=True)
+            raise ValueError(
+                f"checksum mismatch: expected {expected_checksum}, got {digest}"
+            )
+        await writer.finish()
+        return DownloadResult(target, offset, digest, resumed)
 
     @classmethod
     async def get(
@@ -41,14 +730,18 @@ class RequestBase:
         params: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         timeout: int = 10,
-    ) -> Dict:
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
         """
         Perform a GET request.
         :param url: URL to request
         :param params: Query parameters
         :param headers: Request headers
         :param timeout: Request timeout in seconds
-        :return: Parsed JSON response
+        :param response_model: Type the response is validated into directly
+        :param response_type: ``"json"``, ``"text"`` or ``"bytes"``
+        :return: Parsed JSON response, or the body as text or bytes
         """
         return await cls.fetch(
             method="GET",
@@ -56,6 +749,8 @@ class RequestBase:
             params=params,
             headers=headers,
             timeout=timeout,
+            response_model=response_model,
+            response_type=response_type,
         )
 
     @classmethod
@@ -66,14 +761,22 @@ class RequestBase:
         data: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         timeout: int = 10,
-    ) -> Dict:
+        idempotent: Optional[bool] = None,
+        json: Any = None,
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
         """
         Perform a POST request.
         :param url: URL to request
         :param data: Request body data
         :param headers: Request headers
         :param timeout: Request timeout in seconds
-        :return: Parsed JSON response
+        :param idempotent: Allow retrying the request, e.g. for logins
+        :param json: Value sent as a JSON body
+        :param response_model: Type the response is validated into directly
+        :param response_type: ``"json"``, ``"text"`` or ``"bytes"``
+        :return: Parsed JSON response, or the body as text or bytes
         """
         return await cls.fetch(
             method="POST",
@@ -82,6 +785,10 @@ class RequestBase:
             params=params,
             headers=headers,
             timeout=timeout,
+            idempotent=idempotent,
+            json=json,
+            response_model=response_model,
+            response_type=response_type,
         )
 
     @classmethod
@@ -92,13 +799,21 @@ class RequestBase:
         data: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         timeout: int = 10,
-    ) -> Dict:
+        idempotent: Optional[bool] = None,
+        json: Any = None,
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
         """
         Perform a DELETE request.
         :param url: URL to request
         :param headers: Request headers
         :param timeout: Request timeout in seconds
-        :return: Parsed JSON response
+        :param idempotent: Set to False to never retry the request
+        :param json: Value sent as a JSON body
+        :param response_model: Type the response is validated into directly
+        :param response_type: ``"json"``, ``"text"`` or ``"bytes"``
+        :return: Parsed JSON response, or the body as text or bytes
         """
         return await cls.fetch(
             method="DELETE",
@@ -107,6 +822,10 @@ class RequestBase:
             params=params,
             headers=headers,
             timeout=timeout,
+            idempotent=idempotent,
+            json=json,
+            response_model=response_model,
+            response_type=response_type,
         )
 
     @classmethod
@@ -117,14 +836,22 @@ class RequestBase:
         data: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         timeout: int = 10,
-    ) -> Dict:
+        idempotent: Optional[bool] = None,
+        json: Any = None,
+        response_model: Any = None,
+        response_type: str = "json",
+    ) -> Any:
         """
         Perform a PUT request.
         :param url: URL to request
         :param data: Request body data
         :param headers: Request headers
         :param timeout: Request timeout in seconds
-        :return: Parsed JSON response
+        :param idempotent: Set to False to never retry the request
+        :param json: Value sent as a JSON body
+        :param response_model: Type the response is validated into directly
+        :param response_type: ``"json"``, ``"text"`` or ``"bytes"``
+        :return: Parsed JSON response, or the body as text or bytes
         """
         return await cls.fetch(
             method="PUT",
@@ -133,4 +860,8 @@ class RequestBase:
             params=params,
             headers=headers,
             timeout=timeout,
+            idempotent=idempotent,
+            json=json,
+            response_model=response_model,
+            response_type=response_type,
         )
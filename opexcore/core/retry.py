@@ -0,0 +1,194 @@
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Optional, Any, Awaitable, Callable, Iterable, Iterator, Mapping
+from aiohttp import ClientConnectionError, ClientPayloadError, ClientResponseError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+_retry_safe: ContextVar[bool] = ContextVar("opexcore_retry_safe", default=False)
+_deadline: ContextVar[Optional[float]] = ContextVar("opexcore_deadline", default=None)
+
+
+@contextmanager
+def retry_safe() -> Iterator[None]:
+    """
+    Allow retrying the non-idempotent requests made inside the block.
+
+    Use it around calls such as ``add_user`` when a duplicate is harmless or
+    rejected by the panel.
+    """
+    token = _retry_safe.set(True)
+    try:
+        yield
+    finally:
+        _retry_safe.reset(token)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound the total time of the requests made inside the block, retries included.
+
+    Nested deadlines never extend an outer one.
+
+    :param seconds: Time budget from now
+    """
+    expires_at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    When and how often failed requests are retried.
+
+    Connection errors, truncated bodies, timeouts and the configured statuses
+    are retried with exponential backoff and full jitter, honoring
+    ``Retry-After``. Requests that are not idempotent (POST) are only retried
+    when the caller marks them safe, except on 429, which means the panel did
+    not process them.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10,
+        jitter: bool = True,
+        statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        max_retry_after: float = 60,
+        deadline: Optional[float] = None,
+    ):
+        """
+        Create a retry policy.
+
+        :param attempts: Maximum number of attempts, including the first one
+        :param backoff: Delay before the first retry in seconds, doubled on
+            each further retry
+        :param max_backoff: Upper bound of the backoff delay in seconds
+        :param jitter: Pick a random delay between 0 and the backoff delay
+        :param statuses: Response statuses that are retried
+        :param max_retry_after: Longest ``Retry-After`` delay that is honored,
+            longer ones fail immediately
+        :param deadline: Total time budget of one operation in seconds,
+            retries included
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.max_retry_after = max_retry_after
+        self.deadline = deadline
+
+    def is_retryable(
+        self, error: BaseException, method: str, idempotent: Optional[bool]
+    ) -> bool:
+        """
+        Whether a request that failed with ``error`` may be sent again.
+
+        :param error: Raised exception
+        :param method: HTTP method
+        :param idempotent: Explicit idempotency of the request, None to infer
+            it from the method
+        :return: True if the request can be retried
+        """
+        if isinstance(error, ClientResponseError):
+            if error.status not in self.statuses:
+                return False
+            if error.status == 429:
+                return True
+        elif not isinstance(
+            error, (ClientConnectionError, ClientPayloadError, asyncio.TimeoutError)
+        ):
+            return False
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return idempotent or _retry_safe.get()
+
+    def delay(self, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        Seconds to wait before retry number ``attempt`` (starting at 1).
+
+        :param attempt: Number of the retry
+        :param error: Exception that caused the retry
+        :return: Delay in seconds, None if the server asked to wait too long
+        """
+        if isinstance(error, ClientResponseError):
+            retry_after = _retry_after(error.headers)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    async def run(
+        self,
+        send: Callable[[float], Awaitable[Any]],
+        method: str,
+        idempotent: Optional[bool],
+        timeout: float,
+    ) -> Any:
+        """
+        Call ``send`` until it succeeds, the error is final or the budget is spent.
+
+        :param send: Coroutine function performing one attempt with the given
+            timeout in seconds
+        :param method: HTTP method
+        :param idempotent: Explicit idempotency of the request
+        :param timeout: Timeout of a single attempt in seconds
+        :return: Result of the successful attempt
+        """
+        expires_at = _deadline.get()
+        if self.deadline is not None:
+            own = time.monotonic() + self.deadline
+            expires_at = own if expires_at is None else min(expires_at, own)
+
+        attempt = 0
+        while True:
+            attempt_timeout = timeout
+            if expires_at is not None:
+                remaining = expires_at - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError("request deadline exceeded")
+                attempt_timeout = min(timeout, remaining)
+            try:
+                return await send(attempt_timeout)
+            except Exception as error:
+                attempt += 1
+                if attempt >= self.attempts or not self.is_retryable(
+                    error, method, idempotent
+                ):
+                    raise
+                delay = self.delay(attempt, error)
+                if delay is None or (
+                    expires_at is not None and time.monotonic() + delay >= expires_at
+                ):
+                    raise
+            await asyncio.sleep(delay)
@@ -0,0 +1,167 @@
+import asyncio
+from typing import Optional, Dict, List, Iterable
+from aiohttp import ClientSession, TCPConnector, TraceConfig
+from yarl import URL
+
+
+class SessionPool:
+    """Long-lived aiohttp sessions shared by every manager, one per host"""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        host_limits: Optional[Dict[str, int]] = None,
+        ttl_dns_cache: Optional[int] = 300,
+        keepalive_timeout: float = 30,
+        trace_configs: Optional[List[TraceConfig]] = None,
+    ):
+        """
+        Create a session pool.
+
+        :param limit: Maximum number of open connections per host session
+        :param limit_per_host: Default keep-alive connections kept per host
+        :param host_limits: Per-host connection limits, keyed by host URL
+        :param ttl_dns_cache: Seconds to cache DNS lookups, None to cache forever
+        :param keepalive_timeout: Seconds an idle connection is kept open
+        :param trace_configs: aiohttp trace configs installed on every session
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.host_limits = {
+            self._origin(host): value for host, value in (host_limits or {}).items()
+        }
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.trace_configs: List[TraceConfig] = list(trace_configs or [])
+        self._sessions: Dict[str, ClientSession] = {}
+        self._retired: List[ClientSession] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """Reduce a URL to the scheme://host:port key sessions are pooled by"""
+        parsed = URL(url)
+        return f"{parsed.scheme}://{parsed.host}:{parsed.port}"
+
+    def set_host_limit(self, host: str, limit: int) -> None:
+        """
+        Set the connection limit for a single host.
+
+        Takes effect the next time a session is opened for that host.
+
+        :param host: Host URL
+        :param limit: Maximum concurrent connections to the host
+        """
+        self.host_limits[self._origin(host)] = limit
+
+    def _create_session(self, origin: str) -> ClientSession:
+        connector = TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.host_limits.get(origin, self.limit_per_host),
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return ClientSession(
+            connector=connector, trace_configs=self.trace_configs or None
+        )
+
+    def add_trace_config(self, trace_config: TraceConfig) -> None:
+        """
+        Install an aiohttp trace config on every session of the pool.
+
+        Open sessions are replaced by new ones on their next use; requests
+        still running on them are not interrupted.
+
+        :param trace_config: Frozen trace config
+        """
+        if trace_config in self.trace_configs:
+            return
+        self.trace_configs.append(trace_config)
+        self._retired.extend(self._sessions.values())
+        self._sessions = {}
+
+    def get_session(self, url: str) -> ClientSession:
+        """
+        Return the pooled session for the host of ``url``, opening it if needed.
+
+        Sessions are bound to the event loop they were created on, so a pool
+        reused from a new loop (e.g. successive ``asyncio.run`` calls) closes
+        the sessions of the previous loop and starts over.
+
+        :param url: Request URL
+        :return: Client session for the URL's host
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                self._release(self._loop, self._detach())
+            self._loop = loop
+
+        origin = self._origin(url)
+        session = self._sessions.get(origin)
+        if session is None or session.closed:
+            session = self._create_session(origin)
+            self._sessions[origin] = session
+        return session
+
+    @property
+    def hosts(self) -> List[str]:
+        """Hosts that currently have an open session"""
+        return [origin for origin, s in self._sessions.items() if not s.closed]
+
+    def _detach(self) -> List[ClientSession]:
+        sessions = [*self._sessions.values(), *self._retired]
+        self._sessions, self._retired = {}, []
+        return [session for session in sessions if not session.closed]
+
+    @staticmethod
+    async def _close_sessions(sessions: Iterable[ClientSession]) -> None:
+        await asyncio.gather(*(session.close() for session in sessions))
+
+    @classmethod
+    def _release(
+        cls, loop: asyncio.AbstractEventLoop, sessions: List[ClientSession]
+    ) -> Optional["asyncio.Future[None]"]:
+        """
+        Close sessions created on another event loop.
+
+        The close runs on their own loop, which may be running in another
+        thread. Once that loop is closed, nothing is left to wait for, so
+        each close finishes in a single step without a loop.
+
+        :return: Future of the close when ``loop`` is running
+        """
+        if not sessions:
+            return None
+        if not loop.is_closed():
+            future = asyncio.run_coroutine_threadsafe(
+                cls._close_sessions(sessions), loop
+            )
+            return asyncio.wrap_future(future) if loop.is_running() else None
+        for session in sessions:
+            closing = session.close()
+            try:
+                closing.send(None)
+            except StopIteration:
+                continue
+            closing.close()
+        return None
+
+    async def close(self) -> None:
+        """Close every pooled session and its connections"""
+        sessions = self._detach()
+        loop, self._loop = self._loop, None
+        if loop is asyncio.get_running_loop():
+            await self._close_sessions(sessions)
+        elif loop is not None:
+            scheduled = self._release(loop, sessions)
+            if scheduled is not None:
+                await scheduled
+
+    async def __aenter__(self) -> "SessionPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
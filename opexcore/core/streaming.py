@@ -0,0 +1,109 @@
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Sequence
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",:]}" + _WHITESPACE
+
+
+class _Buffer:
+    """Decoded text of a byte stream, read on demand"""
+
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self._chunks = chunks.__aiter__()
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decoder_json = json.JSONDecoder()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def fill(self) -> bool:
+        """Read one more chunk, dropping consumed text; False at the end"""
+        if self.eof:
+            return False
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.eof = True
+            chunk = b""
+        self.text = self.text[self.pos :] + self._decoder.decode(chunk, self.eof)
+        self.pos = 0
+        return True
+
+    async def peek(self) -> str:
+        """Skip whitespace and return the next character, "" at the end"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not await self.fill():
+                return ""
+
+    async def expect(self, char: str) -> None:
+        found = await self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r} in JSON stream, found {found!r}")
+        self.pos += 1
+
+    async def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        await self.peek()
+        while True:
+            try:
+                value, end = self._decoder_json.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not await self.fill():
+                    raise
+                continue
+            if not self.eof and (
+                end == len(self.text) or self.text[end] not in _DELIMITERS
+            ):
+                # A number cut at the chunk boundary still decodes ("1" of
+                # "1.5", "1" of "1e3"); only a delimiter or the end of the
+                # stream proves the value is complete.
+                await self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes], path: Sequence[str] = ()
+) -> AsyncIterator[Any]:
+    """
+    Decode the items of a JSON array while its bytes arrive.
+
+    Only one item, plus the unread part of the current chunk, is held in
+    memory at a time.
+
+    :param chunks: Body of the response as byte chunks
+    :param path: Object keys leading to the array, e.g. ``("users",)`` for
+        ``{"users": [...], "total": 10}``; empty when the body is the array
+    :return: Async iterator over the decoded items
+    """
+    buffer = _Buffer(chunks)
+    for key in path:
+        await buffer.expect("{")
+        while True:
+            if await buffer.peek() == "}":
+                raise ValueError(f"key {key!r} not found in JSON stream")
+            name = await buffer.value()
+            await buffer.expect(":")
+            if name == key:
+                break
+            await buffer.value()
+            if await buffer.peek() == ",":
+                buffer.pos += 1
+
+    await buffer.expect("[")
+    if await buffer.peek() == "]":
+        return
+    while True:
+        yield await buffer.value()
+        separator = await buffer.peek()
+        buffer.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"expected ',' or ']' in JSON stream, found {separator!r}")
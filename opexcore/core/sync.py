@@ -0,0 +1,217 @@
+import asyncio
+import atexit
+import contextvars
+import inspect
+import os
+import threading
+from concurrent.futures import Future
+from functools import wraps
+from typing import Optional, Any, AsyncIterator, Awaitable, Callable, Iterator, TypeVar
+from .request import RequestBase
+
+T = TypeVar("T")
+
+
+async def _in_context(awaitable: Awaitable[T], context: contextvars.Context) -> T:
+    # Tasks copy the current context when created, so the call sees the
+    # caller's context variables (deadline, retry_safe, ...)
+    return await context.run(asyncio.ensure_future, awaitable)
+
+
+async def _next(iterator: AsyncIterator[T]) -> T:
+    return await iterator.__anext__()
+
+
+class EventLoopThread:
+    """
+    Event loop running forever in a daemon thread, for calling the async
+    API from synchronous code.
+
+    Everything submitted shares the loop, so the session pools, token caches
+    and rate limiters used by the calls keep their connections and state
+    between calls, and calls submitted from several threads run concurrently.
+    """
+
+    def __init__(self, name: str = "opexcore-loop"):
+        """
+        Create an event loop thread; it starts on the first call.
+
+        :param name: Name of the thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the thread is running in this process"""
+        return self._thread is not None and self._pid == os.getpid()
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A forked child (e.g. a Celery prefork worker) inherits the loop
+            # but not its thread, so it starts a loop of its own
+            if not self.running:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._loop,), name=self.name, daemon=True
+                )
+                self._pid = os.getpid()
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def submit(self, awaitable: Awaitable[T]) -> "Future[T]":
+        """
+        Schedule ``awaitable`` on the loop without waiting for it.
+
+        :param awaitable: Coroutine or other awaitable
+        :return: Future holding the result
+        """
+        loop = self._start()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(f"{self.name} cannot wait for itself")
+        context = contextvars.copy_context()
+        return asyncio.run_coroutine_threadsafe(_in_context(awaitable, context), loop)
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run ``awaitable`` on the loop and block until it finishes.
+
+        :param awaitable: Coroutine or other awaitable
+        :param timeout: Seconds to wait before cancelling it, None for no limit
+        :return: Its result; its exception is raised in the calling thread
+        """
+        future = self.submit(awaitable)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """
+        Iterate an async iterator from the calling thread, one item at a time.
+
+        Close the returned iterator (or exhaust it) to release the async one,
+        e.g. with ``contextlib.closing`` when breaking out early.
+
+        :param iterator: Async iterator, e.g. from ``iter_users``
+        :return: Blocking iterator over the same items
+        """
+        try:
+            while True:
+                try:
+                    item = self.run(_next(iterator))
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None and self.running:
+                self.run(aclose())
+
+    def close(self) -> None:
+        """Close the shared session pool on the loop, then stop the thread."""
+        with self._lock:
+            if not self.running:
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+        asyncio.run_coroutine_threadsafe(RequestBase.shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+
+_default_loop: Optional[EventLoopThread] = None
+_default_lock = threading.Lock()
+
+
+def default_loop() -> EventLoopThread:
+    """
+    Return the event loop thread shared by every ``SyncClient`` by default.
+
+    It is stopped, and the shared session pool closed, at interpreter exit.
+    """
+    global _default_loop
+    with _default_lock:
+        if _default_loop is None:
+            _default_loop = EventLoopThread()
+            atexit.register(_default_loop.close)
+        return _default_loop
+
+
+class SyncClient:
+    """
+    Blocking facade over a manager class or a ``PanelClient``.
+
+    Every coroutine method of the target is available as a blocking method
+    that runs on a background event loop, and every async iterator it returns
+    (``iter_users``, ``stream_users``, ...) becomes a blocking iterator.
+    Other attributes are passed through unchanged::
+
+        marzban = SyncClient(MarzbanManager)
+        users = marzban.get_users(host, token, limit=100)
+
+        client = SyncClient(MarzbanClient(host, "admin", "secret"))
+        for user in client.iter_users():
+            ...
+
+    Unlike ``asyncio.run`` per call, connections and tokens are reused across
+    calls, and calls from several threads run concurrently on the loop.
+    """
+
+    def __init__(self, target: Any, loop: Optional[EventLoopThread] = None):
+        """
+        Create a blocking facade.
+
+        :param target: Manager class, e.g. ``MarzbanManager``, or client
+            instance, e.g. ``MarzbanClient(...)``
+        :param loop: Event loop thread to run on, the shared one when omitted
+        """
+        self.target = target
+        self.loop = loop or default_loop()
+
+    def _wrap(self, method: Callable) -> Callable:
+        @wraps(method)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            result = method(*args, **kwargs)
+            if hasattr(result, "__anext__"):
+                return self.loop.iterate(result)
+            if inspect.isawaitable(result):
+                return self.loop.run(result)
+            return result
+
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attribute = getattr(self.target, name)
+        if not callable(attribute) or isinstance(attribute, type):
+            return attribute
+        wrapped = self._wrap(attribute)
+        setattr(self, name, wrapped)
+        return wrapped
+
+    def close(self) -> None:
+        """Close the target client's session pool if it owns one."""
+        close = getattr(self.target, "close", None)
+        if close is not None:
+            self.loop.run(close())
+
+    def __enter__(self) -> "SyncClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
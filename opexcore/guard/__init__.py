@@ -1,39 +1,85 @@
-from .manager import GuardManager
-from .types import (
-    GuardAdminCreate,
-    GuardAdminCurrentUpdate,
-    GuardAdminPlaceHolder,
-    GuardAdminPlaceHolderCategory,
-    GuardAdminResponse,
-    GuardAdminRole,
-    GuardAdminToken,
-    GuardAdminUpdate,
-    GuardAdminUsageLog,
-    GuardAdminUsageLogsResponse,
-    GuardNodeCreate,
-    GuardNodeResponse,
-    GuardNodeStatsResponse,
-    GuardNodeUpdate,
-    GuardNodeCategory,
-    GuardServiceCreate,
-    GuardServiceResponse,
-    GuardServiceUpdate,
-    AdminStatsResponseNew,
-    GuardCountDetailStats,
-    GuardExpireSubDetailStats,
-    GuardStatsResponse,
-    GuardTopSubDetailStats,
-    GuardUsageDetailStats,
-    GuardSubscriptionCreate,
-    GuardSubscriptionResponse,
-    GuardSubscriptionStatsResponse,
-    GuardSubscriptionUpdate,
-    GuardSubscriptionUsageLog,
-    GuardSubscriptionUsageLogsResponse,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import GuardManager
+    from .client import GuardClient
+    from .types import (
+        GuardAdminCreate,
+        GuardAdminCurrentUpdate,
+        GuardAdminPlaceHolder,
+        GuardAdminPlaceHolderCategory,
+        GuardAdminResponse,
+        GuardAdminRole,
+        GuardAdminToken,
+        GuardAdminUpdate,
+        GuardAdminUsageLog,
+        GuardAdminUsageLogsResponse,
+        GuardNodeCreate,
+        GuardNodeResponse,
+        GuardNodeStatsResponse,
+        GuardNodeUpdate,
+        GuardNodeCategory,
+        GuardServiceCreate,
+        GuardServiceResponse,
+        GuardServiceUpdate,
+        AdminStatsResponseNew,
+        GuardCountDetailStats,
+        GuardExpireSubDetailStats,
+        GuardStatsResponse,
+        GuardTopSubDetailStats,
+        GuardUsageDetailStats,
+        GuardSubscriptionCreate,
+        GuardSubscriptionResponse,
+        GuardSubscriptionStatsResponse,
+        GuardSubscriptionUpdate,
+        GuardSubscriptionUsageLog,
+        GuardSubscriptionUsageLogsResponse,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".manager": ["GuardManager"],
+        ".client": ["GuardClient"],
+        ".types": [
+            "GuardAdminCreate",
+            "GuardAdminCurrentUpdate",
+            "GuardAdminPlaceHolder",
+            "GuardAdminPlaceHolderCategory",
+            "GuardAdminResponse",
+            "GuardAdminRole",
+            "GuardAdminToken",
+            "GuardAdminUpdate",
+            "GuardAdminUsageLog",
+            "GuardAdminUsageLogsResponse",
+            "GuardNodeCreate",
+            "GuardNodeResponse",
+            "GuardNodeStatsResponse",
+            "GuardNodeUpdate",
+            "GuardNodeCategory",
+            "GuardServiceCreate",
+            "GuardServiceResponse",
+            "GuardServiceUpdate",
+            "AdminStatsResponseNew",
+            "GuardCountDetailStats",
+            "GuardExpireSubDetailStats",
+            "GuardStatsResponse",
+            "GuardTopSubDetailStats",
+            "GuardUsageDetailStats",
+            "GuardSubscriptionCreate",
+            "GuardSubscriptionResponse",
+            "GuardSubscriptionStatsResponse",
+            "GuardSubscriptionUpdate",
+            "GuardSubscriptionUsageLog",
+            "GuardSubscriptionUsageLogsResponse",
+        ],
+    },
 )
 
 __all__ = [
     "GuardManager",
+    "GuardClient",
     "AdminStatsResponseNew",
     "GuardAdminCreate",
     "GuardAdminCurrentUpdate",
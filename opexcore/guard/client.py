@@ -0,0 +1,30 @@
+from typing import Optional, Any
+from opexcore.core import PanelClient
+from .manager import GuardManager
+
+
+class GuardClient(PanelClient):
+    """GuardCore API client bound to a single panel"""
+
+    manager = GuardManager
+
+    def __init__(self, *args: Any, totp_code: Optional[str] = None, **kwargs: Any):
+        """
+        Create a GuardCore client.
+
+        Takes the same arguments as ``PanelClient``.
+
+        :param totp_code: Optional six digit TOTP code sent on login
+        """
+        super().__init__(*args, **kwargs)
+        self.totp_code = totp_code
+
+    async def _authenticate(self) -> str:
+        response = await GuardManager.create_token(
+            self.host,
+            self.username,
+            self.password,
+            totp_code=self.totp_code,
+            timeout=self.timeout,
+        )
+        return response.access_token
@@ -1,6 +1,14 @@
-import json
-from typing import Optional, List, Dict, Any
-from opexcore.core import RequestBase
+from contextlib import aclosing
+from typing import Optional, List, Dict, Any, AsyncIterator
+from opexcore.core import (
+    RequestBase,
+    paginate,
+    gather_pages,
+    Projection,
+    project,
+    DownloadResult,
+    Target,
+)
 from .types import (
     GuardAdminCreate,
     GuardAdminCurrentUpdate,
@@ -48,19 +56,20 @@ class GuardManager(RequestBase):
     @classmethod
     async def get_subscription_by_secret(
         cls, host: str, secret: str, timeout: int = 10
-    ) -> List[str]:
+    ) -> str:
         """
         Handle incoming subscription request from clients.
 
         :param host: API host URL
         :param secret: Subscription secret
         :param timeout: Request timeout in seconds
-        :return: Response data
+        :return: Subscription content as served by the panel
         """
-        response = await cls.get(
-            url=f"{host.rstrip('/')}/guards/{secret}", timeout=timeout
+        return await cls.get(
+            url=f"{host.rstrip('/')}/guards/{secret}",
+            timeout=timeout,
+            response_type="text",
         )
-        return response
 
     @classmethod
     async def get_subscription_info_by_secret(
@@ -77,7 +86,7 @@ class GuardManager(RequestBase):
         response = await cls.get(
             url=f"{host.rstrip('/')}/guards/{secret}/info", timeout=timeout
         )
-        return GuardSubscriptionResponse(**response)
+        return cls._parse(GuardSubscriptionResponse, response)
 
     @classmethod
     async def get_subscription_usages_by_secret(
@@ -94,7 +103,7 @@ class GuardManager(RequestBase):
         response = await cls.get(
             url=f"{host.rstrip('/')}/guards/{secret}/usages", timeout=timeout
         )
-        return GuardSubscriptionUsageLogsResponse(**response)
+        return cls._parse(GuardSubscriptionUsageLogsResponse, response)
 
     @classmethod
     async def get_subscription_status_stats(
@@ -113,7 +122,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardSubscriptionStatusStatsResponse(**response)
+        return cls._parse(GuardSubscriptionStatusStatsResponse, response)
 
     @classmethod
     async def get_most_usage_subscriptions(
@@ -136,7 +145,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardMostUsageSubscription(**response)
+        return cls._parse(GuardMostUsageSubscription, response)
 
     @classmethod
     async def get_usage_stats(
@@ -159,7 +168,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardUsageStatsResponse(**response)
+        return cls._parse(GuardUsageStatsResponse, response)
 
     @classmethod
     async def get_agent_stats(
@@ -178,7 +187,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAgentStatsResponse(**response)
+        return cls._parse(GuardAgentStatsResponse, response)
 
     @classmethod
     async def get_last_reached_subscriptions(
@@ -205,7 +214,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardLastReachedSubscriptionDetail(**item) for item in response]
+        return cls._parse(List[GuardLastReachedSubscriptionDetail], response)
 
     @classmethod
     async def get_nodes(
@@ -224,7 +233,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardNodeResponse(**item) for item in response]
+        return cls._parse(List[GuardNodeResponse], response)
 
     @classmethod
     async def create_node(
@@ -241,11 +250,11 @@ class GuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/nodes",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardNodeResponse(**response)
+        return cls._parse(GuardNodeResponse, response)
 
     @classmethod
     async def get_node_stats(
@@ -264,7 +273,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardNodeStatsResponse(**response)
+        return cls._parse(GuardNodeStatsResponse, response)
 
     @classmethod
     async def get_node(
@@ -284,7 +293,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardNodeResponse(**response)
+        return cls._parse(GuardNodeResponse, response)
 
     @classmethod
     async def update_node(
@@ -307,11 +316,11 @@ class GuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/nodes/{node_id}",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardNodeResponse(**response)
+        return cls._parse(GuardNodeResponse, response)
 
     @classmethod
     async def delete_node(
@@ -351,7 +360,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardNodeResponse(**response)
+        return cls._parse(GuardNodeResponse, response)
 
     @classmethod
     async def disable_node(
@@ -371,7 +380,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardNodeResponse(**response)
+        return cls._parse(GuardNodeResponse, response)
 
     @classmethod
     async def get_services(
@@ -390,7 +399,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardServiceResponse(**item) for item in response]
+        return cls._parse(List[GuardServiceResponse], response)
 
     @classmethod
     async def create_service(
@@ -407,11 +416,11 @@ class GuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/services",
-            data=service_data.model_dump_json(exclude_none=True),
+            json=service_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardServiceResponse(**response)
+        return cls._parse(GuardServiceResponse, response)
 
     @classmethod
     async def get_service(
@@ -431,7 +440,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardServiceResponse(**response)
+        return cls._parse(GuardServiceResponse, response)
 
     @classmethod
     async def update_service(
@@ -454,11 +463,11 @@ class GuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/services/{service_id}",
-            data=service_data.model_dump_json(exclude_none=True),
+            json=service_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardServiceResponse(**response)
+        return cls._parse(GuardServiceResponse, response)
 
     @classmethod
     async def delete_service(
@@ -497,7 +506,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardAdminResponse(**item) for item in response]
+        return cls._parse(List[GuardAdminResponse], response)
 
     @classmethod
     async def create_admin(
@@ -514,11 +523,11 @@ class GuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/admins",
-            data=admin_data.model_dump_json(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def create_token(
@@ -554,8 +563,9 @@ class GuardManager(RequestBase):
             data=form_data,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             timeout=timeout,
+            idempotent=True,
         )
-        return GuardAdminToken(**response)
+        return cls._parse(GuardAdminToken, response)
 
     @classmethod
     async def get_current_admin(
@@ -574,7 +584,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def update_current_admin(
@@ -594,17 +604,19 @@ class GuardManager(RequestBase):
         :param timeout: Request timeout in seconds
         :return: Admin response
         """
-        payload: Dict[str, Any] = {"data": admin_data.model_dump(exclude_none=True)}
+        payload: Dict[str, Any] = {
+            "data": admin_data.model_dump(mode="json", exclude_none=True)
+        }
         if code is not None:
             payload["code"] = code
 
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/admins/current",
-            data=json.dumps(payload),
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def get_current_admin_usages(
@@ -623,7 +635,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminUsageLogsResponse(**response)
+        return cls._parse(GuardAdminUsageLogsResponse, response)
 
     @classmethod
     async def revoke_current_admin_totp(
@@ -634,7 +646,7 @@ class GuardManager(RequestBase):
         payload: Dict[str, Any] = {"code": code} if code is not None else {}
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/admins/current/totp/revoke",
-            data=json.dumps(payload),
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
@@ -646,10 +658,10 @@ class GuardManager(RequestBase):
     ) -> Dict[str, Any]:
         """Verify and activate the pending TOTP secret for the current admin."""
 
-        payload = json.dumps({"code": code})
+        payload = {"code": code}
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/admins/current/totp/verify",
-            data=payload,
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
@@ -668,6 +680,44 @@ class GuardManager(RequestBase):
         )
         return response
 
+    @classmethod
+    async def download_current_admin_backup_to(
+        cls,
+        host: str,
+        token: str,
+        target: Target,
+        checksum: Optional[str] = None,
+        expected_checksum: Optional[str] = None,
+        timeout: int = 10,
+        resume: bool = True,
+    ) -> DownloadResult:
+        """
+        Download the current admin backup straight to a file.
+
+        Nightly backups run in constant memory. The backup is generated per
+        request, so a broken transfer only resumes when the panel sends an
+        ``ETag`` or ``Last-Modified`` for it; otherwise it starts over.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param target: File path, or a binary file object (sync or async)
+        :param checksum: ``hashlib`` algorithm to digest the file with
+        :param expected_checksum: Hex digest the file must match
+        :param timeout: Seconds allowed to connect and for each read
+        :param resume: Continue a ``.part`` file left by an earlier call when
+            the panel reports the same document
+        :return: Size and digest of the written file
+        """
+        return await cls.download_to(
+            url=f"{host.rstrip('/')}/api/admins/current/backup",
+            target=target,
+            headers=cls._generate_headers(token),
+            timeout=timeout,
+            checksum=checksum,
+            expected_checksum=expected_checksum,
+            resume=resume,
+        )
+
     @classmethod
     async def revoke_current_admin_api_key(
         cls, host: str, token: str, timeout: int = 10
@@ -685,7 +735,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def get_admin(
@@ -705,7 +755,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def update_admin(
@@ -728,11 +778,11 @@ class GuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/admins/{username}",
-            data=admin_data.model_dump_json(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def delete_admin(
@@ -772,7 +822,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminUsageLogsResponse(**response)
+        return cls._parse(GuardAdminUsageLogsResponse, response)
 
     @classmethod
     async def enable_admin(
@@ -792,7 +842,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def disable_admin(
@@ -812,7 +862,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def revoke_admin_api_key(
@@ -832,7 +882,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardAdminResponse(**response)
+        return cls._parse(GuardAdminResponse, response)
 
     @classmethod
     async def get_admin_subscriptions(
@@ -852,7 +902,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardSubscriptionResponse(**item) for item in response]
+        return cls._parse(List[GuardSubscriptionResponse], response)
 
     @classmethod
     async def delete_admin_subscriptions(
@@ -929,6 +979,7 @@ class GuardManager(RequestBase):
         page: int = 1,
         size: int = 10,
         timeout: int = 10,
+        projection: Optional[Projection] = None,
     ) -> List[GuardSubscriptionResponse]:
         """
         Get a list of all subscriptions with optional filters.
@@ -945,6 +996,7 @@ class GuardManager(RequestBase):
         :param page: Page number
         :param size: Page size
         :param timeout: Request timeout in seconds
+        :param projection: Fields to keep, or a lighter model to parse subscriptions into
         :return: List of subscription responses
         """
         params = {"page": page, "size": size}
@@ -963,13 +1015,206 @@ class GuardManager(RequestBase):
         if order_by is not None:
             params["order_by"] = order_by
 
-        response = await cls.get(
+        return await cls.get(
+            url=f"{host.rstrip('/')}/api/subscriptions",
+            params=params,
+            headers=cls._generate_headers(token),
+            timeout=timeout,
+            response_model=List[project(GuardSubscriptionResponse, projection)],
+        )
+
+    @classmethod
+    async def iter_subscriptions(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 100,
+        limited: Optional[bool] = None,
+        expired: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        search: Optional[str] = None,
+        online: Optional[bool] = None,
+        order_by: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[GuardSubscriptionResponse]:
+        """
+        Iterate over all subscriptions matching the filters, page by page.
+
+        The next page is requested while the current one is being consumed.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of subscriptions requested per page
+        :param limited: Filter by limited status
+        :param expired: Filter by expired status
+        :param is_active: Filter by active status
+        :param enabled: Filter by enabled status
+        :param search: Search query
+        :param online: Filter by online status
+        :param order_by: Order by field
+        :param projection: Fields to keep, or a lighter model to parse subscriptions into
+        :param timeout: Request timeout in seconds
+        :return: Async iterator over subscription responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            subscriptions = await cls.get_subscriptions(
+                host,
+                token,
+                limited=limited,
+                expired=expired,
+                is_active=is_active,
+                enabled=enabled,
+                search=search,
+                online=online,
+                order_by=order_by,
+                page=index + 1,
+                size=size,
+                projection=projection,
+                timeout=timeout,
+            )
+            return subscriptions, None
+
+        async with aclosing(paginate(fetch_page, page_size)) as items:
+            async for subscription in items:
+                yield subscription
+
+    @classmethod
+    async def get_all_subscriptions(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 1000,
+        concurrency: int = 8,
+        limited: Optional[bool] = None,
+        expired: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        online: Optional[bool] = None,
+        order_by: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> List[GuardSubscriptionResponse]:
+        """
+        Fetch every subscription matching the filters with concurrent page requests.
+
+        The total is read from the count endpoint and the page size the panel
+        serves from the first page; the remaining pages are then fetched in
+        parallel and returned in order. Raises ``PaginationError`` if they do
+        not add up to the total.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of subscriptions requested per page
+        :param concurrency: Maximum number of pages fetched at once
+        :param limited: Filter by limited status
+        :param expired: Filter by expired status
+        :param is_active: Filter by active status
+        :param enabled: Filter by enabled status
+        :param online: Filter by online status
+        :param order_by: Order by field
+        :param projection: Fields to keep, or a lighter model to parse subscriptions into
+        :param timeout: Request timeout in seconds
+        :return: List of subscription responses
+        """
+        total = await cls.get_subscription_count(
+            host,
+            token,
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            online=online,
+            timeout=timeout,
+        )
+
+        async def fetch_page(index: int, size: int):
+            subscriptions = await cls.get_subscriptions(
+                host,
+                token,
+                limited=limited,
+                expired=expired,
+                is_active=is_active,
+                enabled=enabled,
+                online=online,
+                order_by=order_by,
+                page=index + 1,
+                size=size,
+                projection=projection,
+                timeout=timeout,
+            )
+            return subscriptions, total
+
+        return await gather_pages(
+            fetch_page, page_size, total=total, concurrency=concurrency
+        )
+
+    @classmethod
+    async def stream_subscriptions(
+        cls,
+        host: str,
+        token: str,
+        limited: Optional[bool] = None,
+        expired: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        search: Optional[str] = None,
+        online: Optional[bool] = None,
+        order_by: Optional[str] = None,
+        page: int = 1,
+        size: int = 10000,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[GuardSubscriptionResponse]:
+        """
+        Fetch a large page of subscriptions, parsing them as they arrive.
+
+        Only one subscription is decoded at a time, so memory stays flat
+        however large ``size`` is.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param limited: Filter by limited status
+        :param expired: Filter by expired status
+        :param is_active: Filter by active status
+        :param enabled: Filter by enabled status
+        :param search: Search query
+        :param online: Filter by online status
+        :param order_by: Order by field
+        :param page: Page number
+        :param size: Page size
+        :param projection: Fields to keep, or a lighter model to parse subscriptions into
+        :param timeout: Seconds allowed to connect and for each read
+        :return: Async iterator over subscription responses
+        """
+        params = {"page": page, "size": size}
+        if limited is not None:
+            params["limited"] = limited
+        if expired is not None:
+            params["expired"] = expired
+        if is_active is not None:
+            params["is_active"] = is_active
+        if enabled is not None:
+            params["enabled"] = enabled
+        if search is not None:
+            params["search"] = search
+        if online is not None:
+            params["online"] = online
+        if order_by is not None:
+            params["order_by"] = order_by
+
+        items = cls.stream_items(
             url=f"{host.rstrip('/')}/api/subscriptions",
+            model=project(GuardSubscriptionResponse, projection),
             params=params,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardSubscriptionResponse(**item) for item in response]
+        async with aclosing(items):
+            async for subscription in items:
+                yield subscription
 
     @classmethod
     async def create_subscriptions(
@@ -988,14 +1233,16 @@ class GuardManager(RequestBase):
         :param timeout: Request timeout in seconds
         :return: List of subscription responses
         """
-        payload = [sub.model_dump(exclude_none=True) for sub in subscriptions_data]
+        payload = [
+            sub.model_dump(mode="json", exclude_none=True) for sub in subscriptions_data
+        ]
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/subscriptions",
-            data=json.dumps(payload),
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardSubscriptionResponse(**item) for item in response]
+        return cls._parse(List[GuardSubscriptionResponse], response)
 
     @classmethod
     async def delete_subscriptions(
@@ -1003,10 +1250,10 @@ class GuardManager(RequestBase):
     ) -> Dict[str, Any]:
         """Bulk delete subscriptions by usernames."""
 
-        payload = json.dumps({"usernames": usernames})
+        payload = {"usernames": usernames}
         response = await cls.delete(
             url=f"{host.rstrip('/')}/api/subscriptions",
-            data=payload,
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
@@ -1074,7 +1321,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardSubscriptionStatsResponse(**response)
+        return cls._parse(GuardSubscriptionStatsResponse, response)
 
     @classmethod
     async def get_subscription(
@@ -1094,7 +1341,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardSubscriptionResponse(**response)
+        return cls._parse(GuardSubscriptionResponse, response)
 
     @classmethod
     async def update_subscription(
@@ -1117,11 +1364,11 @@ class GuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/subscriptions/{username}",
-            data=subscription_data.model_dump_json(exclude_none=True),
+            json=subscription_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardSubscriptionResponse(**response)
+        return cls._parse(GuardSubscriptionResponse, response)
 
     @classmethod
     async def delete_subscription(
@@ -1161,7 +1408,7 @@ class GuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return GuardSubscriptionUsageLogsResponse(**response)
+        return cls._parse(GuardSubscriptionUsageLogsResponse, response)
 
     @classmethod
     async def enable_subscriptions(
@@ -1169,14 +1416,14 @@ class GuardManager(RequestBase):
     ) -> List[GuardSubscriptionResponse]:
         """Bulk enable subscriptions by usernames."""
 
-        payload = json.dumps({"usernames": usernames})
+        payload = {"usernames": usernames}
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/subscriptions/enable",
-            data=payload,
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardSubscriptionResponse(**item) for item in response]
+        return cls._parse(List[GuardSubscriptionResponse], response)
 
     @classmethod
     async def disable_subscriptions(
@@ -1184,14 +1431,14 @@ class GuardManager(RequestBase):
     ) -> List[GuardSubscriptionResponse]:
         """Bulk disable subscriptions by usernames."""
 
-        payload = json.dumps({"usernames": usernames})
+        payload = {"usernames": usernames}
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/subscriptions/disable",
-            data=payload,
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardSubscriptionResponse(**item) for item in response]
+        return cls._parse(List[GuardSubscriptionResponse], response)
 
     @classmethod
     async def revoke_subscriptions(
@@ -1199,14 +1446,14 @@ class GuardManager(RequestBase):
     ) -> List[GuardSubscriptionResponse]:
         """Bulk revoke subscriptions by usernames."""
 
-        payload = json.dumps({"usernames": usernames})
+        payload = {"usernames": usernames}
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/subscriptions/revoke",
-            data=payload,
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardSubscriptionResponse(**item) for item in response]
+        return cls._parse(List[GuardSubscriptionResponse], response)
 
     @classmethod
     async def reset_subscriptions(
@@ -1214,14 +1461,14 @@ class GuardManager(RequestBase):
     ) -> List[GuardSubscriptionResponse]:
         """Bulk reset subscriptions by usernames."""
 
-        payload = json.dumps({"usernames": usernames})
+        payload = {"usernames": usernames}
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/subscriptions/reset",
-            data=payload,
+            json=payload,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [GuardSubscriptionResponse(**item) for item in response]
+        return cls._parse(List[GuardSubscriptionResponse], response)
 
     @classmethod
     async def bulk_add_service(
@@ -1,49 +1,110 @@
-from .admin import (
-    GuardAdminCreate,
-    GuardAdminCurrentUpdate,
-    GuardAdminPlaceHolder,
-    GuardAdminPlaceHolderCategory,
-    GuardAdminResponse,
-    GuardAdminRole,
-    GuardAdminToken,
-    GuardAdminUpdate,
-    GuardAdminUsageLog,
-    GuardAdminUsageLogsResponse,
-)
-from .node import (
-    GuardNodeCreate,
-    GuardNodeResponse,
-    GuardNodeStatsResponse,
-    GuardNodeUpdate,
-    GuardNodeCategory,
-)
-from .service import GuardServiceCreate, GuardServiceResponse, GuardServiceUpdate
-from .stats import (
-    AdminStatsResponseNew,
-    GuardCountDetailStats,
-    GuardExpireSubDetailStats,
-    GuardStatsResponse,
-    GuardTopSubDetailStats,
-    GuardUsageDetailStats,
-    GuardSubscriptionStatusStatsResponse,
-    GuardUsageSubscriptionDetail,
-    GuardMostUsageSubscription,
-    GuardUsageDetail,
-    GuardUsageStatsResponse,
-    GuardAgentStatsDetail,
-    GuardAgentStatsResponse,
-    GuardLastReachedSubscriptionDetail,
-)
-from .subscription import (
-    GuardAutoRenewalCreate,
-    GuardAutoRenewalResponse,
-    GuardAutoRenewalUpdate,
-    GuardSubscriptionCreate,
-    GuardSubscriptionResponse,
-    GuardSubscriptionStatsResponse,
-    GuardSubscriptionUpdate,
-    GuardSubscriptionUsageLog,
-    GuardSubscriptionUsageLogsResponse,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .admin import (
+        GuardAdminCreate,
+        GuardAdminCurrentUpdate,
+        GuardAdminPlaceHolder,
+        GuardAdminPlaceHolderCategory,
+        GuardAdminResponse,
+        GuardAdminRole,
+        GuardAdminToken,
+        GuardAdminUpdate,
+        GuardAdminUsageLog,
+        GuardAdminUsageLogsResponse,
+    )
+    from .node import (
+        GuardNodeCreate,
+        GuardNodeResponse,
+        GuardNodeStatsResponse,
+        GuardNodeUpdate,
+        GuardNodeCategory,
+    )
+    from .service import GuardServiceCreate, GuardServiceResponse, GuardServiceUpdate
+    from .stats import (
+        AdminStatsResponseNew,
+        GuardCountDetailStats,
+        GuardExpireSubDetailStats,
+        GuardStatsResponse,
+        GuardTopSubDetailStats,
+        GuardUsageDetailStats,
+        GuardSubscriptionStatusStatsResponse,
+        GuardUsageSubscriptionDetail,
+        GuardMostUsageSubscription,
+        GuardUsageDetail,
+        GuardUsageStatsResponse,
+        GuardAgentStatsDetail,
+        GuardAgentStatsResponse,
+        GuardLastReachedSubscriptionDetail,
+    )
+    from .subscription import (
+        GuardAutoRenewalCreate,
+        GuardAutoRenewalResponse,
+        GuardAutoRenewalUpdate,
+        GuardSubscriptionCreate,
+        GuardSubscriptionResponse,
+        GuardSubscriptionStatsResponse,
+        GuardSubscriptionUpdate,
+        GuardSubscriptionUsageLog,
+        GuardSubscriptionUsageLogsResponse,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".admin": [
+            "GuardAdminCreate",
+            "GuardAdminCurrentUpdate",
+            "GuardAdminPlaceHolder",
+            "GuardAdminPlaceHolderCategory",
+            "GuardAdminResponse",
+            "GuardAdminRole",
+            "GuardAdminToken",
+            "GuardAdminUpdate",
+            "GuardAdminUsageLog",
+            "GuardAdminUsageLogsResponse",
+        ],
+        ".node": [
+            "GuardNodeCreate",
+            "GuardNodeResponse",
+            "GuardNodeStatsResponse",
+            "GuardNodeUpdate",
+            "GuardNodeCategory",
+        ],
+        ".service": [
+            "GuardServiceCreate",
+            "GuardServiceResponse",
+            "GuardServiceUpdate",
+        ],
+        ".stats": [
+            "AdminStatsResponseNew",
+            "GuardCountDetailStats",
+            "GuardExpireSubDetailStats",
+            "GuardStatsResponse",
+            "GuardTopSubDetailStats",
+            "GuardUsageDetailStats",
+            "GuardSubscriptionStatusStatsResponse",
+            "GuardUsageSubscriptionDetail",
+            "GuardMostUsageSubscription",
+            "GuardUsageDetail",
+            "GuardUsageStatsResponse",
+            "GuardAgentStatsDetail",
+            "GuardAgentStatsResponse",
+            "GuardLastReachedSubscriptionDetail",
+        ],
+        ".subscription": [
+            "GuardAutoRenewalCreate",
+            "GuardAutoRenewalResponse",
+            "GuardAutoRenewalUpdate",
+            "GuardSubscriptionCreate",
+            "GuardSubscriptionResponse",
+            "GuardSubscriptionStatsResponse",
+            "GuardSubscriptionUpdate",
+            "GuardSubscriptionUsageLog",
+            "GuardSubscriptionUsageLogsResponse",
+        ],
+    },
 )
 
 __all__ = [
@@ -1,7 +1,8 @@
 from typing import List, Optional
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class GuardAdminRole(str, Enum):
@@ -21,14 +22,14 @@ class GuardAdminPlaceHolderCategory(str, Enum):
     DISABLED = "disabled"
 
 
-class GuardAdminPlaceHolder(BaseModel):
+class GuardAdminPlaceHolder(PanelModel):
     """Admin placeholder configuration"""
 
     remark: str = Field(..., title="Remark")
     categories: List[GuardAdminPlaceHolderCategory] = Field(..., title="Categories")
 
 
-class GuardAdminCreate(BaseModel):
+class GuardAdminCreate(PanelModel):
     """Schema for creating a new admin"""
 
     username: str = Field(..., title="Username")
@@ -72,7 +73,7 @@ class GuardAdminCreate(BaseModel):
     announce_url: Optional[str] = Field(None, title="Announce Url")
 
 
-class GuardAdminUpdate(BaseModel):
+class GuardAdminUpdate(PanelModel):
     """Schema for updating an existing admin"""
 
     password: Optional[str] = Field(None, title="Password")
@@ -113,7 +114,7 @@ class GuardAdminUpdate(BaseModel):
     totp_status: Optional[bool] = Field(None, title="Totp Status")
 
 
-class GuardAdminCurrentUpdate(BaseModel):
+class GuardAdminCurrentUpdate(PanelModel):
     """Schema for updating current admin"""
 
     password: Optional[str] = Field(None, title="Password")
@@ -147,7 +148,7 @@ class GuardAdminCurrentUpdate(BaseModel):
     totp_status: Optional[bool] = Field(None, title="Totp Status")
 
 
-class GuardAdminResponse(BaseModel):
+class GuardAdminResponse(PanelModel):
     """Admin response schema"""
 
     id: int = Field(..., title="Id")
@@ -203,21 +204,21 @@ class GuardAdminResponse(BaseModel):
     updated_at: datetime = Field(..., title="Updated At")
 
 
-class GuardAdminToken(BaseModel):
+class GuardAdminToken(PanelModel):
     """Admin authentication token"""
 
     access_token: str = Field(..., title="Access Token")
     token_type: str = Field("bearer", title="Token Type")
 
 
-class GuardAdminUsageLog(BaseModel):
+class GuardAdminUsageLog(PanelModel):
     """Admin usage log entry"""
 
     usage: int = Field(..., title="Usage")
     created_at: datetime = Field(..., title="Created At")
 
 
-class GuardAdminUsageLogsResponse(BaseModel):
+class GuardAdminUsageLogsResponse(PanelModel):
     """Admin usage logs response"""
 
     admin: GuardAdminResponse = Field(..., title="Admin")
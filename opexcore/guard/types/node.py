@@ -1,7 +1,8 @@
 from typing import Optional
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class GuardNodeCategory(str, Enum):
@@ -11,7 +12,7 @@ class GuardNodeCategory(str, Enum):
     MARZNESHIN = "marzneshin"
 
 
-class GuardNodeCreate(BaseModel):
+class GuardNodeCreate(PanelModel):
     """Schema for creating a new node"""
 
     remark: str = Field(..., title="Remark")
@@ -24,7 +25,7 @@ class GuardNodeCreate(BaseModel):
     usage_rate: float = Field(1.0, title="Usage Rate")
 
 
-class GuardNodeUpdate(BaseModel):
+class GuardNodeUpdate(PanelModel):
     """Schema for updating an existing node"""
 
     remark: Optional[str] = Field(None, title="Remark")
@@ -36,7 +37,7 @@ class GuardNodeUpdate(BaseModel):
     usage_rate: Optional[float] = Field(None, title="Usage Rate")
 
 
-class GuardNodeResponse(BaseModel):
+class GuardNodeResponse(PanelModel):
     """Node response schema"""
 
     id: int = Field(..., title="Id")
@@ -55,7 +56,7 @@ class GuardNodeResponse(BaseModel):
     updated_at: datetime = Field(..., title="Updated At")
 
 
-class GuardNodeStatsResponse(BaseModel):
+class GuardNodeStatsResponse(PanelModel):
     """Node statistics response"""
 
     total_nodes: int = Field(..., title="Total Nodes")
@@ -1,22 +1,23 @@
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class GuardServiceCreate(BaseModel):
+class GuardServiceCreate(PanelModel):
     """Schema for creating a new service"""
 
     remark: str = Field(..., title="Remark")
     node_ids: List[int] = Field(..., title="Node Ids")
 
 
-class GuardServiceUpdate(BaseModel):
+class GuardServiceUpdate(PanelModel):
     """Schema for updating an existing service"""
 
     remark: Optional[str] = Field(None, title="Remark")
     node_ids: Optional[List[int]] = Field(None, title="Node Ids")
 
 
-class GuardServiceResponse(BaseModel):
+class GuardServiceResponse(PanelModel):
     """Service response schema"""
 
     id: int = Field(..., title="Id")
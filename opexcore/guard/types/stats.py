@@ -1,9 +1,10 @@
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class GuardUsageDetailStats(BaseModel):
+class GuardUsageDetailStats(PanelModel):
     """Usage detail statistics"""
 
     start: Optional[datetime] = Field(None, title="Start")
@@ -13,7 +14,7 @@ class GuardUsageDetailStats(BaseModel):
     usage: int = Field(..., title="Usage")
 
 
-class GuardCountDetailStats(BaseModel):
+class GuardCountDetailStats(PanelModel):
     """Count detail statistics"""
 
     start: Optional[datetime] = Field(None, title="Start")
@@ -21,7 +22,7 @@ class GuardCountDetailStats(BaseModel):
     count: int = Field(..., title="Count")
 
 
-class GuardTopSubDetailStats(BaseModel):
+class GuardTopSubDetailStats(PanelModel):
     """Top subscription detail statistics"""
 
     username: str = Field(..., title="Username")
@@ -29,7 +30,7 @@ class GuardTopSubDetailStats(BaseModel):
     usage: int = Field(..., title="Usage")
 
 
-class GuardExpireSubDetailStats(BaseModel):
+class GuardExpireSubDetailStats(PanelModel):
     """Expire subscription detail statistics"""
 
     username: str = Field(..., title="Username")
@@ -37,7 +38,7 @@ class GuardExpireSubDetailStats(BaseModel):
     expire: int = Field(..., title="Expire")
 
 
-class GuardStatsResponse(BaseModel):
+class GuardStatsResponse(PanelModel):
     """General statistics response"""
 
     total_subscriptions: int = Field(..., title="Total Subscriptions")
@@ -67,7 +68,7 @@ class GuardStatsResponse(BaseModel):
     last_7d_usages: List[GuardUsageDetailStats] = Field(..., title="Last 7D Usages")
 
 
-class AdminStatsResponseNew(BaseModel):
+class AdminStatsResponseNew(PanelModel):
     """Combined admin statistics response"""
 
     usage_limit: Optional[int] = Field(..., title="Usage Limit")
@@ -126,7 +127,7 @@ class AdminStatsResponseNew(BaseModel):
     total_removed_subscriptions: int = Field(..., title="Total Removed Subscriptions")
 
 
-class GuardSubscriptionStatusStatsResponse(BaseModel):
+class GuardSubscriptionStatusStatsResponse(PanelModel):
     """Subscription status statistics response"""
 
     total: int = Field(..., title="Total")
@@ -141,7 +142,7 @@ class GuardSubscriptionStatusStatsResponse(BaseModel):
     offline: int = Field(..., title="Offline")
 
 
-class GuardUsageSubscriptionDetail(BaseModel):
+class GuardUsageSubscriptionDetail(PanelModel):
     """Usage subscription detail"""
 
     username: str = Field(..., title="Username")
@@ -149,7 +150,7 @@ class GuardUsageSubscriptionDetail(BaseModel):
     is_active: bool = Field(..., title="Is Active")
 
 
-class GuardMostUsageSubscription(BaseModel):
+class GuardMostUsageSubscription(PanelModel):
     """Most usage subscription response"""
 
     subscriptions: List[GuardUsageSubscriptionDetail] = Field(
@@ -159,7 +160,7 @@ class GuardMostUsageSubscription(BaseModel):
     end_date: datetime = Field(..., title="End Date")
 
 
-class GuardUsageDetail(BaseModel):
+class GuardUsageDetail(PanelModel):
     """Usage detail"""
 
     start_date: datetime = Field(..., title="Start Date")
@@ -167,7 +168,7 @@ class GuardUsageDetail(BaseModel):
     usage: int = Field(..., title="Usage")
 
 
-class GuardUsageStatsResponse(BaseModel):
+class GuardUsageStatsResponse(PanelModel):
     """Usage statistics response"""
 
     total: int = Field(..., title="Total")
@@ -176,20 +177,20 @@ class GuardUsageStatsResponse(BaseModel):
     end_date: datetime = Field(..., title="End Date")
 
 
-class GuardAgentStatsDetail(BaseModel):
+class GuardAgentStatsDetail(PanelModel):
     """Agent statistics detail"""
 
     category: str = Field(..., title="Category")
     count: int = Field(..., title="Count")
 
 
-class GuardAgentStatsResponse(BaseModel):
+class GuardAgentStatsResponse(PanelModel):
     """Agent statistics response"""
 
     agents: List[GuardAgentStatsDetail] = Field(..., title="Agents")
 
 
-class GuardLastReachedSubscriptionDetail(BaseModel):
+class GuardLastReachedSubscriptionDetail(PanelModel):
     """Detail of the last reached subscription entry"""
 
     username: str = Field(..., title="Username")
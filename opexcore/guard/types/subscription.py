@@ -1,9 +1,10 @@
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class GuardAutoRenewalCreate(BaseModel):
+class GuardAutoRenewalCreate(PanelModel):
     """Schema for creating a new auto renewal rule"""
 
     limit_expire: int = Field(..., title="Limit Expire")
@@ -11,7 +12,7 @@ class GuardAutoRenewalCreate(BaseModel):
     reset_usage: bool = Field(False, title="Reset Usage")
 
 
-class GuardAutoRenewalUpdate(BaseModel):
+class GuardAutoRenewalUpdate(PanelModel):
     """Schema for updating an existing auto renewal rule"""
 
     id: int = Field(..., title="Id")
@@ -20,7 +21,7 @@ class GuardAutoRenewalUpdate(BaseModel):
     reset_usage: Optional[bool] = Field(None, title="Reset Usage")
 
 
-class GuardAutoRenewalResponse(BaseModel):
+class GuardAutoRenewalResponse(PanelModel):
     """Auto renewal response schema"""
 
     id: int = Field(..., title="Id")
@@ -29,7 +30,7 @@ class GuardAutoRenewalResponse(BaseModel):
     reset_usage: bool = Field(..., title="Reset Usage")
 
 
-class GuardSubscriptionCreate(BaseModel):
+class GuardSubscriptionCreate(PanelModel):
     """Schema for creating a new subscription"""
 
     username: str = Field(..., title="Username")
@@ -46,7 +47,7 @@ class GuardSubscriptionCreate(BaseModel):
     )
 
 
-class GuardSubscriptionUpdate(BaseModel):
+class GuardSubscriptionUpdate(PanelModel):
     """Schema for updating an existing subscription"""
 
     username: Optional[str] = Field(None, title="Username")
@@ -62,7 +63,7 @@ class GuardSubscriptionUpdate(BaseModel):
     )
 
 
-class GuardSubscriptionResponse(BaseModel):
+class GuardSubscriptionResponse(PanelModel):
     """Subscription response schema"""
 
     id: int = Field(..., title="Id")
@@ -99,21 +100,21 @@ class GuardSubscriptionResponse(BaseModel):
     )
 
 
-class GuardSubscriptionUsageLog(BaseModel):
+class GuardSubscriptionUsageLog(PanelModel):
     """Subscription usage log entry"""
 
     usage: int = Field(..., title="Usage")
     created_at: datetime = Field(..., title="Created At")
 
 
-class GuardSubscriptionUsageLogsResponse(BaseModel):
+class GuardSubscriptionUsageLogsResponse(PanelModel):
     """Subscription usage logs response"""
 
     subscription: GuardSubscriptionResponse = Field(..., title="Subscription")
     usages: List[GuardSubscriptionUsageLog] = Field(..., title="Usages")
 
 
-class GuardSubscriptionStatsResponse(BaseModel):
+class GuardSubscriptionStatsResponse(PanelModel):
     """Subscription statistics response"""
 
     total: int = Field(..., title="Total")
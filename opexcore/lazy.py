@@ -0,0 +1,39 @@
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str, modules: Dict[str, Iterable[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module ``__getattr__`` and ``__dir__`` of a lazily loaded package.
+
+    A name is imported from its submodule on first access and then cached in
+    the package, so importing the package itself loads none of them.
+    Subpackages are imported on attribute access too, as if they had been
+    imported eagerly.
+
+    :param package: ``__name__`` of the package
+    :param modules: Names exported by each relative submodule, e.g.
+        ``{".manager": ["MarzbanManager"]}``
+    :return: ``__getattr__`` and ``__dir__`` functions for the package
+    """
+    origins = {name: module for module, names in modules.items() for name in names}
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is not None:
+            value = getattr(import_module(module, package), name)
+        elif not name.startswith("_") and find_spec(f"{package}.{name}"):
+            value = import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*namespace, *origins})
+
+    return __getattr__, __dir__
@@ -1,45 +1,95 @@
-from .manager import MarzbanManager
-from .types import (
-    MarzbanAdmin,
-    MarzbanAdminCreate,
-    MarzbanAdminModify,
-    MarzbanToken,
-    MarzbanUserCreate,
-    MarzbanUserModify,
-    MarzbanUserResponse,
-    MarzbanUsersResponse,
-    MarzbanUserStatus,
-    MarzbanUserStatusCreate,
-    MarzbanUserStatusModify,
-    MarzbanUserDataLimitResetStrategy,
-    MarzbanProxyTypes,
-    MarzbanNextPlanModel,
-    MarzbanUserUsageResponse,
-    MarzbanUserUsagesResponse,
-    MarzbanUsersUsagesResponse,
-    MarzbanNodeCreate,
-    MarzbanNodeModify,
-    MarzbanNodeResponse,
-    MarzbanNodeSettings,
-    MarzbanNodeStatus,
-    MarzbanNodeUsageResponse,
-    MarzbanNodesUsageResponse,
-    MarzbanCoreStats,
-    MarzbanSystemStats,
-    MarzbanProxyInbound,
-    MarzbanProxyHost,
-    MarzbanProxyHostSecurity,
-    MarzbanProxyHostALPN,
-    MarzbanProxyHostFingerprint,
-    MarzbanSubscriptionUserResponse,
-    MarzbanUserTemplateCreate,
-    MarzbanUserTemplateModify,
-    MarzbanUserTemplateResponse,
-)
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import MarzbanManager
+    from .client import MarzbanClient
+    from .types import (
+        MarzbanAdmin,
+        MarzbanAdminCreate,
+        MarzbanAdminModify,
+        MarzbanToken,
+        MarzbanUserCreate,
+        MarzbanUserModify,
+        MarzbanUserResponse,
+        MarzbanUsersResponse,
+        MarzbanUserStatus,
+        MarzbanUserStatusCreate,
+        MarzbanUserStatusModify,
+        MarzbanUserDataLimitResetStrategy,
+        MarzbanProxyTypes,
+        MarzbanNextPlanModel,
+        MarzbanUserUsageResponse,
+        MarzbanUserUsagesResponse,
+        MarzbanUsersUsagesResponse,
+        MarzbanNodeCreate,
+        MarzbanNodeModify,
+        MarzbanNodeResponse,
+        MarzbanNodeSettings,
+        MarzbanNodeStatus,
+        MarzbanNodeUsageResponse,
+        MarzbanNodesUsageResponse,
+        MarzbanCoreStats,
+        MarzbanSystemStats,
+        MarzbanProxyInbound,
+        MarzbanProxyHost,
+        MarzbanProxyHostSecurity,
+        MarzbanProxyHostALPN,
+        MarzbanProxyHostFingerprint,
+        MarzbanSubscriptionUserResponse,
+        MarzbanUserTemplateCreate,
+        MarzbanUserTemplateModify,
+        MarzbanUserTemplateResponse,
+    )
 
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".manager": ["MarzbanManager"],
+        ".client": ["MarzbanClient"],
+        ".types": [
+            "MarzbanAdmin",
+            "MarzbanAdminCreate",
+            "MarzbanAdminModify",
+            "MarzbanToken",
+            "MarzbanUserCreate",
+            "MarzbanUserModify",
+            "MarzbanUserResponse",
+            "MarzbanUsersResponse",
+            "MarzbanUserStatus",
+            "MarzbanUserStatusCreate",
+            "MarzbanUserStatusModify",
+            "MarzbanUserDataLimitResetStrategy",
+            "MarzbanProxyTypes",
+            "MarzbanNextPlanModel",
+            "MarzbanUserUsageResponse",
+            "MarzbanUserUsagesResponse",
+            "MarzbanUsersUsagesResponse",
+            "MarzbanNodeCreate",
+            "MarzbanNodeModify",
+            "MarzbanNodeResponse",
+            "MarzbanNodeSettings",
+            "MarzbanNodeStatus",
+            "MarzbanNodeUsageResponse",
+            "MarzbanNodesUsageResponse",
+            "MarzbanCoreStats",
+            "MarzbanSystemStats",
+            "MarzbanProxyInbound",
+            "MarzbanProxyHost",
+            "MarzbanProxyHostSecurity",
+            "MarzbanProxyHostALPN",
+            "MarzbanProxyHostFingerprint",
+            "MarzbanSubscriptionUserResponse",
+            "MarzbanUserTemplateCreate",
+            "MarzbanUserTemplateModify",
+            "MarzbanUserTemplateResponse",
+        ],
+    },
+)
 
 __all__ = [
     "MarzbanManager",
+    "MarzbanClient",
     "MarzbanAdmin",
     "MarzbanAdminCreate",
     "MarzbanAdminModify",
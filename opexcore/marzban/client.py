@@ -0,0 +1,22 @@
+from opexcore.core import PanelClient
+from .manager import MarzbanManager
+
+
+class MarzbanClient(PanelClient):
+    """Marzban API client bound to a single panel"""
+
+    manager = MarzbanManager
+    public_methods = frozenset(
+        {
+            "user_subscription",
+            "user_subscription_info",
+            "user_get_usage",
+            "user_subscription_with_client_type",
+        }
+    )
+
+    async def _authenticate(self) -> str:
+        response = await MarzbanManager.admin_token(
+            self.host, self.username, self.password, timeout=self.timeout
+        )
+        return response.access_token
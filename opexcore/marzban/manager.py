@@ -1,6 +1,16 @@
-from typing import Optional, List, Dict, Any
+from contextlib import aclosing
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import datetime
-from opexcore.core import RequestBase
+from opexcore.core import (
+    RequestBase,
+    paginate,
+    gather_pages,
+    cached,
+    invalidates,
+    Projection,
+    project,
+    with_items,
+)
 from .types import (
     MarzbanAdmin,
     MarzbanAdminCreate,
@@ -58,8 +68,9 @@ class MarzbanManager(RequestBase):
             data={"username": username, "password": password},
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             timeout=timeout,
+            idempotent=True,
         )
-        return MarzbanToken(**response)
+        return cls._parse(MarzbanToken, response)
 
     @classmethod
     async def get_current_admin(
@@ -78,7 +89,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanAdmin(**response)
+        return cls._parse(MarzbanAdmin, response)
 
     @classmethod
     async def create_admin(
@@ -95,11 +106,11 @@ class MarzbanManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/admin",
-            data=admin_data.model_dump_json(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanAdmin(**response)
+        return cls._parse(MarzbanAdmin, response)
 
     @classmethod
     async def modify_admin(
@@ -122,11 +133,11 @@ class MarzbanManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/admin/{username}",
-            data=admin_data.model_dump_json(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanAdmin(**response)
+        return cls._parse(MarzbanAdmin, response)
 
     @classmethod
     async def remove_admin(
@@ -182,7 +193,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzbanAdmin(**item) for item in response]
+        return cls._parse(List[MarzbanAdmin], response)
 
     @classmethod
     async def disable_all_active_users(
@@ -240,7 +251,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanAdmin(**response)
+        return cls._parse(MarzbanAdmin, response)
 
     @classmethod
     async def get_admin_usage(
@@ -278,7 +289,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanCoreStats(**response)
+        return cls._parse(MarzbanCoreStats, response)
 
     @classmethod
     async def restart_core(
@@ -317,6 +328,7 @@ class MarzbanManager(RequestBase):
         )
 
     @classmethod
+    @invalidates("inbounds", "hosts")
     async def modify_core_config(
         cls, host: str, token: str, config: Dict[str, Any], timeout: int = 10
     ) -> Dict[str, Any]:
@@ -331,12 +343,13 @@ class MarzbanManager(RequestBase):
         """
         return await cls.put(
             url=f"{host.rstrip('/')}/api/core/config",
-            data=config,
+            json=config,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
 
     @classmethod
+    @cached(ttl=3600, stale_ttl=3600, tags=("node_settings",))
     async def get_node_settings(
         cls, host: str, token: str, timeout: int = 10
     ) -> MarzbanNodeSettings:
@@ -353,7 +366,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanNodeSettings(**response)
+        return cls._parse(MarzbanNodeSettings, response)
 
     @classmethod
     async def add_node(
@@ -370,11 +383,11 @@ class MarzbanManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/node",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanNodeResponse(**response)
+        return cls._parse(MarzbanNodeResponse, response)
 
     @classmethod
     async def get_node(
@@ -394,7 +407,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanNodeResponse(**response)
+        return cls._parse(MarzbanNodeResponse, response)
 
     @classmethod
     async def modify_node(
@@ -417,11 +430,11 @@ class MarzbanManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/node/{node_id}",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanNodeResponse(**response)
+        return cls._parse(MarzbanNodeResponse, response)
 
     @classmethod
     async def remove_node(
@@ -459,7 +472,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzbanNodeResponse(**item) for item in response]
+        return cls._parse(List[MarzbanNodeResponse], response)
 
     @classmethod
     async def reconnect_node(
@@ -506,12 +519,12 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanNodesUsageResponse(**response)
+        return cls._parse(MarzbanNodesUsageResponse, response)
 
     @classmethod
     async def user_subscription(
         cls, host: str, token: str, user_agent: str = "", timeout: int = 10
-    ) -> List[str]:
+    ) -> str:
         """
         Provides a subscription link based on the user agent (Clash, V2Ray, etc.).
 
@@ -519,7 +532,7 @@ class MarzbanManager(RequestBase):
         :param token: Subscription token
         :param user_agent: User agent header
         :param timeout: Request timeout in seconds
-        :return: Subscription links
+        :return: Subscription content as served by the panel
         """
         headers = {}
         if user_agent:
@@ -529,6 +542,7 @@ class MarzbanManager(RequestBase):
             url=f"{host.rstrip('/')}/sub/{token}/",
             headers=headers,
             timeout=timeout,
+            response_type="text",
         )
 
     @classmethod
@@ -547,7 +561,7 @@ class MarzbanManager(RequestBase):
             url=f"{host.rstrip('/')}/sub/{token}/info",
             timeout=timeout,
         )
-        return MarzbanSubscriptionUserResponse(**response)
+        return cls._parse(MarzbanSubscriptionUserResponse, response)
 
     @classmethod
     async def user_get_usage(
@@ -583,7 +597,7 @@ class MarzbanManager(RequestBase):
         client_type: str,
         user_agent: str = "",
         timeout: int = 10,
-    ) -> List[str]:
+    ) -> str:
         """
         Provides a subscription link based on the specified client type (e.g., Clash, V2Ray).
 
@@ -592,7 +606,7 @@ class MarzbanManager(RequestBase):
         :param client_type: Client type (sing-box, clash-meta, clash, outline, v2ray, v2ray-json)
         :param user_agent: User agent header
         :param timeout: Request timeout in seconds
-        :return: Subscription links
+        :return: Subscription content as served by the panel
         """
         headers = {}
         if user_agent:
@@ -602,6 +616,7 @@ class MarzbanManager(RequestBase):
             url=f"{host.rstrip('/')}/sub/{token}/{client_type}",
             headers=headers,
             timeout=timeout,
+            response_type="text",
         )
 
     @classmethod
@@ -621,9 +636,10 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanSystemStats(**response)
+        return cls._parse(MarzbanSystemStats, response)
 
     @classmethod
+    @cached(ttl=300, stale_ttl=300, tags=("inbounds",))
     async def get_inbounds(
         cls, host: str, token: str, timeout: int = 10
     ) -> Dict[str, List[MarzbanProxyInbound]]:
@@ -642,10 +658,11 @@ class MarzbanManager(RequestBase):
         )
         result = {}
         for protocol, inbounds in response.items():
-            result[protocol] = [MarzbanProxyInbound(**inbound) for inbound in inbounds]
+            result[protocol] = cls._parse(List[MarzbanProxyInbound], inbounds)
         return result
 
     @classmethod
+    @cached(ttl=60, stale_ttl=60, tags=("hosts",))
     async def get_hosts(
         cls, host: str, token: str, timeout: int = 10
     ) -> Dict[str, List[MarzbanProxyHost]]:
@@ -664,10 +681,11 @@ class MarzbanManager(RequestBase):
         )
         result = {}
         for tag, hosts in response.items():
-            result[tag] = [MarzbanProxyHost(**host_data) for host_data in hosts]
+            result[tag] = cls._parse(List[MarzbanProxyHost], hosts)
         return result
 
     @classmethod
+    @invalidates("hosts")
     async def modify_hosts(
         cls,
         host: str,
@@ -687,18 +705,19 @@ class MarzbanManager(RequestBase):
         data = {}
         for tag, hosts in modified_hosts.items():
             data[tag] = [
-                host_obj.model_dump_json(exclude_none=True) for host_obj in hosts
+                host_obj.model_dump(mode="json", exclude_none=True)
+                for host_obj in hosts
             ]
 
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/hosts",
-            data=data,
+            json=data,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
         result = {}
         for tag, hosts in response.items():
-            result[tag] = [MarzbanProxyHost(**host_data) for host_data in hosts]
+            result[tag] = cls._parse(List[MarzbanProxyHost], hosts)
         return result
 
     @classmethod
@@ -720,11 +739,11 @@ class MarzbanManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/user_template",
-            data=template_data.model_dump_json(exclude_none=True),
+            json=template_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserTemplateResponse(**response)
+        return cls._parse(MarzbanUserTemplateResponse, response)
 
     @classmethod
     async def get_user_templates(
@@ -757,7 +776,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzbanUserTemplateResponse(**item) for item in response]
+        return cls._parse(List[MarzbanUserTemplateResponse], response)
 
     @classmethod
     async def get_user_template(
@@ -777,7 +796,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserTemplateResponse(**response)
+        return cls._parse(MarzbanUserTemplateResponse, response)
 
     @classmethod
     async def modify_user_template(
@@ -800,11 +819,11 @@ class MarzbanManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/user_template/{template_id}",
-            data=template_data.model_dump_json(exclude_none=True),
+            json=template_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserTemplateResponse(**response)
+        return cls._parse(MarzbanUserTemplateResponse, response)
 
     @classmethod
     async def remove_user_template(
@@ -840,11 +859,11 @@ class MarzbanManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/user",
-            data=user_data.model_dump_json(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserResponse(**response)
+        return cls._parse(MarzbanUserResponse, response)
 
     @classmethod
     async def get_user(
@@ -864,7 +883,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserResponse(**response)
+        return cls._parse(MarzbanUserResponse, response)
 
     @classmethod
     async def modify_user(
@@ -887,11 +906,11 @@ class MarzbanManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/user/{username}",
-            data=user_data.model_dump_json(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserResponse(**response)
+        return cls._parse(MarzbanUserResponse, response)
 
     @classmethod
     async def remove_user(
@@ -930,7 +949,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserResponse(**response)
+        return cls._parse(MarzbanUserResponse, response)
 
     @classmethod
     async def revoke_user_subscription(
@@ -950,7 +969,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserResponse(**response)
+        return cls._parse(MarzbanUserResponse, response)
 
     @classmethod
     async def get_users(
@@ -965,6 +984,7 @@ class MarzbanManager(RequestBase):
         status: Optional[MarzbanUserStatus] = None,
         sort: Optional[str] = None,
         timeout: int = 10,
+        projection: Optional[Projection] = None,
     ) -> MarzbanUsersResponse:
         """
         Get all users with optional filters.
@@ -979,6 +999,7 @@ class MarzbanManager(RequestBase):
         :param status: Filter by status
         :param sort: Sort field
         :param timeout: Request timeout in seconds
+        :param projection: Fields to keep, or a lighter model to parse users into
         :return: Users response
         """
         params = {}
@@ -997,13 +1018,175 @@ class MarzbanManager(RequestBase):
         if sort is not None:
             params["sort"] = sort
 
-        response = await cls.get(
+        return await cls.get(
+            url=f"{host.rstrip('/')}/api/users",
+            params=params,
+            headers=cls._generate_headers(token),
+            timeout=timeout,
+            response_model=with_items(
+                MarzbanUsersResponse, "users", project(MarzbanUserResponse, projection)
+            ),
+        )
+
+    @classmethod
+    async def iter_users(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 100,
+        username: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        admin: Optional[List[str]] = None,
+        status: Optional[MarzbanUserStatus] = None,
+        sort: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[MarzbanUserResponse]:
+        """
+        Iterate over all users matching the filters, page by page.
+
+        The next page is requested while the current one is being consumed.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of users requested per page
+        :param username: Filter by usernames
+        :param search: Search query
+        :param admin: Filter by admin usernames
+        :param status: Filter by status
+        :param sort: Sort field
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Request timeout in seconds
+        :return: Async iterator over user responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            response = await cls.get_users(
+                host,
+                token,
+                offset=index * size,
+                limit=size,
+                username=username,
+                search=search,
+                admin=admin,
+                status=status,
+                sort=sort,
+                projection=projection,
+                timeout=timeout,
+            )
+            return response.users, response.total
+
+        async with aclosing(paginate(fetch_page, page_size)) as items:
+            async for user in items:
+                yield user
+
+    @classmethod
+    async def get_all_users(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 1000,
+        concurrency: int = 8,
+        username: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        admin: Optional[List[str]] = None,
+        status: Optional[MarzbanUserStatus] = None,
+        sort: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> List[MarzbanUserResponse]:
+        """
+        Fetch every user matching the filters with concurrent page requests.
+
+        The first page reports the total and the page size the panel serves;
+        the remaining pages are then fetched in parallel and returned in order.
+        Raises ``PaginationError`` if they do not add up to the total.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of users requested per page
+        :param concurrency: Maximum number of pages fetched at once
+        :param username: Filter by usernames
+        :param search: Search query
+        :param admin: Filter by admin usernames
+        :param status: Filter by status
+        :param sort: Sort field
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Request timeout in seconds
+        :return: List of user responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            response = await cls.get_users(
+                host,
+                token,
+                offset=index * size,
+                limit=size,
+                username=username,
+                search=search,
+                admin=admin,
+                status=status,
+                sort=sort,
+                projection=projection,
+                timeout=timeout,
+            )
+            return response.users, response.total
+
+        return await gather_pages(fetch_page, page_size, concurrency=concurrency)
+
+    @classmethod
+    async def stream_users(
+        cls,
+        host: str,
+        token: str,
+        username: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        admin: Optional[List[str]] = None,
+        status: Optional[MarzbanUserStatus] = None,
+        sort: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[MarzbanUserResponse]:
+        """
+        Fetch every user in one unpaginated request, parsing users as they arrive.
+
+        Only one user is decoded at a time, so memory stays flat however large
+        the panel is.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param username: Filter by usernames
+        :param search: Search query
+        :param admin: Filter by admin usernames
+        :param status: Filter by status
+        :param sort: Sort field
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Seconds allowed to connect and for each read
+        :return: Async iterator over user responses
+        """
+        params = {}
+        if username is not None:
+            params["username"] = username
+        if search is not None:
+            params["search"] = search
+        if admin is not None:
+            params["admin"] = admin
+        if status is not None:
+            params["status"] = status.value
+        if sort is not None:
+            params["sort"] = sort
+
+        items = cls.stream_items(
             url=f"{host.rstrip('/')}/api/users",
+            model=project(MarzbanUserResponse, projection),
+            path=("users",),
             params=params,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUsersResponse(**response)
+        async with aclosing(items):
+            async for user in items:
+                yield user
 
     @classmethod
     async def reset_users_data_usage(
@@ -1051,7 +1234,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserUsagesResponse(**response)
+        return cls._parse(MarzbanUserUsagesResponse, response)
 
     @classmethod
     async def active_next_plan(
@@ -1071,7 +1254,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserResponse(**response)
+        return cls._parse(MarzbanUserResponse, response)
 
     @classmethod
     async def get_users_usage(
@@ -1104,7 +1287,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUsersUsagesResponse(**response)
+        return cls._parse(MarzbanUsersUsagesResponse, response)
 
     @classmethod
     async def set_owner(
@@ -1131,7 +1314,7 @@ class MarzbanManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzbanUserResponse(**response)
+        return cls._parse(MarzbanUserResponse, response)
 
     @classmethod
     async def get_expired_users(
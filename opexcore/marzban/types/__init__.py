@@ -1,42 +1,102 @@
-from .admin import MarzbanAdmin, MarzbanAdminCreate, MarzbanAdminModify, MarzbanToken
-from .user import (
-    MarzbanUserCreate,
-    MarzbanUserModify,
-    MarzbanUserResponse,
-    MarzbanUsersResponse,
-    MarzbanUserStatus,
-    MarzbanUserStatusCreate,
-    MarzbanUserStatusModify,
-    MarzbanUserDataLimitResetStrategy,
-    MarzbanProxyTypes,
-    MarzbanNextPlanModel,
-    MarzbanUserUsageResponse,
-    MarzbanUserUsagesResponse,
-    MarzbanUsersUsagesResponse,
-)
-from .node import (
-    MarzbanNodeCreate,
-    MarzbanNodeModify,
-    MarzbanNodeResponse,
-    MarzbanNodeSettings,
-    MarzbanNodeStatus,
-    MarzbanNodeUsageResponse,
-    MarzbanNodesUsageResponse,
-)
-from .core import MarzbanCoreStats
-from .system import (
-    MarzbanSystemStats,
-    MarzbanProxyInbound,
-    MarzbanProxyHost,
-    MarzbanProxyHostSecurity,
-    MarzbanProxyHostALPN,
-    MarzbanProxyHostFingerprint,
-)
-from .subscription import MarzbanSubscriptionUserResponse
-from .user_template import (
-    MarzbanUserTemplateCreate,
-    MarzbanUserTemplateModify,
-    MarzbanUserTemplateResponse,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .admin import (
+        MarzbanAdmin,
+        MarzbanAdminCreate,
+        MarzbanAdminModify,
+        MarzbanToken,
+    )
+    from .user import (
+        MarzbanUserCreate,
+        MarzbanUserModify,
+        MarzbanUserResponse,
+        MarzbanUsersResponse,
+        MarzbanUserStatus,
+        MarzbanUserStatusCreate,
+        MarzbanUserStatusModify,
+        MarzbanUserDataLimitResetStrategy,
+        MarzbanProxyTypes,
+        MarzbanNextPlanModel,
+        MarzbanUserUsageResponse,
+        MarzbanUserUsagesResponse,
+        MarzbanUsersUsagesResponse,
+    )
+    from .node import (
+        MarzbanNodeCreate,
+        MarzbanNodeModify,
+        MarzbanNodeResponse,
+        MarzbanNodeSettings,
+        MarzbanNodeStatus,
+        MarzbanNodeUsageResponse,
+        MarzbanNodesUsageResponse,
+    )
+    from .core import MarzbanCoreStats
+    from .system import (
+        MarzbanSystemStats,
+        MarzbanProxyInbound,
+        MarzbanProxyHost,
+        MarzbanProxyHostSecurity,
+        MarzbanProxyHostALPN,
+        MarzbanProxyHostFingerprint,
+    )
+    from .subscription import MarzbanSubscriptionUserResponse
+    from .user_template import (
+        MarzbanUserTemplateCreate,
+        MarzbanUserTemplateModify,
+        MarzbanUserTemplateResponse,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".admin": [
+            "MarzbanAdmin",
+            "MarzbanAdminCreate",
+            "MarzbanAdminModify",
+            "MarzbanToken",
+        ],
+        ".user": [
+            "MarzbanUserCreate",
+            "MarzbanUserModify",
+            "MarzbanUserResponse",
+            "MarzbanUsersResponse",
+            "MarzbanUserStatus",
+            "MarzbanUserStatusCreate",
+            "MarzbanUserStatusModify",
+            "MarzbanUserDataLimitResetStrategy",
+            "MarzbanProxyTypes",
+            "MarzbanNextPlanModel",
+            "MarzbanUserUsageResponse",
+            "MarzbanUserUsagesResponse",
+            "MarzbanUsersUsagesResponse",
+        ],
+        ".node": [
+            "MarzbanNodeCreate",
+            "MarzbanNodeModify",
+            "MarzbanNodeResponse",
+            "MarzbanNodeSettings",
+            "MarzbanNodeStatus",
+            "MarzbanNodeUsageResponse",
+            "MarzbanNodesUsageResponse",
+        ],
+        ".core": ["MarzbanCoreStats"],
+        ".system": [
+            "MarzbanSystemStats",
+            "MarzbanProxyInbound",
+            "MarzbanProxyHost",
+            "MarzbanProxyHostSecurity",
+            "MarzbanProxyHostALPN",
+            "MarzbanProxyHostFingerprint",
+        ],
+        ".subscription": ["MarzbanSubscriptionUserResponse"],
+        ".user_template": [
+            "MarzbanUserTemplateCreate",
+            "MarzbanUserTemplateModify",
+            "MarzbanUserTemplateResponse",
+        ],
+    },
 )
 
 __all__ = [
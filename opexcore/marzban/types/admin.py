@@ -1,8 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class MarzbanAdminCreate(BaseModel):
+class MarzbanAdminCreate(PanelModel):
     """Schema for creating a new admin"""
 
     username: str = Field(..., title="Username")
@@ -13,7 +14,7 @@ class MarzbanAdminCreate(BaseModel):
     users_usage: Optional[int] = Field(None, title="Users Usage")
 
 
-class MarzbanAdminModify(BaseModel):
+class MarzbanAdminModify(PanelModel):
     """Schema for modifying an existing admin"""
 
     password: Optional[str] = Field(None, title="Password")
@@ -22,7 +23,7 @@ class MarzbanAdminModify(BaseModel):
     discord_webhook: Optional[str] = Field(None, title="Discord Webhook")
 
 
-class MarzbanAdmin(BaseModel):
+class MarzbanAdmin(PanelModel):
     """Admin response schema"""
 
     username: str = Field(..., title="Username")
@@ -32,7 +33,7 @@ class MarzbanAdmin(BaseModel):
     users_usage: Optional[int] = Field(None, title="Users Usage")
 
 
-class MarzbanToken(BaseModel):
+class MarzbanToken(PanelModel):
     """Authentication token response"""
 
     access_token: str = Field(..., title="Access Token")
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class MarzbanCoreStats(BaseModel):
+class MarzbanCoreStats(PanelModel):
     """Core statistics schema"""
 
     version: str = Field(..., title="Version")
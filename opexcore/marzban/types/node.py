@@ -1,6 +1,7 @@
 from typing import Optional, List
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class MarzbanNodeStatus(str, Enum):
@@ -12,7 +13,7 @@ class MarzbanNodeStatus(str, Enum):
     DISABLED = "disabled"
 
 
-class MarzbanNodeCreate(BaseModel):
+class MarzbanNodeCreate(PanelModel):
     """Schema for creating a new node"""
 
     name: str = Field(..., title="Name")
@@ -23,7 +24,7 @@ class MarzbanNodeCreate(BaseModel):
     add_as_new_host: bool = Field(True, title="Add As New Host")
 
 
-class MarzbanNodeModify(BaseModel):
+class MarzbanNodeModify(PanelModel):
     """Schema for modifying an existing node"""
 
     name: Optional[str] = Field(None, title="Name")
@@ -34,7 +35,7 @@ class MarzbanNodeModify(BaseModel):
     status: Optional[MarzbanNodeStatus] = Field(None, title="Status")
 
 
-class MarzbanNodeResponse(BaseModel):
+class MarzbanNodeResponse(PanelModel):
     """Node response schema"""
 
     id: int = Field(..., title="Id")
@@ -48,14 +49,14 @@ class MarzbanNodeResponse(BaseModel):
     message: Optional[str] = Field(None, title="Message")
 
 
-class MarzbanNodeSettings(BaseModel):
+class MarzbanNodeSettings(PanelModel):
     """Node settings schema"""
 
     min_node_version: str = Field("v0.2.0", title="Min Node Version")
     certificate: str = Field(..., title="Certificate")
 
 
-class MarzbanNodeUsageResponse(BaseModel):
+class MarzbanNodeUsageResponse(PanelModel):
     """Node usage response schema"""
 
     node_id: Optional[int] = Field(None, title="Node Id")
@@ -64,7 +65,7 @@ class MarzbanNodeUsageResponse(BaseModel):
     downlink: int = Field(..., title="Downlink")
 
 
-class MarzbanNodesUsageResponse(BaseModel):
+class MarzbanNodesUsageResponse(PanelModel):
     """Multiple nodes usage response schema"""
 
     usages: List[MarzbanNodeUsageResponse] = Field(..., title="Usages")
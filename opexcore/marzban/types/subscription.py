@@ -1,6 +1,7 @@
 from typing import Optional, Dict, List
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 from .user import (
     MarzbanProxyTypes,
     MarzbanUserStatus,
@@ -9,7 +10,7 @@ from .user import (
 )
 
 
-class MarzbanSubscriptionUserResponse(BaseModel):
+class MarzbanSubscriptionUserResponse(PanelModel):
     """Subscription user response schema"""
 
     username: str = Field(..., title="Username")
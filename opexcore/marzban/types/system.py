@@ -1,8 +1,9 @@
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class MarzbanSystemStats(BaseModel):
+class MarzbanSystemStats(PanelModel):
     """System statistics schema"""
 
     version: str = Field(..., title="Version")
@@ -32,7 +33,7 @@ class MarzbanProxyTypes(str, Enum):
     SHADOWSOCKS = "shadowsocks"
 
 
-class MarzbanProxyInbound(BaseModel):
+class MarzbanProxyInbound(PanelModel):
     """Proxy inbound configuration schema"""
 
     tag: str = Field(..., title="Tag")
@@ -78,7 +79,7 @@ class MarzbanProxyHostFingerprint(str, Enum):
     RANDOMIZED = "randomized"
 
 
-class MarzbanProxyHost(BaseModel):
+class MarzbanProxyHost(PanelModel):
     """Proxy host configuration schema"""
 
     remark: str = Field(..., title="Remark")
@@ -1,7 +1,8 @@
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class MarzbanUserStatus(str, Enum):
@@ -48,7 +49,7 @@ class MarzbanProxyTypes(str, Enum):
     SHADOWSOCKS = "shadowsocks"
 
 
-class MarzbanNextPlanModel(BaseModel):
+class MarzbanNextPlanModel(PanelModel):
     """Next plan model for user"""
 
     data_limit: Optional[int] = Field(None, title="Data Limit")
@@ -57,7 +58,7 @@ class MarzbanNextPlanModel(BaseModel):
     fire_on_either: bool = Field(True, title="Fire On Either")
 
 
-class MarzbanUserCreate(BaseModel):
+class MarzbanUserCreate(PanelModel):
     """Schema for creating a new user"""
 
     username: str = Field(..., title="Username")
@@ -87,7 +88,7 @@ class MarzbanUserCreate(BaseModel):
     next_plan: Optional[MarzbanNextPlanModel] = Field(None, title="Next Plan")
 
 
-class MarzbanUserModify(BaseModel):
+class MarzbanUserModify(PanelModel):
     """Schema for modifying an existing user"""
 
     status: Optional[MarzbanUserStatusModify] = Field(None, title="Status")
@@ -114,7 +115,7 @@ class MarzbanUserModify(BaseModel):
     next_plan: Optional[MarzbanNextPlanModel] = Field(None, title="Next Plan")
 
 
-class MarzbanUserResponse(BaseModel):
+class MarzbanUserResponse(PanelModel):
     """User response schema"""
 
     username: str = Field(..., title="Username")
@@ -149,14 +150,14 @@ class MarzbanUserResponse(BaseModel):
     admin: Optional[Any] = Field(None, title="Admin")
 
 
-class MarzbanUsersResponse(BaseModel):
+class MarzbanUsersResponse(PanelModel):
     """Multiple users response schema"""
 
     users: List[MarzbanUserResponse] = Field(..., title="Users")
     total: int = Field(..., title="Total")
 
 
-class MarzbanUserUsageResponse(BaseModel):
+class MarzbanUserUsageResponse(PanelModel):
     """User usage response schema"""
 
     node_id: Optional[int] = Field(None, title="Node Id")
@@ -164,14 +165,14 @@ class MarzbanUserUsageResponse(BaseModel):
     used_traffic: int = Field(..., title="Used Traffic")
 
 
-class MarzbanUserUsagesResponse(BaseModel):
+class MarzbanUserUsagesResponse(PanelModel):
     """User usages response schema"""
 
     username: str = Field(..., title="Username")
     usages: List[MarzbanUserUsageResponse] = Field(..., title="Usages")
 
 
-class MarzbanUsersUsagesResponse(BaseModel):
+class MarzbanUsersUsagesResponse(PanelModel):
     """Multiple users usages response schema"""
 
     usages: List[MarzbanUserUsageResponse] = Field(..., title="Usages")
@@ -1,9 +1,10 @@
 from typing import Optional, Dict, List
-from pydantic import BaseModel, Field, constr
+from pydantic import Field, constr
+from opexcore.base import PanelModel
 from .user import MarzbanProxyTypes
 
 
-class MarzbanUserTemplateCreate(BaseModel):
+class MarzbanUserTemplateCreate(PanelModel):
     """Schema for creating a user template"""
 
     name: Optional[str] = Field(None, title="Name")
@@ -24,7 +25,7 @@ class MarzbanUserTemplateCreate(BaseModel):
     )
 
 
-class MarzbanUserTemplateModify(BaseModel):
+class MarzbanUserTemplateModify(PanelModel):
     """Schema for modifying a user template"""
 
     name: Optional[str] = Field(None, title="Name")
@@ -41,7 +42,7 @@ class MarzbanUserTemplateModify(BaseModel):
     )
 
 
-class MarzbanUserTemplateResponse(BaseModel):
+class MarzbanUserTemplateResponse(PanelModel):
     """User template response schema"""
 
     id: int = Field(..., title="Id")
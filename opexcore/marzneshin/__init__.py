@@ -1,58 +1,123 @@
-from .manager import MarzneshinManager
-from .types import (
-    MarzneshinAdminCreate,
-    MarzneshinAdminPartialModify,
-    MarzneshinAdmin,
-    MarzneshinAdminResponse,
-    MarzneshinToken,
-    MarzneshinNodeStatus,
-    MarzneshinNodeConnectionBackend,
-    MarzneshinNodeCreate,
-    MarzneshinNodeModify,
-    MarzneshinBackend,
-    MarzneshinNodeResponse,
-    MarzneshinNodeSettings,
-    MarzneshinServiceCreate,
-    MarzneshinServiceModify,
-    MarzneshinServiceResponse,
-    MarzneshinUserExpireStrategy,
-    MarzneshinUserDataUsageResetStrategy,
-    MarzneshinUsersSortingOptions,
-    MarzneshinUserCreate,
-    MarzneshinUserModify,
-    MarzneshinUserResponse,
-    MarzneshinUserNodeUsageSeries,
-    MarzneshinUserUsageSeriesResponse,
-    MarzneshinConfigTypes,
-    MarzneshinSubscriptionRule,
-    MarzneshinSubscriptionSettings,
-    MarzneshinAdminsStats,
-    MarzneshinNodesStats,
-    MarzneshinUsersStats,
-    MarzneshinTrafficUsageSeries,
-    MarzneshinTelegramSettings,
-    MarzneshinProxyTypes,
-    MarzneshinProxyHostALPN,
-    MarzneshinProxyHostFingerprint,
-    MarzneshinInboundHostSecurity,
-    MarzneshinFragmentSettings,
-    MarzneshinXrayNoise,
-    MarzneshinXMuxSettings,
-    MarzneshinSplitHttpSettings,
-    MarzneshinSingBoxMuxSettings,
-    MarzneshinMuxCoolSettings,
-    MarzneshinMuxSettings,
-    MarzneshinInboundHost,
-    MarzneshinInboundHostResponse,
-    MarzneshinNode,
-    MarzneshinInbound,
-    MarzneshinBackendConfigFormat,
-    MarzneshinBackendConfig,
-    MarzneshinBackendStats,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import MarzneshinManager
+    from .client import MarzneshinClient
+    from .types import (
+        MarzneshinAdminCreate,
+        MarzneshinAdminPartialModify,
+        MarzneshinAdmin,
+        MarzneshinAdminResponse,
+        MarzneshinToken,
+        MarzneshinNodeStatus,
+        MarzneshinNodeConnectionBackend,
+        MarzneshinNodeCreate,
+        MarzneshinNodeModify,
+        MarzneshinBackend,
+        MarzneshinNodeResponse,
+        MarzneshinNodeSettings,
+        MarzneshinServiceCreate,
+        MarzneshinServiceModify,
+        MarzneshinServiceResponse,
+        MarzneshinUserExpireStrategy,
+        MarzneshinUserDataUsageResetStrategy,
+        MarzneshinUsersSortingOptions,
+        MarzneshinUserCreate,
+        MarzneshinUserModify,
+        MarzneshinUserResponse,
+        MarzneshinUserNodeUsageSeries,
+        MarzneshinUserUsageSeriesResponse,
+        MarzneshinConfigTypes,
+        MarzneshinSubscriptionRule,
+        MarzneshinSubscriptionSettings,
+        MarzneshinAdminsStats,
+        MarzneshinNodesStats,
+        MarzneshinUsersStats,
+        MarzneshinTrafficUsageSeries,
+        MarzneshinTelegramSettings,
+        MarzneshinProxyTypes,
+        MarzneshinProxyHostALPN,
+        MarzneshinProxyHostFingerprint,
+        MarzneshinInboundHostSecurity,
+        MarzneshinFragmentSettings,
+        MarzneshinXrayNoise,
+        MarzneshinXMuxSettings,
+        MarzneshinSplitHttpSettings,
+        MarzneshinSingBoxMuxSettings,
+        MarzneshinMuxCoolSettings,
+        MarzneshinMuxSettings,
+        MarzneshinInboundHost,
+        MarzneshinInboundHostResponse,
+        MarzneshinNode,
+        MarzneshinInbound,
+        MarzneshinBackendConfigFormat,
+        MarzneshinBackendConfig,
+        MarzneshinBackendStats,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".manager": ["MarzneshinManager"],
+        ".client": ["MarzneshinClient"],
+        ".types": [
+            "MarzneshinAdminCreate",
+            "MarzneshinAdminPartialModify",
+            "MarzneshinAdmin",
+            "MarzneshinAdminResponse",
+            "MarzneshinToken",
+            "MarzneshinNodeStatus",
+            "MarzneshinNodeConnectionBackend",
+            "MarzneshinNodeCreate",
+            "MarzneshinNodeModify",
+            "MarzneshinBackend",
+            "MarzneshinNodeResponse",
+            "MarzneshinNodeSettings",
+            "MarzneshinServiceCreate",
+            "MarzneshinServiceModify",
+            "MarzneshinServiceResponse",
+            "MarzneshinUserExpireStrategy",
+            "MarzneshinUserDataUsageResetStrategy",
+            "MarzneshinUsersSortingOptions",
+            "MarzneshinUserCreate",
+            "MarzneshinUserModify",
+            "MarzneshinUserResponse",
+            "MarzneshinUserNodeUsageSeries",
+            "MarzneshinUserUsageSeriesResponse",
+            "MarzneshinConfigTypes",
+            "MarzneshinSubscriptionRule",
+            "MarzneshinSubscriptionSettings",
+            "MarzneshinAdminsStats",
+            "MarzneshinNodesStats",
+            "MarzneshinUsersStats",
+            "MarzneshinTrafficUsageSeries",
+            "MarzneshinTelegramSettings",
+            "MarzneshinProxyTypes",
+            "MarzneshinProxyHostALPN",
+            "MarzneshinProxyHostFingerprint",
+            "MarzneshinInboundHostSecurity",
+            "MarzneshinFragmentSettings",
+            "MarzneshinXrayNoise",
+            "MarzneshinXMuxSettings",
+            "MarzneshinSplitHttpSettings",
+            "MarzneshinSingBoxMuxSettings",
+            "MarzneshinMuxCoolSettings",
+            "MarzneshinMuxSettings",
+            "MarzneshinInboundHost",
+            "MarzneshinInboundHostResponse",
+            "MarzneshinNode",
+            "MarzneshinInbound",
+            "MarzneshinBackendConfigFormat",
+            "MarzneshinBackendConfig",
+            "MarzneshinBackendStats",
+        ],
+    },
 )
 
 __all__ = [
     "MarzneshinManager",
+    "MarzneshinClient",
     "MarzneshinAdminCreate",
     "MarzneshinAdminPartialModify",
     "MarzneshinAdmin",
@@ -0,0 +1,14 @@
+from opexcore.core import PanelClient
+from .manager import MarzneshinManager
+
+
+class MarzneshinClient(PanelClient):
+    """Marzneshin API client bound to a single panel"""
+
+    manager = MarzneshinManager
+
+    async def _authenticate(self) -> str:
+        response = await MarzneshinManager.admin_token(
+            self.host, self.username, self.password, timeout=self.timeout
+        )
+        return response.access_token
@@ -1,5 +1,13 @@
-from typing import Optional, List, Dict, Any
-from opexcore.core import RequestBase
+from contextlib import aclosing
+from typing import Optional, List, Dict, Any, AsyncIterator
+from opexcore.core import (
+    RequestBase,
+    paginate,
+    cached,
+    invalidates,
+    Projection,
+    project,
+)
 from .types import (
     MarzneshinAdminCreate,
     MarzneshinAdminPartialModify,
@@ -61,8 +69,9 @@ class MarzneshinManager(RequestBase):
             data={"username": username, "password": password},
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             timeout=timeout,
+            idempotent=True,
         )
-        return MarzneshinToken(**response)
+        return cls._parse(MarzneshinToken, response)
 
     @classmethod
     async def get_current_admin(
@@ -81,7 +90,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinAdmin(**response)
+        return cls._parse(MarzneshinAdmin, response)
 
     @classmethod
     async def get_admins(
@@ -114,7 +123,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzneshinAdminResponse(**admin) for admin in response.get("items", [])]
+        return cls._parse(List[MarzneshinAdminResponse], response.get("items", []))
 
     @classmethod
     async def create_admin(
@@ -131,11 +140,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/admins",
-            json=admin_data.dict(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinAdmin(**response)
+        return cls._parse(MarzneshinAdmin, response)
 
     @classmethod
     async def get_admin(
@@ -155,7 +164,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinAdminResponse(**response)
+        return cls._parse(MarzneshinAdminResponse, response)
 
     @classmethod
     async def modify_admin(
@@ -178,11 +187,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/admins/{username}",
-            json=admin_data.dict(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinAdminResponse(**response)
+        return cls._parse(MarzneshinAdminResponse, response)
 
     @classmethod
     async def remove_admin(
@@ -232,10 +241,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [
-            MarzneshinServiceResponse(**service)
-            for service in response.get("items", [])
-        ]
+        return cls._parse(List[MarzneshinServiceResponse], response.get("items", []))
 
     @classmethod
     async def get_admin_users(
@@ -265,7 +271,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzneshinUserResponse(**user) for user in response.get("items", [])]
+        return cls._parse(List[MarzneshinUserResponse], response.get("items", []))
 
     @classmethod
     async def disable_admin_users(
@@ -285,7 +291,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinAdminResponse(**response)
+        return cls._parse(MarzneshinAdminResponse, response)
 
     @classmethod
     async def enable_admin_users(
@@ -305,7 +311,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinAdminResponse(**response)
+        return cls._parse(MarzneshinAdminResponse, response)
 
     @classmethod
     async def get_nodes(
@@ -342,7 +348,47 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzneshinNodeResponse(**node) for node in response.get("items", [])]
+        return cls._parse(List[MarzneshinNodeResponse], response.get("items", []))
+
+    @classmethod
+    async def iter_nodes(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 50,
+        status: Optional[List[str]] = None,
+        name: Optional[str] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[MarzneshinNodeResponse]:
+        """
+        Iterate over all nodes matching the filters, page by page.
+
+        The next page is requested while the current one is being consumed.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of nodes requested per page
+        :param status: Filter by status
+        :param name: Filter by name
+        :param timeout: Request timeout in seconds
+        :return: Async iterator over node responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            nodes = await cls.get_nodes(
+                host,
+                token,
+                status=status,
+                name=name,
+                page=index + 1,
+                size=size,
+                timeout=timeout,
+            )
+            return nodes, None
+
+        async with aclosing(paginate(fetch_page, page_size)) as items:
+            async for node in items:
+                yield node
 
     @classmethod
     async def add_node(
@@ -359,11 +405,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/nodes",
-            json=node_data.dict(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinNodeResponse(**response)
+        return cls._parse(MarzneshinNodeResponse, response)
 
     @classmethod
     async def get_node_settings(
@@ -382,7 +428,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinNodeSettings(**response)
+        return cls._parse(MarzneshinNodeSettings, response)
 
     @classmethod
     async def get_node(
@@ -402,7 +448,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinNodeResponse(**response)
+        return cls._parse(MarzneshinNodeResponse, response)
 
     @classmethod
     async def modify_node(
@@ -425,11 +471,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/nodes/{node_id}",
-            json=node_data.dict(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinNodeResponse(**response)
+        return cls._parse(MarzneshinNodeResponse, response)
 
     @classmethod
     async def remove_node(
@@ -504,7 +550,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinTrafficUsageSeries(**response)
+        return cls._parse(MarzneshinTrafficUsageSeries, response)
 
     @classmethod
     async def get_backend_stats(
@@ -525,7 +571,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinBackendStats(**response)
+        return cls._parse(MarzneshinBackendStats, response)
 
     @classmethod
     async def get_node_backend_config(
@@ -546,7 +592,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinBackendConfig(**response)
+        return cls._parse(MarzneshinBackendConfig, response)
 
     @classmethod
     async def alter_node_backend_config(
@@ -571,13 +617,14 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/nodes/{node_id}/{backend}/config",
-            json=config_data.dict(exclude_none=True),
+            json=config_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
         return response
 
     @classmethod
+    @cached(ttl=60, stale_ttl=60, tags=("services",))
     async def get_services(
         cls,
         host: str,
@@ -608,12 +655,10 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [
-            MarzneshinServiceResponse(**service)
-            for service in response.get("items", [])
-        ]
+        return cls._parse(List[MarzneshinServiceResponse], response.get("items", []))
 
     @classmethod
+    @invalidates("services")
     async def add_service(
         cls,
         host: str,
@@ -632,11 +677,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/services",
-            json=service_data.dict(exclude_none=True),
+            json=service_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinServiceResponse(**response)
+        return cls._parse(MarzneshinServiceResponse, response)
 
     @classmethod
     async def get_service(
@@ -656,9 +701,10 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinServiceResponse(**response)
+        return cls._parse(MarzneshinServiceResponse, response)
 
     @classmethod
+    @invalidates("services")
     async def modify_service(
         cls,
         host: str,
@@ -679,13 +725,14 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/services/{service_id}",
-            json=service_data.dict(exclude_none=True),
+            json=service_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinServiceResponse(**response)
+        return cls._parse(MarzneshinServiceResponse, response)
 
     @classmethod
+    @invalidates("services")
     async def remove_service(
         cls, host: str, token: str, service_id: int, timeout: int = 10
     ) -> Dict[str, Any]:
@@ -733,7 +780,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzneshinUserResponse(**user) for user in response.get("items", [])]
+        return cls._parse(List[MarzneshinUserResponse], response.get("items", []))
 
     @classmethod
     async def get_service_inbounds(
@@ -763,7 +810,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzneshinInbound(**inbound) for inbound in response.get("items", [])]
+        return cls._parse(List[MarzneshinInbound], response.get("items", []))
 
     @classmethod
     async def get_inbounds(
@@ -796,7 +843,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzneshinInbound(**inbound) for inbound in response.get("items", [])]
+        return cls._parse(List[MarzneshinInbound], response.get("items", []))
 
     @classmethod
     async def get_inbound(
@@ -816,7 +863,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinInbound(**response)
+        return cls._parse(MarzneshinInbound, response)
 
     @classmethod
     async def get_hosts(
@@ -839,9 +886,9 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [
-            MarzneshinInboundHostResponse(**host) for host in response.get("items", [])
-        ]
+        return cls._parse(
+            List[MarzneshinInboundHostResponse], response.get("items", [])
+        )
 
     @classmethod
     async def create_unbound_host(
@@ -862,11 +909,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/inbounds/hosts",
-            json=host_data.dict(exclude_none=True),
+            json=host_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinInboundHostResponse(**response)
+        return cls._parse(MarzneshinInboundHostResponse, response)
 
     @classmethod
     async def get_host(
@@ -886,7 +933,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinInboundHostResponse(**response)
+        return cls._parse(MarzneshinInboundHostResponse, response)
 
     @classmethod
     async def update_host(
@@ -909,11 +956,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/inbounds/hosts/{host_id}",
-            json=host_data.dict(exclude_none=True),
+            json=host_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinInboundHostResponse(**response)
+        return cls._parse(MarzneshinInboundHostResponse, response)
 
     @classmethod
     async def delete_host(
@@ -963,9 +1010,9 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [
-            MarzneshinInboundHostResponse(**host) for host in response.get("items", [])
-        ]
+        return cls._parse(
+            List[MarzneshinInboundHostResponse], response.get("items", [])
+        )
 
     @classmethod
     async def create_inbound_host(
@@ -988,11 +1035,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/inbounds/{inbound_id}/hosts",
-            json=host_data.dict(exclude_none=True),
+            json=host_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinInboundHostResponse(**response)
+        return cls._parse(MarzneshinInboundHostResponse, response)
 
     @classmethod
     async def get_users(
@@ -1011,6 +1058,7 @@ class MarzneshinManager(RequestBase):
         page: int = 1,
         size: int = 50,
         timeout: int = 10,
+        projection: Optional[Projection] = None,
     ) -> list[MarzneshinUserResponse]:
         """
         Get all users with optional filters.
@@ -1029,6 +1077,7 @@ class MarzneshinManager(RequestBase):
         :param page: Page number
         :param size: Page size
         :param timeout: Request timeout in seconds
+        :param projection: Fields to keep, or a lighter model to parse users into
         :return: List of user responses
         """
         params = {"page": page, "size": size, "descending": descending}
@@ -1055,7 +1104,74 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [MarzneshinUserResponse(**user) for user in response.get("items", [])]
+        return cls._parse(
+            List[project(MarzneshinUserResponse, projection)],
+            response.get("items", []),
+        )
+
+    @classmethod
+    async def iter_users(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 50,
+        username: Optional[List[str]] = None,
+        order_by: Optional[MarzneshinUsersSortingOptions] = None,
+        descending: bool = False,
+        is_active: Optional[bool] = None,
+        activated: Optional[bool] = None,
+        expired: Optional[bool] = None,
+        data_limit_reached: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        owner_username: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[MarzneshinUserResponse]:
+        """
+        Iterate over all users matching the filters, page by page.
+
+        The next page is requested while the current one is being consumed.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of users requested per page
+        :param username: Filter by usernames
+        :param order_by: Sort field
+        :param descending: Sort in descending order
+        :param is_active: Filter by active status
+        :param activated: Filter by activated status
+        :param expired: Filter by expired status
+        :param data_limit_reached: Filter by data limit reached status
+        :param enabled: Filter by enabled status
+        :param owner_username: Filter by owner username
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Request timeout in seconds
+        :return: Async iterator over user responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            users = await cls.get_users(
+                host,
+                token,
+                username=username,
+                order_by=order_by,
+                descending=descending,
+                is_active=is_active,
+                activated=activated,
+                expired=expired,
+                data_limit_reached=data_limit_reached,
+                enabled=enabled,
+                owner_username=owner_username,
+                page=index + 1,
+                size=size,
+                projection=projection,
+                timeout=timeout,
+            )
+            return users, None
+
+        async with aclosing(paginate(fetch_page, page_size)) as items:
+            async for user in items:
+                yield user
 
     @classmethod
     async def add_user(
@@ -1072,11 +1188,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/users",
-            json=user_data.dict(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def reset_users_data_usage(
@@ -1137,7 +1253,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def modify_user(
@@ -1160,11 +1276,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/users/{username}",
-            json=user_data.dict(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def remove_user(
@@ -1214,10 +1330,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [
-            MarzneshinServiceResponse(**service)
-            for service in response.get("items", [])
-        ]
+        return cls._parse(List[MarzneshinServiceResponse], response.get("items", []))
 
     @classmethod
     async def reset_user_data_usage(
@@ -1237,7 +1350,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def enable_user(
@@ -1257,7 +1370,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def disable_user(
@@ -1277,7 +1390,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def revoke_user_subscription(
@@ -1297,7 +1410,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def get_user_usage(
@@ -1332,7 +1445,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserUsageSeriesResponse(**response)
+        return cls._parse(MarzneshinUserUsageSeriesResponse, response)
 
     @classmethod
     async def set_user_owner(
@@ -1360,12 +1473,12 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def user_subscription(
         cls, host: str, username: str, key: str, user_agent: str = "", timeout: int = 10
-    ) -> List[str]:
+    ) -> str:
         """
         Get user subscription.
 
@@ -1374,7 +1487,7 @@ class MarzneshinManager(RequestBase):
         :param key: Subscription key
         :param user_agent: User agent header
         :param timeout: Request timeout in seconds
-        :return: Subscription links
+        :return: Subscription content as served by the panel
         """
         headers = {}
         if user_agent:
@@ -1384,6 +1497,7 @@ class MarzneshinManager(RequestBase):
             url=f"{host.rstrip('/')}/sub/{username}/{key}",
             headers=headers,
             timeout=timeout,
+            response_type="text",
         )
         return response
 
@@ -1404,7 +1518,7 @@ class MarzneshinManager(RequestBase):
             url=f"{host.rstrip('/')}/sub/{username}/{key}/info",
             timeout=timeout,
         )
-        return MarzneshinUserResponse(**response)
+        return cls._parse(MarzneshinUserResponse, response)
 
     @classmethod
     async def user_subscription_usage(
@@ -1438,7 +1552,7 @@ class MarzneshinManager(RequestBase):
             params=params,
             timeout=timeout,
         )
-        return MarzneshinTrafficUsageSeries(**response)
+        return cls._parse(MarzneshinTrafficUsageSeries, response)
 
     @classmethod
     async def user_subscription_with_client_type(
@@ -1448,7 +1562,7 @@ class MarzneshinManager(RequestBase):
         key: str,
         client_type: str,
         timeout: int = 10,
-    ) -> List[str]:
+    ) -> str:
         """
         Get user subscription with specific client type.
 
@@ -1457,11 +1571,12 @@ class MarzneshinManager(RequestBase):
         :param key: Subscription key
         :param client_type: Client type (sing-box, clash-meta, clash, xray, v2ray, links, wireguard)
         :param timeout: Request timeout in seconds
-        :return: Subscription links
+        :return: Subscription content as served by the panel
         """
         response = await cls.get(
             url=f"{host.rstrip('/')}/sub/{username}/{key}/{client_type}",
             timeout=timeout,
+            response_type="text",
         )
         return response
 
@@ -1482,7 +1597,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinSubscriptionSettings(**response)
+        return cls._parse(MarzneshinSubscriptionSettings, response)
 
     @classmethod
     async def update_subscription_settings(
@@ -1503,11 +1618,11 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/system/settings/subscription",
-            json=settings_data.dict(exclude_none=True),
+            json=settings_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinSubscriptionSettings(**response)
+        return cls._parse(MarzneshinSubscriptionSettings, response)
 
     @classmethod
     async def get_telegram_settings(
@@ -1526,7 +1641,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinTelegramSettings(**response) if response else None
+        return cls._parse(MarzneshinTelegramSettings, response) if response else None
 
     @classmethod
     async def update_telegram_settings(
@@ -1547,11 +1662,15 @@ class MarzneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/system/settings/telegram",
-            json=settings_data.dict(exclude_none=True) if settings_data else None,
+            json=(
+                settings_data.model_dump(mode="json", exclude_none=True)
+                if settings_data
+                else None
+            ),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinTelegramSettings(**response) if response else None
+        return cls._parse(MarzneshinTelegramSettings, response) if response else None
 
     @classmethod
     async def get_admins_stats(
@@ -1570,7 +1689,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinAdminsStats(**response)
+        return cls._parse(MarzneshinAdminsStats, response)
 
     @classmethod
     async def get_nodes_stats(
@@ -1589,7 +1708,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinNodesStats(**response)
+        return cls._parse(MarzneshinNodesStats, response)
 
     @classmethod
     async def get_total_traffic_stats(
@@ -1622,7 +1741,7 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinTrafficUsageSeries(**response)
+        return cls._parse(MarzneshinTrafficUsageSeries, response)
 
     @classmethod
     async def get_users_stats(
@@ -1641,4 +1760,4 @@ class MarzneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return MarzneshinUsersStats(**response)
+        return cls._parse(MarzneshinUsersStats, response)
@@ -1,65 +1,138 @@
-from .admin import (
-    MarzneshinAdminCreate,
-    MarzneshinAdminPartialModify,
-    MarzneshinAdmin,
-    MarzneshinAdminResponse,
-    MarzneshinToken,
-)
-from .node import (
-    MarzneshinNodeStatus,
-    MarzneshinNodeConnectionBackend,
-    MarzneshinNodeCreate,
-    MarzneshinNodeModify,
-    MarzneshinBackend,
-    MarzneshinNodeResponse,
-    MarzneshinNodeSettings,
-)
-from .service import (
-    MarzneshinServiceCreate,
-    MarzneshinServiceModify,
-    MarzneshinServiceResponse,
-)
-from .user import (
-    MarzneshinUserExpireStrategy,
-    MarzneshinUserDataUsageResetStrategy,
-    MarzneshinUsersSortingOptions,
-    MarzneshinUserCreate,
-    MarzneshinUserModify,
-    MarzneshinUserResponse,
-    MarzneshinUserNodeUsageSeries,
-    MarzneshinUserUsageSeriesResponse,
-)
-from .subscription import (
-    MarzneshinConfigTypes,
-    MarzneshinSubscriptionRule,
-    MarzneshinSubscriptionSettings,
-)
-from .system import (
-    MarzneshinAdminsStats,
-    MarzneshinNodesStats,
-    MarzneshinUsersStats,
-    MarzneshinTrafficUsageSeries,
-    MarzneshinTelegramSettings,
-)
-from .inbound import (
-    MarzneshinProxyTypes,
-    MarzneshinProxyHostALPN,
-    MarzneshinProxyHostFingerprint,
-    MarzneshinInboundHostSecurity,
-    MarzneshinFragmentSettings,
-    MarzneshinXrayNoise,
-    MarzneshinXMuxSettings,
-    MarzneshinSplitHttpSettings,
-    MarzneshinSingBoxMuxSettings,
-    MarzneshinMuxCoolSettings,
-    MarzneshinMuxSettings,
-    MarzneshinInboundHost,
-    MarzneshinInboundHostResponse,
-    MarzneshinNode,
-    MarzneshinInbound,
-    MarzneshinBackendConfigFormat,
-    MarzneshinBackendConfig,
-    MarzneshinBackendStats,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .admin import (
+        MarzneshinAdminCreate,
+        MarzneshinAdminPartialModify,
+        MarzneshinAdmin,
+        MarzneshinAdminResponse,
+        MarzneshinToken,
+    )
+    from .node import (
+        MarzneshinNodeStatus,
+        MarzneshinNodeConnectionBackend,
+        MarzneshinNodeCreate,
+        MarzneshinNodeModify,
+        MarzneshinBackend,
+        MarzneshinNodeResponse,
+        MarzneshinNodeSettings,
+    )
+    from .service import (
+        MarzneshinServiceCreate,
+        MarzneshinServiceModify,
+        MarzneshinServiceResponse,
+    )
+    from .user import (
+        MarzneshinUserExpireStrategy,
+        MarzneshinUserDataUsageResetStrategy,
+        MarzneshinUsersSortingOptions,
+        MarzneshinUserCreate,
+        MarzneshinUserModify,
+        MarzneshinUserResponse,
+        MarzneshinUserNodeUsageSeries,
+        MarzneshinUserUsageSeriesResponse,
+    )
+    from .subscription import (
+        MarzneshinConfigTypes,
+        MarzneshinSubscriptionRule,
+        MarzneshinSubscriptionSettings,
+    )
+    from .system import (
+        MarzneshinAdminsStats,
+        MarzneshinNodesStats,
+        MarzneshinUsersStats,
+        MarzneshinTrafficUsageSeries,
+        MarzneshinTelegramSettings,
+    )
+    from .inbound import (
+        MarzneshinProxyTypes,
+        MarzneshinProxyHostALPN,
+        MarzneshinProxyHostFingerprint,
+        MarzneshinInboundHostSecurity,
+        MarzneshinFragmentSettings,
+        MarzneshinXrayNoise,
+        MarzneshinXMuxSettings,
+        MarzneshinSplitHttpSettings,
+        MarzneshinSingBoxMuxSettings,
+        MarzneshinMuxCoolSettings,
+        MarzneshinMuxSettings,
+        MarzneshinInboundHost,
+        MarzneshinInboundHostResponse,
+        MarzneshinNode,
+        MarzneshinInbound,
+        MarzneshinBackendConfigFormat,
+        MarzneshinBackendConfig,
+        MarzneshinBackendStats,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".admin": [
+            "MarzneshinAdminCreate",
+            "MarzneshinAdminPartialModify",
+            "MarzneshinAdmin",
+            "MarzneshinAdminResponse",
+            "MarzneshinToken",
+        ],
+        ".node": [
+            "MarzneshinNodeStatus",
+            "MarzneshinNodeConnectionBackend",
+            "MarzneshinNodeCreate",
+            "MarzneshinNodeModify",
+            "MarzneshinBackend",
+            "MarzneshinNodeResponse",
+            "MarzneshinNodeSettings",
+        ],
+        ".service": [
+            "MarzneshinServiceCreate",
+            "MarzneshinServiceModify",
+            "MarzneshinServiceResponse",
+        ],
+        ".user": [
+            "MarzneshinUserExpireStrategy",
+            "MarzneshinUserDataUsageResetStrategy",
+            "MarzneshinUsersSortingOptions",
+            "MarzneshinUserCreate",
+            "MarzneshinUserModify",
+            "MarzneshinUserResponse",
+            "MarzneshinUserNodeUsageSeries",
+            "MarzneshinUserUsageSeriesResponse",
+        ],
+        ".subscription": [
+            "MarzneshinConfigTypes",
+            "MarzneshinSubscriptionRule",
+            "MarzneshinSubscriptionSettings",
+        ],
+        ".system": [
+            "MarzneshinAdminsStats",
+            "MarzneshinNodesStats",
+            "MarzneshinUsersStats",
+            "MarzneshinTrafficUsageSeries",
+            "MarzneshinTelegramSettings",
+        ],
+        ".inbound": [
+            "MarzneshinProxyTypes",
+            "MarzneshinProxyHostALPN",
+            "MarzneshinProxyHostFingerprint",
+            "MarzneshinInboundHostSecurity",
+            "MarzneshinFragmentSettings",
+            "MarzneshinXrayNoise",
+            "MarzneshinXMuxSettings",
+            "MarzneshinSplitHttpSettings",
+            "MarzneshinSingBoxMuxSettings",
+            "MarzneshinMuxCoolSettings",
+            "MarzneshinMuxSettings",
+            "MarzneshinInboundHost",
+            "MarzneshinInboundHostResponse",
+            "MarzneshinNode",
+            "MarzneshinInbound",
+            "MarzneshinBackendConfigFormat",
+            "MarzneshinBackendConfig",
+            "MarzneshinBackendStats",
+        ],
+    },
 )
 
 __all__ = [
@@ -1,8 +1,9 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class MarzneshinAdminCreate(BaseModel):
+class MarzneshinAdminCreate(PanelModel):
     """Schema for creating a new admin"""
 
     username: str = Field(..., title="Username")
@@ -15,7 +16,7 @@ class MarzneshinAdminCreate(BaseModel):
     subscription_url_prefix: str = Field("", title="Subscription Url Prefix")
 
 
-class MarzneshinAdminPartialModify(BaseModel):
+class MarzneshinAdminPartialModify(PanelModel):
     """Schema for modifying an existing admin"""
 
     username: Optional[str] = Field(None, title="Username")
@@ -30,7 +31,7 @@ class MarzneshinAdminPartialModify(BaseModel):
     )
 
 
-class MarzneshinAdmin(BaseModel):
+class MarzneshinAdmin(PanelModel):
     """Admin response schema"""
 
     id: int = Field(..., title="Id")
@@ -43,7 +44,7 @@ class MarzneshinAdmin(BaseModel):
     subscription_url_prefix: str = Field("", title="Subscription Url Prefix")
 
 
-class MarzneshinAdminResponse(BaseModel):
+class MarzneshinAdminResponse(PanelModel):
     """Admin response with usage data"""
 
     id: int = Field(..., title="Id")
@@ -57,7 +58,7 @@ class MarzneshinAdminResponse(BaseModel):
     users_data_usage: int = Field(..., title="Users Data Usage")
 
 
-class MarzneshinToken(BaseModel):
+class MarzneshinToken(PanelModel):
     """Authentication token response"""
 
     access_token: str = Field(..., title="Access Token")
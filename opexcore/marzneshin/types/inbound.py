@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class MarzneshinProxyTypes(str, Enum):
@@ -53,7 +54,7 @@ class MarzneshinInboundHostSecurity(str, Enum):
     TLS = "tls"
 
 
-class MarzneshinFragmentSettings(BaseModel):
+class MarzneshinFragmentSettings(PanelModel):
     """Fragment settings"""
 
     packets: str = Field(..., pattern=r"^(:?tlshello|[\d-]{1,32})$", title="Packets")
@@ -61,7 +62,7 @@ class MarzneshinFragmentSettings(BaseModel):
     interval: str = Field(..., pattern=r"^[\d-]{1,32}$", title="Interval")
 
 
-class MarzneshinXrayNoise(BaseModel):
+class MarzneshinXrayNoise(PanelModel):
     """Xray noise settings"""
 
     type: str = Field(..., pattern=r"^(:?rand|str|base64)$", title="Type")
@@ -69,7 +70,7 @@ class MarzneshinXrayNoise(BaseModel):
     delay: str = Field(..., pattern=r"^\d{1,10}(-\d{1,10})?$", title="Delay")
 
 
-class MarzneshinXMuxSettings(BaseModel):
+class MarzneshinXMuxSettings(PanelModel):
     """XMux settings"""
 
     max_concurrency: Optional[str] = Field(
@@ -88,7 +89,7 @@ class MarzneshinXMuxSettings(BaseModel):
     keep_alive_period: Optional[int] = Field(None, title="Keep Alive Period")
 
 
-class MarzneshinSplitHttpSettings(BaseModel):
+class MarzneshinSplitHttpSettings(PanelModel):
     """Split HTTP settings"""
 
     mode: Optional[str] = Field(None, title="Mode")
@@ -97,7 +98,7 @@ class MarzneshinSplitHttpSettings(BaseModel):
     xmux: Optional[MarzneshinXMuxSettings] = Field(None, title="XMux")
 
 
-class MarzneshinSingBoxMuxSettings(BaseModel):
+class MarzneshinSingBoxMuxSettings(PanelModel):
     """Sing-Box mux settings"""
 
     max_connections: Optional[int] = Field(None, title="Max Connections")
@@ -106,7 +107,7 @@ class MarzneshinSingBoxMuxSettings(BaseModel):
     padding: Optional[bool] = Field(None, title="Padding")
 
 
-class MarzneshinMuxCoolSettings(BaseModel):
+class MarzneshinMuxCoolSettings(PanelModel):
     """Mux cool settings"""
 
     concurrency: Optional[int] = Field(None, title="Concurrency")
@@ -114,7 +115,7 @@ class MarzneshinMuxCoolSettings(BaseModel):
     xudp_proxy_443: Optional[str] = Field(None, title="Xudp Proxy 443")
 
 
-class MarzneshinMuxSettings(BaseModel):
+class MarzneshinMuxSettings(PanelModel):
     """Mux settings"""
 
     protocol: str = Field(..., title="Protocol")
@@ -126,7 +127,7 @@ class MarzneshinMuxSettings(BaseModel):
     )
 
 
-class MarzneshinInboundHost(BaseModel):
+class MarzneshinInboundHost(PanelModel):
     """Inbound host"""
 
     remark: str = Field(..., title="Remark")
@@ -178,7 +179,7 @@ class MarzneshinInboundHostResponse(MarzneshinInboundHost):
     id: int = Field(..., title="Id")
 
 
-class MarzneshinNode(BaseModel):
+class MarzneshinNode(PanelModel):
     """Node information"""
 
     id: int = Field(..., title="Id")
@@ -189,7 +190,7 @@ class MarzneshinNode(BaseModel):
     usage_coefficient: float = Field(1.0, title="Usage Coefficient")
 
 
-class MarzneshinInbound(BaseModel):
+class MarzneshinInbound(PanelModel):
     """Inbound"""
 
     id: int = Field(..., title="Id")
@@ -208,14 +209,14 @@ class MarzneshinBackendConfigFormat(int, Enum):
     TOML = 2
 
 
-class MarzneshinBackendConfig(BaseModel):
+class MarzneshinBackendConfig(PanelModel):
     """Backend config"""
 
     config: str = Field(..., title="Config")
     format: MarzneshinBackendConfigFormat = Field(..., title="Format")
 
 
-class MarzneshinBackendStats(BaseModel):
+class MarzneshinBackendStats(PanelModel):
     """Backend stats"""
 
     running: bool = Field(..., title="Running")
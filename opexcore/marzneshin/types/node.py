@@ -1,6 +1,7 @@
 from typing import Optional, List
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class MarzneshinNodeStatus(str, Enum):
@@ -18,7 +19,7 @@ class MarzneshinNodeConnectionBackend(str, Enum):
     GRPCLIB = "grpclib"
 
 
-class MarzneshinNodeCreate(BaseModel):
+class MarzneshinNodeCreate(PanelModel):
     """Schema for creating a new node"""
 
     name: str = Field(..., title="Name")
@@ -30,7 +31,7 @@ class MarzneshinNodeCreate(BaseModel):
     usage_coefficient: float = Field(1.0, ge=0.0, title="Usage Coefficient")
 
 
-class MarzneshinNodeModify(BaseModel):
+class MarzneshinNodeModify(PanelModel):
     """Schema for modifying an existing node"""
 
     name: Optional[str] = Field(None, title="Name")
@@ -43,7 +44,7 @@ class MarzneshinNodeModify(BaseModel):
     status: Optional[MarzneshinNodeStatus] = Field(None, title="Status")
 
 
-class MarzneshinBackend(BaseModel):
+class MarzneshinBackend(PanelModel):
     """Backend information"""
 
     name: str = Field(..., title="Name")
@@ -52,7 +53,7 @@ class MarzneshinBackend(BaseModel):
     running: bool = Field(..., title="Running")
 
 
-class MarzneshinNodeResponse(BaseModel):
+class MarzneshinNodeResponse(PanelModel):
     """Node response schema"""
 
     id: int = Field(..., title="Id")
@@ -70,7 +71,7 @@ class MarzneshinNodeResponse(BaseModel):
     backends: List[MarzneshinBackend] = Field(..., title="Backends")
 
 
-class MarzneshinNodeSettings(BaseModel):
+class MarzneshinNodeSettings(PanelModel):
     """Node settings response"""
 
     min_node_version: str = Field("v0.2.0", title="Min Node Version")
@@ -1,22 +1,23 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class MarzneshinServiceCreate(BaseModel):
+class MarzneshinServiceCreate(PanelModel):
     """Schema for creating a new service"""
 
     name: Optional[str] = Field(None, title="Name")
     inbound_ids: List[int] = Field(default_factory=list, title="Inbound Ids")
 
 
-class MarzneshinServiceModify(BaseModel):
+class MarzneshinServiceModify(PanelModel):
     """Schema for modifying an existing service"""
 
     name: Optional[str] = Field(None, title="Name")
     inbound_ids: Optional[List[int]] = Field(None, title="Inbound Ids")
 
 
-class MarzneshinServiceResponse(BaseModel):
+class MarzneshinServiceResponse(PanelModel):
     """Service response schema"""
 
     id: int = Field(..., title="Id")
@@ -1,6 +1,7 @@
 from typing import List
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class MarzneshinConfigTypes(str, Enum):
@@ -16,14 +17,14 @@ class MarzneshinConfigTypes(str, Enum):
     BLOCK = "block"
 
 
-class MarzneshinSubscriptionRule(BaseModel):
+class MarzneshinSubscriptionRule(PanelModel):
     """Subscription rule"""
 
     pattern: str = Field(..., title="Pattern", format="regex")
     result: MarzneshinConfigTypes = Field(..., title="Result")
 
 
-class MarzneshinSubscriptionSettings(BaseModel):
+class MarzneshinSubscriptionSettings(PanelModel):
     """Subscription settings"""
 
     template_on_acceptance: bool = Field(..., title="Template On Acceptance")
@@ -1,14 +1,15 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class MarzneshinAdminsStats(BaseModel):
+class MarzneshinAdminsStats(PanelModel):
     """Admins statistics"""
 
     total: int = Field(..., title="Total")
 
 
-class MarzneshinNodesStats(BaseModel):
+class MarzneshinNodesStats(PanelModel):
     """Nodes statistics"""
 
     total: int = Field(..., title="Total")
@@ -16,7 +17,7 @@ class MarzneshinNodesStats(BaseModel):
     unhealthy: int = Field(..., title="Unhealthy")
 
 
-class MarzneshinUsersStats(BaseModel):
+class MarzneshinUsersStats(PanelModel):
     """Users statistics"""
 
     total: int = Field(..., title="Total")
@@ -27,7 +28,7 @@ class MarzneshinUsersStats(BaseModel):
     online: int = Field(..., title="Online")
 
 
-class MarzneshinTrafficUsageSeries(BaseModel):
+class MarzneshinTrafficUsageSeries(PanelModel):
     """Traffic usage series"""
 
     step: int = Field(3600, title="Step")
@@ -35,7 +36,7 @@ class MarzneshinTrafficUsageSeries(BaseModel):
     usages: List[List[int]] = Field(..., title="Usages")
 
 
-class MarzneshinTelegramSettings(BaseModel):
+class MarzneshinTelegramSettings(PanelModel):
     """Telegram settings"""
 
     token: str = Field(..., title="Token")
@@ -1,7 +1,8 @@
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class MarzneshinUserExpireStrategy(str, Enum):
@@ -32,7 +33,7 @@ class MarzneshinUsersSortingOptions(str, Enum):
     CREATED_AT = "created_at"
 
 
-class MarzneshinUserCreate(BaseModel):
+class MarzneshinUserCreate(PanelModel):
     """Schema for creating a new user"""
 
     username: str = Field(..., pattern=r"^\w{3,32}$", title="Username")
@@ -50,7 +51,7 @@ class MarzneshinUserCreate(BaseModel):
     service_ids: List[int] = Field(default_factory=list, title="Service Ids")
 
 
-class MarzneshinUserModify(BaseModel):
+class MarzneshinUserModify(PanelModel):
     """Schema for modifying an existing user"""
 
     username: str = Field(..., pattern=r"^\w{3,32}$", title="Username")
@@ -70,7 +71,7 @@ class MarzneshinUserModify(BaseModel):
     service_ids: Optional[List[int]] = Field(None, title="Service Ids")
 
 
-class MarzneshinUserResponse(BaseModel):
+class MarzneshinUserResponse(PanelModel):
     """User response schema"""
 
     id: int = Field(..., title="Id")
@@ -105,7 +106,7 @@ class MarzneshinUserResponse(BaseModel):
     online_at: Optional[datetime] = Field(None, title="Online At")
 
 
-class MarzneshinUserNodeUsageSeries(BaseModel):
+class MarzneshinUserNodeUsageSeries(PanelModel):
     """User node usage series"""
 
     node_id: Optional[int] = Field(None, title="Node Id")
@@ -113,7 +114,7 @@ class MarzneshinUserNodeUsageSeries(BaseModel):
     usages: List[List[int]] = Field(..., title="Usages")
 
 
-class MarzneshinUserUsageSeriesResponse(BaseModel):
+class MarzneshinUserUsageSeriesResponse(PanelModel):
     """User usage series response"""
 
     username: str = Field(..., title="Username")
@@ -0,0 +1,39 @@
+from .faker import ModelFaker
+from .dataset import Dataset
+from .server import MockPanel, Latency, fake_jwt
+from .marzban import MockMarzban
+from .marzneshin import MockMarzneshin
+from .pasarguard import MockPasarGuard
+from .rustneshin import MockRustneshin
+from .guard import MockGuard
+from .remnawave import MockRemnawave
+from .ovpanel import MockOVPanel
+
+MOCK_PANELS = {
+    panel.name: panel
+    for panel in (
+        MockMarzban,
+        MockMarzneshin,
+        MockPasarGuard,
+        MockRustneshin,
+        MockGuard,
+        MockRemnawave,
+        MockOVPanel,
+    )
+}
+
+__all__ = [
+    "ModelFaker",
+    "Dataset",
+    "MockPanel",
+    "Latency",
+    "fake_jwt",
+    "MockMarzban",
+    "MockMarzneshin",
+    "MockPasarGuard",
+    "MockRustneshin",
+    "MockGuard",
+    "MockRemnawave",
+    "MockOVPanel",
+    "MOCK_PANELS",
+]
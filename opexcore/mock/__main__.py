@@ -0,0 +1,53 @@
+import argparse
+import asyncio
+from . import MOCK_PANELS
+
+
+async def serve(args: argparse.Namespace) -> None:
+    latency = (
+        args.latency if args.jitter == 0 else (args.latency, args.latency + args.jitter)
+    )
+    panel = MOCK_PANELS[args.panel](
+        users=args.users,
+        seed=args.seed,
+        latency=latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        max_page_size=args.max_page_size,
+        username=args.username,
+        password=args.password,
+        compress=args.compress,
+    )
+    url = await panel.start(args.host, args.port)
+    print(f"mock {args.panel} panel with {args.users} users at {url}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await panel.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m opexcore.mock", description="Serve a mock panel API"
+    )
+    parser.add_argument("panel", choices=sorted(MOCK_PANELS))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--max-page-size", type=int, default=None)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--compress", action="store_true")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import bisect
+from itertools import islice
+from typing import Optional, Dict, List, Any, Callable, Iterator
+from opexcore.core.codec import get_codec
+
+
+class Dataset:
+    """
+    Records of a mock panel, generated on first use and editable like a table.
+
+    The dataset starts with ``size`` generated records; record ``i`` is always
+    the same for a given generator, so nothing has to be stored up front.
+    Created, changed and deleted records are kept on the side. Encoded records
+    are cached, which keeps a mock from becoming the bottleneck of a load
+    test at the cost of roughly one kilobyte per record served.
+    """
+
+    def __init__(
+        self,
+        make: Callable[[int], Dict[str, Any]],
+        size: int,
+        key: str,
+        key_of: Callable[[int], str],
+        cache: bool = True,
+    ):
+        """
+        :param make: Builds generated record ``i``
+        :param size: Number of generated records
+        :param key: Field identifying a record, e.g. ``"username"``
+        :param key_of: Returns the key of generated record ``i`` without
+            building it; ``make`` must agree with it
+        :param cache: Keep encoded records in memory
+        """
+        self.make = make
+        self.size = size
+        self.key = key
+        self.key_of = key_of
+        self.cache = cache
+        self._codec = get_codec()
+        self._keys: Optional[Dict[str, int]] = None
+        self._deleted: List[int] = []
+        self._changed: Dict[int, Dict[str, Any]] = {}
+        self._created: Dict[str, Dict[str, Any]] = {}
+        self._encoded: Dict[Any, bytes] = {}
+
+    def __len__(self) -> int:
+        return self.size - len(self._deleted) + len(self._created)
+
+    def _index(self, key: str) -> Optional[int]:
+        if self._keys is None:
+            self._keys = {self.key_of(index): index for index in range(self.size)}
+        index = self._keys.get(key)
+        if index is None or self._is_deleted(index):
+            return None
+        return index
+
+    def _is_deleted(self, index: int) -> bool:
+        position = bisect.bisect_left(self._deleted, index)
+        return position < len(self._deleted) and self._deleted[position] == index
+
+    def _live(self, position: int) -> int:
+        """Index of the generated record at ``position`` once deletions are skipped"""
+        index = position
+        while True:
+            skipped = bisect.bisect_right(self._deleted, index)
+            if index - skipped == position and not self._is_deleted(index):
+                return index
+            index = position + skipped
+
+    def _record(self, index: int) -> Dict[str, Any]:
+        record = self._changed.get(index)
+        return record if record is not None else self.make(index)
+
+    def _encode(self, slot: Any, record: Dict[str, Any]) -> bytes:
+        body = self._encoded.get(slot)
+        if body is None:
+            body = self._codec.dumps(record)
+            if self.cache:
+                self._encoded[slot] = body
+        return body
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the record with ``key``, None if there is none"""
+        index = self._index(key)
+        if index is not None:
+            return self._record(index)
+        return self._created.get(key)
+
+    def encoded(self, key: str) -> Optional[bytes]:
+        """Return the JSON encoding of the record with ``key``"""
+        index = self._index(key)
+        if index is not None:
+            return self._encode(index, self._record(index))
+        record = self._created.get(key)
+        return None if record is None else self._encode(key, record)
+
+    def page(self, offset: int, limit: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Encoded records in dataset order, generated ones first.
+
+        :param offset: Number of records to skip
+        :param limit: Maximum number of records, None for all of them
+        :return: Iterator over JSON-encoded records
+        """
+        remaining = len(self) - offset if limit is None else limit
+        generated = self.size - len(self._deleted)
+        position = offset
+        while remaining > 0 and position < generated:
+            index = self._live(position)
+            yield self._encode(index, self._record(index))
+            position += 1
+            remaining -= 1
+        if remaining > 0:
+            start = max(0, offset - generated)
+            for key, record in islice(self._created.items(), start, start + remaining):
+                yield self._encode(key, record)
+
+    def create(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add a record.
+
+        :param record: Complete record, including its key field
+        :return: The stored record
+        :raises KeyError: If a record with the same key exists
+        """
+        key = record[self.key]
+        if self.get(key) is not None:
+            raise KeyError(key)
+        self._created[key] = record
+        return record
+
+    def update(self, key: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Change fields of a record.
+
+        :param key: Key of the record
+        :param changes: Fields to overwrite
+        :return: The updated record, None if there is none
+        """
+        index = self._index(key)
+        if index is not None:
+            record = self._changed[index] = {**self._record(index), **changes}
+            self._encoded.pop(index, None)
+            return record
+        record = self._created.get(key)
+        if record is None:
+            return None
+        record.update(changes)
+        self._encoded.pop(key, None)
+        return record
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a record.
+
+        :param key: Key of the record
+        :return: Whether a record was removed
+        """
+        index = self._index(key)
+        if index is not None:
+            bisect.insort(self._deleted, index)
+            self._changed.pop(index, None)
+            self._encoded.pop(index, None)
+            return True
+        self._encoded.pop(key, None)
+        return self._created.pop(key, None) is not None
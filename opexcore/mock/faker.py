@@ -0,0 +1,195 @@
+import random
+import types
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Callable,
+    Literal,
+    Union,
+    get_args,
+    get_origin,
+)
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+Generator = Callable[[random.Random, int], Any]
+"""Build one value from a seeded random generator and the record index"""
+
+REFERENCE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+"""Fixed point in time every generated date is spread around"""
+
+GIB = 1024**3
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _moment(rng: random.Random) -> datetime:
+    return REFERENCE + timedelta(seconds=rng.randint(-365 * 86400, 365 * 86400))
+
+
+def _bounds(field: Optional[FieldInfo]) -> Dict[str, Any]:
+    bounds: Dict[str, Any] = {}
+    for item in field.metadata if field is not None else ():
+        for name in ("ge", "gt", "le", "lt", "min_length", "max_length"):
+            value = getattr(item, name, None)
+            if value is not None:
+                bounds[name] = value
+    return bounds
+
+
+def _integer(name: str, bounds: Dict[str, Any]) -> Generator:
+    if name == "id" or name.endswith("_id"):
+        return lambda rng, index: index + 1
+    low, high = 0, 1000
+    if "expire" in name or name.endswith("_at"):
+        low = int(REFERENCE.timestamp())
+        high = low + 365 * 86400
+    elif any(part in name for part in ("traffic", "usage", "limit", "bytes", "data")):
+        high = 100 * GIB
+    elif "bandwidth" in name or "mem" in name:
+        high = 64 * GIB
+    elif "port" in name:
+        low, high = 1024, 65535
+    low = bounds["ge"] if "ge" in bounds else bounds.get("gt", low - 1) + 1
+    high = bounds["le"] if "le" in bounds else bounds.get("lt", high + 1) - 1
+    return lambda rng, index: rng.randint(low, max(low, high))
+
+
+def _string(name: str, bounds: Dict[str, Any]) -> Generator:
+    if "uuid" in name:
+        make: Generator = lambda rng, index: _uuid(rng)
+    elif "email" in name:
+        make = lambda rng, index: f"user{index}@example.com"
+    elif "url" in name or "link" in name:
+        make = (
+            lambda rng, index: f"https://panel.example.com/sub/{rng.getrandbits(64):016x}"
+        )
+    elif any(part in name for part in ("key", "token", "secret", "password", "hash")):
+        make = lambda rng, index: f"{rng.getrandbits(128):032x}"
+    elif "address" in name or "host" in name or name == "sni":
+        make = lambda rng, index: f"node{rng.randint(1, 64)}.example.com"
+    elif "version" in name:
+        make = lambda rng, index: "1.0.0"
+    elif name.endswith("_at") or "date" in name or "time" in name:
+        make = lambda rng, index: _moment(rng).isoformat()
+    else:
+        make = lambda rng, index: f"{name}_{index}"
+    low, high = bounds.get("min_length", 0), bounds.get("max_length")
+    if not low and high is None:
+        return make
+    return lambda rng, index: make(rng, index).ljust(low, "x")[:high]
+
+
+class ModelFaker:
+    """
+    Deterministic generator of JSON-ready records shaped like a pydantic model.
+
+    Field values are derived from the field types, constraints and names, so
+    records validate against the model and look plausible. The same seed and
+    index always produce the same record.
+    """
+
+    def __init__(
+        self,
+        model: type,
+        seed: int = 0,
+        overrides: Optional[Dict[str, Generator]] = None,
+    ):
+        """
+        :param model: Pydantic model to imitate
+        :param seed: Seed mixed into every record
+        :param overrides: Generators replacing the derived ones, keyed by
+            field name
+        """
+        self.model = model
+        self.seed = seed
+        self._fields = _compile_model(model, overrides or {})
+
+    def __call__(self, index: int) -> Dict[str, Any]:
+        """
+        Build record ``index``.
+
+        :param index: Position of the record in its dataset
+        :return: Dict keyed by the model's aliases
+        """
+        rng = random.Random(self.seed * 1_000_003 + index)
+        return {key: make(rng, index) for key, make in self._fields}
+
+
+def _compile_model(
+    model: type, overrides: Dict[str, Generator], depth: int = 0
+) -> List[Any]:
+    fields = []
+    for name, field in model.model_fields.items():
+        make = overrides.get(name)
+        if make is None:
+            make = _compile(field.annotation, name, field, depth)
+            if not field.is_required():
+                make = _sometimes_default(make, field)
+        fields.append((field.alias or name, make))
+    return fields
+
+
+def _sometimes_default(make: Generator, field: FieldInfo) -> Generator:
+    if field.default is not None or field.default_factory is not None:
+        return make
+    return lambda rng, index: None if rng.random() < 0.3 else make(rng, index)
+
+
+def _compile(
+    annotation: Any, name: str, field: Optional[FieldInfo] = None, depth: int = 0
+) -> Generator:
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in (Union, types.UnionType):
+        options = [arg for arg in args if arg is not type(None)]
+        return _compile(options[0], name, field, depth) if options else _none
+    if origin is Literal:
+        return lambda rng, index: rng.choice(args)
+    if origin in (list, List, set, tuple):
+        item = _compile(args[0] if args else Any, name, None, depth + 1)
+        if depth > 1:
+            return lambda rng, index: []
+        return lambda rng, index: [item(rng, index) for _ in range(rng.randint(1, 2))]
+    if origin in (dict, Dict):
+        key_type = args[0] if args else str
+        if isinstance(key_type, type) and issubclass(key_type, Enum) and depth < 2:
+            value = _compile(args[1], name, None, depth + 1)
+            keys = [member.value for member in key_type]
+            return lambda rng, index: {keys[0]: value(rng, index)}
+        return lambda rng, index: {}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            if depth > 2:
+                return _none
+            nested = _compile_model(annotation, {}, depth + 1)
+            return lambda rng, index: {key: make(rng, index) for key, make in nested}
+        if issubclass(annotation, Enum):
+            values = [member.value for member in annotation]
+            return lambda rng, index: rng.choice(values)
+        if issubclass(annotation, bool):
+            return lambda rng, index: rng.random() < 0.8
+        if issubclass(annotation, int):
+            return _integer(name, _bounds(field))
+        if issubclass(annotation, float):
+            return lambda rng, index: round(rng.uniform(0, 100), 2)
+        if issubclass(annotation, datetime):
+            return lambda rng, index: _moment(rng).isoformat()
+        if issubclass(annotation, date):
+            return lambda rng, index: _moment(rng).date().isoformat()
+        if issubclass(annotation, uuid.UUID):
+            return lambda rng, index: _uuid(rng)
+        if issubclass(annotation, str):
+            return _string(name, _bounds(field))
+    return _none
+
+
+def _none(rng: random.Random, index: int) -> None:
+    return None
@@ -0,0 +1,130 @@
+import hashlib
+from typing import Dict
+from aiohttp import web
+from opexcore.guard.types import (
+    GuardSubscriptionResponse,
+    GuardSubscriptionStatsResponse,
+)
+from .dataset import Dataset
+from .faker import ModelFaker
+from .server import MockPanel
+
+
+class MockGuard(MockPanel):
+    """Mock Guard panel, where users are subscriptions reached by a secret"""
+
+    name = "guard"
+    login_paths = ("/api/admins/token",)
+    public_prefixes = ("/guards/",)
+
+    def __init__(self, *args, **kwargs):
+        self._secrets: Dict[str, str] = {}
+        super().__init__(*args, **kwargs)
+
+    def access_key(self, index: int) -> str:
+        """Secret of generated subscription ``index``, which encodes the index"""
+        digest = hashlib.md5(f"{self.seed}:{index}".encode()).hexdigest()
+        return f"{index:08x}{digest[:24]}"
+
+    def dataset(self, size: int, cache: bool) -> Dataset:
+        faker = ModelFaker(
+            GuardSubscriptionResponse,
+            self.seed,
+            {
+                "username": lambda rng, index: self.key_of(index),
+                "access_key": lambda rng, index: self.access_key(index),
+                "link": lambda rng, index: f"/guards/{self.access_key(index)}",
+            },
+        )
+        return Dataset(faker, size, "username", self.key_of, cache)
+
+    def routes(self, router: web.UrlDispatcher) -> None:
+        router.add_post("/api/admins/token", self.login)
+        router.add_get("/api/subscriptions", self.list_subscriptions)
+        router.add_post("/api/subscriptions", self.create_subscriptions)
+        router.add_get("/api/subscriptions/stats", self.subscription_stats)
+        router.add_get("/api/subscriptions/count", self.subscription_count)
+        router.add_get("/api/subscriptions/{username}", self.get_subscription)
+        router.add_put("/api/subscriptions/{username}", self.update_subscription)
+        router.add_delete("/api/subscriptions/{username}", self.delete_subscription)
+        router.add_get("/api/admins/current/backup", self.backup)
+        router.add_get("/guards/{secret}", self.subscription_content)
+        router.add_get("/guards/{secret}/info", self.subscription_info)
+
+    def _by_secret(self, secret: str) -> str:
+        username = self._secrets.get(secret)
+        if username is None:
+            try:
+                index = int(secret[:8], 16)
+            except ValueError:
+                return ""
+            if self.access_key(index) == secret:
+                username = self.key_of(index)
+        return username or ""
+
+    async def login(self, request: web.Request) -> web.Response:
+        if not await self.check_login(request):
+            return self.error(401, "Incorrect username or password")
+        return self.json({"access_token": self.token, "token_type": "bearer"})
+
+    async def list_subscriptions(self, request: web.Request) -> web.StreamResponse:
+        offset, size = self.pages(request)
+        return await self.records(request, self.users.page(offset, size))
+
+    async def subscription_count(self, request: web.Request) -> web.Response:
+        return self.json(len(self.users))
+
+    async def create_subscriptions(self, request: web.Request) -> web.Response:
+        created = []
+        for fields in await self.body(request):
+            try:
+                record = self.users.create(self.new_user(fields))
+            except KeyError:
+                return self.error(409, "Subscription already exists")
+            record["link"] = f"/guards/{record['access_key']}"
+            self._secrets[record["access_key"]] = record["username"]
+            created.append(record)
+        return self.json(created)
+
+    async def subscription_stats(self, request: web.Request) -> web.Response:
+        counts = self.counts()
+        stats = ModelFaker(GuardSubscriptionStatsResponse, self.seed)(0)
+        stats.update({key: counts[key] for key in stats if key in counts})
+        stats["inactive"] = counts["total"] - counts["active"]
+        return self.json(stats)
+
+    async def get_subscription(self, request: web.Request) -> web.Response:
+        body = self.users.encoded(request.match_info["username"])
+        if body is None:
+            return self.error(404, "Subscription not found")
+        return self.raw(body)
+
+    async def update_subscription(self, request: web.Request) -> web.Response:
+        username = request.match_info["username"]
+        record = self.users.get(username)
+        if record is None:
+            return self.error(404, "Subscription not found")
+        fields = await self.body(request)
+        return self.json(self.users.update(username, self.changes(record, fields)))
+
+    async def delete_subscription(self, request: web.Request) -> web.Response:
+        if not self.users.delete(request.match_info["username"]):
+            return self.error(404, "Subscription not found")
+        return self.json({})
+
+    async def backup(self, request: web.Request) -> web.StreamResponse:
+        return await self.records(
+            request, self.users.page(0), b'{"subscriptions":[', b"]}"
+        )
+
+    async def subscription_content(self, request: web.Request) -> web.Response:
+        username = self._by_secret(request.match_info["secret"])
+        if self.users.get(username) is None:
+            return self.error(404, "Subscription not found")
+        return web.Response(text=self.subscription(username))
+
+    async def subscription_info(self, request: web.Request) -> web.Response:
+        body = self.users.encoded(self._by_secret(request.match_info["secret"]))
+        if body is None:
+            return self.error(404, "Subscription not found")
+        return self.raw(body)
@@ -0,0 +1,93 @@
+from aiohttp import web
+from opexcore.marzban.types import MarzbanUserResponse, MarzbanSystemStats
+from .dataset import Dataset
+from .faker import ModelFaker
+from .server import MockPanel
+
+
+class MockMarzban(MockPanel):
+    """Mock Marzban panel with offset/limit user pagination"""
+
+    name = "marzban"
+    login_paths = ("/api/admin/token",)
+    user_model = MarzbanUserResponse
+    stats_model = MarzbanSystemStats
+    stats_field = "users_{}"
+
+    def dataset(self, size: int, cache: bool) -> Dataset:
+        faker = ModelFaker(
+            self.user_model,
+            self.seed,
+            {
+                "username": lambda rng, index: self.key_of(index),
+                "subscription_url": lambda rng, index: f"/sub/{self.key_of(index)}/",
+            },
+        )
+        return Dataset(faker, size, "username", self.key_of, cache)
+
+    def routes(self, router: web.UrlDispatcher) -> None:
+        router.add_post("/api/admin/token", self.login)
+        router.add_get("/api/users", self.list_users)
+        router.add_post("/api/user", self.create_user)
+        router.add_get("/api/user/{username}", self.get_user)
+        router.add_put("/api/user/{username}", self.modify_user)
+        router.add_delete("/api/user/{username}", self.remove_user)
+        router.add_get("/api/system", self.system_stats)
+        router.add_get("/sub/{token}/", self.user_subscription)
+        router.add_get("/sub/{token}/{client_type}", self.user_subscription)
+
+    async def login(self, request: web.Request) -> web.Response:
+        if not await self.check_login(request):
+            return self.error(401, "Incorrect username or password")
+        return self.json({"access_token": self.token, "token_type": "bearer"})
+
+    async def list_users(self, request: web.Request) -> web.StreamResponse:
+        offset = int(request.query.get("offset", 0))
+        limit = self.limit(request.query.get("limit"))
+        tail = b'],"total":%d}' % len(self.users)
+        return await self.records(
+            request, self.users.page(offset, limit), b'{"users":[', tail
+        )
+
+    async def create_user(self, request: web.Request) -> web.Response:
+        fields = await self.body(request)
+        try:
+            record = self.users.create(self.new_user(fields))
+        except KeyError:
+            return self.error(409, "User already exists")
+        return self.json(record)
+
+    async def get_user(self, request: web.Request) -> web.Response:
+        body = self.users.encoded(request.match_info["username"])
+        if body is None:
+            return self.error(404, "User not found")
+        return self.raw(body)
+
+    async def modify_user(self, request: web.Request) -> web.Response:
+        username = request.match_info["username"]
+        record = self.users.get(username)
+        if record is None:
+            return self.error(404, "User not found")
+        fields = await self.body(request)
+        return self.json(self.users.update(username, self.changes(record, fields)))
+
+    async def remove_user(self, request: web.Request) -> web.Response:
+        if not self.users.delete(request.match_info["username"]):
+            return self.error(404, "User not found")
+        return self.json({})
+
+    async def system_stats(self, request: web.Request) -> web.Response:
+        stats = ModelFaker(self.stats_model, self.seed)(0)
+        counts = self.counts()
+        stats["total_user"] = counts["total"]
+        stats["online_users"] = counts["online"]
+        for status in ("active", "on_hold", "disabled", "expired", "limited"):
+            stats[self.stats_field.format(status)] = counts[status]
+        return self.json(stats)
+
+    async def user_subscription(self, request: web.Request) -> web.Response:
+        username = request.match_info["token"]
+        if self.users.get(username) is None:
+            return self.error(404, "Not Found")
+        client_type = request.match_info.get("client_type", "")
+        return web.Response(text=self.subscription(username, client_type))
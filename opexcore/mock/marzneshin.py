@@ -0,0 +1,104 @@
+import hashlib
+from aiohttp import web
+from opexcore.marzneshin.types import MarzneshinUserResponse, MarzneshinUsersStats
+from .dataset import Dataset
+from .faker import ModelFaker
+from .server import MockPanel
+
+
+class MockMarzneshin(MockPanel):
+    """Mock Marzneshin panel with page/size user pagination"""
+
+    name = "marzneshin"
+    login_paths = ("/api/admins/token",)
+    user_model = MarzneshinUserResponse
+    stats_model = MarzneshinUsersStats
+
+    def dataset(self, size: int, cache: bool) -> Dataset:
+        faker = ModelFaker(
+            self.user_model,
+            self.seed,
+            {
+                "username": lambda rng, index: self.key_of(index),
+                "key": lambda rng, index: self.subscription_key(index),
+                "subscription_url": lambda rng, index: (
+                    f"/sub/{self.key_of(index)}/{self.subscription_key(index)}"
+                ),
+            },
+        )
+        return Dataset(faker, size, "username", self.key_of, cache)
+
+    def subscription_key(self, index: int) -> str:
+        """Subscription key of generated user ``index``"""
+        return hashlib.md5(f"{self.seed}:{index}".encode()).hexdigest()
+
+    def routes(self, router: web.UrlDispatcher) -> None:
+        router.add_post("/api/admins/token", self.login)
+        router.add_get("/api/users", self.list_users)
+        router.add_post("/api/users", self.create_user)
+        router.add_get("/api/users/{username}", self.get_user)
+        router.add_put("/api/users/{username}", self.modify_user)
+        router.add_delete("/api/users/{username}", self.remove_user)
+        router.add_get("/api/system/stats/users", self.users_stats)
+        router.add_get("/sub/{username}/{key}", self.user_subscription)
+        router.add_get("/sub/{username}/{key}/{client_type}", self.user_subscription)
+
+    async def login(self, request: web.Request) -> web.Response:
+        if not await self.check_login(request):
+            return self.error(401, "Incorrect username or password")
+        return self.json(
+            {"access_token": self.token, "token_type": "bearer", "is_sudo": True}
+        )
+
+    async def list_users(self, request: web.Request) -> web.StreamResponse:
+        offset, size = self.pages(request)
+        total = len(self.users)
+        tail = b'],"total":%d,"page":%d,"size":%d,"pages":%d}' % (
+            total,
+            offset // size + 1,
+            size,
+            -(-total // size),
+        )
+        return await self.records(
+            request, self.users.page(offset, size), b'{"items":[', tail
+        )
+
+    async def create_user(self, request: web.Request) -> web.Response:
+        fields = await self.body(request)
+        try:
+            record = self.users.create(self.new_user(fields))
+        except KeyError:
+            return self.error(409, "User already exists")
+        return self.json(record)
+
+    async def get_user(self, request: web.Request) -> web.Response:
+        body = self.users.encoded(request.match_info["username"])
+        if body is None:
+            return self.error(404, "User not found")
+        return self.raw(body)
+
+    async def modify_user(self, request: web.Request) -> web.Response:
+        username = request.match_info["username"]
+        record = self.users.get(username)
+        if record is None:
+            return self.error(404, "User not found")
+        fields = await self.body(request)
+        return self.json(self.users.update(username, self.changes(record, fields)))
+
+    async def remove_user(self, request: web.Request) -> web.Response:
+        if not self.users.delete(request.match_info["username"]):
+            return self.error(404, "User not found")
+        return self.json({})
+
+    async def users_stats(self, request: web.Request) -> web.Response:
+        counts = self.counts()
+        stats = ModelFaker(self.stats_model, self.seed)(0)
+        return self.json({key: counts.get(key, value) for key, value in stats.items()})
+
+    async def user_subscription(self, request: web.Request) -> web.Response:
+        username = request.match_info["username"]
+        record = self.users.get(username)
+        if record is None or record.get("key") != request.match_info["key"]:
+            return self.error(404, "Not Found")
+        client_type = request.match_info.get("client_type", "")
+        return web.Response(text=self.subscription(username, client_type))
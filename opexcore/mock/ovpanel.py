@@ -0,0 +1,135 @@
+import random
+import uuid
+from typing import Any, Dict, List
+from aiohttp import web
+from opexcore.ovpanel.types import OVPanelUser, OVPanelNode
+from .dataset import Dataset
+from .faker import ModelFaker
+from .server import MockPanel
+
+
+class MockOVPanel(MockPanel):
+    """Mock OVPanel; users are keyed by UUID and lists are never paginated"""
+
+    name = "ovpanel"
+    key = "uuid"
+    login_paths = ("/api/login",)
+
+    def __init__(self, *args, nodes: int = 3, **kwargs):
+        """
+        :param nodes: Number of OpenVPN nodes
+        """
+        super().__init__(*args, **kwargs)
+        faker = ModelFaker(
+            OVPanelNode, self.seed, {"name": lambda rng, index: f"node{index + 1}"}
+        )
+        self.nodes: List[Dict[str, Any]] = [faker(index) for index in range(nodes)]
+
+    def key_of(self, index: int) -> str:
+        return str(uuid.UUID(int=(self.seed << 64) | index, version=4))
+
+    def dataset(self, size: int, cache: bool) -> Dataset:
+        faker = ModelFaker(
+            OVPanelUser,
+            self.seed,
+            {
+                "uuid": lambda rng, index: self.key_of(index),
+                "name": lambda rng, index: f"u{index:06d}",
+            },
+        )
+        return Dataset(faker, size, "uuid", self.key_of, cache)
+
+    def routes(self, router: web.UrlDispatcher) -> None:
+        router.add_post("/api/login", self.login)
+        router.add_get("/api/users/", self.list_users)
+        router.add_post("/api/users/", self.create_user)
+        router.add_put("/api/users/{uuid}", self.update_user)
+        router.add_put("/api/users/{uuid}/status", self.update_user)
+        router.add_delete("/api/users/{uuid}", self.delete_user)
+        router.add_get("/api/nodes/", self.list_nodes)
+        router.add_get("/api/nodes/ovpn/{uuid}/{node_id}", self.ovpn_client)
+        router.add_get("/api/server/info", self.server_info)
+        router.add_get("/sub/{uuid}", self.subscription_info)
+        router.add_get("/sub/download/{uuid}/{node_name}", self.ovpn_client)
+
+    def result(self, data: Any, msg: str = "ok") -> web.Response:
+        """Response in OVPanel's ``success``/``msg``/``data`` envelope"""
+        return self.json({"success": True, "msg": msg, "data": data})
+
+    def error(self, status: int, detail: str) -> web.Response:
+        return self.json({"success": False, "msg": detail, "data": None}, status)
+
+    def ovpn(self, user: Dict[str, Any], node: Dict[str, Any]) -> bytes:
+        """Client configuration of ``user`` on ``node``, padded to a realistic size"""
+        rng = random.Random(f"{self.seed}:{user['uuid']}:{node['id']}")
+        blocks = {
+            name: "\n".join(f"{rng.getrandbits(256):064x}" for _ in range(24))
+            for name in ("ca", "cert", "key", "tls-crypt")
+        }
+        lines = [
+            "client",
+            "dev tun",
+            f"proto {node['protocol']}",
+            f"remote {node['address']} {node['ovpn_port']}",
+            f"# {user['name']}",
+            *(f"<{name}>\n{block}\n</{name}>" for name, block in blocks.items()),
+        ]
+        return ("\n".join(lines) + "\n").encode()
+
+    async def login(self, request: web.Request) -> web.Response:
+        if not await self.check_login(request):
+            return self.error(401, "Incorrect username or password")
+        return self.json({"access_token": self.token, "token_type": "bearer"})
+
+    async def list_users(self, request: web.Request) -> web.StreamResponse:
+        return await self.records(
+            request,
+            self.users.page(0),
+            b'{"success":true,"msg":"users","data":[',
+            b"]}",
+        )
+
+    async def create_user(self, request: web.Request) -> web.Response:
+        fields = await self.body(request)
+        return self.result(self.users.create(self.new_user(fields)), "user created")
+
+    async def update_user(self, request: web.Request) -> web.Response:
+        key = request.match_info["uuid"]
+        record = self.users.get(key)
+        if record is None:
+            return self.error(404, "User not found")
+        fields = await self.body(request)
+        changes = self.changes(record, fields)
+        return self.result(self.users.update(key, changes), "user updated")
+
+    async def delete_user(self, request: web.Request) -> web.Response:
+        if not self.users.delete(request.match_info["uuid"]):
+            return self.error(404, "User not found")
+        return self.result(None, "user deleted")
+
+    async def list_nodes(self, request: web.Request) -> web.Response:
+        return self.result(self.nodes, "nodes")
+
+    async def ovpn_client(self, request: web.Request) -> web.Response:
+        user = self.users.get(request.match_info["uuid"])
+        wanted = request.match_info.get("node_id") or request.match_info["node_name"]
+        node = next(
+            (node for node in self.nodes if wanted in (str(node["id"]), node["name"])),
+            None,
+        )
+        if user is None or node is None:
+            return self.error(404, "Not found")
+        return self.raw(
+            self.ovpn(user, node), content_type="application/x-openvpn-profile"
+        )
+
+    async def server_info(self, request: web.Request) -> web.Response:
+        return self.result(
+            {"users": len(self.users), "nodes": len(self.nodes), "version": "mock"}
+        )
+
+    async def subscription_info(self, request: web.Request) -> web.Response:
+        user = self.users.get(request.match_info["uuid"])
+        if user is None:
+            return self.error(404, "User not found")
+        return self.result({**user, "nodes": [node["name"] for node in self.nodes]})
@@ -0,0 +1,11 @@
+from opexcore.pasarguard.types import PasarGuardUserResponse, PasarGuardSystemStats
+from .marzban import MockMarzban
+
+
+class MockPasarGuard(MockMarzban):
+    """Mock PasarGuard panel, which keeps Marzban's user endpoints"""
+
+    name = "pasarguard"
+    user_model = PasarGuardUserResponse
+    stats_model = PasarGuardSystemStats
+    stats_field = "{}_users"
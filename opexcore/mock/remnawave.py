@@ -0,0 +1,143 @@
+import uuid
+from typing import Any
+from aiohttp import web
+from opexcore.remnawave.types import RemnawaveUser, RemnawaveSystemStats
+from .dataset import Dataset
+from .faker import ModelFaker
+from .server import MockPanel
+
+
+class MockRemnawave(MockPanel):
+    """Mock Remnawave panel, keyed by UUID and wrapping bodies in ``response``"""
+
+    name = "remnawave"
+    key = "uuid"
+    login_paths = ("/api/auth/login",)
+    public_prefixes = ("/api/sub/",)
+
+    def key_of(self, index: int) -> str:
+        return str(uuid.UUID(int=(self.seed << 64) | index, version=4))
+
+    def short_uuid(self, index: int) -> str:
+        """Short UUID of generated user ``index``, which encodes the index"""
+        return f"{self.seed:04x}{index:012x}"
+
+    def dataset(self, size: int, cache: bool) -> Dataset:
+        faker = ModelFaker(
+            RemnawaveUser,
+            self.seed,
+            {
+                "uuid": lambda rng, index: self.key_of(index),
+                "short_uuid": lambda rng, index: self.short_uuid(index),
+                "username": lambda rng, index: f"user_{index:06d}",
+                "subscription_url": lambda rng, index: (
+                    f"/api/sub/{self.short_uuid(index)}"
+                ),
+            },
+        )
+        return Dataset(faker, size, "uuid", self.key_of, cache)
+
+    def routes(self, router: web.UrlDispatcher) -> None:
+        router.add_post("/api/auth/login", self.login)
+        router.add_get("/api/users", self.list_users)
+        router.add_post("/api/users", self.create_user)
+        router.add_get("/api/users/{uuid}", self.get_user)
+        router.add_put("/api/users/{uuid}", self.update_user)
+        router.add_delete("/api/users/{uuid}", self.delete_user)
+        router.add_get("/api/system/stats", self.system_stats)
+        router.add_get("/api/sub/{short_uuid}", self.subscription_links)
+        router.add_get("/api/sub/{short_uuid}/info", self.subscription_info)
+        router.add_get("/api/sub/{short_uuid}/{client_type}", self.subscription_links)
+
+    def raw(
+        self, body: bytes, status: int = 200, content_type: str = "application/json"
+    ) -> web.Response:
+        if content_type == "application/json" and status < 400:
+            body = b'{"response":' + body + b"}"
+        return super().raw(body, status, content_type)
+
+    def error(self, status: int, detail: str) -> web.Response:
+        body = self._codec.dumps({"message": detail, "statusCode": status})
+        return super().raw(body, status)
+
+    def _by_short_uuid(self, short_uuid: str) -> Any:
+        try:
+            index = int(short_uuid[4:], 16)
+        except ValueError:
+            return None
+        if self.short_uuid(index) != short_uuid:
+            return None
+        return self.users.get(self.key_of(index))
+
+    async def login(self, request: web.Request) -> web.Response:
+        if not await self.check_login(request):
+            return self.error(401, "Invalid credentials")
+        return self.json({"accessToken": self.token})
+
+    async def list_users(self, request: web.Request) -> web.StreamResponse:
+        start = int(request.query.get("start", 0))
+        size = self.limit(request.query.get("size"), 25)
+        tail = b'],"total":%d}}' % len(self.users)
+        return await self.records(
+            request, self.users.page(start, size), b'{"response":{"users":[', tail
+        )
+
+    async def create_user(self, request: web.Request) -> web.Response:
+        fields = await self.body(request)
+        return self.json(self.users.create(self.new_user(fields)))
+
+    async def get_user(self, request: web.Request) -> web.Response:
+        body = self.users.encoded(request.match_info["uuid"])
+        if body is None:
+            return self.error(404, "User not found")
+        return self.raw(body)
+
+    async def update_user(self, request: web.Request) -> web.Response:
+        key = request.match_info["uuid"]
+        record = self.users.get(key)
+        if record is None:
+            return self.error(404, "User not found")
+        fields = await self.body(request)
+        return self.json(self.users.update(key, self.changes(record, fields)))
+
+    async def delete_user(self, request: web.Request) -> web.Response:
+        deleted = self.users.delete(request.match_info["uuid"])
+        if not deleted:
+            return self.error(404, "User not found")
+        return self.json({"isDeleted": True})
+
+    async def system_stats(self, request: web.Request) -> web.Response:
+        counts = self.counts()
+        stats = ModelFaker(RemnawaveSystemStats, self.seed)(0)
+        stats["userStats"] = {
+            status: counts[status]
+            for status in ("active", "disabled", "limited", "expired")
+        }
+        stats["onlineStats"]["onlineNow"] = counts["online"]
+        return self.json(stats)
+
+    async def subscription_links(self, request: web.Request) -> web.Response:
+        user = self._by_short_uuid(request.match_info["short_uuid"])
+        if user is None:
+            return self.error(404, "Subscription not found")
+        client_type = request.match_info.get("client_type", "")
+        return web.Response(text=self.subscription(user["username"], client_type))
+
+    async def subscription_info(self, request: web.Request) -> web.Response:
+        user = self._by_short_uuid(request.match_info["short_uuid"])
+        if user is None:
+            return self.error(404, "Subscription not found")
+        return self.json(
+            {
+                "shortUuid": user["shortUuid"],
+                "username": user["username"],
+                "daysLeft": 30,
+                "trafficUsed": str(user["usedTrafficBytes"]),
+                "trafficLimit": str(user["trafficLimitBytes"]),
+                "lifetimeTrafficUsed": str(user["lifetimeUsedTrafficBytes"]),
+                "expiresAt": user["expireAt"],
+                "isActive": user["status"] == "ACTIVE",
+                "userStatus": user["status"],
+                "subscriptionUrl": user["subscriptionUrl"],
+            }
+        )
@@ -0,0 +1,10 @@
+from opexcore.rustneshin.types import RustneshinUserResponse, RustneshinUsersStats
+from .marzneshin import MockMarzneshin
+
+
+class MockRustneshin(MockMarzneshin):
+    """Mock Rustneshin panel, which keeps Marzneshin's user endpoints"""
+
+    name = "rustneshin"
+    user_model = RustneshinUserResponse
+    stats_model = RustneshinUsersStats
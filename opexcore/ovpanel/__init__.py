@@ -1,20 +1,47 @@
-from .manager import OVPanelManager
-from .types import (
-    OVPanelToken,
-    OVPanelAdmin,
-    OVPanelUser,
-    OVPanelCreateUser,
-    OVPanelUpdateUser,
-    OVPanelResponseModel,
-    OVPanelNode,
-    OVPanelNodeCreate,
-    OVPanelNodeStatus,
-    OVPanelSettings,
-    OVPanelServerInfo,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import OVPanelManager
+    from .client import OVPanelClient
+    from .types import (
+        OVPanelToken,
+        OVPanelAdmin,
+        OVPanelUser,
+        OVPanelCreateUser,
+        OVPanelUpdateUser,
+        OVPanelResponseModel,
+        OVPanelNode,
+        OVPanelNodeCreate,
+        OVPanelNodeStatus,
+        OVPanelSettings,
+        OVPanelServerInfo,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".manager": ["OVPanelManager"],
+        ".client": ["OVPanelClient"],
+        ".types": [
+            "OVPanelToken",
+            "OVPanelAdmin",
+            "OVPanelUser",
+            "OVPanelCreateUser",
+            "OVPanelUpdateUser",
+            "OVPanelResponseModel",
+            "OVPanelNode",
+            "OVPanelNodeCreate",
+            "OVPanelNodeStatus",
+            "OVPanelSettings",
+            "OVPanelServerInfo",
+        ],
+    },
 )
 
 __all__ = [
     "OVPanelManager",
+    "OVPanelClient",
     "OVPanelToken",
     "OVPanelAdmin",
     "OVPanelUser",
@@ -0,0 +1,14 @@
+from opexcore.core import PanelClient
+from .manager import OVPanelManager
+
+
+class OVPanelClient(PanelClient):
+    """OVPanel API client bound to a single panel"""
+
+    manager = OVPanelManager
+
+    async def _authenticate(self) -> str:
+        response = await OVPanelManager.login(
+            self.host, self.username, self.password, timeout=self.timeout
+        )
+        return response.access_token
@@ -1,10 +1,30 @@
-from typing import Optional, Dict, Any
-from aiohttp import ClientSession, ClientTimeout
-from opexcore.core import RequestBase
+from contextlib import aclosing
+from functools import partial
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from opexcore.core import (
+    RequestBase,
+    DownloadResult,
+    Target,
+    ArchiveJob,
+    ArchiveReport,
+    archive_name,
+    write_archive,
+)
 from .types import (
     OVPanelToken,
     OVPanelCreateUser,
     OVPanelUpdateUser,
+    OVPanelUser,
+    OVPanelNode,
     OVPanelResponseModel,
     OVPanelNodeCreate,
 )
@@ -39,8 +59,9 @@ class OVPanelManager(RequestBase):
             data={"username": username, "password": password},
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             timeout=timeout,
+            idempotent=True,
         )
-        return OVPanelToken(**response)
+        return cls._parse(OVPanelToken, response)
 
     @classmethod
     async def get_all_users(
@@ -54,12 +75,38 @@ class OVPanelManager(RequestBase):
         :param timeout: Request timeout in seconds
         :return: Response with list of users
         """
-        response = await cls.get(
+        return await cls.get(
+            url=f"{host.rstrip('/')}/api/users/",
+            headers=cls._generate_headers(token),
+            timeout=timeout,
+            response_model=OVPanelResponseModel,
+        )
+
+    @classmethod
+    async def stream_users(
+        cls, host: str, token: str, timeout: int = 10
+    ) -> AsyncIterator[OVPanelUser]:
+        """
+        Get all users in the panel, parsing users as they arrive.
+
+        Only one user is decoded at a time, so memory stays flat however large
+        the panel is.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param timeout: Seconds allowed to connect and for each read
+        :return: Async iterator over users
+        """
+        items = cls.stream_items(
             url=f"{host.rstrip('/')}/api/users/",
+            model=OVPanelUser,
+            path=("data",),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        async with aclosing(items):
+            async for user in items:
+                yield user
 
     @classmethod
     async def create_user(
@@ -76,11 +123,11 @@ class OVPanelManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/users/",
-            data=user_data.model_dump_json(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def update_user(
@@ -103,11 +150,11 @@ class OVPanelManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/users/{uuid}",
-            data=user_data.model_dump_json(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def change_user_status(
@@ -130,11 +177,11 @@ class OVPanelManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/users/{uuid}/status",
-            data=user_data.model_dump_json(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def delete_user(
@@ -154,7 +201,7 @@ class OVPanelManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def get_settings(
@@ -173,7 +220,7 @@ class OVPanelManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def get_server_info(
@@ -192,7 +239,7 @@ class OVPanelManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def add_node(
@@ -209,11 +256,11 @@ class OVPanelManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/nodes/",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def update_node(
@@ -236,11 +283,11 @@ class OVPanelManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/nodes/{node_id}",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def get_node_status(
@@ -260,7 +307,7 @@ class OVPanelManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def list_nodes(
@@ -279,7 +326,7 @@ class OVPanelManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def download_ovpn_client(
@@ -295,13 +342,109 @@ class OVPanelManager(RequestBase):
         :param timeout: Request timeout in seconds
         :return: OVPN configuration file content
         """
-        async with ClientSession(timeout=ClientTimeout(total=timeout)) as session:
-            async with session.get(
-                url=f"{host.rstrip('/')}/api/nodes/ovpn/{uuid}/{node_id}",
-                headers=cls._generate_headers(token),
-            ) as response:
-                response.raise_for_status()
-                return await response.read()
+        return await cls.get(
+            url=f"{host.rstrip('/')}/api/nodes/ovpn/{uuid}/{node_id}",
+            headers=cls._generate_headers(token),
+            timeout=timeout,
+            response_type="bytes",
+        )
+
+    @classmethod
+    async def download_ovpn_client_to(
+        cls,
+        host: str,
+        token: str,
+        uuid: str,
+        node_id: int,
+        target: Target,
+        checksum: Optional[str] = None,
+        expected_checksum: Optional[str] = None,
+        timeout: int = 10,
+        resume: bool = True,
+    ) -> DownloadResult:
+        """
+        Download OVPN client configuration from a node straight to a file.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param uuid: User UUID
+        :param node_id: Node ID
+        :param target: File path, or a binary file object (sync or async)
+        :param checksum: ``hashlib`` algorithm to digest the file with
+        :param expected_checksum: Hex digest the file must match
+        :param timeout: Seconds allowed to connect and for each read
+        :param resume: Continue a ``.part`` file left by an earlier call when
+            the panel reports the same document
+        :return: Size and digest of the written file
+        """
+        return await cls.download_to(
+            url=f"{host.rstrip('/')}/api/nodes/ovpn/{uuid}/{node_id}",
+            target=target,
+            headers=cls._generate_headers(token),
+            timeout=timeout,
+            checksum=checksum,
+            expected_checksum=expected_checksum,
+            resume=resume,
+        )
+
+    @classmethod
+    async def export_ovpn_clients(
+        cls,
+        host: str,
+        token: str,
+        target: Target,
+        users: Optional[Iterable[OVPanelUser]] = None,
+        nodes: Optional[List[OVPanelNode]] = None,
+        format: str = "zip",
+        concurrency: int = 8,
+        progress: Optional[Callable[[ArchiveReport], Any]] = None,
+        timeout: int = 10,
+    ) -> ArchiveReport:
+        """
+        Download the OVPN configuration of every user on every node into one archive.
+
+        Downloads run concurrently and each file is added as soon as it
+        arrives, as ``<node name>/<user name>.ovpn``. Users are streamed from
+        the panel when not given, so memory does not grow with their number.
+        Failed downloads are listed in the report instead of aborting the export.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param target: Archive file path, or a writable binary file object
+        :param users: Users to export, defaults to all users
+        :param nodes: Nodes to export from, defaults to all nodes
+        :param format: ``"zip"``, ``"tar"`` or ``"tar.gz"``
+        :param concurrency: Maximum number of downloads at once
+        :param progress: Called with the report after every finished file
+        :param timeout: Request timeout in seconds
+        :return: Export report with counts and per-file failures
+        """
+        if nodes is None:
+            response = await cls.list_nodes(host, token, timeout=timeout)
+            nodes = cls._parse(List[OVPanelNode], response.data or [])
+
+        def entries(user: OVPanelUser) -> Iterator[ArchiveJob]:
+            for node in nodes:
+                download = partial(
+                    cls.download_ovpn_client, host, token, user.uuid, node.id, timeout
+                )
+                yield archive_name(node.name, f"{user.name}.ovpn"), download
+
+        async def jobs() -> AsyncIterator[ArchiveJob]:
+            if users is not None:
+                for user in users:
+                    for job in entries(user):
+                        yield job
+                return
+            source = cls.stream_users(host, token, timeout=timeout)
+            async with aclosing(source):
+                async for user in source:
+                    for job in entries(user):
+                        yield job
+
+        return await write_archive(
+            jobs(), target, format=format, concurrency=concurrency, progress=progress
+        )
 
     @classmethod
     async def delete_node(
@@ -321,7 +464,7 @@ class OVPanelManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def get_all_admins(
@@ -340,7 +483,7 @@ class OVPanelManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return OVPanelResponseModel(**response)
+        return cls._parse(OVPanelResponseModel, response)
 
     @classmethod
     async def get_subscription(
@@ -373,9 +516,43 @@ class OVPanelManager(RequestBase):
         :param timeout: Request timeout in seconds
         :return: OVPN file content
         """
-        async with ClientSession(timeout=ClientTimeout(total=timeout)) as session:
-            async with session.get(
-                url=f"{host.rstrip('/')}/sub/download/{uuid}/{node_name}",
-            ) as response:
-                response.raise_for_status()
-                return await response.read()
+        return await cls.get(
+            url=f"{host.rstrip('/')}/sub/download/{uuid}/{node_name}",
+            timeout=timeout,
+            response_type="bytes",
+        )
+
+    @classmethod
+    async def download_subscription_to(
+        cls,
+        host: str,
+        uuid: str,
+        node_name: str,
+        target: Target,
+        checksum: Optional[str] = None,
+        expected_checksum: Optional[str] = None,
+        timeout: int = 10,
+        resume: bool = True,
+    ) -> DownloadResult:
+        """
+        Download subscription OVPN file straight to a file.
+
+        :param host: API host URL
+        :param uuid: Subscription UUID
+        :param node_name: Node name
+        :param target: File path, or a binary file object (sync or async)
+        :param checksum: ``hashlib`` algorithm to digest the file with
+        :param expected_checksum: Hex digest the file must match
+        :param timeout: Seconds allowed to connect and for each read
+        :param resume: Continue a ``.part`` file left by an earlier call when
+            the panel reports the same document
+        :return: Size and digest of the written file
+        """
+        return await cls.download_to(
+            url=f"{host.rstrip('/')}/sub/download/{uuid}/{node_name}",
+            target=target,
+            timeout=timeout,
+            checksum=checksum,
+            expected_checksum=expected_checksum,
+            resume=resume,
+        )
@@ -1,12 +1,31 @@
-from .admin import OVPanelAdmin, OVPanelToken
-from .user import (
-    OVPanelUser,
-    OVPanelCreateUser,
-    OVPanelUpdateUser,
-    OVPanelResponseModel,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .admin import OVPanelAdmin, OVPanelToken
+    from .user import (
+        OVPanelUser,
+        OVPanelCreateUser,
+        OVPanelUpdateUser,
+        OVPanelResponseModel,
+    )
+    from .node import OVPanelNode, OVPanelNodeCreate, OVPanelNodeStatus
+    from .system import OVPanelSettings, OVPanelServerInfo
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".admin": ["OVPanelAdmin", "OVPanelToken"],
+        ".user": [
+            "OVPanelUser",
+            "OVPanelCreateUser",
+            "OVPanelUpdateUser",
+            "OVPanelResponseModel",
+        ],
+        ".node": ["OVPanelNode", "OVPanelNodeCreate", "OVPanelNodeStatus"],
+        ".system": ["OVPanelSettings", "OVPanelServerInfo"],
+    },
 )
-from .node import OVPanelNode, OVPanelNodeCreate, OVPanelNodeStatus
-from .system import OVPanelSettings, OVPanelServerInfo
 
 __all__ = [
     "OVPanelAdmin",
@@ -1,14 +1,15 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class OVPanelToken(BaseModel):
+class OVPanelToken(PanelModel):
     """Authentication token response"""
 
     access_token: str = Field(..., title="Access Token")
     token_type: str = Field("bearer", title="Token Type")
 
 
-class OVPanelAdmin(BaseModel):
+class OVPanelAdmin(PanelModel):
     """Admin response schema"""
 
     username: str = Field(..., title="Username")
@@ -1,8 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class OVPanelNodeCreate(BaseModel):
+class OVPanelNodeCreate(PanelModel):
     """Schema for creating a new node"""
 
     name: str = Field(..., max_length=10, title="Name")
@@ -16,7 +17,7 @@ class OVPanelNodeCreate(BaseModel):
     set_new_setting: bool = Field(False, title="Set New Setting")
 
 
-class OVPanelNodeStatus(BaseModel):
+class OVPanelNodeStatus(PanelModel):
     """Node status response schema"""
 
     success: bool = Field(..., title="Success")
@@ -24,7 +25,7 @@ class OVPanelNodeStatus(BaseModel):
     data: Optional[dict] = Field(None, title="Data")
 
 
-class OVPanelNode(BaseModel):
+class OVPanelNode(PanelModel):
     """Node response schema"""
 
     id: int = Field(..., title="ID")
@@ -1,8 +1,9 @@
 from typing import Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class OVPanelSettings(BaseModel):
+class OVPanelSettings(PanelModel):
     """Panel settings response schema"""
 
     success: bool = Field(..., title="Success")
@@ -10,7 +11,7 @@ class OVPanelSettings(BaseModel):
     data: Optional[Any] = Field(None, title="Data")
 
 
-class OVPanelServerInfo(BaseModel):
+class OVPanelServerInfo(PanelModel):
     """Server information response schema"""
 
     success: bool = Field(..., title="Success")
@@ -1,16 +1,17 @@
 from typing import Optional, Any
 from datetime import date
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class OVPanelCreateUser(BaseModel):
+class OVPanelCreateUser(PanelModel):
     """Schema for creating a new user"""
 
     name: str = Field(..., min_length=3, max_length=10, title="Name")
     expiry_date: date = Field(..., title="Expiry Date")
 
 
-class OVPanelUpdateUser(BaseModel):
+class OVPanelUpdateUser(PanelModel):
     """Schema for updating an existing user"""
 
     name: str = Field(..., title="Name")
@@ -18,7 +19,7 @@ class OVPanelUpdateUser(BaseModel):
     status: bool = Field(True, title="Status")
 
 
-class OVPanelUser(BaseModel):
+class OVPanelUser(PanelModel):
     """User response schema"""
 
     uuid: str = Field(..., title="UUID")
@@ -27,7 +28,7 @@ class OVPanelUser(BaseModel):
     status: bool = Field(..., title="Status")
 
 
-class OVPanelResponseModel(BaseModel):
+class OVPanelResponseModel(PanelModel):
     """Generic response model"""
 
     success: bool = Field(..., title="Success")
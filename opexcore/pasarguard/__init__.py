@@ -1,35 +1,77 @@
-from .manager import PasarGuardManager
-from .types import (
-    PasarGuardAdminCreate,
-    PasarGuardAdminModify,
-    PasarGuardAdminDetails,
-    PasarGuardToken,
-    PasarGuardUserCreate,
-    PasarGuardUserModify,
-    PasarGuardUserResponse,
-    PasarGuardUsersResponse,
-    PasarGuardUserStatus,
-    PasarGuardSubscriptionUserResponse,
-    PasarGuardNodeCreate,
-    PasarGuardNodeModify,
-    PasarGuardNodeResponse,
-    PasarGuardNodeSettings,
-    PasarGuardNodeStatus,
-    PasarGuardCoreCreate,
-    PasarGuardCoreResponse,
-    PasarGuardSystemStats,
-    PasarGuardGroupCreate,
-    PasarGuardGroupModify,
-    PasarGuardGroupResponse,
-    PasarGuardHostCreate,
-    PasarGuardHostResponse,
-    PasarGuardUserTemplateCreate,
-    PasarGuardUserTemplateModify,
-    PasarGuardUserTemplateResponse,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import PasarGuardManager
+    from .client import PasarGuardClient
+    from .types import (
+        PasarGuardAdminCreate,
+        PasarGuardAdminModify,
+        PasarGuardAdminDetails,
+        PasarGuardToken,
+        PasarGuardUserCreate,
+        PasarGuardUserModify,
+        PasarGuardUserResponse,
+        PasarGuardUsersResponse,
+        PasarGuardUserStatus,
+        PasarGuardSubscriptionUserResponse,
+        PasarGuardNodeCreate,
+        PasarGuardNodeModify,
+        PasarGuardNodeResponse,
+        PasarGuardNodeSettings,
+        PasarGuardNodeStatus,
+        PasarGuardCoreCreate,
+        PasarGuardCoreResponse,
+        PasarGuardSystemStats,
+        PasarGuardGroupCreate,
+        PasarGuardGroupModify,
+        PasarGuardGroupResponse,
+        PasarGuardHostCreate,
+        PasarGuardHostResponse,
+        PasarGuardUserTemplateCreate,
+        PasarGuardUserTemplateModify,
+        PasarGuardUserTemplateResponse,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".manager": ["PasarGuardManager"],
+        ".client": ["PasarGuardClient"],
+        ".types": [
+            "PasarGuardAdminCreate",
+            "PasarGuardAdminModify",
+            "PasarGuardAdminDetails",
+            "PasarGuardToken",
+            "PasarGuardUserCreate",
+            "PasarGuardUserModify",
+            "PasarGuardUserResponse",
+            "PasarGuardUsersResponse",
+            "PasarGuardUserStatus",
+            "PasarGuardSubscriptionUserResponse",
+            "PasarGuardNodeCreate",
+            "PasarGuardNodeModify",
+            "PasarGuardNodeResponse",
+            "PasarGuardNodeSettings",
+            "PasarGuardNodeStatus",
+            "PasarGuardCoreCreate",
+            "PasarGuardCoreResponse",
+            "PasarGuardSystemStats",
+            "PasarGuardGroupCreate",
+            "PasarGuardGroupModify",
+            "PasarGuardGroupResponse",
+            "PasarGuardHostCreate",
+            "PasarGuardHostResponse",
+            "PasarGuardUserTemplateCreate",
+            "PasarGuardUserTemplateModify",
+            "PasarGuardUserTemplateResponse",
+        ],
+    },
 )
 
 __all__ = [
     "PasarGuardManager",
+    "PasarGuardClient",
     "PasarGuardAdminCreate",
     "PasarGuardAdminModify",
     "PasarGuardAdminDetails",
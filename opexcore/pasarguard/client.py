@@ -0,0 +1,21 @@
+from opexcore.core import PanelClient
+from .manager import PasarGuardManager
+
+
+class PasarGuardClient(PanelClient):
+    """PasarGuard API client bound to a single panel"""
+
+    manager = PasarGuardManager
+    public_methods = frozenset(
+        {
+            "user_subscription",
+            "user_subscription_info",
+            "user_subscription_with_client_type",
+        }
+    )
+
+    async def _authenticate(self) -> str:
+        response = await PasarGuardManager.admin_token(
+            self.host, self.username, self.password, timeout=self.timeout
+        )
+        return response.access_token
@@ -1,6 +1,16 @@
-from typing import Optional, List, Dict, Any
+from contextlib import aclosing
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import datetime
-from opexcore.core import RequestBase
+from opexcore.core import (
+    RequestBase,
+    paginate,
+    gather_pages,
+    cached,
+    invalidates,
+    Projection,
+    project,
+    with_items,
+)
 from .types import (
     PasarGuardAdminCreate,
     PasarGuardAdminModify,
@@ -60,8 +70,9 @@ class PasarGuardManager(RequestBase):
             data={"username": username, "password": password},
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             timeout=timeout,
+            idempotent=True,
         )
-        return PasarGuardToken(**response)
+        return cls._parse(PasarGuardToken, response)
 
     @classmethod
     async def get_current_admin(
@@ -80,7 +91,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardAdminDetails(**response)
+        return cls._parse(PasarGuardAdminDetails, response)
 
     @classmethod
     async def create_admin(
@@ -97,11 +108,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/admin",
-            data=admin_data.model_dump_json(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardAdminDetails(**response)
+        return cls._parse(PasarGuardAdminDetails, response)
 
     @classmethod
     async def modify_admin(
@@ -124,11 +135,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/admin/{username}",
-            data=admin_data.model_dump_json(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardAdminDetails(**response)
+        return cls._parse(PasarGuardAdminDetails, response)
 
     @classmethod
     async def remove_admin(
@@ -189,7 +200,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [PasarGuardAdminDetails(**item) for item in response]
+        return cls._parse(List[PasarGuardAdminDetails], response)
 
     @classmethod
     async def reset_admin_usage(
@@ -209,7 +220,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardAdminDetails(**response)
+        return cls._parse(PasarGuardAdminDetails, response)
 
     @classmethod
     async def get_system_stats(
@@ -238,7 +249,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardSystemStats(**response)
+        return cls._parse(PasarGuardSystemStats, response)
 
     @classmethod
     async def get_inbounds(cls, host: str, token: str, timeout: int = 10) -> List[str]:
@@ -258,6 +269,7 @@ class PasarGuardManager(RequestBase):
         return response
 
     @classmethod
+    @invalidates("groups")
     async def create_group(
         cls, host: str, token: str, group_data: PasarGuardGroupCreate, timeout: int = 10
     ) -> PasarGuardGroupResponse:
@@ -272,13 +284,14 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/group",
-            data=group_data.model_dump_json(exclude_none=True),
+            json=group_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardGroupResponse(**response)
+        return cls._parse(PasarGuardGroupResponse, response)
 
     @classmethod
+    @cached(ttl=60, stale_ttl=60, tags=("groups",))
     async def get_groups(
         cls,
         host: str,
@@ -310,9 +323,9 @@ class PasarGuardManager(RequestBase):
             timeout=timeout,
         )
         return (
-            [PasarGuardGroupResponse(**item["groups"]) for item in [response]][0]
+            cls._parse(PasarGuardGroupResponse, response["groups"])
             if isinstance(response, dict)
-            else [PasarGuardGroupResponse(**item) for item in response]
+            else cls._parse(List[PasarGuardGroupResponse], response)
         )
 
     @classmethod
@@ -333,9 +346,10 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardGroupResponse(**response)
+        return cls._parse(PasarGuardGroupResponse, response)
 
     @classmethod
+    @invalidates("groups")
     async def modify_group(
         cls,
         host: str,
@@ -356,13 +370,14 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/group/{group_id}",
-            data=group_data.model_dump_json(exclude_none=True),
+            json=group_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardGroupResponse(**response)
+        return cls._parse(PasarGuardGroupResponse, response)
 
     @classmethod
+    @invalidates("groups")
     async def remove_group(
         cls, host: str, token: str, group_id: int, timeout: int = 10
     ) -> Dict[str, Any]:
@@ -383,6 +398,7 @@ class PasarGuardManager(RequestBase):
         return response
 
     @classmethod
+    @invalidates("cores")
     async def create_core(
         cls, host: str, token: str, core_data: PasarGuardCoreCreate, timeout: int = 10
     ) -> PasarGuardCoreResponse:
@@ -397,11 +413,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/core",
-            data=core_data.model_dump_json(exclude_none=True),
+            json=core_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardCoreResponse(**response)
+        return cls._parse(PasarGuardCoreResponse, response)
 
     @classmethod
     async def get_core(
@@ -421,9 +437,10 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardCoreResponse(**response)
+        return cls._parse(PasarGuardCoreResponse, response)
 
     @classmethod
+    @invalidates("cores")
     async def modify_core(
         cls,
         host: str,
@@ -448,13 +465,14 @@ class PasarGuardManager(RequestBase):
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/core/{core_id}",
             params=params,
-            data=core_data.model_dump_json(exclude_none=True),
+            json=core_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardCoreResponse(**response)
+        return cls._parse(PasarGuardCoreResponse, response)
 
     @classmethod
+    @invalidates("cores")
     async def delete_core(
         cls,
         host: str,
@@ -483,6 +501,7 @@ class PasarGuardManager(RequestBase):
         return response
 
     @classmethod
+    @cached(ttl=60, stale_ttl=60, tags=("cores",))
     async def get_cores(
         cls,
         host: str,
@@ -514,7 +533,7 @@ class PasarGuardManager(RequestBase):
             timeout=timeout,
         )
         cores = response.get("cores", []) if isinstance(response, dict) else response
-        return [PasarGuardCoreResponse(**item) for item in cores]
+        return cls._parse(List[PasarGuardCoreResponse], cores)
 
     @classmethod
     async def create_host(
@@ -531,11 +550,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/host/",
-            data=host_data.model_dump_json(exclude_none=True),
+            json=host_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardHostResponse(**response)
+        return cls._parse(PasarGuardHostResponse, response)
 
     @classmethod
     async def get_host(
@@ -555,7 +574,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardHostResponse(**response)
+        return cls._parse(PasarGuardHostResponse, response)
 
     @classmethod
     async def modify_host(
@@ -578,11 +597,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/host/{host_id}",
-            data=host_data.model_dump_json(exclude_none=True),
+            json=host_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardHostResponse(**response)
+        return cls._parse(PasarGuardHostResponse, response)
 
     @classmethod
     async def remove_host(
@@ -630,7 +649,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [PasarGuardHostResponse(**item) for item in response]
+        return cls._parse(List[PasarGuardHostResponse], response)
 
     @classmethod
     async def get_node_settings(
@@ -649,7 +668,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardNodeSettings(**response)
+        return cls._parse(PasarGuardNodeSettings, response)
 
     @classmethod
     async def get_nodes(
@@ -700,7 +719,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [PasarGuardNodeResponse(**item) for item in response]
+        return cls._parse(List[PasarGuardNodeResponse], response)
 
     @classmethod
     async def create_node(
@@ -717,11 +736,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/node",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardNodeResponse(**response)
+        return cls._parse(PasarGuardNodeResponse, response)
 
     @classmethod
     async def get_node(
@@ -741,7 +760,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardNodeResponse(**response)
+        return cls._parse(PasarGuardNodeResponse, response)
 
     @classmethod
     async def modify_node(
@@ -764,11 +783,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/node/{node_id}",
-            data=node_data.dict(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardNodeResponse(**response)
+        return cls._parse(PasarGuardNodeResponse, response)
 
     @classmethod
     async def remove_node(
@@ -808,7 +827,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardNodeResponse(**response)
+        return cls._parse(PasarGuardNodeResponse, response)
 
     @classmethod
     async def reconnect_node(
@@ -849,11 +868,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/user_template",
-            data=template_data.model_dump_json(exclude_none=True),
+            json=template_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserTemplateResponse(**response)
+        return cls._parse(PasarGuardUserTemplateResponse, response)
 
     @classmethod
     async def get_user_template(
@@ -873,7 +892,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserTemplateResponse(**response)
+        return cls._parse(PasarGuardUserTemplateResponse, response)
 
     @classmethod
     async def modify_user_template(
@@ -896,11 +915,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/user_template/{template_id}",
-            data=template_data.dict(exclude_none=True),
+            json=template_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserTemplateResponse(**response)
+        return cls._parse(PasarGuardUserTemplateResponse, response)
 
     @classmethod
     async def remove_user_template(
@@ -953,7 +972,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [PasarGuardUserTemplateResponse(**item) for item in response]
+        return cls._parse(List[PasarGuardUserTemplateResponse], response)
 
     @classmethod
     async def create_user(
@@ -970,11 +989,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/user",
-            data=user_data.dict(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserResponse(**response)
+        return cls._parse(PasarGuardUserResponse, response)
 
     @classmethod
     async def get_user(
@@ -994,7 +1013,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserResponse(**response)
+        return cls._parse(PasarGuardUserResponse, response)
 
     @classmethod
     async def modify_user(
@@ -1017,11 +1036,11 @@ class PasarGuardManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/user/{username}",
-            data=user_data.dict(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserResponse(**response)
+        return cls._parse(PasarGuardUserResponse, response)
 
     @classmethod
     async def remove_user(
@@ -1061,7 +1080,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserResponse(**response)
+        return cls._parse(PasarGuardUserResponse, response)
 
     @classmethod
     async def revoke_user_subscription(
@@ -1081,7 +1100,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserResponse(**response)
+        return cls._parse(PasarGuardUserResponse, response)
 
     @classmethod
     async def get_users(
@@ -1099,6 +1118,7 @@ class PasarGuardManager(RequestBase):
         proxy_id: Optional[str] = None,
         load_sub: bool = False,
         timeout: int = 10,
+        projection: Optional[Projection] = None,
     ) -> PasarGuardUsersResponse:
         """
         Get all users.
@@ -1116,6 +1136,7 @@ class PasarGuardManager(RequestBase):
         :param proxy_id: Filter by proxy ID
         :param load_sub: Load subscription data
         :param timeout: Request timeout in seconds
+        :param projection: Fields to keep, or a lighter model to parse users into
         :return: Users response
         """
         params = {"load_sub": load_sub}
@@ -1138,13 +1159,141 @@ class PasarGuardManager(RequestBase):
         if proxy_id is not None:
             params["proxy_id"] = proxy_id
 
-        response = await cls.get(
+        return await cls.get(
             url=f"{host.rstrip('/')}/api/users",
             params=params,
             headers=cls._generate_headers(token),
             timeout=timeout,
+            response_model=with_items(
+                PasarGuardUsersResponse,
+                "users",
+                project(PasarGuardUserResponse, projection),
+            ),
         )
-        return PasarGuardUsersResponse(**response)
+
+    @classmethod
+    async def iter_users(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 100,
+        username: Optional[List[str]] = None,
+        admin: Optional[List[str]] = None,
+        group: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        status: Optional[PasarGuardUserStatus] = None,
+        sort: Optional[str] = None,
+        proxy_id: Optional[str] = None,
+        load_sub: bool = False,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[PasarGuardUserResponse]:
+        """
+        Iterate over all users matching the filters, page by page.
+
+        The next page is requested while the current one is being consumed.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of users requested per page
+        :param username: Filter by usernames
+        :param admin: Filter by admin usernames
+        :param group: Filter by group IDs
+        :param search: Search query
+        :param status: Filter by status
+        :param sort: Sort field
+        :param proxy_id: Filter by proxy ID
+        :param load_sub: Load subscription data
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Request timeout in seconds
+        :return: Async iterator over user responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            response = await cls.get_users(
+                host,
+                token,
+                offset=index * size,
+                limit=size,
+                username=username,
+                admin=admin,
+                group=group,
+                search=search,
+                status=status,
+                sort=sort,
+                proxy_id=proxy_id,
+                load_sub=load_sub,
+                projection=projection,
+                timeout=timeout,
+            )
+            return response.users, response.total
+
+        async with aclosing(paginate(fetch_page, page_size)) as items:
+            async for user in items:
+                yield user
+
+    @classmethod
+    async def get_all_users(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 1000,
+        concurrency: int = 8,
+        username: Optional[List[str]] = None,
+        admin: Optional[List[str]] = None,
+        group: Optional[List[int]] = None,
+        search: Optional[str] = None,
+        status: Optional[PasarGuardUserStatus] = None,
+        sort: Optional[str] = None,
+        proxy_id: Optional[str] = None,
+        load_sub: bool = False,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> List[PasarGuardUserResponse]:
+        """
+        Fetch every user matching the filters with concurrent page requests.
+
+        The first page reports the total and the page size the panel serves;
+        the remaining pages are then fetched in parallel and returned in order.
+        Raises ``PaginationError`` if they do not add up to the total.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of users requested per page
+        :param concurrency: Maximum number of pages fetched at once
+        :param username: Filter by usernames
+        :param admin: Filter by admin usernames
+        :param group: Filter by group IDs
+        :param search: Search query
+        :param status: Filter by status
+        :param sort: Sort field
+        :param proxy_id: Filter by proxy ID
+        :param load_sub: Load subscription data
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Request timeout in seconds
+        :return: List of user responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            response = await cls.get_users(
+                host,
+                token,
+                offset=index * size,
+                limit=size,
+                username=username,
+                admin=admin,
+                group=group,
+                search=search,
+                status=status,
+                sort=sort,
+                proxy_id=proxy_id,
+                load_sub=load_sub,
+                projection=projection,
+                timeout=timeout,
+            )
+            return response.users, response.total
+
+        return await gather_pages(fetch_page, page_size, concurrency=concurrency)
 
     @classmethod
     async def set_user_owner(
@@ -1172,7 +1321,7 @@ class PasarGuardManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return PasarGuardUserResponse(**response)
+        return cls._parse(PasarGuardUserResponse, response)
 
     @classmethod
     async def get_expired_users(
@@ -1251,7 +1400,7 @@ class PasarGuardManager(RequestBase):
     @classmethod
     async def user_subscription(
         cls, host: str, token: str, user_agent: str = "", timeout: int = 10
-    ) -> List[str]:
+    ) -> str:
         """
         Provides a subscription link based on the user agent.
 
@@ -1259,7 +1408,7 @@ class PasarGuardManager(RequestBase):
         :param token: Subscription token
         :param user_agent: User agent header
         :param timeout: Request timeout in seconds
-        :return: Subscription links
+        :return: Subscription content as served by the panel
         """
         headers = {}
         if user_agent:
@@ -1269,6 +1418,7 @@ class PasarGuardManager(RequestBase):
             url=f"{host.rstrip('/')}/sub/{token}/",
             headers=headers,
             timeout=timeout,
+            response_type="text",
         )
         return response
 
@@ -1288,7 +1438,7 @@ class PasarGuardManager(RequestBase):
             url=f"{host.rstrip('/')}/sub/{token}/info",
             timeout=timeout,
         )
-        return PasarGuardSubscriptionUserResponse(**response)
+        return cls._parse(PasarGuardSubscriptionUserResponse, response)
 
     @classmethod
     async def user_subscription_with_client_type(
@@ -1297,7 +1447,7 @@ class PasarGuardManager(RequestBase):
         token: str,
         client_type: str,
         timeout: int = 10,
-    ) -> List[str]:
+    ) -> str:
         """
         Provides a subscription link based on the specified client type.
 
@@ -1305,10 +1455,11 @@ class PasarGuardManager(RequestBase):
         :param token: Subscription token
         :param client_type: Client type (links, links_base64, xray, sing_box, clash, clash_meta, outline, block)
         :param timeout: Request timeout in seconds
-        :return: Subscription links
+        :return: Subscription content as served by the panel
         """
         response = await cls.get(
             url=f"{host.rstrip('/')}/sub/{token}/{client_type}",
             timeout=timeout,
+            response_type="text",
         )
         return response
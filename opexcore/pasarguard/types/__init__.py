@@ -1,44 +1,88 @@
-from .admin import (
-    PasarGuardAdminCreate,
-    PasarGuardAdminModify,
-    PasarGuardAdminDetails,
-    PasarGuardToken,
-)
-from .user import (
-    PasarGuardUserCreate,
-    PasarGuardUserModify,
-    PasarGuardUserResponse,
-    PasarGuardUsersResponse,
-    PasarGuardUserStatus,
-    PasarGuardSubscriptionUserResponse,
-)
-from .node import (
-    PasarGuardNodeCreate,
-    PasarGuardNodeModify,
-    PasarGuardNodeResponse,
-    PasarGuardNodeSettings,
-    PasarGuardNodeStatus,
-)
-from .core import (
-    PasarGuardCoreCreate,
-    PasarGuardCoreResponse,
-)
-from .system import (
-    PasarGuardSystemStats,
-)
-from .group import (
-    PasarGuardGroupCreate,
-    PasarGuardGroupModify,
-    PasarGuardGroupResponse,
-)
-from .host import (
-    PasarGuardHostCreate,
-    PasarGuardHostResponse,
-)
-from .user_template import (
-    PasarGuardUserTemplateCreate,
-    PasarGuardUserTemplateModify,
-    PasarGuardUserTemplateResponse,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .admin import (
+        PasarGuardAdminCreate,
+        PasarGuardAdminModify,
+        PasarGuardAdminDetails,
+        PasarGuardToken,
+    )
+    from .user import (
+        PasarGuardUserCreate,
+        PasarGuardUserModify,
+        PasarGuardUserResponse,
+        PasarGuardUsersResponse,
+        PasarGuardUserStatus,
+        PasarGuardSubscriptionUserResponse,
+    )
+    from .node import (
+        PasarGuardNodeCreate,
+        PasarGuardNodeModify,
+        PasarGuardNodeResponse,
+        PasarGuardNodeSettings,
+        PasarGuardNodeStatus,
+    )
+    from .core import (
+        PasarGuardCoreCreate,
+        PasarGuardCoreResponse,
+    )
+    from .system import (
+        PasarGuardSystemStats,
+    )
+    from .group import (
+        PasarGuardGroupCreate,
+        PasarGuardGroupModify,
+        PasarGuardGroupResponse,
+    )
+    from .host import (
+        PasarGuardHostCreate,
+        PasarGuardHostResponse,
+    )
+    from .user_template import (
+        PasarGuardUserTemplateCreate,
+        PasarGuardUserTemplateModify,
+        PasarGuardUserTemplateResponse,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".admin": [
+            "PasarGuardAdminCreate",
+            "PasarGuardAdminModify",
+            "PasarGuardAdminDetails",
+            "PasarGuardToken",
+        ],
+        ".user": [
+            "PasarGuardUserCreate",
+            "PasarGuardUserModify",
+            "PasarGuardUserResponse",
+            "PasarGuardUsersResponse",
+            "PasarGuardUserStatus",
+            "PasarGuardSubscriptionUserResponse",
+        ],
+        ".node": [
+            "PasarGuardNodeCreate",
+            "PasarGuardNodeModify",
+            "PasarGuardNodeResponse",
+            "PasarGuardNodeSettings",
+            "PasarGuardNodeStatus",
+        ],
+        ".core": ["PasarGuardCoreCreate", "PasarGuardCoreResponse"],
+        ".system": ["PasarGuardSystemStats"],
+        ".group": [
+            "PasarGuardGroupCreate",
+            "PasarGuardGroupModify",
+            "PasarGuardGroupResponse",
+        ],
+        ".host": ["PasarGuardHostCreate", "PasarGuardHostResponse"],
+        ".user_template": [
+            "PasarGuardUserTemplateCreate",
+            "PasarGuardUserTemplateModify",
+            "PasarGuardUserTemplateResponse",
+        ],
+    },
 )
 
 __all__ = [
@@ -1,8 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class PasarGuardAdminCreate(BaseModel):
+class PasarGuardAdminCreate(PanelModel):
     """Schema for creating a new admin"""
 
     username: str = Field(..., title="Username")
@@ -18,7 +19,7 @@ class PasarGuardAdminCreate(BaseModel):
     support_url: Optional[str] = Field(None, title="Support Url")
 
 
-class PasarGuardAdminModify(BaseModel):
+class PasarGuardAdminModify(PanelModel):
     """Schema for modifying an existing admin"""
 
     password: Optional[str] = Field(None, title="Password")
@@ -33,7 +34,7 @@ class PasarGuardAdminModify(BaseModel):
     support_url: Optional[str] = Field(None, title="Support Url")
 
 
-class PasarGuardAdminDetails(BaseModel):
+class PasarGuardAdminDetails(PanelModel):
     """Admin response schema"""
 
     username: str = Field(..., title="Username")
@@ -52,7 +53,7 @@ class PasarGuardAdminDetails(BaseModel):
     lifetime_used_traffic: Optional[int] = Field(None, title="Lifetime Used Traffic")
 
 
-class PasarGuardToken(BaseModel):
+class PasarGuardToken(PanelModel):
     """Authentication token response"""
 
     access_token: str = Field(..., title="Access Token")
@@ -1,9 +1,10 @@
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 from datetime import datetime
 
 
-class PasarGuardCoreCreate(BaseModel):
+class PasarGuardCoreCreate(PanelModel):
     """Schema for creating a new core config"""
 
     name: Optional[str] = Field(None, title="Name")
@@ -16,7 +17,7 @@ class PasarGuardCoreCreate(BaseModel):
     )
 
 
-class PasarGuardCoreResponse(BaseModel):
+class PasarGuardCoreResponse(PanelModel):
     """Core response schema"""
 
     id: int = Field(..., title="Id")
@@ -1,8 +1,9 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class PasarGuardGroupCreate(BaseModel):
+class PasarGuardGroupCreate(PanelModel):
     """Schema for creating a new group"""
 
     name: str = Field(..., title="Name", min_length=3, max_length=64)
@@ -10,7 +11,7 @@ class PasarGuardGroupCreate(BaseModel):
     is_disabled: bool = Field(False, title="Is Disabled")
 
 
-class PasarGuardGroupModify(BaseModel):
+class PasarGuardGroupModify(PanelModel):
     """Schema for modifying an existing group"""
 
     name: str = Field(..., title="Name", min_length=3, max_length=64)
@@ -18,7 +19,7 @@ class PasarGuardGroupModify(BaseModel):
     is_disabled: bool = Field(False, title="Is Disabled")
 
 
-class PasarGuardGroupResponse(BaseModel):
+class PasarGuardGroupResponse(PanelModel):
     """Group response schema"""
 
     id: int = Field(..., title="Id")
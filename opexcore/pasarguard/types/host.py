@@ -1,8 +1,9 @@
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class PasarGuardHostCreate(BaseModel):
+class PasarGuardHostCreate(PanelModel):
     """Schema for creating/modifying a host"""
 
     id: Optional[int] = Field(None, title="Id")
@@ -1,5 +1,6 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 from enum import Enum
 
 
@@ -30,7 +31,7 @@ class PasarGuardDataLimitResetStrategy(str, Enum):
     year = "year"
 
 
-class PasarGuardNodeCreate(BaseModel):
+class PasarGuardNodeCreate(PanelModel):
     """Schema for creating a new node"""
 
     name: str = Field(..., title="Name")
@@ -49,7 +50,7 @@ class PasarGuardNodeCreate(BaseModel):
     reset_time: int = Field(-1, title="Reset Time")
 
 
-class PasarGuardNodeModify(BaseModel):
+class PasarGuardNodeModify(PanelModel):
     """Schema for modifying an existing node"""
 
     name: Optional[str] = Field(None, title="Name")
@@ -71,7 +72,7 @@ class PasarGuardNodeModify(BaseModel):
     status: Optional[PasarGuardNodeStatus] = Field(None, title="Status")
 
 
-class PasarGuardNodeResponse(BaseModel):
+class PasarGuardNodeResponse(PanelModel):
     """Node response schema"""
 
     id: int = Field(..., title="Id")
@@ -99,7 +100,7 @@ class PasarGuardNodeResponse(BaseModel):
     lifetime_downlink: Optional[int] = Field(None, title="Lifetime Downlink")
 
 
-class PasarGuardNodeSettings(BaseModel):
+class PasarGuardNodeSettings(PanelModel):
     """Node settings response schema"""
 
     min_node_version: str = Field("v1.0.0", title="Min Node Version")
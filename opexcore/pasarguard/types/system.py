@@ -1,8 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class PasarGuardSystemStats(BaseModel):
+class PasarGuardSystemStats(PanelModel):
     """System statistics response schema"""
 
     version: str = Field(..., title="Version")
@@ -1,5 +1,6 @@
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 from datetime import datetime
 from enum import Enum
 
@@ -24,7 +25,7 @@ class PasarGuardDataLimitResetStrategy(str, Enum):
     year = "year"
 
 
-class PasarGuardUserCreate(BaseModel):
+class PasarGuardUserCreate(PanelModel):
     """Schema for creating a new user"""
 
     username: str = Field(..., title="Username")
@@ -44,7 +45,7 @@ class PasarGuardUserCreate(BaseModel):
     status: Optional[str] = Field(None, title="Status")
 
 
-class PasarGuardUserModify(BaseModel):
+class PasarGuardUserModify(PanelModel):
     """Schema for modifying an existing user"""
 
     proxy_settings: Optional[Dict[str, Any]] = Field(None, title="Proxy Settings")
@@ -63,7 +64,7 @@ class PasarGuardUserModify(BaseModel):
     status: Optional[str] = Field(None, title="Status")
 
 
-class PasarGuardUserResponse(BaseModel):
+class PasarGuardUserResponse(PanelModel):
     """User response schema"""
 
     id: int = Field(..., title="Id")
@@ -91,14 +92,14 @@ class PasarGuardUserResponse(BaseModel):
     admin: Optional[Dict[str, Any]] = Field(None, title="Admin")
 
 
-class PasarGuardUsersResponse(BaseModel):
+class PasarGuardUsersResponse(PanelModel):
     """Users list response schema"""
 
     users: List[PasarGuardUserResponse] = Field(..., title="Users")
     total: int = Field(..., title="Total")
 
 
-class PasarGuardSubscriptionUserResponse(BaseModel):
+class PasarGuardSubscriptionUserResponse(PanelModel):
     """Subscription user response schema"""
 
     id: int = Field(..., title="Id")
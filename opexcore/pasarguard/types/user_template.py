@@ -1,8 +1,9 @@
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class PasarGuardUserTemplateCreate(BaseModel):
+class PasarGuardUserTemplateCreate(PanelModel):
     """Schema for creating a new user template"""
 
     name: Optional[str] = Field(None, title="Name")
@@ -21,7 +22,7 @@ class PasarGuardUserTemplateCreate(BaseModel):
     is_disabled: Optional[bool] = Field(None, title="Is Disabled")
 
 
-class PasarGuardUserTemplateModify(BaseModel):
+class PasarGuardUserTemplateModify(PanelModel):
     """Schema for modifying an existing user template"""
 
     name: Optional[str] = Field(None, title="Name")
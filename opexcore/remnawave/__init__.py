@@ -1,25 +1,57 @@
-from .manager import RemnawaveManager
-from .types import (
-    RemnawaveAdmin,
-    RemnawaveAdminCreate,
-    RemnawaveAdminUpdate,
-    RemnawaveToken,
-    RemnawaveUser,
-    RemnawaveUserCreate,
-    RemnawaveUserUpdate,
-    RemnawaveUserStatus,
-    RemnawaveNode,
-    RemnawaveNodeCreate,
-    RemnawaveNodeUpdate,
-    RemnawaveHost,
-    RemnawaveHostCreate,
-    RemnawaveHostUpdate,
-    RemnawaveSubscription,
-    RemnawaveSystemStats,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import RemnawaveManager
+    from .client import RemnawaveClient
+    from .types import (
+        RemnawaveAdmin,
+        RemnawaveAdminCreate,
+        RemnawaveAdminUpdate,
+        RemnawaveToken,
+        RemnawaveUser,
+        RemnawaveUserCreate,
+        RemnawaveUserUpdate,
+        RemnawaveUserStatus,
+        RemnawaveNode,
+        RemnawaveNodeCreate,
+        RemnawaveNodeUpdate,
+        RemnawaveHost,
+        RemnawaveHostCreate,
+        RemnawaveHostUpdate,
+        RemnawaveSubscription,
+        RemnawaveSystemStats,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".manager": ["RemnawaveManager"],
+        ".client": ["RemnawaveClient"],
+        ".types": [
+            "RemnawaveAdmin",
+            "RemnawaveAdminCreate",
+            "RemnawaveAdminUpdate",
+            "RemnawaveToken",
+            "RemnawaveUser",
+            "RemnawaveUserCreate",
+            "RemnawaveUserUpdate",
+            "RemnawaveUserStatus",
+            "RemnawaveNode",
+            "RemnawaveNodeCreate",
+            "RemnawaveNodeUpdate",
+            "RemnawaveHost",
+            "RemnawaveHostCreate",
+            "RemnawaveHostUpdate",
+            "RemnawaveSubscription",
+            "RemnawaveSystemStats",
+        ],
+    },
 )
 
 __all__ = [
     "RemnawaveManager",
+    "RemnawaveClient",
     "RemnawaveAdmin",
     "RemnawaveAdminCreate",
     "RemnawaveAdminUpdate",
@@ -0,0 +1,14 @@
+from opexcore.core import PanelClient
+from .manager import RemnawaveManager
+
+
+class RemnawaveClient(PanelClient):
+    """Remnawave API client bound to a single panel"""
+
+    manager = RemnawaveManager
+
+    async def _authenticate(self) -> str:
+        response = await RemnawaveManager.admin_login(
+            self.host, self.username, self.password, timeout=self.timeout
+        )
+        return response.access_token
@@ -1,6 +1,6 @@
-from typing import Optional, List, Dict, Any
-from aiohttp import ClientSession, ClientTimeout
-from opexcore.core import RequestBase
+from contextlib import aclosing
+from typing import Optional, List, Dict, Any, AsyncIterator
+from opexcore.core import RequestBase, paginate, Projection, project
 from .types import (
     RemnawaveToken,
     RemnawaveUser,
@@ -46,8 +46,9 @@ class RemnawaveManager(RequestBase):
             data={"username": username, "password": password},
             headers={"Content-Type": "application/json"},
             timeout=timeout,
+            idempotent=True,
         )
-        return RemnawaveToken(**response.get("response", response))
+        return cls._parse(RemnawaveToken, response.get("response", response))
 
     @classmethod
     async def admin_register(
@@ -68,7 +69,7 @@ class RemnawaveManager(RequestBase):
             headers={"Content-Type": "application/json"},
             timeout=timeout,
         )
-        return RemnawaveToken(**response.get("response", response))
+        return cls._parse(RemnawaveToken, response.get("response", response))
 
     @classmethod
     async def create_user(
@@ -85,11 +86,11 @@ class RemnawaveManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/users",
-            data=user_data.dict(by_alias=True, exclude_none=True),
+            json=user_data.model_dump(mode="json", by_alias=True, exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveUser(**response.get("response", response))
+        return cls._parse(RemnawaveUser, response.get("response", response))
 
     @classmethod
     async def get_users(
@@ -100,6 +101,7 @@ class RemnawaveManager(RequestBase):
         start: int = 0,
         sort: Optional[str] = None,
         timeout: int = 10,
+        projection: Optional[Projection] = None,
     ) -> List[RemnawaveUser]:
         """
         Get all users with pagination.
@@ -110,6 +112,7 @@ class RemnawaveManager(RequestBase):
         :param start: Start index (offset)
         :param sort: Sort field
         :param timeout: Request timeout in seconds
+        :param projection: Fields to keep, or a lighter model to parse users into
         :return: List of users
         """
         params = {"size": size, "start": start}
@@ -123,7 +126,47 @@ class RemnawaveManager(RequestBase):
             timeout=timeout,
         )
         users_data = response.get("response", {}).get("users", [])
-        return [RemnawaveUser(**user) for user in users_data]
+        return cls._parse(List[project(RemnawaveUser, projection)], users_data)
+
+    @classmethod
+    async def iter_users(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 100,
+        sort: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[RemnawaveUser]:
+        """
+        Iterate over all users, page by page.
+
+        The next page is requested while the current one is being consumed.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of users requested per page
+        :param sort: Sort field
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Request timeout in seconds
+        :return: Async iterator over users
+        """
+
+        async def fetch_page(index: int, size: int):
+            users = await cls.get_users(
+                host,
+                token,
+                size=size,
+                start=index * size,
+                sort=sort,
+                projection=projection,
+                timeout=timeout,
+            )
+            return users, None
+
+        async with aclosing(paginate(fetch_page, page_size)) as items:
+            async for user in items:
+                yield user
 
     @classmethod
     async def get_user(
@@ -143,7 +186,7 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveUser(**response.get("response", response))
+        return cls._parse(RemnawaveUser, response.get("response", response))
 
     @classmethod
     async def update_user(
@@ -166,11 +209,11 @@ class RemnawaveManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/users/{uuid}",
-            data=user_data.dict(by_alias=True, exclude_none=True),
+            json=user_data.model_dump(mode="json", by_alias=True, exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveUser(**response.get("response", response))
+        return cls._parse(RemnawaveUser, response.get("response", response))
 
     @classmethod
     async def delete_user(
@@ -210,7 +253,7 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveUser(**response.get("response", response))
+        return cls._parse(RemnawaveUser, response.get("response", response))
 
     @classmethod
     async def enable_user(
@@ -230,7 +273,7 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveUser(**response.get("response", response))
+        return cls._parse(RemnawaveUser, response.get("response", response))
 
     @classmethod
     async def reset_user_traffic(
@@ -250,7 +293,7 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveUser(**response.get("response", response))
+        return cls._parse(RemnawaveUser, response.get("response", response))
 
     @classmethod
     async def revoke_user_subscription(
@@ -271,7 +314,7 @@ class RemnawaveManager(RequestBase):
             timeout=timeout,
             data={},
         )
-        return RemnawaveUser(**response.get("response", response))
+        return cls._parse(RemnawaveUser, response.get("response", response))
 
     @classmethod
     async def get_nodes(
@@ -291,7 +334,7 @@ class RemnawaveManager(RequestBase):
             timeout=timeout,
         )
         nodes_data = response.get("response", [])
-        return [RemnawaveNode(**node) for node in nodes_data]
+        return cls._parse(List[RemnawaveNode], nodes_data)
 
     @classmethod
     async def create_node(
@@ -308,11 +351,11 @@ class RemnawaveManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/nodes",
-            data=node_data.dict(by_alias=True, exclude_none=True),
+            json=node_data.model_dump(mode="json", by_alias=True, exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveNode(**response.get("response", response))
+        return cls._parse(RemnawaveNode, response.get("response", response))
 
     @classmethod
     async def get_node(
@@ -332,7 +375,7 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveNode(**response.get("response", response))
+        return cls._parse(RemnawaveNode, response.get("response", response))
 
     @classmethod
     async def update_node(
@@ -355,11 +398,11 @@ class RemnawaveManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/nodes/{uuid}",
-            data=node_data.dict(by_alias=True, exclude_none=True),
+            json=node_data.model_dump(mode="json", by_alias=True, exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveNode(**response.get("response", response))
+        return cls._parse(RemnawaveNode, response.get("response", response))
 
     @classmethod
     async def delete_node(
@@ -399,7 +442,7 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveNode(**response.get("response", response))
+        return cls._parse(RemnawaveNode, response.get("response", response))
 
     @classmethod
     async def disable_node(
@@ -419,7 +462,7 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveNode(**response.get("response", response))
+        return cls._parse(RemnawaveNode, response.get("response", response))
 
     @classmethod
     async def restart_node(
@@ -479,7 +522,7 @@ class RemnawaveManager(RequestBase):
             timeout=timeout,
         )
         hosts_data = response.get("response", [])
-        return [RemnawaveHost(**host_data) for host_data in hosts_data]
+        return cls._parse(List[RemnawaveHost], hosts_data)
 
     @classmethod
     async def create_host(
@@ -496,11 +539,11 @@ class RemnawaveManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/hosts",
-            data=host_data.dict(by_alias=True, exclude_none=True),
+            json=host_data.model_dump(mode="json", by_alias=True, exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveHost(**response.get("response", response))
+        return cls._parse(RemnawaveHost, response.get("response", response))
 
     @classmethod
     async def get_host(
@@ -520,7 +563,7 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveHost(**response.get("response", response))
+        return cls._parse(RemnawaveHost, response.get("response", response))
 
     @classmethod
     async def update_host(
@@ -543,11 +586,11 @@ class RemnawaveManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/hosts/{uuid}",
-            data=host_data.dict(by_alias=True, exclude_none=True),
+            json=host_data.model_dump(mode="json", by_alias=True, exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveHost(**response.get("response", response))
+        return cls._parse(RemnawaveHost, response.get("response", response))
 
     @classmethod
     async def delete_host(
@@ -585,7 +628,7 @@ class RemnawaveManager(RequestBase):
             url=f"{host.rstrip('/')}/api/sub/{short_uuid}/info",
             timeout=timeout,
         )
-        return RemnawaveSubscription(**response.get("response", response))
+        return cls._parse(RemnawaveSubscription, response.get("response", response))
 
     @classmethod
     async def get_subscription_links(
@@ -605,10 +648,7 @@ class RemnawaveManager(RequestBase):
         else:
             url = f"{host.rstrip('/')}/api/sub/{short_uuid}"
 
-        async with ClientSession(timeout=ClientTimeout(total=timeout)) as session:
-            async with session.get(url=url) as response:
-                response.raise_for_status()
-                return await response.text()
+        return await cls.get(url=url, timeout=timeout, response_type="text")
 
     @classmethod
     async def get_system_stats(
@@ -627,4 +667,4 @@ class RemnawaveManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RemnawaveSystemStats(**response.get("response", response))
+        return cls._parse(RemnawaveSystemStats, response.get("response", response))
@@ -1,27 +1,53 @@
-from .admin import (
-    RemnawaveAdmin,
-    RemnawaveAdminCreate,
-    RemnawaveAdminUpdate,
-    RemnawaveToken,
-)
-from .user import (
-    RemnawaveUser,
-    RemnawaveUserCreate,
-    RemnawaveUserUpdate,
-    RemnawaveUserStatus,
-)
-from .node import (
-    RemnawaveNode,
-    RemnawaveNodeCreate,
-    RemnawaveNodeUpdate,
-)
-from .host import (
-    RemnawaveHost,
-    RemnawaveHostCreate,
-    RemnawaveHostUpdate,
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .admin import (
+        RemnawaveAdmin,
+        RemnawaveAdminCreate,
+        RemnawaveAdminUpdate,
+        RemnawaveToken,
+    )
+    from .user import (
+        RemnawaveUser,
+        RemnawaveUserCreate,
+        RemnawaveUserUpdate,
+        RemnawaveUserStatus,
+    )
+    from .node import (
+        RemnawaveNode,
+        RemnawaveNodeCreate,
+        RemnawaveNodeUpdate,
+    )
+    from .host import (
+        RemnawaveHost,
+        RemnawaveHostCreate,
+        RemnawaveHostUpdate,
+    )
+    from .subscription import RemnawaveSubscription
+    from .system import RemnawaveSystemStats
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".admin": [
+            "RemnawaveAdmin",
+            "RemnawaveAdminCreate",
+            "RemnawaveAdminUpdate",
+            "RemnawaveToken",
+        ],
+        ".user": [
+            "RemnawaveUser",
+            "RemnawaveUserCreate",
+            "RemnawaveUserUpdate",
+            "RemnawaveUserStatus",
+        ],
+        ".node": ["RemnawaveNode", "RemnawaveNodeCreate", "RemnawaveNodeUpdate"],
+        ".host": ["RemnawaveHost", "RemnawaveHostCreate", "RemnawaveHostUpdate"],
+        ".subscription": ["RemnawaveSubscription"],
+        ".system": ["RemnawaveSystemStats"],
+    },
 )
-from .subscription import RemnawaveSubscription
-from .system import RemnawaveSystemStats
 
 __all__ = [
     "RemnawaveAdmin",
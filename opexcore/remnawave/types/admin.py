@@ -1,8 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class RemnawaveToken(BaseModel):
+class RemnawaveToken(PanelModel):
     """Token response"""
 
     access_token: str = Field(..., alias="accessToken")
@@ -11,7 +12,7 @@ class RemnawaveToken(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveAdmin(BaseModel):
+class RemnawaveAdmin(PanelModel):
     """Admin response"""
 
     uuid: str
@@ -26,7 +27,7 @@ class RemnawaveAdmin(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveAdminCreate(BaseModel):
+class RemnawaveAdminCreate(PanelModel):
     """Admin creation data"""
 
     username: str
@@ -39,7 +40,7 @@ class RemnawaveAdminCreate(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveAdminUpdate(BaseModel):
+class RemnawaveAdminUpdate(PanelModel):
     """Admin update data"""
 
     password: Optional[str] = None
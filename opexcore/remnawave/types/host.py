@@ -1,8 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class RemnawaveHost(BaseModel):
+class RemnawaveHost(PanelModel):
     """Host response"""
 
     uuid: str
@@ -25,7 +26,7 @@ class RemnawaveHost(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveHostCreate(BaseModel):
+class RemnawaveHostCreate(PanelModel):
     """Host creation data"""
 
     remark: str = Field(..., min_length=1, max_length=40)
@@ -43,7 +44,7 @@ class RemnawaveHostCreate(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveHostUpdate(BaseModel):
+class RemnawaveHostUpdate(PanelModel):
     """Host update data"""
 
     remark: Optional[str] = Field(None, max_length=40)
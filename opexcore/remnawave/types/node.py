@@ -1,8 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class RemnawaveNode(BaseModel):
+class RemnawaveNode(PanelModel):
     """Node response"""
 
     uuid: str
@@ -27,7 +28,7 @@ class RemnawaveNode(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveNodeCreate(BaseModel):
+class RemnawaveNodeCreate(PanelModel):
     """Node creation data"""
 
     name: str = Field(..., min_length=3, max_length=30)
@@ -42,7 +43,7 @@ class RemnawaveNodeCreate(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveNodeUpdate(BaseModel):
+class RemnawaveNodeUpdate(PanelModel):
     """Node update data"""
 
     name: Optional[str] = Field(None, min_length=3, max_length=30)
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class RemnawaveSubscription(BaseModel):
+class RemnawaveSubscription(PanelModel):
     """Subscription response"""
 
     short_uuid: str = Field(..., alias="shortUuid")
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class RemnawaveUserStatistics(BaseModel):
+class RemnawaveUserStatistics(PanelModel):
     """User statistics"""
 
     active: int
@@ -13,7 +14,7 @@ class RemnawaveUserStatistics(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveOnlineStatistics(BaseModel):
+class RemnawaveOnlineStatistics(PanelModel):
     """Online statistics"""
 
     last_day: int = Field(..., alias="lastDay")
@@ -25,7 +26,7 @@ class RemnawaveOnlineStatistics(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveNodeStatistics(BaseModel):
+class RemnawaveNodeStatistics(PanelModel):
     """Node statistics"""
 
     total_online: int = Field(..., alias="totalOnline")
@@ -34,7 +35,7 @@ class RemnawaveNodeStatistics(BaseModel):
         populate_by_name = True
 
 
-class RemnawaveSystemStats(BaseModel):
+class RemnawaveSystemStats(PanelModel):
     """System statistics response"""
 
     user_stats: RemnawaveUserStatistics = Field(..., alias="userStats")
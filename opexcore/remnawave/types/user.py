@@ -1,6 +1,7 @@
 from typing import Optional
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class RemnawaveUserStatus(str, Enum):
@@ -21,7 +22,7 @@ class RemnawaveTrafficLimitStrategy(str, Enum):
     MONTH = "MONTH"
 
 
-class RemnawaveUser(BaseModel):
+class RemnawaveUser(PanelModel):
     """User response"""
 
     uuid: str
@@ -54,7 +55,7 @@ class RemnawaveUser(BaseModel):
         use_enum_values = True
 
 
-class RemnawaveUserCreate(BaseModel):
+class RemnawaveUserCreate(PanelModel):
     """User creation data"""
 
     username: str = Field(..., min_length=3, max_length=32)
@@ -74,7 +75,7 @@ class RemnawaveUserCreate(BaseModel):
         use_enum_values = True
 
 
-class RemnawaveUserUpdate(BaseModel):
+class RemnawaveUserUpdate(PanelModel):
     """User update data"""
 
     traffic_limit_bytes: Optional[int] = Field(None, alias="trafficLimitBytes")
@@ -1,74 +1,153 @@
-from .manager import RustneshinManager
-from .types import (
-    RustneshinAdminCreate,
-    RustneshinAdminModify,
-    RustneshinAdminResponse,
-    RustneshinAdminsStats,
-    RustneshinPageAdminResponse,
-    RustneshinToken,
-    RustneshinProxyTypes,
-    RustneshinInboundHostAlpn,
-    RustneshinInboundHostFingerprint,
-    RustneshinInboundHostSecurity,
-    RustneshinFragmentSettings,
-    RustneshinMuxCoolSettings,
-    RustneshinSingBoxMuxSettings,
-    RustneshinMuxSettings,
-    RustneshinXMuxSettings,
-    RustneshinSplitHttpSettings,
-    RustneshinXrayNoise,
-    RustneshinNode,
-    RustneshinInbound,
-    RustneshinInboundHost,
-    RustneshinInboundHostResponse,
-    RustneshinPageInbound,
-    RustneshinPageInboundHostResponse,
-    RustneshinNodeStatus,
-    RustneshinNodeConnectionBackend,
-    RustneshinBackendConfigFormat,
-    RustneshinBackend,
-    RustneshinBackendConfig,
-    RustneshinNodeCreate,
-    RustneshinNodeModify,
-    RustneshinNodeResponse,
-    RustneshinNodeSettings,
-    RustneshinPageNodeResponse,
-    RustneshinServiceCreate,
-    RustneshinServiceModify,
-    RustneshinServiceResponse,
-    RustneshinPageServiceResponse,
-    RustneshinUserExpireStrategy,
-    RustneshinUserDataUsageResetStrategy,
-    RustneshinUsersSortingOptions,
-    RustneshinUserCreate,
-    RustneshinUserModify,
-    RustneshinUserResponse,
-    RustneshinPageUserResponse,
-    RustneshinUserNodeUsageSeries,
-    RustneshinUserUsageSeriesResponse,
-    RustneshinGranularity,
-    RustneshinConfigTypes,
-    RustneshinNodesStats,
-    RustneshinUsersStats,
-    RustneshinTrafficUsageSeries,
-    RustneshinSubscriptionRule,
-    RustneshinSubscriptionSettings,
-    RustneshinTemplateSettings,
-    RustneshinClientType,
-    RustneshinCreateSubReq,
-    RustneshinCreateEndpointReq,
-    RustneshinSubscriptionRes,
-    RustneshinEndpointRes,
-    RustneshinEndpointCreatedRes,
-    RustneshinEndpointWithSubsRes,
-    RustneshinSubUpsertReq,
-    RustneshinSubsUpdateReq,
-    RustneshinUpdateEndpointReq,
-)
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import RustneshinManager
+    from .client import RustneshinClient
+    from .types import (
+        RustneshinAdminCreate,
+        RustneshinAdminModify,
+        RustneshinAdminResponse,
+        RustneshinAdminsStats,
+        RustneshinPageAdminResponse,
+        RustneshinToken,
+        RustneshinProxyTypes,
+        RustneshinInboundHostAlpn,
+        RustneshinInboundHostFingerprint,
+        RustneshinInboundHostSecurity,
+        RustneshinFragmentSettings,
+        RustneshinMuxCoolSettings,
+        RustneshinSingBoxMuxSettings,
+        RustneshinMuxSettings,
+        RustneshinXMuxSettings,
+        RustneshinSplitHttpSettings,
+        RustneshinXrayNoise,
+        RustneshinNode,
+        RustneshinInbound,
+        RustneshinInboundHost,
+        RustneshinInboundHostResponse,
+        RustneshinPageInbound,
+        RustneshinPageInboundHostResponse,
+        RustneshinNodeStatus,
+        RustneshinNodeConnectionBackend,
+        RustneshinBackendConfigFormat,
+        RustneshinBackend,
+        RustneshinBackendConfig,
+        RustneshinNodeCreate,
+        RustneshinNodeModify,
+        RustneshinNodeResponse,
+        RustneshinNodeSettings,
+        RustneshinPageNodeResponse,
+        RustneshinServiceCreate,
+        RustneshinServiceModify,
+        RustneshinServiceResponse,
+        RustneshinPageServiceResponse,
+        RustneshinUserExpireStrategy,
+        RustneshinUserDataUsageResetStrategy,
+        RustneshinUsersSortingOptions,
+        RustneshinUserCreate,
+        RustneshinUserModify,
+        RustneshinUserResponse,
+        RustneshinPageUserResponse,
+        RustneshinUserNodeUsageSeries,
+        RustneshinUserUsageSeriesResponse,
+        RustneshinGranularity,
+        RustneshinConfigTypes,
+        RustneshinNodesStats,
+        RustneshinUsersStats,
+        RustneshinTrafficUsageSeries,
+        RustneshinSubscriptionRule,
+        RustneshinSubscriptionSettings,
+        RustneshinTemplateSettings,
+        RustneshinClientType,
+        RustneshinCreateSubReq,
+        RustneshinCreateEndpointReq,
+        RustneshinSubscriptionRes,
+        RustneshinEndpointRes,
+        RustneshinEndpointCreatedRes,
+        RustneshinEndpointWithSubsRes,
+        RustneshinSubUpsertReq,
+        RustneshinSubsUpdateReq,
+        RustneshinUpdateEndpointReq,
+    )
 
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".manager": ["RustneshinManager"],
+        ".client": ["RustneshinClient"],
+        ".types": [
+            "RustneshinAdminCreate",
+            "RustneshinAdminModify",
+            "RustneshinAdminResponse",
+            "RustneshinAdminsStats",
+            "RustneshinPageAdminResponse",
+            "RustneshinToken",
+            "RustneshinProxyTypes",
+            "RustneshinInboundHostAlpn",
+            "RustneshinInboundHostFingerprint",
+            "RustneshinInboundHostSecurity",
+            "RustneshinFragmentSettings",
+            "RustneshinMuxCoolSettings",
+            "RustneshinSingBoxMuxSettings",
+            "RustneshinMuxSettings",
+            "RustneshinXMuxSettings",
+            "RustneshinSplitHttpSettings",
+            "RustneshinXrayNoise",
+            "RustneshinNode",
+            "RustneshinInbound",
+            "RustneshinInboundHost",
+            "RustneshinInboundHostResponse",
+            "RustneshinPageInbound",
+            "RustneshinPageInboundHostResponse",
+            "RustneshinNodeStatus",
+            "RustneshinNodeConnectionBackend",
+            "RustneshinBackendConfigFormat",
+            "RustneshinBackend",
+            "RustneshinBackendConfig",
+            "RustneshinNodeCreate",
+            "RustneshinNodeModify",
+            "RustneshinNodeResponse",
+            "RustneshinNodeSettings",
+            "RustneshinPageNodeResponse",
+            "RustneshinServiceCreate",
+            "RustneshinServiceModify",
+            "RustneshinServiceResponse",
+            "RustneshinPageServiceResponse",
+            "RustneshinUserExpireStrategy",
+            "RustneshinUserDataUsageResetStrategy",
+            "RustneshinUsersSortingOptions",
+            "RustneshinUserCreate",
+            "RustneshinUserModify",
+            "RustneshinUserResponse",
+            "RustneshinPageUserResponse",
+            "RustneshinUserNodeUsageSeries",
+            "RustneshinUserUsageSeriesResponse",
+            "RustneshinGranularity",
+            "RustneshinConfigTypes",
+            "RustneshinNodesStats",
+            "RustneshinUsersStats",
+            "RustneshinTrafficUsageSeries",
+            "RustneshinSubscriptionRule",
+            "RustneshinSubscriptionSettings",
+            "RustneshinTemplateSettings",
+            "RustneshinClientType",
+            "RustneshinCreateSubReq",
+            "RustneshinCreateEndpointReq",
+            "RustneshinSubscriptionRes",
+            "RustneshinEndpointRes",
+            "RustneshinEndpointCreatedRes",
+            "RustneshinEndpointWithSubsRes",
+            "RustneshinSubUpsertReq",
+            "RustneshinSubsUpdateReq",
+            "RustneshinUpdateEndpointReq",
+        ],
+    },
+)
 
 __all__ = [
     "RustneshinManager",
+    "RustneshinClient",
     "RustneshinAdminCreate",
     "RustneshinAdminModify",
     "RustneshinAdminResponse",
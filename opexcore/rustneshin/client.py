@@ -0,0 +1,14 @@
+from opexcore.core import PanelClient
+from .manager import RustneshinManager
+
+
+class RustneshinClient(PanelClient):
+    """Rustneshin API client bound to a single panel"""
+
+    manager = RustneshinManager
+
+    async def _authenticate(self) -> str:
+        response = await RustneshinManager.admin_token(
+            self.host, self.username, self.password, timeout=self.timeout
+        )
+        return response.access_token
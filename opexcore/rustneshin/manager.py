@@ -1,6 +1,16 @@
-from typing import Optional, List, Dict, Any
+from contextlib import aclosing
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import datetime
-from opexcore.core import RequestBase
+from opexcore.core import (
+    RequestBase,
+    paginate,
+    gather_pages,
+    cached,
+    invalidates,
+    Projection,
+    project,
+    with_items,
+)
 from .types import (
     RustneshinToken,
     RustneshinAdminCreate,
@@ -74,8 +84,9 @@ class RustneshinManager(RequestBase):
             data={"username": username, "password": password},
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             timeout=timeout,
+            idempotent=True,
         )
-        return RustneshinToken(**response)
+        return cls._parse(RustneshinToken, response)
 
     @classmethod
     async def get_current_admin(
@@ -94,7 +105,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinAdminResponse(**response)
+        return cls._parse(RustneshinAdminResponse, response)
 
     @classmethod
     async def get_admins(
@@ -113,7 +124,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinPageAdminResponse(**response)
+        return cls._parse(RustneshinPageAdminResponse, response)
 
     @classmethod
     async def create_admin(
@@ -130,11 +141,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/admins",
-            data=admin_data.model_dump_json(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinAdminResponse(**response)
+        return cls._parse(RustneshinAdminResponse, response)
 
     @classmethod
     async def get_admin(
@@ -154,7 +165,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinAdminResponse(**response)
+        return cls._parse(RustneshinAdminResponse, response)
 
     @classmethod
     async def update_admin(
@@ -177,11 +188,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/admins/{username}",
-            data=admin_data.model_dump_json(exclude_none=True),
+            json=admin_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinAdminResponse(**response)
+        return cls._parse(RustneshinAdminResponse, response)
 
     @classmethod
     async def delete_admin(
@@ -257,7 +268,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinTrafficUsageSeries(**response)
+        return cls._parse(RustneshinTrafficUsageSeries, response)
 
     # ==================== Inbound Endpoints ====================
 
@@ -278,7 +289,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinPageInbound(**response)
+        return cls._parse(RustneshinPageInbound, response)
 
     @classmethod
     async def get_inbound(
@@ -298,7 +309,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinInbound(**response)
+        return cls._parse(RustneshinInbound, response)
 
     @classmethod
     async def get_hosts(
@@ -317,7 +328,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinPageInboundHostResponse(**response)
+        return cls._parse(RustneshinPageInboundHostResponse, response)
 
     @classmethod
     async def get_host(
@@ -337,7 +348,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinInboundHostResponse(**response)
+        return cls._parse(RustneshinInboundHostResponse, response)
 
     @classmethod
     async def update_host(
@@ -360,11 +371,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/inbounds/hosts/{host_id}",
-            data=host_data.model_dump_json(exclude_none=True),
+            json=host_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinInboundHostResponse(**response)
+        return cls._parse(RustneshinInboundHostResponse, response)
 
     @classmethod
     async def delete_host(
@@ -403,7 +414,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinPageInboundHostResponse(**response)
+        return cls._parse(RustneshinPageInboundHostResponse, response)
 
     @classmethod
     async def create_host(
@@ -426,11 +437,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/inbounds/{inbound_id}/hosts",
-            data=host_data.model_dump_json(exclude_none=True),
+            json=host_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinInboundHostResponse(**response)
+        return cls._parse(RustneshinInboundHostResponse, response)
 
     # ==================== Node Endpoints ====================
 
@@ -469,7 +480,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinPageNodeResponse(**response)
+        return cls._parse(RustneshinPageNodeResponse, response)
 
     @classmethod
     async def create_node(
@@ -486,11 +497,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/nodes",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinNodeResponse(**response)
+        return cls._parse(RustneshinNodeResponse, response)
 
     @classmethod
     async def get_node_settings(
@@ -509,7 +520,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinNodeSettings(**response)
+        return cls._parse(RustneshinNodeSettings, response)
 
     @classmethod
     async def get_node(
@@ -529,7 +540,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinNodeResponse(**response)
+        return cls._parse(RustneshinNodeResponse, response)
 
     @classmethod
     async def update_node(
@@ -552,7 +563,7 @@ class RustneshinManager(RequestBase):
         """
         return await cls.put(
             url=f"{host.rstrip('/')}/api/nodes/{node_id}",
-            data=node_data.model_dump_json(exclude_none=True),
+            json=node_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
@@ -656,7 +667,7 @@ class RustneshinManager(RequestBase):
         """
         return await cls.put(
             url=f"{host.rstrip('/')}/api/nodes/{node_id}/{backend}/config",
-            data=config.model_dump_json(exclude_none=True),
+            json=config.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
@@ -720,7 +731,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinPageServiceResponse(**response)
+        return cls._parse(RustneshinPageServiceResponse, response)
 
     @classmethod
     async def create_service(
@@ -741,11 +752,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/services",
-            data=service_data.model_dump_json(exclude_none=True),
+            json=service_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinServiceResponse(**response)
+        return cls._parse(RustneshinServiceResponse, response)
 
     @classmethod
     async def get_service(
@@ -765,7 +776,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinServiceResponse(**response)
+        return cls._parse(RustneshinServiceResponse, response)
 
     @classmethod
     async def update_service(
@@ -788,11 +799,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/services/{service_id}",
-            data=service_data.model_dump_json(exclude_none=True),
+            json=service_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinServiceResponse(**response)
+        return cls._parse(RustneshinServiceResponse, response)
 
     @classmethod
     async def delete_service(
@@ -851,22 +862,20 @@ class RustneshinManager(RequestBase):
         :param timeout: Request timeout in seconds
         :return: Service response
         """
-        import json
-
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/services/{service_id}/inbound_ids",
-            data=json.dumps(inbound_ids),
+            json=inbound_ids,
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinServiceResponse(**response)
+        return cls._parse(RustneshinServiceResponse, response)
 
     # ==================== Subscription Endpoints ====================
 
     @classmethod
     async def user_subscription(
         cls, host: str, username: str, key: str, timeout: int = 10
-    ) -> Dict[str, Any]:
+    ) -> str:
         """
         Get user subscription.
 
@@ -874,11 +883,12 @@ class RustneshinManager(RequestBase):
         :param username: Username
         :param key: Subscription key
         :param timeout: Request timeout in seconds
-        :return: Subscription data
+        :return: Subscription content as served by the panel
         """
         return await cls.get(
             url=f"{host.rstrip('/')}/sub/{username}/{key}",
             timeout=timeout,
+            response_type="text",
         )
 
     @classmethod
@@ -938,7 +948,7 @@ class RustneshinManager(RequestBase):
         key: str,
         client_type: RustneshinClientType,
         timeout: int = 10,
-    ) -> Dict[str, Any]:
+    ) -> str:
         """
         Get user subscription with client type.
 
@@ -947,16 +957,18 @@ class RustneshinManager(RequestBase):
         :param key: Subscription key
         :param client_type: Client type
         :param timeout: Request timeout in seconds
-        :return: Subscription data
+        :return: Subscription content as served by the panel
         """
         return await cls.get(
             url=f"{host.rstrip('/')}/sub/{username}/{key}/{client_type.value}",
             timeout=timeout,
+            response_type="text",
         )
 
     # ==================== System Endpoints ====================
 
     @classmethod
+    @cached(ttl=300, stale_ttl=300, tags=("subscription_settings",))
     async def get_subscription_settings(
         cls, host: str, token: str, timeout: int = 10
     ) -> RustneshinSubscriptionSettings:
@@ -973,9 +985,10 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinSubscriptionSettings(**response)
+        return cls._parse(RustneshinSubscriptionSettings, response)
 
     @classmethod
+    @invalidates("subscription_settings")
     async def update_subscription_settings(
         cls,
         host: str,
@@ -994,11 +1007,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/system/settings/subscription",
-            data=settings.model_dump_json(exclude_none=True),
+            json=settings.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinNodesStats(**response)
+        return cls._parse(RustneshinNodesStats, response)
 
     @classmethod
     async def get_template(
@@ -1018,7 +1031,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinTemplateSettings(**response)
+        return cls._parse(RustneshinTemplateSettings, response)
 
     @classmethod
     async def update_template(
@@ -1041,11 +1054,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/system/settings/subscription/templates/{template_name}",
-            data=settings.model_dump_json(exclude_none=True),
+            json=settings.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinTemplateSettings(**response)
+        return cls._parse(RustneshinTemplateSettings, response)
 
     @classmethod
     async def get_admins_stats(
@@ -1064,7 +1077,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinAdminsStats(**response)
+        return cls._parse(RustneshinAdminsStats, response)
 
     @classmethod
     async def get_nodes_stats(
@@ -1083,7 +1096,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinNodesStats(**response)
+        return cls._parse(RustneshinNodesStats, response)
 
     @classmethod
     async def get_traffic_stats(
@@ -1119,7 +1132,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinTrafficUsageSeries(**response)
+        return cls._parse(RustneshinTrafficUsageSeries, response)
 
     @classmethod
     async def get_users_stats(
@@ -1138,7 +1151,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUsersStats(**response)
+        return cls._parse(RustneshinUsersStats, response)
 
     # ==================== User Endpoints ====================
 
@@ -1157,6 +1170,9 @@ class RustneshinManager(RequestBase):
         owner_username: Optional[str] = None,
         order_by: Optional[str] = None,
         timeout: int = 10,
+        projection: Optional[Projection] = None,
+        page: Optional[int] = None,
+        size: Optional[int] = None,
     ) -> RustneshinPageUserResponse:
         """
         Retrieve all users with optional filters.
@@ -1173,6 +1189,9 @@ class RustneshinManager(RequestBase):
         :param owner_username: Filter by owner username
         :param order_by: Sort field
         :param timeout: Request timeout in seconds
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param page: Page number
+        :param size: Page size
         :return: Paginated user response
         """
         params = {}
@@ -1194,14 +1213,152 @@ class RustneshinManager(RequestBase):
             params["owner_username"] = owner_username
         if order_by:
             params["order_by"] = order_by
+        if page is not None:
+            params["page"] = page
+        if size is not None:
+            params["size"] = size
 
-        response = await cls.get(
+        return await cls.get(
             url=f"{host.rstrip('/')}/api/users",
             params=params,
             headers=cls._generate_headers(token),
             timeout=timeout,
+            response_model=with_items(
+                RustneshinPageUserResponse,
+                "items",
+                project(RustneshinUserResponse, projection),
+            ),
         )
-        return RustneshinPageUserResponse(**response)
+
+    @classmethod
+    async def iter_users(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 100,
+        username: Optional[List[str]] = None,
+        descending: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        activated: Optional[bool] = None,
+        expired: Optional[bool] = None,
+        data_limit_reached: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        owner_username: Optional[str] = None,
+        order_by: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> AsyncIterator[RustneshinUserResponse]:
+        """
+        Iterate over all users matching the filters, page by page.
+
+        The next page is requested while the current one is being consumed.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of users requested per page
+        :param username: Filter by usernames
+        :param descending: Sort descending
+        :param is_active: Filter by active status
+        :param activated: Filter by activated status
+        :param expired: Filter by expired status
+        :param data_limit_reached: Filter by data limit reached
+        :param enabled: Filter by enabled status
+        :param owner_username: Filter by owner username
+        :param order_by: Sort field
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Request timeout in seconds
+        :return: Async iterator over user responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            response = await cls.get_users(
+                host,
+                token,
+                username=username,
+                descending=descending,
+                is_active=is_active,
+                activated=activated,
+                expired=expired,
+                data_limit_reached=data_limit_reached,
+                enabled=enabled,
+                owner_username=owner_username,
+                order_by=order_by,
+                page=index + 1,
+                size=size,
+                projection=projection,
+                timeout=timeout,
+            )
+            return response.items, response.total
+
+        async with aclosing(paginate(fetch_page, page_size)) as items:
+            async for user in items:
+                yield user
+
+    @classmethod
+    async def get_all_users(
+        cls,
+        host: str,
+        token: str,
+        page_size: int = 1000,
+        concurrency: int = 8,
+        username: Optional[List[str]] = None,
+        descending: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        activated: Optional[bool] = None,
+        expired: Optional[bool] = None,
+        data_limit_reached: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        owner_username: Optional[str] = None,
+        order_by: Optional[str] = None,
+        projection: Optional[Projection] = None,
+        timeout: int = 10,
+    ) -> List[RustneshinUserResponse]:
+        """
+        Fetch every user matching the filters with concurrent page requests.
+
+        The first page reports the total and the page size the panel serves;
+        the remaining pages are then fetched in parallel and returned in order.
+        Raises ``PaginationError`` if they do not add up to the total.
+
+        :param host: API host URL
+        :param token: Authentication token
+        :param page_size: Number of users requested per page
+        :param concurrency: Maximum number of pages fetched at once
+        :param username: Filter by usernames
+        :param descending: Sort descending
+        :param is_active: Filter by active status
+        :param activated: Filter by activated status
+        :param expired: Filter by expired status
+        :param data_limit_reached: Filter by data limit reached
+        :param enabled: Filter by enabled status
+        :param owner_username: Filter by owner username
+        :param order_by: Sort field
+        :param projection: Fields to keep, or a lighter model to parse users into
+        :param timeout: Request timeout in seconds
+        :return: List of user responses
+        """
+
+        async def fetch_page(index: int, size: int):
+            response = await cls.get_users(
+                host,
+                token,
+                username=username,
+                descending=descending,
+                is_active=is_active,
+                activated=activated,
+                expired=expired,
+                data_limit_reached=data_limit_reached,
+                enabled=enabled,
+                owner_username=owner_username,
+                order_by=order_by,
+                page=index + 1,
+                size=size,
+                projection=projection,
+                timeout=timeout,
+            )
+            return response.items, response.total
+
+        return await gather_pages(fetch_page, page_size, concurrency=concurrency)
 
     @classmethod
     async def create_user(
@@ -1218,11 +1375,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/users",
-            data=user_data.model_dump_json(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserResponse(**response)
+        return cls._parse(RustneshinUserResponse, response)
 
     @classmethod
     async def get_user(
@@ -1242,7 +1399,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserResponse(**response)
+        return cls._parse(RustneshinUserResponse, response)
 
     @classmethod
     async def update_user(
@@ -1265,11 +1422,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.put(
             url=f"{host.rstrip('/')}/api/users/{username}",
-            data=user_data.model_dump_json(exclude_none=True),
+            json=user_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserResponse(**response)
+        return cls._parse(RustneshinUserResponse, response)
 
     @classmethod
     async def delete_user(
@@ -1289,7 +1446,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserResponse(**response)
+        return cls._parse(RustneshinUserResponse, response)
 
     @classmethod
     async def disable_user(
@@ -1310,7 +1467,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserResponse(**response)
+        return cls._parse(RustneshinUserResponse, response)
 
     @classmethod
     async def enable_user(
@@ -1331,7 +1488,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserResponse(**response)
+        return cls._parse(RustneshinUserResponse, response)
 
     @classmethod
     async def reset_user_data_usage(
@@ -1351,7 +1508,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserResponse(**response)
+        return cls._parse(RustneshinUserResponse, response)
 
     @classmethod
     async def revoke_user_subscription(
@@ -1371,7 +1528,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserResponse(**response)
+        return cls._parse(RustneshinUserResponse, response)
 
     @classmethod
     async def get_user_usage(
@@ -1409,7 +1566,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinUserUsageSeriesResponse(**response)
+        return cls._parse(RustneshinUserUsageSeriesResponse, response)
 
     # ==================== Webhook Endpoints ====================
 
@@ -1430,7 +1587,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return [RustneshinEndpointRes(**item) for item in response]
+        return cls._parse(List[RustneshinEndpointRes], response)
 
     @classmethod
     async def create_webhook_endpoint(
@@ -1451,11 +1608,11 @@ class RustneshinManager(RequestBase):
         """
         response = await cls.post(
             url=f"{host.rstrip('/')}/api/webhook/endpoints",
-            data=endpoint_data.model_dump_json(exclude_none=True),
+            json=endpoint_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinEndpointCreatedRes(**response)
+        return cls._parse(RustneshinEndpointCreatedRes, response)
 
     @classmethod
     async def get_webhook_endpoint(
@@ -1475,7 +1632,7 @@ class RustneshinManager(RequestBase):
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinEndpointWithSubsRes(**response)
+        return cls._parse(RustneshinEndpointWithSubsRes, response)
 
     @classmethod
     async def delete_webhook_endpoint(
@@ -1518,8 +1675,8 @@ class RustneshinManager(RequestBase):
         response = await cls.fetch(
             method="PATCH",
             url=f"{host.rstrip('/')}/api/webhook/endpoints/{endpoint_id}",
-            data=endpoint_data.model_dump_json(exclude_none=True),
+            json=endpoint_data.model_dump(mode="json", exclude_none=True),
             headers=cls._generate_headers(token),
             timeout=timeout,
         )
-        return RustneshinEndpointWithSubsRes(**response)
+        return cls._parse(RustneshinEndpointWithSubsRes, response)
@@ -1,82 +1,169 @@
-from .admin import (
-    RustneshinAdminCreate,
-    RustneshinAdminModify,
-    RustneshinAdminResponse,
-    RustneshinAdminsStats,
-    RustneshinPageAdminResponse,
-    RustneshinToken,
-)
-from .inbound import (
-    RustneshinProxyTypes,
-    RustneshinInboundHostAlpn,
-    RustneshinInboundHostFingerprint,
-    RustneshinInboundHostSecurity,
-    RustneshinFragmentSettings,
-    RustneshinMuxCoolSettings,
-    RustneshinSingBoxMuxSettings,
-    RustneshinMuxSettings,
-    RustneshinXMuxSettings,
-    RustneshinSplitHttpSettings,
-    RustneshinXrayNoise,
-    RustneshinNode,
-    RustneshinInbound,
-    RustneshinInboundHost,
-    RustneshinInboundHostResponse,
-    RustneshinPageInbound,
-    RustneshinPageInboundHostResponse,
-)
-from .node import (
-    RustneshinNodeStatus,
-    RustneshinNodeConnectionBackend,
-    RustneshinBackendConfigFormat,
-    RustneshinBackend,
-    RustneshinBackendConfig,
-    RustneshinNodeCreate,
-    RustneshinNodeModify,
-    RustneshinNodeResponse,
-    RustneshinNodeSettings,
-    RustneshinPageNodeResponse,
-)
-from .service import (
-    RustneshinServiceCreate,
-    RustneshinServiceModify,
-    RustneshinServiceResponse,
-    RustneshinPageServiceResponse,
-)
-from .user import (
-    RustneshinUserExpireStrategy,
-    RustneshinUserDataUsageResetStrategy,
-    RustneshinUsersSortingOptions,
-    RustneshinUserCreate,
-    RustneshinUserModify,
-    RustneshinUserResponse,
-    RustneshinPageUserResponse,
-    RustneshinUserNodeUsageSeries,
-    RustneshinUserUsageSeriesResponse,
-)
-from .system import (
-    RustneshinGranularity,
-    RustneshinConfigTypes,
-    RustneshinNodesStats,
-    RustneshinUsersStats,
-    RustneshinTrafficUsageSeries,
-    RustneshinSubscriptionRule,
-    RustneshinSubscriptionSettings,
-    RustneshinTemplateSettings,
-)
-from .subscription import RustneshinClientType
-from .webhook import (
-    RustneshinCreateSubReq,
-    RustneshinCreateEndpointReq,
-    RustneshinSubscriptionRes,
-    RustneshinEndpointRes,
-    RustneshinEndpointCreatedRes,
-    RustneshinEndpointWithSubsRes,
-    RustneshinSubUpsertReq,
-    RustneshinSubsUpdateReq,
-    RustneshinUpdateEndpointReq,
-)
+from typing import TYPE_CHECKING
+from opexcore.lazy import lazy_exports
 
+if TYPE_CHECKING:
+    from .admin import (
+        RustneshinAdminCreate,
+        RustneshinAdminModify,
+        RustneshinAdminResponse,
+        RustneshinAdminsStats,
+        RustneshinPageAdminResponse,
+        RustneshinToken,
+    )
+    from .inbound import (
+        RustneshinProxyTypes,
+        RustneshinInboundHostAlpn,
+        RustneshinInboundHostFingerprint,
+        RustneshinInboundHostSecurity,
+        RustneshinFragmentSettings,
+        RustneshinMuxCoolSettings,
+        RustneshinSingBoxMuxSettings,
+        RustneshinMuxSettings,
+        RustneshinXMuxSettings,
+        RustneshinSplitHttpSettings,
+        RustneshinXrayNoise,
+        RustneshinNode,
+        RustneshinInbound,
+        RustneshinInboundHost,
+        RustneshinInboundHostResponse,
+        RustneshinPageInbound,
+        RustneshinPageInboundHostResponse,
+    )
+    from .node import (
+        RustneshinNodeStatus,
+        RustneshinNodeConnectionBackend,
+        RustneshinBackendConfigFormat,
+        RustneshinBackend,
+        RustneshinBackendConfig,
+        RustneshinNodeCreate,
+        RustneshinNodeModify,
+        RustneshinNodeResponse,
+        RustneshinNodeSettings,
+        RustneshinPageNodeResponse,
+    )
+    from .service import (
+        RustneshinServiceCreate,
+        RustneshinServiceModify,
+        RustneshinServiceResponse,
+        RustneshinPageServiceResponse,
+    )
+    from .user import (
+        RustneshinUserExpireStrategy,
+        RustneshinUserDataUsageResetStrategy,
+        RustneshinUsersSortingOptions,
+        RustneshinUserCreate,
+        RustneshinUserModify,
+        RustneshinUserResponse,
+        RustneshinPageUserResponse,
+        RustneshinUserNodeUsageSeries,
+        RustneshinUserUsageSeriesResponse,
+    )
+    from .system import (
+        RustneshinGranularity,
+        RustneshinConfigTypes,
+        RustneshinNodesStats,
+        RustneshinUsersStats,
+        RustneshinTrafficUsageSeries,
+        RustneshinSubscriptionRule,
+        RustneshinSubscriptionSettings,
+        RustneshinTemplateSettings,
+    )
+    from .subscription import RustneshinClientType
+    from .webhook import (
+        RustneshinCreateSubReq,
+        RustneshinCreateEndpointReq,
+        RustneshinSubscriptionRes,
+        RustneshinEndpointRes,
+        RustneshinEndpointCreatedRes,
+        RustneshinEndpointWithSubsRes,
+        RustneshinSubUpsertReq,
+        RustneshinSubsUpdateReq,
+        RustneshinUpdateEndpointReq,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".admin": [
+            "RustneshinAdminCreate",
+            "RustneshinAdminModify",
+            "RustneshinAdminResponse",
+            "RustneshinAdminsStats",
+            "RustneshinPageAdminResponse",
+            "RustneshinToken",
+        ],
+        ".inbound": [
+            "RustneshinProxyTypes",
+            "RustneshinInboundHostAlpn",
+            "RustneshinInboundHostFingerprint",
+            "RustneshinInboundHostSecurity",
+            "RustneshinFragmentSettings",
+            "RustneshinMuxCoolSettings",
+            "RustneshinSingBoxMuxSettings",
+            "RustneshinMuxSettings",
+            "RustneshinXMuxSettings",
+            "RustneshinSplitHttpSettings",
+            "RustneshinXrayNoise",
+            "RustneshinNode",
+            "RustneshinInbound",
+            "RustneshinInboundHost",
+            "RustneshinInboundHostResponse",
+            "RustneshinPageInbound",
+            "RustneshinPageInboundHostResponse",
+        ],
+        ".node": [
+            "RustneshinNodeStatus",
+            "RustneshinNodeConnectionBackend",
+            "RustneshinBackendConfigFormat",
+            "RustneshinBackend",
+            "RustneshinBackendConfig",
+            "RustneshinNodeCreate",
+            "RustneshinNodeModify",
+            "RustneshinNodeResponse",
+            "RustneshinNodeSettings",
+            "RustneshinPageNodeResponse",
+        ],
+        ".service": [
+            "RustneshinServiceCreate",
+            "RustneshinServiceModify",
+            "RustneshinServiceResponse",
+            "RustneshinPageServiceResponse",
+        ],
+        ".user": [
+            "RustneshinUserExpireStrategy",
+            "RustneshinUserDataUsageResetStrategy",
+            "RustneshinUsersSortingOptions",
+            "RustneshinUserCreate",
+            "RustneshinUserModify",
+            "RustneshinUserResponse",
+            "RustneshinPageUserResponse",
+            "RustneshinUserNodeUsageSeries",
+            "RustneshinUserUsageSeriesResponse",
+        ],
+        ".system": [
+            "RustneshinGranularity",
+            "RustneshinConfigTypes",
+            "RustneshinNodesStats",
+            "RustneshinUsersStats",
+            "RustneshinTrafficUsageSeries",
+            "RustneshinSubscriptionRule",
+            "RustneshinSubscriptionSettings",
+            "RustneshinTemplateSettings",
+        ],
+        ".subscription": ["RustneshinClientType"],
+        ".webhook": [
+            "RustneshinCreateSubReq",
+            "RustneshinCreateEndpointReq",
+            "RustneshinSubscriptionRes",
+            "RustneshinEndpointRes",
+            "RustneshinEndpointCreatedRes",
+            "RustneshinEndpointWithSubsRes",
+            "RustneshinSubUpsertReq",
+            "RustneshinSubsUpdateReq",
+            "RustneshinUpdateEndpointReq",
+        ],
+    },
+)
 
 __all__ = [
     # Admin
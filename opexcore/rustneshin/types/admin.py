@@ -1,8 +1,9 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class RustneshinAdminCreate(BaseModel):
+class RustneshinAdminCreate(PanelModel):
     """Schema for creating a new admin"""
 
     username: str = Field(..., title="Username")
@@ -17,7 +18,7 @@ class RustneshinAdminCreate(BaseModel):
     )
 
 
-class RustneshinAdminModify(BaseModel):
+class RustneshinAdminModify(PanelModel):
     """Schema for modifying an existing admin"""
 
     username: Optional[str] = Field(None, title="Username")
@@ -32,7 +33,7 @@ class RustneshinAdminModify(BaseModel):
     )
 
 
-class RustneshinAdminResponse(BaseModel):
+class RustneshinAdminResponse(PanelModel):
     """Admin response schema"""
 
     id: int = Field(..., title="ID")
@@ -48,7 +49,7 @@ class RustneshinAdminResponse(BaseModel):
     lifetime_subscription_count: int = Field(..., title="Lifetime Subscription Count")
 
 
-class RustneshinToken(BaseModel):
+class RustneshinToken(PanelModel):
     """Authentication token response"""
 
     access_token: str = Field(..., title="Access Token")
@@ -56,13 +57,13 @@ class RustneshinToken(BaseModel):
     is_sudo: bool = Field(..., title="Is Sudo")
 
 
-class RustneshinAdminsStats(BaseModel):
+class RustneshinAdminsStats(PanelModel):
     """Admin statistics"""
 
     total: int = Field(..., title="Total")
 
 
-class RustneshinPageAdminResponse(BaseModel):
+class RustneshinPageAdminResponse(PanelModel):
     """Paginated admin response"""
 
     items: List[RustneshinAdminResponse] = Field(default_factory=list, title="Items")
@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class RustneshinProxyTypes(str, Enum):
@@ -53,7 +54,7 @@ class RustneshinInboundHostSecurity(str, Enum):
     TLS = "tls"
 
 
-class RustneshinFragmentSettings(BaseModel):
+class RustneshinFragmentSettings(PanelModel):
     """Fragment settings"""
 
     packets: str = Field(..., title="Packets")
@@ -61,7 +62,7 @@ class RustneshinFragmentSettings(BaseModel):
     interval: str = Field(..., title="Interval")
 
 
-class RustneshinMuxCoolSettings(BaseModel):
+class RustneshinMuxCoolSettings(PanelModel):
     """Mux cool settings"""
 
     concurrency: Optional[int] = Field(None, title="Concurrency")
@@ -69,7 +70,7 @@ class RustneshinMuxCoolSettings(BaseModel):
     xudp_proxy_443: Optional[str] = Field(None, title="XUDP Proxy 443")
 
 
-class RustneshinSingBoxMuxSettings(BaseModel):
+class RustneshinSingBoxMuxSettings(PanelModel):
     """Sing-box mux settings"""
 
     max_connections: Optional[int] = Field(None, title="Max Connections")
@@ -78,7 +79,7 @@ class RustneshinSingBoxMuxSettings(BaseModel):
     padding: Optional[bool] = Field(None, title="Padding")
 
 
-class RustneshinMuxSettings(BaseModel):
+class RustneshinMuxSettings(PanelModel):
     """Mux settings"""
 
     protocol: str = Field(..., title="Protocol")
@@ -90,7 +91,7 @@ class RustneshinMuxSettings(BaseModel):
     )
 
 
-class RustneshinXMuxSettings(BaseModel):
+class RustneshinXMuxSettings(PanelModel):
     """X-Mux settings"""
 
     keep_alive_period: Optional[int] = Field(None, title="Keep Alive Period")
@@ -101,7 +102,7 @@ class RustneshinXMuxSettings(BaseModel):
     max_reuse_times: Optional[str] = Field(None, title="Max Reuse Times")
 
 
-class RustneshinSplitHttpSettings(BaseModel):
+class RustneshinSplitHttpSettings(PanelModel):
     """Split HTTP settings"""
 
     mode: Optional[str] = Field(None, title="Mode")
@@ -110,7 +111,7 @@ class RustneshinSplitHttpSettings(BaseModel):
     xmux: Optional[RustneshinXMuxSettings] = Field(None, title="X-Mux Settings")
 
 
-class RustneshinXrayNoise(BaseModel):
+class RustneshinXrayNoise(PanelModel):
     """Xray noise settings"""
 
     type: str = Field(..., title="Type")
@@ -118,7 +119,7 @@ class RustneshinXrayNoise(BaseModel):
     delay: str = Field(..., title="Delay")
 
 
-class RustneshinNode(BaseModel):
+class RustneshinNode(PanelModel):
     """Node base model"""
 
     id: Optional[int] = Field(None, title="ID")
@@ -129,7 +130,7 @@ class RustneshinNode(BaseModel):
     connection_backend: Optional[str] = Field(None, title="Connection Backend")
 
 
-class RustneshinInbound(BaseModel):
+class RustneshinInbound(PanelModel):
     """Inbound model"""
 
     id: int = Field(..., title="ID")
@@ -140,7 +141,7 @@ class RustneshinInbound(BaseModel):
     service_ids: List[int] = Field(default_factory=list, title="Service IDs")
 
 
-class RustneshinInboundHost(BaseModel):
+class RustneshinInboundHost(PanelModel):
     """Inbound host model"""
 
     remark: str = Field(..., title="Remark")
@@ -190,7 +191,7 @@ class RustneshinInboundHostResponse(RustneshinInboundHost):
     id: int = Field(..., title="ID")
 
 
-class RustneshinPageInbound(BaseModel):
+class RustneshinPageInbound(PanelModel):
     """Paginated inbound response"""
 
     items: List[RustneshinInbound] = Field(default_factory=list, title="Items")
@@ -200,7 +201,7 @@ class RustneshinPageInbound(BaseModel):
     pages: int = Field(..., title="Pages")
 
 
-class RustneshinPageInboundHostResponse(BaseModel):
+class RustneshinPageInboundHostResponse(PanelModel):
     """Paginated inbound host response"""
 
     items: List[RustneshinInboundHostResponse] = Field(
@@ -1,6 +1,7 @@
 from typing import Optional, List
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class RustneshinNodeStatus(str, Enum):
@@ -26,7 +27,7 @@ class RustneshinBackendConfigFormat(str, Enum):
     YAML = "Yaml"
 
 
-class RustneshinBackend(BaseModel):
+class RustneshinBackend(PanelModel):
     """Backend model"""
 
     name: str = Field(..., title="Name")
@@ -35,14 +36,14 @@ class RustneshinBackend(BaseModel):
     version: Optional[str] = Field(None, title="Version")
 
 
-class RustneshinBackendConfig(BaseModel):
+class RustneshinBackendConfig(PanelModel):
     """Backend config model"""
 
     config: str = Field(..., title="Config")
     format: RustneshinBackendConfigFormat = Field(..., title="Format")
 
 
-class RustneshinNodeCreate(BaseModel):
+class RustneshinNodeCreate(PanelModel):
     """Schema for creating a new node"""
 
     name: str = Field(..., title="Name")
@@ -54,7 +55,7 @@ class RustneshinNodeCreate(BaseModel):
     )
 
 
-class RustneshinNodeModify(BaseModel):
+class RustneshinNodeModify(PanelModel):
     """Schema for modifying an existing node"""
 
     name: Optional[str] = Field(None, title="Name")
@@ -66,7 +67,7 @@ class RustneshinNodeModify(BaseModel):
     )
 
 
-class RustneshinNodeResponse(BaseModel):
+class RustneshinNodeResponse(PanelModel):
     """Node response schema"""
 
     id: Optional[int] = Field(None, title="ID")
@@ -84,14 +85,14 @@ class RustneshinNodeResponse(BaseModel):
     inbound_ids: Optional[List[int]] = Field(None, title="Inbound IDs")
 
 
-class RustneshinNodeSettings(BaseModel):
+class RustneshinNodeSettings(PanelModel):
     """Node settings schema"""
 
     certificate: str = Field(..., title="Certificate")
     min_node_version: str = Field("", title="Min Node Version")
 
 
-class RustneshinPageNodeResponse(BaseModel):
+class RustneshinPageNodeResponse(PanelModel):
     """Paginated node response"""
 
     items: List[RustneshinNodeResponse] = Field(default_factory=list, title="Items")
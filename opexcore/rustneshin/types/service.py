@@ -1,8 +1,9 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class RustneshinServiceCreate(BaseModel):
+class RustneshinServiceCreate(PanelModel):
     """Schema for creating a new service"""
 
     id: Optional[int] = Field(None, title="ID")
@@ -10,7 +11,7 @@ class RustneshinServiceCreate(BaseModel):
     inbound_ids: List[int] = Field(default_factory=list, title="Inbound IDs")
 
 
-class RustneshinServiceModify(BaseModel):
+class RustneshinServiceModify(PanelModel):
     """Schema for modifying an existing service"""
 
     id: Optional[int] = Field(None, title="ID")
@@ -18,7 +19,7 @@ class RustneshinServiceModify(BaseModel):
     inbound_ids: Optional[List[int]] = Field(None, title="Inbound IDs")
 
 
-class RustneshinServiceResponse(BaseModel):
+class RustneshinServiceResponse(PanelModel):
     """Service response schema"""
 
     id: int = Field(..., title="ID")
@@ -29,7 +30,7 @@ class RustneshinServiceResponse(BaseModel):
     user_count: int = Field(0, title="User Count")
 
 
-class RustneshinPageServiceResponse(BaseModel):
+class RustneshinPageServiceResponse(PanelModel):
     """Paginated service response"""
 
     items: List[RustneshinServiceResponse] = Field(default_factory=list, title="Items")
@@ -1,6 +1,7 @@
 from typing import Optional, List, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class RustneshinGranularity(str, Enum):
@@ -26,7 +27,7 @@ class RustneshinConfigTypes(str, Enum):
     BLOCK = "block"
 
 
-class RustneshinNodesStats(BaseModel):
+class RustneshinNodesStats(PanelModel):
     """Nodes statistics"""
 
     total: int = Field(..., title="Total")
@@ -34,7 +35,7 @@ class RustneshinNodesStats(BaseModel):
     unhealthy: int = Field(..., title="Unhealthy")
 
 
-class RustneshinUsersStats(BaseModel):
+class RustneshinUsersStats(PanelModel):
     """Users statistics"""
 
     total: int = Field(..., title="Total")
@@ -45,7 +46,7 @@ class RustneshinUsersStats(BaseModel):
     online: int = Field(..., title="Online")
 
 
-class RustneshinTrafficUsageSeries(BaseModel):
+class RustneshinTrafficUsageSeries(PanelModel):
     """Traffic usage series"""
 
     total: int = Field(..., title="Total")
@@ -53,14 +54,14 @@ class RustneshinTrafficUsageSeries(BaseModel):
     step: int = Field(3600, title="Step")
 
 
-class RustneshinSubscriptionRule(BaseModel):
+class RustneshinSubscriptionRule(PanelModel):
     """Subscription rule"""
 
     pattern: str = Field(..., title="Pattern")
     result: RustneshinConfigTypes = Field(..., title="Result")
 
 
-class RustneshinSubscriptionSettings(BaseModel):
+class RustneshinSubscriptionSettings(PanelModel):
     """Subscription settings"""
 
     template_on_acceptance: bool = Field(..., title="Template On Acceptance")
@@ -75,7 +76,7 @@ class RustneshinSubscriptionSettings(BaseModel):
     placeholder_remark: Optional[str] = Field(None, title="Placeholder Remark")
 
 
-class RustneshinTemplateSettings(BaseModel):
+class RustneshinTemplateSettings(PanelModel):
     """Template settings"""
 
     value: Optional[str] = Field(None, title="Value")
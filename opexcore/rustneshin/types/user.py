@@ -1,7 +1,8 @@
 from typing import Optional, List, Tuple
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
 class RustneshinUserExpireStrategy(str, Enum):
@@ -32,7 +33,7 @@ class RustneshinUsersSortingOptions(str, Enum):
     CREATED_AT = "created_at"
 
 
-class RustneshinUserCreate(BaseModel):
+class RustneshinUserCreate(PanelModel):
     """Schema for creating a new user"""
 
     username: str = Field(..., title="Username")
@@ -49,7 +50,7 @@ class RustneshinUserCreate(BaseModel):
     service_ids: List[int] = Field(default_factory=list, title="Service IDs")
 
 
-class RustneshinUserModify(BaseModel):
+class RustneshinUserModify(PanelModel):
     """Schema for modifying an existing user"""
 
     username: str = Field(..., title="Username")
@@ -68,7 +69,7 @@ class RustneshinUserModify(BaseModel):
     service_ids: Optional[List[int]] = Field(None, title="Service IDs")
 
 
-class RustneshinUserResponse(BaseModel):
+class RustneshinUserResponse(PanelModel):
     """User response schema"""
 
     id: int = Field(..., title="ID")
@@ -104,7 +105,7 @@ class RustneshinUserResponse(BaseModel):
     owner_username: Optional[str] = Field(None, title="Owner Username")
 
 
-class RustneshinPageUserResponse(BaseModel):
+class RustneshinPageUserResponse(PanelModel):
     """Paginated user response"""
 
     items: List[RustneshinUserResponse] = Field(default_factory=list, title="Items")
@@ -114,7 +115,7 @@ class RustneshinPageUserResponse(BaseModel):
     pages: int = Field(..., title="Pages")
 
 
-class RustneshinUserNodeUsageSeries(BaseModel):
+class RustneshinUserNodeUsageSeries(PanelModel):
     """User node usage series"""
 
     node_id: Optional[int] = Field(None, title="Node ID")
@@ -122,7 +123,7 @@ class RustneshinUserNodeUsageSeries(BaseModel):
     usages: List[Tuple[int, int]] = Field(default_factory=list, title="Usages")
 
 
-class RustneshinUserUsageSeriesResponse(BaseModel):
+class RustneshinUserUsageSeriesResponse(PanelModel):
     """User usage series response"""
 
     username: str = Field(..., title="Username")
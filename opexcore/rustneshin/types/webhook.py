@@ -1,9 +1,10 @@
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import Field
+from opexcore.base import PanelModel
 
 
-class RustneshinCreateSubReq(BaseModel):
+class RustneshinCreateSubReq(PanelModel):
     """Create subscription request"""
 
     is_enabled: Optional[bool] = Field(None, title="Is Enabled")
@@ -12,7 +13,7 @@ class RustneshinCreateSubReq(BaseModel):
     topic: Optional[str] = Field(None, title="Topic")
 
 
-class RustneshinCreateEndpointReq(BaseModel):
+class RustneshinCreateEndpointReq(PanelModel):
     """Create endpoint request"""
 
     url: str = Field(..., title="URL")
@@ -24,7 +25,7 @@ class RustneshinCreateEndpointReq(BaseModel):
     )
 
 
-class RustneshinSubscriptionRes(BaseModel):
+class RustneshinSubscriptionRes(PanelModel):
     """Subscription response"""
 
     id: int = Field(..., title="ID")
@@ -36,7 +37,7 @@ class RustneshinSubscriptionRes(BaseModel):
     topic: Optional[str] = Field(None, title="Topic")
 
 
-class RustneshinEndpointRes(BaseModel):
+class RustneshinEndpointRes(PanelModel):
     """Endpoint response"""
 
     id: int = Field(..., title="ID")
@@ -63,7 +64,7 @@ class RustneshinEndpointWithSubsRes(RustneshinEndpointRes):
     )
 
 
-class RustneshinSubUpsertReq(BaseModel):
+class RustneshinSubUpsertReq(PanelModel):
     """Subscription upsert request"""
 
     id: Optional[int] = Field(None, title="ID")
@@ -73,13 +74,13 @@ class RustneshinSubUpsertReq(BaseModel):
     topic: Optional[str] = Field(None, title="Topic")
 
 
-class RustneshinSubsUpdateReq(BaseModel):
+class RustneshinSubsUpdateReq(PanelModel):
     """Subscriptions update request"""
 
     items: List[RustneshinSubUpsertReq] = Field(..., title="Items")
 
 
-class RustneshinUpdateEndpointReq(BaseModel):
+class RustneshinUpdateEndpointReq(PanelModel):
     """Update endpoint request"""
 
     url: Optional[str] = Field(None, title="URL")
@@ -0,0 +1,54 @@
+import asyncio
+import tarfile
+import threading
+import zipfile
+import pytest
+from opexcore.core import archive_name, write_archive
+from opexcore.core.archive import _ArchiveWriter
+
+NAMES = {
+    "../../etc/cron.d/job": "_/_/etc/cron.d/job",
+    "/etc/passwd": "etc/passwd",
+    "node\\..\\..\\evil.ovpn": "node/_/_/evil.ovpn",
+    "node//./alice.ovpn": "node/_/alice.ovpn",
+}
+
+
+def _jobs(names):
+    async def content(name):
+        return name.encode()
+
+    return [(name, lambda name=name: content(name)) for name in names]
+
+
+def test_archive_name_keeps_segments_inside():
+    assert archive_name("node", "alice.ovpn") == "node/alice.ovpn"
+    assert archive_name("..", "a/b.ovpn") == "_/a_b.ovpn"
+    assert archive_name("", "/etc/passwd") == "_/_etc_passwd"
+
+
+@pytest.mark.parametrize("format", ["zip", "tar", "tar.gz"])
+def test_entry_names_cannot_escape(tmp_path, format):
+    path = tmp_path / f"export.{format}"
+    report = asyncio.run(write_archive(_jobs(NAMES), str(path), format=format))
+    assert report.written == len(NAMES) and not report.failures
+    if format == "zip":
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+    else:
+        with tarfile.open(path) as archive:
+            names = archive.getnames()
+    assert sorted(names) == sorted(NAMES.values())
+
+
+def test_entries_are_written_off_the_event_loop(tmp_path, monkeypatch):
+    threads = set()
+    add = _ArchiveWriter.add
+
+    def record(self, name, data):
+        threads.add(threading.current_thread())
+        add(self, name, data)
+
+    monkeypatch.setattr(_ArchiveWriter, "add", record)
+    asyncio.run(write_archive(_jobs(["a", "b"]), str(tmp_path / "export.zip")))
+    assert threads and threading.current_thread() not in threads
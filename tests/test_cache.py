@@ -0,0 +1,31 @@
+import asyncio
+import logging
+from opexcore import ResponseCache
+
+
+def test_failed_refresh_is_logged_once(caplog):
+    cache = ResponseCache()
+    calls = []
+
+    async def load():
+        calls.append(None)
+        if len(calls) > 1:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("panel down")
+        return ["value"]
+
+    async def main():
+        get = lambda: cache.get_or_load(
+            "endpoint", "http://panel", "key", frozenset(), 0.01, 60, load
+        )
+        await get()
+        await asyncio.sleep(0.02)
+        values = [await get() for _ in range(5)]
+        await asyncio.sleep(0.05)
+        return values
+
+    with caplog.at_level(logging.WARNING, "opexcore.core.cache"):
+        values = asyncio.run(main())
+    assert values == [["value"]] * 5 and len(calls) == 2
+    assert cache.stale_hits == 5
+    assert len(caplog.records) == 1
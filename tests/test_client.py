@@ -0,0 +1,30 @@
+import asyncio
+from opexcore import MarzbanClient
+from opexcore.mock import MockMarzban
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def _with_stale_token(use):
+    async with MockMarzban(users=250) as panel:
+        async with MarzbanClient(panel.url, "admin", "admin", token="stale") as client:
+            return await use(client)
+
+
+def test_iterator_refreshes_rejected_token():
+    async def scan(client):
+        return [user.username async for user in client.iter_users(page_size=100)]
+
+    assert len(set(run(_with_stale_token(scan)))) == 250
+
+
+def test_call_refreshes_rejected_token():
+    async def call(client):
+        users = await client.get_users(limit=10)
+        stats = await client.request("GET", "/api/system")
+        return len(users.users), stats, client.token
+
+    count, stats, token = run(_with_stale_token(call))
+    assert count == 10 and "total_user" in stats and token != "stale"
@@ -0,0 +1,112 @@
+import asyncio
+import gzip
+import json
+from aiohttp import web
+from opexcore import MarzbanManager
+from opexcore.core import Compression, RequestBase, record_transfers
+from opexcore.marzban.types import MarzbanProxyHost, MarzbanUserCreate
+from opexcore.core.context import ClientContext, _current_context
+
+
+async def echo_size(request: web.Request) -> web.Response:
+    return web.json_response({"size": len(await request.read())})
+
+
+async def gzipped_text(request: web.Request) -> web.Response:
+    charset = request.query["charset"]
+    encoded = "café".encode("latin-1" if charset == "latin-1" else "utf-8")
+    body = web.Response(body=gzip.compress(encoded))
+    body.headers["Content-Type"] = f"text/plain; charset={charset}"
+    body.headers["Content-Encoding"] = "gzip"
+    return body
+
+
+async def echo_body(request: web.Request) -> web.Response:
+    # The server decompresses the body itself; the header tells how it came
+    encoding = request.headers.get("Content-Encoding")
+    return web.json_response({"encoding": encoding, "body": await request.json()})
+
+
+async def echo_json(request: web.Request) -> web.Response:
+    return web.json_response(await request.json())
+
+
+def serve(calls, compression=None):
+    async def main():
+        app = web.Application()
+        app.router.add_post("/form", echo_size)
+        app.router.add_get("/text", gzipped_text)
+        app.router.add_post("/echo", echo_body)
+        app.router.add_put("/api/core/config", echo_body)
+        app.router.add_put("/api/hosts", echo_json)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        token = _current_context.set(
+            ClientContext(compression=compression or Compression())
+        )
+        try:
+            with record_transfers() as transfers:
+                return await calls(url), transfers
+        finally:
+            _current_context.reset(token)
+            await RequestBase.shutdown()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_form_body_is_counted():
+    async def login(url):
+        form = {"username": "admin", "password": "p@ss word"}
+        return await RequestBase.fetch("POST", f"{url}/form", data=form)
+
+    response, (transfer,) = serve(login)
+    assert transfer.sent == transfer.sent_wire == response["size"] > 0
+
+
+def test_compressed_text_uses_response_encoding():
+    async def texts(url):
+        return [
+            await RequestBase.fetch(
+                "GET",
+                f"{url}/text",
+                params={"charset": charset},
+                response_type="text",
+            )
+            for charset in ("latin-1", "unknown-charset")
+        ]
+
+    assert serve(texts)[0] == ["café", "café"]
+
+
+def test_large_text_and_json_bodies_are_compressed():
+    user = MarzbanUserCreate(
+        username="alice", proxies={"vless": {}}, note="x" * 4096
+    ).model_dump_json(exclude_none=True)
+    config = {"inbounds": [{"tag": f"inbound {index}"} for index in range(200)]}
+
+    async def send(url):
+        echoed = await RequestBase.fetch("POST", f"{url}/echo", data=user)
+        modified = await MarzbanManager.modify_core_config(url, "token", config)
+        return echoed, modified
+
+    (echoed, modified), transfers = serve(send, Compression(request_threshold=1024))
+    assert echoed == {"encoding": "gzip", "body": json.loads(user)}
+    assert modified == {"encoding": "gzip", "body": config}
+    assert all(transfer.sent_wire < transfer.sent for transfer in transfers)
+
+
+def test_model_bodies_are_sent_as_json():
+    hosts = {
+        "VLESS TCP": [
+            MarzbanProxyHost(remark="{USERNAME}", address="{SERVER_IP}", port=443)
+        ]
+    }
+
+    async def modify(url):
+        return await MarzbanManager.modify_hosts(url, "token", hosts)
+
+    assert serve(modify)[0] == hosts
@@ -0,0 +1,130 @@
+import asyncio
+import os
+import pytest
+from aiohttp import ClientResponseError, web
+from opexcore.core import RequestBase, RetryPolicy
+
+
+class Document:
+    """Serves one body with optional ETag, Range and If-Range support"""
+
+    def __init__(self, body: bytes, etag=None):
+        self.body = body
+        self.etag = etag
+        self.honor_if_range = True
+        self.break_after = None
+        self.status = 200
+        self.ranges = []
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        if self.status != 200:
+            raise web.HTTPNotFound()
+        headers = {"ETag": self.etag} if self.etag else {}
+        start, status = 0, 200
+        requested = request.headers.get("Range")
+        self.ranges.append((requested, request.headers.get("If-Range")))
+        if requested and (
+            not self.honor_if_range or request.headers.get("If-Range") == self.etag
+        ):
+            start, status = int(requested[6:-1]), 206
+        body = self.body[start:]
+        response = web.StreamResponse(status=status, headers=headers)
+        response.content_length = len(body)
+        await response.prepare(request)
+        if self.break_after is not None:
+            await response.write(body[: self.break_after])
+            self.break_after = None
+            request.transport.close()
+            return response
+        await response.write(body)
+        return response
+
+
+def download(document: Document, path: str, **kwargs):
+    async def main():
+        app = web.Application()
+        app.router.add_get("/file", document.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            return await RequestBase.download_to(
+                f"http://127.0.0.1:{port}/file", path, **kwargs
+            )
+        finally:
+            await RequestBase.shutdown()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def retries(monkeypatch):
+    monkeypatch.setattr(RequestBase, "retry_policy", RetryPolicy(attempts=3, backoff=0))
+
+
+def read(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+BODY = bytes(range(256)) * 4096
+
+
+def test_broken_transfer_resumes_with_if_range(tmp_path, retries):
+    document = Document(BODY, '"v1"')
+    document.break_after = 300_000
+    path = str(tmp_path / "backup")
+    result = download(document, path)
+    assert read(path) == BODY
+    assert result.resumed
+    (first, _), (resumed_range, if_range) = document.ranges
+    assert first is None and resumed_range.startswith("bytes=")
+    assert if_range == '"v1"'
+    assert not os.path.exists(path + ".part.validator")
+
+
+def test_changed_document_starts_over(tmp_path):
+    path = str(tmp_path / "backup")
+    with open(path + ".part", "wb") as part:
+        part.write(b"old document bytes")
+    with open(path + ".part.validator", "w") as validator:
+        validator.write('"v1"')
+    result = download(Document(BODY, '"v2"'), path)
+    assert read(path) == BODY
+    assert not result.resumed
+
+
+def test_ignored_if_range_starts_over(tmp_path):
+    path = str(tmp_path / "backup")
+    with open(path + ".part", "wb") as part:
+        part.write(b"old document bytes")
+    with open(path + ".part.validator", "w") as validator:
+        validator.write('"v1"')
+    document = Document(BODY, '"v2"')
+    document.honor_if_range = False
+    assert download(document, path).size == len(BODY)
+    assert read(path) == BODY
+
+
+def test_no_validator_never_resumes(tmp_path, retries):
+    document = Document(BODY)
+    document.break_after = 300_000
+    path = str(tmp_path / "backup")
+    with open(path + ".part", "wb") as part:
+        part.write(b"bytes of another backup")
+    result = download(document, path)
+    assert read(path) == BODY
+    assert not result.resumed
+    assert document.ranges == [(None, None), (None, None)]
+
+
+def test_rejected_request_removes_part(tmp_path):
+    document = Document(BODY, '"v1"')
+    document.status = 404
+    path = str(tmp_path / "backup")
+    with pytest.raises(ClientResponseError):
+        download(document, path)
+    assert not os.path.exists(path + ".part")
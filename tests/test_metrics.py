@@ -0,0 +1,35 @@
+import pytest
+from opexcore.core.metrics import MetricsRegistry
+
+
+def test_same_definition_returns_existing_metric():
+    registry = MetricsRegistry()
+    counter = registry.counter("calls_total", "Calls", ("panel",))
+    assert registry.counter("calls_total", "Calls", ("panel",)) is counter
+
+
+@pytest.mark.parametrize(
+    "register",
+    [
+        lambda registry: registry.counter("calls_total", "Calls", ("host",)),
+        lambda registry: registry.histogram("calls_total", "Calls", ("panel",)),
+        lambda registry: registry.histogram(
+            "latency_seconds", "Latency", ("panel",), (0.5, 1)
+        ),
+    ],
+)
+def test_conflicting_definition_raises(register):
+    registry = MetricsRegistry()
+    registry.counter("calls_total", "Calls", ("panel",))
+    registry.histogram("latency_seconds", "Latency", ("panel",), (0.1, 1))
+    with pytest.raises(ValueError):
+        register(registry)
+
+
+def test_help_escapes_only_backslash_and_newline():
+    registry = MetricsRegistry(namespace="")
+    counter = registry.counter("quoted_total", 'Say "hi"\\now\nplease', ("path",))
+    counter.inc(path='a"b')
+    help_line, _, sample = registry.render().splitlines()
+    assert help_line == '# HELP quoted_total Say "hi"\\\\now\\nplease'
+    assert sample == 'quoted_total{path="a\\"b"} 1'
@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+from opexcore import GuardManager, MarzbanManager, PasarGuardManager, RustneshinManager
+from opexcore.core import RequestBase, gather_pages, paginate, PaginationError
+from opexcore.mock import MockGuard, MockMarzban, MockPasarGuard, MockRustneshin
+
+USERS = 3000
+
+
+def run(coroutine):
+    async def main():
+        try:
+            return await coroutine
+        finally:
+            await RequestBase.shutdown()
+
+    return asyncio.run(main())
+
+
+async def _capped(mock, manager, scan):
+    async with mock(users=USERS, max_page_size=100) as panel:
+        token = await manager.admin_token(panel.url, "admin", "admin")
+        return await scan(manager, panel.url, token.access_token)
+
+
+async def _get_all(manager, url, token):
+    users = await manager.get_all_users(url, token, page_size=500)
+    return [user.username for user in users]
+
+
+async def _iter(manager, url, token):
+    return [
+        user.username async for user in manager.iter_users(url, token, page_size=500)
+    ]
+
+
+@pytest.mark.parametrize(
+    "mock, manager",
+    [
+        (MockMarzban, MarzbanManager),
+        (MockPasarGuard, PasarGuardManager),
+        (MockRustneshin, RustneshinManager),
+    ],
+)
+@pytest.mark.parametrize("scan", [_get_all, _iter])
+def test_capped_page_size_returns_every_user(mock, manager, scan):
+    usernames = run(_capped(mock, manager, scan))
+    assert len(usernames) == USERS
+    assert len(set(usernames)) == USERS
+
+
+@pytest.mark.parametrize("method", ["get_all_subscriptions", "iter_subscriptions"])
+def test_capped_guard_returns_every_subscription(method):
+    async def scan():
+        async with MockGuard(users=USERS, max_page_size=100) as panel:
+            token = await GuardManager.create_token(panel.url, "admin", "admin")
+            result = getattr(GuardManager, method)(
+                panel.url, token.access_token, page_size=500
+            )
+            if method == "get_all_subscriptions":
+                return [item.username for item in await result]
+            return [item.username async for item in result]
+
+    usernames = run(scan())
+    assert len(usernames) == len(set(usernames)) == USERS
+
+
+def _pages(items, served, total=True):
+    async def fetch_page(index, size):
+        size = min(size, served)
+        page = items[index * size : (index + 1) * size]
+        return page, len(items) if total else None
+
+    return fetch_page
+
+
+def test_paginate_continues_after_short_page():
+    async def collect():
+        return [item async for item in paginate(_pages(list(range(95)), 10, False), 25)]
+
+    assert run(collect()) == list(range(95))
+
+
+def test_gather_pages_follows_served_page_size():
+    items = list(range(1234))
+    assert run(gather_pages(_pages(items, 100), 500)) == items
+
+
+def test_gather_pages_raises_on_missing_items():
+    async def fetch_page(index, size):
+        return list(range(index * size, (index + 1) * size))[:-1], 100
+
+    with pytest.raises(PaginationError):
+        run(gather_pages(fetch_page, 10))
@@ -0,0 +1,20 @@
+from typing import List
+from opexcore.core import RequestBase, decode_model, project
+from opexcore.core.parsing import parse
+from opexcore.remnawave.types import RemnawaveUser
+
+FIELDS = {"username", "status", "short_uuid"}
+USER = {"username": "alice", "status": "ACTIVE", "shortUuid": "abc", "extra": 1}
+
+
+def test_projection_keeps_model_config():
+    projected = project(RemnawaveUser, FIELDS)
+    assert projected.model_config == RemnawaveUser.model_config
+    for user in (
+        parse(projected, USER),
+        decode_model(RequestBase.codec.dumps([USER]), List[projected])[0],
+    ):
+        assert user.status == "ACTIVE" and type(user.status) is str
+        assert user.short_uuid == "abc"
+    by_name = projected(username="bob", status="DISABLED", short_uuid="xyz")
+    assert by_name.short_uuid == "xyz"
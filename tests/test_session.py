@@ -0,0 +1,50 @@
+import asyncio
+from opexcore.core import SessionPool
+from opexcore.core.sync import EventLoopThread
+
+URL = "http://127.0.0.1:9/"
+
+
+async def _open(pool):
+    return pool.get_session(URL)
+
+
+def test_new_loop_closes_previous_sessions():
+    pool = SessionPool()
+    first = asyncio.run(_open(pool))
+    second = asyncio.run(_open(pool))
+    assert first.closed and not second.closed
+    asyncio.run(pool.close())
+    assert second.closed
+
+
+def test_close_from_another_loop_closes_on_owning_loop():
+    pool = SessionPool()
+    thread = EventLoopThread()
+    try:
+        session = thread.run(_open(pool))
+        asyncio.run(pool.close())
+        assert session.closed
+    finally:
+        thread.close()
+
+
+def test_new_loop_closes_sessions_of_running_loop():
+    pool = SessionPool()
+    thread = EventLoopThread()
+    try:
+        session = thread.run(_open(pool))
+
+        async def reopen():
+            fresh = pool.get_session(URL)
+            for _ in range(100):
+                if session.closed:
+                    break
+                await asyncio.sleep(0.01)
+            return fresh
+
+        fresh = asyncio.run(reopen())
+        assert session.closed and fresh is not session
+        asyncio.run(pool.close())
+    finally:
+        thread.close()
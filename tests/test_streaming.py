@@ -0,0 +1,47 @@
+import asyncio
+import json
+import pytest
+from opexcore.core.streaming import iter_json_array
+
+DOCUMENTS = [
+    ("[1.5, 2.25]", ()),
+    ("[-1, 1e3, 2.5E-2, -0.125e+2, 0, 10]", ()),
+    ('[{"a": 1.5, "b": [1, -2e1]}, "x\\"y", "\\u00e9\\u2603 ok", true, null]', ()),
+    ('{"total":1.5,"users":[{"n":1.25},{"n":-3e2}],"tail":2}', ("users",)),
+    ('{"meta": {"x": [1, 2.5]}, "count": -12.5e1, "users": [7.75, 8]}', ("users",)),
+    ('["caf\\u00e9", "ünïcødé ☃", 3.0]', ()),
+    ("  [ ]  ", ()),
+]
+
+
+def _decode(chunks, path):
+    async def source():
+        for chunk in chunks:
+            yield chunk
+
+    async def collect():
+        return [item async for item in iter_json_array(source(), path)]
+
+    return asyncio.run(collect())
+
+
+def _expected(text, path):
+    value = json.loads(text)
+    for key in path:
+        value = value[key]
+    return value
+
+
+@pytest.mark.parametrize("text, path", DOCUMENTS)
+def test_every_split_point(text, path):
+    body = text.encode()
+    expected = _expected(text, path)
+    for split in range(len(body) + 1):
+        assert _decode([body[:split], body[split:]], path) == expected, split
+
+
+@pytest.mark.parametrize("text, path", DOCUMENTS)
+def test_single_byte_chunks(text, path):
+    body = text.encode()
+    chunks = [body[index : index + 1] for index in range(len(body))]
+    assert _decode(chunks, path) == _expected(text, path)